@@ -0,0 +1,68 @@
+from argparse import ArgumentParser, Namespace, RawTextHelpFormatter
+from logging import error, info, INFO, WARNING
+from pathlib import Path
+from typing import Dict, NoReturn
+
+from ruamel.yaml import YAML
+
+from util.logging import configure_logging
+
+
+def _main() -> NoReturn:
+    args = _parse_arguments()
+    # Logging shares standard output with the report, keep it quiet unless the report goes to a file
+    configure_logging(console_level=INFO if args.output is not None else WARNING)
+
+    # noinspection PyBroadException
+    try:
+        config: dict = YAML(typ="safe").load(Path(args.config))
+        repository_config: Dict[str, str] = config["timeline_tracker_app_config"]["repositories_config"]
+        _report_event_overlaps(args.world, repository_config, sharing_traveler=args.sharing_traveler, output=args.output)
+    except Exception as e:
+        error(f"Failure occurred while finding event overlaps: {e}", exc_info=e)
+        exit(-1)
+    exit(0)
+
+
+def _parse_arguments() -> Namespace:
+    description = "Event Overlap Report: \n" \
+                  " - Lists every pair of events in a world whose spans intersect.\n" \
+                  " - The configuration file for the application will be read to determine repository type and location.\n" \
+                  " - Repository data is only read, never modified."
+    parser = ArgumentParser(description=description, formatter_class=RawTextHelpFormatter)
+    parser.add_argument("-c", "--config", required=True,
+                        help="Timeline Tracker API configuration file. Repository type/location are loaded from it")
+    parser.add_argument("-w", "--world", required=True,
+                        help="Id of the world to check, for example 'world-00000000-0000-4000-8000-000000000000'")
+    parser.add_argument("--sharing-traveler", action="store_true",
+                        help="Only report overlapping events that affect at least one common traveler")
+    parser.add_argument("-o", "--output",
+                        help="File to write the overlaps to as a JSON array. They are written to standard output when omitted")
+    return parser.parse_args()
+
+
+def _report_event_overlaps(world_id_raw: str, repository_config: Dict[str, str], *, sharing_traveler: bool, output: str = None) -> None:
+    from application.access.clients import Profile
+    from application.factories import RepositoriesFactory
+    from application.requests.data_forms import JsonTranslator
+    from application.use_case.event_use_cases import EventUseCase
+    from domain.ids import PrefixedUUID
+
+    repositories = RepositoriesFactory(**repository_config)
+    event_use_case = EventUseCase(
+        repositories.world_repo, repositories.location_repo, repositories.traveler_repo, repositories.event_repo)
+
+    overlaps = event_use_case.find_overlaps(
+        JsonTranslator.from_json(world_id_raw, PrefixedUUID), sharing_traveler=sharing_traveler,
+        profile=Profile("event-overlaps", "Event Overlap Report"))
+    overlaps_json = JsonTranslator.to_json_str(overlaps)
+
+    if output is None:
+        print(overlaps_json)
+    else:
+        Path(output).write_text(overlaps_json, encoding="utf8")
+    info(f"Found {len(overlaps)} overlapping event pair(s)")
+
+
+if __name__ == "__main__":
+    _main()
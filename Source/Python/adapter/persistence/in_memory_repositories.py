@@ -1,11 +1,15 @@
 from collections import defaultdict
 from copy import deepcopy
-from typing import Set, Dict, TypeVar, Generic, Type
+from typing import Set, Dict, TypeVar, Generic, Type, Optional
 
+from adapter.persistence.indexes import JourneyIndex, TagIndex, NameIndex, SpanIndex
+from domain.collections import Range
 from domain.events import Event
 from domain.ids import PrefixedUUID, IdentifiedEntity
 from domain.locations import Location
 from domain.persistence.repositories import LocationRepository, TravelerRepository, EventRepository, WorldRepository
+from domain.positions import Position, PositionalRange, PositionalMove
+from domain.tags import Tag
 from domain.travelers import Traveler
 from domain.worlds import World
 
@@ -16,16 +20,22 @@ _T = TypeVar('_T', bound=IdentifiedEntity)
 class _InMemoryIdentifiedEntityRepository(Generic[_T]):
     _entity_type: Type[_T]
     _entities_by_id: Dict[PrefixedUUID, _T]
+    _name_index: NameIndex
+    _tag_index: TagIndex
 
     def __init__(self, entity_type: Type[_T]) -> None:
         self._entity_type = entity_type
         self._entities_by_id = {}
+        self._name_index = NameIndex()
+        self._tag_index = TagIndex()
 
     def save(self, entity: _T) -> None:
         if not isinstance(entity, self._entity_type):
             raise TypeError(f"Argument 'entity' must be of type {_T}")
 
         self._entities_by_id[entity.id] = entity
+        self._name_index.add(entity.id, entity.name)
+        self._tag_index.add(entity.id, entity.tags)
 
     def retrieve(self, entity_id: PrefixedUUID) -> _T:
         if not isinstance(entity_id, PrefixedUUID):
@@ -41,11 +51,39 @@ class _InMemoryIdentifiedEntityRepository(Generic[_T]):
             for entity in self._entities_by_id.values()
         }
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        estimates = [len(self._entities_by_id)]
+        if name_is is not None or name_has is not None:
+            estimates.append(self._name_index.estimate_count(name_is=name_is, name_has=name_has))
+        if tagged_all is not None or tagged_any is not None or tagged_only is not None or tagged_none is not None:
+            estimates.append(self._tag_index.estimate_count(
+                tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only, tagged_none=tagged_none))
+        return min(estimates)
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        matching_ids_per_index = []
+        if name_is is not None or name_has is not None:
+            matching_ids_per_index.append(self._name_index.retrieve_ids(name_is=name_is, name_has=name_has))
+        if tagged_all is not None or tagged_any is not None or tagged_only is not None or tagged_none is not None:
+            matching_ids_per_index.append(self._tag_index.retrieve_ids(
+                tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only, tagged_none=tagged_none))
+        if not matching_ids_per_index:
+            return set(self._entities_by_id)
+        return matching_ids_per_index[0].intersection(*matching_ids_per_index[1:])
+
     def delete(self, entity_id: PrefixedUUID) -> None:
         if entity_id not in self._entities_by_id:
             raise NameError(f"No stored entity with id '{entity_id}'")
 
         self._entities_by_id.pop(entity_id)
+        self._name_index.remove(entity_id)
+        self._tag_index.remove(entity_id)
 
 
 class InMemoryWorldRepository(WorldRepository):
@@ -69,6 +107,22 @@ class InMemoryWorldRepository(WorldRepository):
     def retrieve_all(self) -> Set[World]:
         return self._inner_repo.retrieve_all()
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        return self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        return self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
     def delete(self, world_id: PrefixedUUID) -> None:
         return self._inner_repo.delete(world_id)
 
@@ -83,6 +137,15 @@ class InMemoryWorldRepository(WorldRepository):
         if event_id is not None:
             self._associated_events[world_id].add(event_id)
 
+    def associate_all(
+            self, world_id: PrefixedUUID,
+            *, location_ids: Set[PrefixedUUID] = frozenset(), traveler_ids: Set[PrefixedUUID] = frozenset(),
+            event_ids: Set[PrefixedUUID] = frozenset()
+    ) -> None:
+        self._associated_locations[world_id].update(location_ids)
+        self._associated_travelers[world_id].update(traveler_ids)
+        self._associated_events[world_id].update(event_ids)
+
     def disassociate(
             self, world_id: PrefixedUUID,
             *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, event_id: PrefixedUUID = None
@@ -109,12 +172,15 @@ class InMemoryWorldRepository(WorldRepository):
 
 class InMemoryLocationRepository(LocationRepository):
     _inner_repo: _InMemoryIdentifiedEntityRepository
+    _span_index: SpanIndex
 
     def __init__(self) -> None:
         self._inner_repo = _InMemoryIdentifiedEntityRepository(Location)
+        self._span_index = SpanIndex()
 
     def save(self, location: Location) -> None:
         self._inner_repo.save(location)
+        self._span_index.add(location.id, location.span)
 
     def retrieve(self, location_id: PrefixedUUID) -> Location:
         return self._inner_repo.retrieve(location_id)
@@ -122,18 +188,48 @@ class InMemoryLocationRepository(LocationRepository):
     def retrieve_all(self) -> Set[Location]:
         return self._inner_repo.retrieve_all()
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        return self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, span_includes: Position = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None,
+            tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        if span_includes is None and continuum_intersects is None and reality_intersects is None:
+            return self._inner_repo.retrieve_ids(
+                name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+                tagged_none=tagged_none)
+        location_ids = self._span_index.retrieve_ids(
+            continuum_intersects=continuum_intersects, reality_intersects=reality_intersects, span_includes=span_includes)
+        if name_is is None and name_has is None and tagged_all is None and tagged_any is None and tagged_only is None \
+                and tagged_none is None:
+            return location_ids
+        return location_ids & self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
     def delete(self, location_id: PrefixedUUID) -> None:
-        return self._inner_repo.delete(location_id)
+        self._inner_repo.delete(location_id)
+        self._span_index.remove(location_id)
 
 
 class InMemoryTravelerRepository(TravelerRepository):
     _inner_repo: _InMemoryIdentifiedEntityRepository
+    _journey_index: JourneyIndex
 
     def __init__(self) -> None:
         self._inner_repo = _InMemoryIdentifiedEntityRepository(Traveler)
+        self._journey_index = JourneyIndex()
 
     def save(self, traveler: Traveler) -> None:
         self._inner_repo.save(traveler)
+        self._journey_index.add(traveler)
 
     def retrieve(self, traveler_id: PrefixedUUID) -> Traveler:
         return self._inner_repo.retrieve(traveler_id)
@@ -141,22 +237,60 @@ class InMemoryTravelerRepository(TravelerRepository):
     def retrieve_all(self) -> Set[Traveler]:
         return self._inner_repo.retrieve_all()
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, journey_includes: Position = None,
+            journey_intersects: PositionalRange = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        estimate = self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+        if journey_includes is None and journey_intersects is None:
+            return estimate
+        return min(estimate, self._journey_index.estimate_count(journey_includes=journey_includes, journey_intersects=journey_intersects))
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, journey_includes: Position = None,
+            journey_intersects: PositionalRange = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        if journey_includes is None and journey_intersects is None:
+            return self._inner_repo.retrieve_ids(
+                name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+                tagged_none=tagged_none)
+        traveler_ids = self._journey_index.retrieve_ids(journey_includes=journey_includes, journey_intersects=journey_intersects)
+        if name_is is None and name_has is None and tagged_all is None and tagged_any is None and tagged_only is None \
+                and tagged_none is None:
+            return traveler_ids
+        return traveler_ids & self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def append_to_journey(self, traveler_id: PrefixedUUID, positional_move: PositionalMove) -> None:
+        traveler = self._inner_repo.retrieve(traveler_id).with_move_appended(positional_move)
+        self._inner_repo.save(traveler)
+        self._journey_index.append(traveler_id, positional_move)
+
     def delete(self, traveler_id: PrefixedUUID) -> None:
-        return self._inner_repo.delete(traveler_id)
+        self._inner_repo.delete(traveler_id)
+        self._journey_index.remove(traveler_id)
 
 
 class InMemoryEventRepository(EventRepository):
     _inner_repo: _InMemoryIdentifiedEntityRepository
     _event_ids_by_location_id: Dict[PrefixedUUID, Set[PrefixedUUID]]
     _event_ids_by_traveler_id: Dict[PrefixedUUID, Set[PrefixedUUID]]
+    _span_index: SpanIndex
 
     def __init__(self) -> None:
         self._inner_repo = _InMemoryIdentifiedEntityRepository(Event)
         self._event_ids_by_location_id = defaultdict(set)
         self._event_ids_by_traveler_id = defaultdict(set)
+        self._span_index = SpanIndex()
 
     def save(self, event: Event) -> None:
         self._inner_repo.save(event)
+        self._span_index.add(event.id, event.span)
         for location_id in event.affected_locations:
             self._event_ids_by_location_id[location_id].add(event.id)
         for traveler_id in event.affected_travelers:
@@ -165,10 +299,66 @@ class InMemoryEventRepository(EventRepository):
     def retrieve(self, event_id: PrefixedUUID) -> Event:
         return self._inner_repo.retrieve(event_id)
 
-    def retrieve_all(self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None) -> Set[Event]:
-        if location_id is None and traveler_id is None:
+    def retrieve_all(
+            self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None
+    ) -> Set[Event]:
+        linked_event_ids = self._linked_event_ids(
+            location_id=location_id, traveler_id=traveler_id, continuum_intersects=continuum_intersects,
+            reality_intersects=reality_intersects)
+        if linked_event_ids is None:
             # Neither filter provided, return all
             return self._inner_repo.retrieve_all()
+        return {self.retrieve(event_id) for event_id in linked_event_ids}
+
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        return self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def retrieve_ids(
+            self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None, span_includes: Position = None, name_is: str = None, name_has: str = None,
+            tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        linked_event_ids = self._linked_event_ids(
+            location_id=location_id, traveler_id=traveler_id, continuum_intersects=continuum_intersects,
+            reality_intersects=reality_intersects, span_includes=span_includes)
+        if linked_event_ids is None:
+            return self._inner_repo.retrieve_ids(
+                name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+                tagged_none=tagged_none)
+        if name_is is None and name_has is None and tagged_all is None and tagged_any is None and tagged_only is None \
+                and tagged_none is None:
+            return linked_event_ids
+        return linked_event_ids & self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def delete(self, event_id: PrefixedUUID) -> None:
+        self._inner_repo.delete(event_id)
+        self._span_index.remove(event_id)
+        for location_id in self._event_ids_by_location_id:
+            self._event_ids_by_location_id[location_id].remove(event_id)
+        for traveler_id in self._event_ids_by_traveler_id:
+            self._event_ids_by_traveler_id[traveler_id].remove(event_id)
+
+    def _linked_event_ids(
+            self, *, location_id: Optional[PrefixedUUID], traveler_id: Optional[PrefixedUUID], continuum_intersects: Optional[Range[float]],
+            reality_intersects: Optional[Set[int]], span_includes: Optional[Position] = None
+    ) -> Optional[Set[PrefixedUUID]]:
+        if continuum_intersects is None and reality_intersects is None and span_includes is None:
+            window_event_ids = None
+        else:
+            # Narrow down by span first, so only events within the window are loaded
+            window_event_ids = self._span_index.retrieve_ids(
+                continuum_intersects=continuum_intersects, reality_intersects=reality_intersects, span_includes=span_includes)
+
+        if location_id is None and traveler_id is None:
+            return window_event_ids
 
         events_linked_to_provided_location_id = self._event_ids_by_location_id.get(location_id, set())
         events_linked_to_provided_traveler_id = self._event_ids_by_traveler_id.get(traveler_id, set())
@@ -178,11 +368,6 @@ class InMemoryEventRepository(EventRepository):
         else:
             # Only on filter provided, return events linked to that one (union with empty set)
             desired_event_ids = events_linked_to_provided_location_id.union(events_linked_to_provided_traveler_id)
-        return {self.retrieve(event_id) for event_id in desired_event_ids}
-
-    def delete(self, event_id: PrefixedUUID) -> None:
-        self._inner_repo.delete(event_id)
-        for location_id in self._event_ids_by_location_id:
-            self._event_ids_by_location_id[location_id].remove(event_id)
-        for traveler_id in self._event_ids_by_traveler_id:
-            self._event_ids_by_traveler_id[traveler_id].remove(event_id)
+        if window_event_ids is not None:
+            desired_event_ids = desired_event_ids.intersection(window_event_ids)
+        return desired_event_ids
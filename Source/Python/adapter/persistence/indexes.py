@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from math import ceil, sqrt, inf
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from domain.collections import Range
+from domain.ids import PrefixedUUID
+from domain.positions import Position, PositionalRange, PositionalMove, MovementType
+from domain.tags import Tag
+from domain.travelers import Traveler
+
+
+_K = TypeVar("_K")
+_Box = Tuple[Tuple[float, ...], Tuple[float, ...]]
+_NODE_CAPACITY = 16
+_CONTINUUM_DIMENSION = 3
+_LATITUDE_DIMENSION = 0
+
+
+def _position_box(start: Position, end: Position) -> _Box:
+    start_values = (start.latitude, start.longitude, start.altitude, start.continuum, float(start.reality))
+    end_values = (end.latitude, end.longitude, end.altitude, end.continuum, float(end.reality))
+    return tuple(map(min, start_values, end_values)), tuple(map(max, start_values, end_values))
+
+
+def _positional_range_box(positional_range: PositionalRange) -> _Box:
+    ranges = [positional_range.latitude, positional_range.longitude, positional_range.altitude, positional_range.continuum]
+    lows = tuple(range_.low for range_ in ranges) + (float(min(positional_range.reality)),)
+    highs = tuple(range_.high for range_ in ranges) + (float(max(positional_range.reality)),)
+    return lows, highs
+
+
+def _union(box_a: _Box, box_b: _Box) -> _Box:
+    return tuple(map(min, box_a[0], box_b[0])), tuple(map(max, box_a[1], box_b[1]))
+
+
+def _intersects(box_a: _Box, box_b: _Box) -> bool:
+    return all(low_a <= high_b and low_b <= high_a for low_a, high_a, low_b, high_b in zip(box_a[0], box_a[1], box_b[0], box_b[1]))
+
+
+def _bounding_box(items: list) -> Optional[_Box]:
+    box = None
+    for item in items:
+        box = item.box if box is None else _union(box, item.box)
+    return box
+
+
+def _margin(box: _Box) -> float:
+    return sum(high - low for low, high in zip(box[0], box[1]))
+
+
+def _center(box: _Box, dimension: int) -> float:
+    return (box[0][dimension] + box[1][dimension]) / 2
+
+
+class _Entry(Generic[_K]):
+    key: _K
+    box: _Box
+    payload: Any
+    leaf: Optional[_Node]
+
+    def __init__(self, key: _K, box: _Box, payload: Any) -> None:
+        self.key = key
+        self.box = box
+        self.payload = payload
+        self.leaf = None
+
+
+class _Node:
+    box: Optional[_Box]
+    children: list
+    is_leaf: bool
+
+    def __init__(self, children: list, *, is_leaf: bool) -> None:
+        self.children = children
+        self.is_leaf = is_leaf
+        self.box = _bounding_box(children)
+        if is_leaf:
+            for entry in children:
+                entry.leaf = self
+
+
+# An R-tree over 5 dimensional boxes (latitude, longitude, altitude, continuum, reality). Entries are grown into the tree by R-tree
+# insertion and removed from their leaf directly, leaving node boxes loose; the tree is repacked (sort-tile-recursive) once more entries
+# have been removed than remain.
+class SpatialIndex(Generic[_K]):
+    _root: _Node
+    _entries_by_key: Dict[_K, List[_Entry[_K]]]
+    _size: int
+    _removed_since_pack: int
+
+    def __init__(self) -> None:
+        self._root = _Node([], is_leaf=True)
+        self._entries_by_key = defaultdict(list)
+        self._size = 0
+        self._removed_since_pack = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, key: _K, box: _Box, payload: Any = None) -> None:
+        entry = _Entry(key, box, payload)
+        self._entries_by_key[key].append(entry)
+        self._size += 1
+        split_sibling = self._insert(self._root, entry)
+        if split_sibling is not None:
+            self._root = _Node([self._root, split_sibling], is_leaf=False)
+
+    def remove(self, key: _K) -> None:
+        entries = self._entries_by_key.pop(key, [])
+        for entry in entries:
+            entry.leaf.children.remove(entry)
+        self._size -= len(entries)
+        self._removed_since_pack += len(entries)
+        if self._removed_since_pack > len(self):
+            self._pack()
+
+    def search(self, box: _Box) -> Iterator[_Entry[_K]]:
+        if self._root.box is None:
+            return
+        nodes_to_visit = [self._root]
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            for child in node.children:
+                if _intersects(child.box, box):
+                    if node.is_leaf:
+                        yield child
+                    else:
+                        nodes_to_visit.append(child)
+
+    def _insert(self, node: _Node, entry: _Entry[_K]) -> Optional[_Node]:
+        node.box = entry.box if node.box is None else _union(node.box, entry.box)
+        if node.is_leaf:
+            node.children.append(entry)
+            entry.leaf = node
+        else:
+            best_child = min(node.children, key=lambda child: _margin(_union(child.box, entry.box)) - _margin(child.box))
+            split_sibling = self._insert(best_child, entry)
+            if split_sibling is not None:
+                node.children.append(split_sibling)
+        if len(node.children) <= _NODE_CAPACITY:
+            return None
+        return self._split(node)
+
+    @staticmethod
+    def _split(node: _Node) -> _Node:
+        dimension_count = len(node.box[0])
+        spreads = [
+            max(_center(child.box, dimension) for child in node.children) - min(_center(child.box, dimension) for child in node.children)
+            for dimension in range(dimension_count)
+        ]
+        split_dimension = spreads.index(max(spreads))
+        ordered_children = sorted(node.children, key=lambda child: _center(child.box, split_dimension))
+        half = len(ordered_children) // 2
+        node.children = ordered_children[:half]
+        node.box = _bounding_box(node.children)
+        if node.is_leaf:
+            for entry in node.children:
+                entry.leaf = node
+        return _Node(ordered_children[half:], is_leaf=node.is_leaf)
+
+    def _pack(self) -> None:
+        level: list = [entry for entries in self._entries_by_key.values() for entry in entries]
+        is_leaf = True
+        while True:
+            level = [_Node(group, is_leaf=is_leaf) for group in self._sort_tile(level)]
+            is_leaf = False
+            if len(level) <= 1:
+                break
+        self._root = level[0] if level else _Node([], is_leaf=True)
+        self._removed_since_pack = 0
+
+    @staticmethod
+    def _sort_tile(items: list) -> List[list]:
+        # Slice along continuum first, as that is the dimension entities are most spread out across, then tile each slice by latitude
+        page_count = max(1, ceil(len(items) / _NODE_CAPACITY))
+        slice_size = _NODE_CAPACITY * ceil(sqrt(page_count))
+        by_continuum = sorted(items, key=lambda item: _center(item.box, _CONTINUUM_DIMENSION))
+        groups = []
+        for slice_start in range(0, len(by_continuum), slice_size):
+            slice_ = sorted(by_continuum[slice_start:slice_start + slice_size], key=lambda item: _center(item.box, _LATITUDE_DIMENSION))
+            groups.extend(slice_[page_start:page_start + _NODE_CAPACITY] for page_start in range(0, len(slice_), _NODE_CAPACITY))
+        return groups
+
+
+class JourneyIndex:
+    _paths: SpatialIndex[PrefixedUUID]
+    _traveler_ids_by_position: Dict[Position, Set[PrefixedUUID]]
+    _positions_by_traveler_id: Dict[PrefixedUUID, Set[Position]]
+    _last_position_by_traveler_id: Dict[PrefixedUUID, Position]
+
+    def __init__(self) -> None:
+        self._paths = SpatialIndex()
+        self._traveler_ids_by_position = defaultdict(set)
+        self._positions_by_traveler_id = {}
+        self._last_position_by_traveler_id = {}
+
+    def add(self, traveler: Traveler) -> None:
+        self.remove(traveler.id)
+        positions = set()
+        for start, end in traveler.journey_paths:
+            self._paths.insert(traveler.id, _position_box(start, end), (start, end))
+            positions.add(end)
+        for position in positions:
+            self._traveler_ids_by_position[position].add(traveler.id)
+        self._positions_by_traveler_id[traveler.id] = positions
+        self._last_position_by_traveler_id[traveler.id] = traveler.journey[-1].position
+
+    def append(self, traveler_id: PrefixedUUID, positional_move: PositionalMove) -> None:
+        # Indexes only the path to the new move, the rest of the journey is already indexed
+        if traveler_id not in self._positions_by_traveler_id:
+            return
+        end = positional_move.position
+        start = self._last_position_by_traveler_id[traveler_id] if positional_move.movement_type == MovementType.INTERPOLATED else end
+        self._paths.insert(traveler_id, _position_box(start, end), (start, end))
+        self._traveler_ids_by_position[end].add(traveler_id)
+        self._positions_by_traveler_id[traveler_id].add(end)
+        self._last_position_by_traveler_id[traveler_id] = end
+
+    def remove(self, traveler_id: PrefixedUUID) -> None:
+        if traveler_id not in self._positions_by_traveler_id:
+            return
+        self._last_position_by_traveler_id.pop(traveler_id)
+        self._paths.remove(traveler_id)
+        for position in self._positions_by_traveler_id.pop(traveler_id):
+            traveler_ids = self._traveler_ids_by_position[position]
+            traveler_ids.discard(traveler_id)
+            if not traveler_ids:
+                self._traveler_ids_by_position.pop(position)
+
+    def estimate_count(self, *, journey_includes: Position = None, journey_intersects: PositionalRange = None) -> int:
+        # Only exact positions have known counts, a range could cover any number of travelers
+        if journey_includes is not None:
+            return len(self._traveler_ids_by_position.get(journey_includes, set()))
+        return len(self._positions_by_traveler_id)
+
+    def retrieve_ids(self, *, journey_includes: Position = None, journey_intersects: PositionalRange = None) -> Set[PrefixedUUID]:
+        if journey_includes is None and journey_intersects is None:
+            return set(self._positions_by_traveler_id)
+
+        matching_ids = None
+        if journey_includes is not None:
+            matching_ids = set(self._traveler_ids_by_position.get(journey_includes, set()))
+        if journey_intersects is not None:
+            matching_ids = {
+                entry.key
+                for entry in self._paths.search(_positional_range_box(journey_intersects))
+                if (matching_ids is None or entry.key in matching_ids) and journey_intersects.intersects_path(*entry.payload)
+            }
+        return matching_ids
+
+
+class SpanIndex:
+    _spans: SpatialIndex[PrefixedUUID]
+    _realities_by_entity_id: Dict[PrefixedUUID, Set[int]]
+
+    def __init__(self) -> None:
+        self._spans = SpatialIndex()
+        self._realities_by_entity_id = {}
+
+    def add(self, entity_id: PrefixedUUID, span: PositionalRange) -> None:
+        self.remove(entity_id)
+        self._spans.insert(entity_id, _positional_range_box(span))
+        self._realities_by_entity_id[entity_id] = set(span.reality)
+
+    def remove(self, entity_id: PrefixedUUID) -> None:
+        if self._realities_by_entity_id.pop(entity_id, None) is not None:
+            self._spans.remove(entity_id)
+
+    def retrieve_ids(
+            self, *, continuum_intersects: Range[float] = None, reality_intersects: Set[int] = None, span_includes: Position = None
+    ) -> Set[PrefixedUUID]:
+        if continuum_intersects is None and reality_intersects is None and span_includes is None:
+            return set(self._realities_by_entity_id)
+
+        # The box only bounds realities between their min and max, the actual sets are checked afterwards
+        unbounded = Range(-inf, inf)
+        continuum = continuum_intersects if continuum_intersects is not None else unbounded
+        reality = Range(float(min(reality_intersects)), float(max(reality_intersects))) if reality_intersects else unbounded
+        window_box = (-inf, -inf, -inf, continuum.low, reality.low), (inf, inf, inf, continuum.high, reality.high)
+        # When a position must be included it is the narrower query, the window is then checked against each found box
+        query_box = _position_box(span_includes, span_includes) if span_includes is not None else window_box
+        return {
+            entry.key
+            for entry in self._spans.search(query_box)
+            if (span_includes is None or _intersects(entry.box, window_box))
+            and (reality_intersects is None or self._realities_by_entity_id[entry.key].intersection(reality_intersects))
+            and (span_includes is None or span_includes.reality in self._realities_by_entity_id[entry.key])
+        }
+
+
+# An inverted index of tag -> bitmap of entity ordinals, with python ints as the bitmaps. Ordinals freed by removals are reused so the
+# bitmaps stay dense.
+class TagIndex:
+    _ordinals_by_id: Dict[PrefixedUUID, int]
+    _ids_by_ordinal: List[Optional[PrefixedUUID]]
+    _free_ordinals: List[int]
+    _tags_by_id: Dict[PrefixedUUID, Set[Tag]]
+    _bitmaps_by_tag: Dict[Tag, int]
+    _counts_by_tag: Dict[Tag, int]
+    _all_bitmap: int
+
+    def __init__(self) -> None:
+        self._ordinals_by_id = {}
+        self._ids_by_ordinal = []
+        self._free_ordinals = []
+        self._tags_by_id = {}
+        self._bitmaps_by_tag = {}
+        self._counts_by_tag = defaultdict(int)
+        self._all_bitmap = 0
+
+    def add(self, entity_id: PrefixedUUID, tags: Set[Tag]) -> None:
+        self.remove(entity_id)
+        if self._free_ordinals:
+            ordinal = self._free_ordinals.pop()
+            self._ids_by_ordinal[ordinal] = entity_id
+        else:
+            ordinal = len(self._ids_by_ordinal)
+            self._ids_by_ordinal.append(entity_id)
+        bit = 1 << ordinal
+        for tag in tags:
+            self._bitmaps_by_tag[tag] = self._bitmaps_by_tag.get(tag, 0) | bit
+            self._counts_by_tag[tag] += 1
+        self._all_bitmap |= bit
+        self._ordinals_by_id[entity_id] = ordinal
+        self._tags_by_id[entity_id] = set(tags)
+
+    def remove(self, entity_id: PrefixedUUID) -> None:
+        if entity_id not in self._ordinals_by_id:
+            return
+        ordinal = self._ordinals_by_id.pop(entity_id)
+        mask = ~(1 << ordinal)
+        for tag in self._tags_by_id.pop(entity_id):
+            bitmap = self._bitmaps_by_tag[tag] & mask
+            if bitmap:
+                self._bitmaps_by_tag[tag] = bitmap
+                self._counts_by_tag[tag] -= 1
+            else:
+                self._bitmaps_by_tag.pop(tag)
+                self._counts_by_tag.pop(tag)
+        self._all_bitmap &= mask
+        self._ids_by_ordinal[ordinal] = None
+        self._free_ordinals.append(ordinal)
+
+    def estimate_count(
+            self, *, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        # Upper bounds from the number of entities carrying each tag, taggedOnly is not estimated
+        estimates = [len(self._ordinals_by_id)]
+        if tagged_all:
+            estimates.append(min(self._counts_by_tag.get(tag, 0) for tag in tagged_all))
+        if tagged_any is not None:
+            estimates.append(sum(self._counts_by_tag.get(tag, 0) for tag in tagged_any))
+        if tagged_none:
+            estimates.append(len(self._ordinals_by_id) - max(self._counts_by_tag.get(tag, 0) for tag in tagged_none))
+        return min(estimates)
+
+    def retrieve_ids(
+            self, *, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        matching_bitmap = self._all_bitmap
+        if tagged_all is not None:
+            for tag in tagged_all:
+                matching_bitmap &= self._bitmaps_by_tag.get(tag, 0)
+        if tagged_any is not None:
+            matching_bitmap &= self._union(tagged_any)
+        if tagged_only is not None:
+            matching_bitmap &= ~self._union(tag for tag in self._bitmaps_by_tag if tag not in tagged_only)
+        if tagged_none is not None:
+            matching_bitmap &= ~self._union(tagged_none)
+        return self._decode(matching_bitmap)
+
+    def _union(self, tags: Iterable[Tag]) -> int:
+        bitmap = 0
+        for tag in tags:
+            bitmap |= self._bitmaps_by_tag.get(tag, 0)
+        return bitmap
+
+    def _decode(self, bitmap: int) -> Set[PrefixedUUID]:
+        bits = bin(bitmap)[:1:-1]
+        entity_ids = set()
+        ordinal = bits.find("1")
+        while ordinal != -1:
+            entity_ids.add(self._ids_by_ordinal[ordinal])
+            ordinal = bits.find("1", ordinal + 1)
+        return entity_ids
+
+
+# Names are indexed case-insensitively, both whole (for exact matches) and by their 3 character substrings. A substring query is answered
+# by intersecting the candidates of each of its trigrams, then confirming the match; queries too short to have a trigram scan the names.
+class NameIndex:
+    _lowered_names_by_id: Dict[PrefixedUUID, str]
+    _ids_by_lowered_name: Dict[str, Set[PrefixedUUID]]
+    _ids_by_trigram: Dict[str, Set[PrefixedUUID]]
+
+    def __init__(self) -> None:
+        self._lowered_names_by_id = {}
+        self._ids_by_lowered_name = defaultdict(set)
+        self._ids_by_trigram = defaultdict(set)
+
+    def add(self, entity_id: PrefixedUUID, name: str) -> None:
+        self.remove(entity_id)
+        lowered_name = name.lower()
+        self._lowered_names_by_id[entity_id] = lowered_name
+        self._ids_by_lowered_name[lowered_name].add(entity_id)
+        for trigram in _trigrams(lowered_name):
+            self._ids_by_trigram[trigram].add(entity_id)
+
+    def remove(self, entity_id: PrefixedUUID) -> None:
+        if entity_id not in self._lowered_names_by_id:
+            return
+        lowered_name = self._lowered_names_by_id.pop(entity_id)
+        _discard_from(self._ids_by_lowered_name, lowered_name, entity_id)
+        for trigram in _trigrams(lowered_name):
+            _discard_from(self._ids_by_trigram, trigram, entity_id)
+
+    def estimate_count(self, *, name_is: str = None, name_has: str = None) -> int:
+        # Exact for nameIs, for nameHas bounded by the rarest of its trigrams
+        if name_is is not None:
+            return len(self._ids_by_lowered_name.get(name_is.lower(), set()))
+        trigrams = _trigrams(name_has.lower()) if name_has is not None else set()
+        if not trigrams:
+            return len(self._lowered_names_by_id)
+        return min(len(self._ids_by_trigram.get(trigram, set())) for trigram in trigrams)
+
+    def retrieve_ids(self, *, name_is: str = None, name_has: str = None) -> Set[PrefixedUUID]:
+        if name_is is not None:
+            matching_ids = set(self._ids_by_lowered_name.get(name_is.lower(), set()))
+        elif name_has is not None:
+            matching_ids = self._candidate_ids(name_has.lower())
+        else:
+            return set(self._lowered_names_by_id)
+
+        if name_has is not None:
+            lowered_name_has = name_has.lower()
+            matching_ids = {entity_id for entity_id in matching_ids if lowered_name_has in self._lowered_names_by_id[entity_id]}
+        return matching_ids
+
+    def _candidate_ids(self, lowered_name_has: str) -> Set[PrefixedUUID]:
+        trigrams = _trigrams(lowered_name_has)
+        if not trigrams:
+            return set(self._lowered_names_by_id)
+        postings = sorted((self._ids_by_trigram.get(trigram, set()) for trigram in trigrams), key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[start:start + 3] for start in range(len(text) - 2)}
+
+
+def _discard_from(ids_by_key: Dict[Any, Set[PrefixedUUID]], key: Any, entity_id: PrefixedUUID) -> None:
+    entity_ids = ids_by_key[key]
+    entity_ids.discard(entity_id)
+    if not entity_ids:
+        ids_by_key.pop(key)
@@ -1,13 +1,17 @@
 from json import dumps, loads
 from pathlib import Path
-from typing import Set, Type, Generic, TypeVar, Dict, Optional, List
+from typing import Set, Type, Generic, TypeVar, Dict, Optional, List, Any
 
 from _version import APP_VERSION, APP_VERSION_RAW, parse_version
+from adapter.persistence.indexes import JourneyIndex, TagIndex, NameIndex, SpanIndex
 from application.requests.data_forms import JsonTranslator
+from domain.collections import Range
 from domain.events import Event
 from domain.ids import PrefixedUUID, IdentifiedEntity
 from domain.locations import Location
 from domain.persistence.repositories import LocationRepository, TravelerRepository, EventRepository, WorldRepository
+from domain.positions import Position, PositionalRange, PositionalMove
+from domain.tags import Tag
 from domain.travelers import Traveler
 from domain.worlds import World
 
@@ -24,8 +28,13 @@ _TIndex = TypeVar('_TIndex')
 class _JsonFileIdentifiedEntityRepository(Generic[_T]):
     _repo_path: Path
     _entity_type: Type[_T]
+    _name_index: Optional[NameIndex]
+    _tag_index: Optional[TagIndex]
+    _appendable_attribute: Optional[str]
 
-    def __init__(self, repo_name: str, entity_type: Type[_T], *, json_repositories_directory_root: str) -> None:
+    def __init__(
+            self, repo_name: str, entity_type: Type[_T], *, json_repositories_directory_root: str, appendable_attribute: str = None
+    ) -> None:
         root_repos_path = Path(json_repositories_directory_root)
         if not root_repos_path.exists() or not root_repos_path.is_dir():
             raise ValueError(f"The path '{root_repos_path}' is not a valid directory and cannot be used.")
@@ -45,6 +54,9 @@ class _JsonFileIdentifiedEntityRepository(Generic[_T]):
 
         self._repo_path = repo_path
         self._entity_type = entity_type
+        self._name_index = None
+        self._tag_index = None
+        self._appendable_attribute = appendable_attribute
 
     def save(self, entity: _T) -> None:
         if not isinstance(entity, self._entity_type):
@@ -57,6 +69,25 @@ class _JsonFileIdentifiedEntityRepository(Generic[_T]):
 
         json = JsonTranslator.to_json(entity)
         entity_path.write_text(dumps(json, indent=2), "utf8")
+        if self._appendable_attribute is not None:
+            # The saved entity already holds everything that was appended
+            self._append_log_path(str(entity.id)).unlink(missing_ok=True)
+        if self._tag_index is not None:
+            self._name_index.add(entity.id, entity.name)
+            self._tag_index.add(entity.id, entity.tags)
+
+    def append(self, entity_id: PrefixedUUID, value: Any) -> None:
+        # Appended values are written one per line to a log beside the entity's file instead of rewriting it. They are added to the
+        # appendable attribute when the entity is read, and the log is dropped when the entity is next saved whole.
+        if not isinstance(entity_id, PrefixedUUID):
+            raise TypeError(f"Argument 'entity_id' must be of type {PrefixedUUID}")
+        if self._appendable_attribute is None:
+            raise TypeError(f"{self._entity_type.__name__} entities do not support appending")
+        if not self._repo_path.joinpath(f"{entity_id}.json").is_file():
+            raise NameError(f"No stored entity with id {entity_id}")
+
+        with self._append_log_path(str(entity_id)).open("a", encoding="utf8") as append_log:
+            append_log.write(dumps(JsonTranslator.to_json(value)) + "\n")
 
     def retrieve(self, entity_id: PrefixedUUID) -> _T:
         if not isinstance(entity_id, PrefixedUUID):
@@ -64,17 +95,41 @@ class _JsonFileIdentifiedEntityRepository(Generic[_T]):
         return self._retrieve_entity_from_json_file(str(entity_id))
 
     def retrieve_all(self) -> Set[_T]:
-        existing_entity_id_strings = [
-            file.name.replace(".json", "")
-            for file in self._repo_path.iterdir()
-            if file.is_file() and file.suffix == ".json"
-        ]
-
         all_entities = set()
-        for entity_id_str in existing_entity_id_strings:
+        for entity_id_str in self._existing_entity_id_strings():
             all_entities.add(self._retrieve_entity_from_json_file(entity_id_str))
         return all_entities
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        if name_is is None and name_has is None and tagged_all is None and tagged_any is None and tagged_only is None \
+                and tagged_none is None:
+            return len(self._existing_entity_id_strings())
+        self._build_indexes()
+        estimates = [self._name_index.estimate_count(name_is=name_is, name_has=name_has)]
+        if tagged_all is not None or tagged_any is not None or tagged_only is not None or tagged_none is not None:
+            estimates.append(self._tag_index.estimate_count(
+                tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only, tagged_none=tagged_none))
+        return min(estimates)
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        matching_ids_per_index = []
+        if name_is is not None or name_has is not None:
+            self._build_indexes()
+            matching_ids_per_index.append(self._name_index.retrieve_ids(name_is=name_is, name_has=name_has))
+        if tagged_all is not None or tagged_any is not None or tagged_only is not None or tagged_none is not None:
+            self._build_indexes()
+            matching_ids_per_index.append(self._tag_index.retrieve_ids(
+                tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only, tagged_none=tagged_none))
+        if not matching_ids_per_index:
+            return {JsonTranslator.from_json(entity_id_str, PrefixedUUID) for entity_id_str in self._existing_entity_id_strings()}
+        return matching_ids_per_index[0].intersection(*matching_ids_per_index[1:])
+
     def delete(self, entity_id: PrefixedUUID) -> None:
         if not isinstance(entity_id, PrefixedUUID):
             raise TypeError(f"Argument 'entity_id' must be of type {PrefixedUUID}")
@@ -85,6 +140,12 @@ class _JsonFileIdentifiedEntityRepository(Generic[_T]):
 
         deleted_suffix_path = entity_path.with_suffix(f"{entity_path.suffix}.deleted")
         entity_path.rename(deleted_suffix_path)
+        if self._appendable_attribute is not None and self._append_log_path(str(entity_id)).exists():
+            append_log_path = self._append_log_path(str(entity_id))
+            append_log_path.rename(append_log_path.with_suffix(f"{append_log_path.suffix}.deleted"))
+        if self._tag_index is not None:
+            self._name_index.remove(entity_id)
+            self._tag_index.remove(entity_id)
 
     def save_index(self, name: str, index: str) -> None:
         index_path = self._repo_path.joinpath(f"{name}.index")
@@ -104,6 +165,26 @@ class _JsonFileIdentifiedEntityRepository(Generic[_T]):
 
         return index_path.read_text(encoding="utf8")
 
+    def _build_indexes(self) -> None:
+        # Names and tags are indexed in memory, built from the stored files on first use and kept up to date by subsequent saves and
+        # deletes
+        if self._tag_index is not None:
+            return
+        name_index = NameIndex()
+        tag_index = TagIndex()
+        for entity in self.retrieve_all():
+            name_index.add(entity.id, entity.name)
+            tag_index.add(entity.id, entity.tags)
+        self._name_index = name_index
+        self._tag_index = tag_index
+
+    def _existing_entity_id_strings(self) -> List[str]:
+        return [
+            file.name.replace(".json", "")
+            for file in self._repo_path.iterdir()
+            if file.is_file() and file.suffix == ".json"
+        ]
+
     def _retrieve_entity_from_json_file(self, entity_id_str: str) -> _T:
         entity_path = self._repo_path.joinpath(f"{entity_id_str}.json")
         if entity_path.exists() and not entity_path.is_file():
@@ -112,8 +193,16 @@ class _JsonFileIdentifiedEntityRepository(Generic[_T]):
         if not entity_path.exists():
             raise NameError(f"No stored entity with id {entity_id_str}")
 
-        entity_json = entity_path.read_text(encoding="utf8")
-        return JsonTranslator.from_json_str(entity_json, self._entity_type)
+        entity_json = loads(entity_path.read_text(encoding="utf8"))
+        if self._appendable_attribute is not None:
+            append_log_path = self._append_log_path(entity_id_str)
+            if append_log_path.exists():
+                appended_json = [loads(line) for line in append_log_path.read_text(encoding="utf8").splitlines() if line]
+                entity_json[self._appendable_attribute].extend(appended_json)
+        return JsonTranslator.from_json(entity_json, self._entity_type)
+
+    def _append_log_path(self, entity_id_str: str) -> Path:
+        return self._repo_path.joinpath(f"{entity_id_str}.{self._appendable_attribute}.jsonl")
 
 
 class JsonFileWorldRepository(WorldRepository):
@@ -131,6 +220,22 @@ class JsonFileWorldRepository(WorldRepository):
     def retrieve_all(self) -> Set[World]:
         return self._inner_repo.retrieve_all()
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        return self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        return self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
     def delete(self, world_id: PrefixedUUID) -> None:
         self._inner_repo.delete(world_id)
 
@@ -158,6 +263,22 @@ class JsonFileWorldRepository(WorldRepository):
             index[index_key] = {val}
         self._inner_repo.save_index(index_name, dumps({key: list(vals) for key, vals in index.items()}))
 
+    def associate_all(
+            self, world_id: PrefixedUUID,
+            *, location_ids: Set[PrefixedUUID] = frozenset(), traveler_ids: Set[PrefixedUUID] = frozenset(),
+            event_ids: Set[PrefixedUUID] = frozenset()
+    ) -> None:
+        # Each index file is rewritten once for all the ids instead of once per id
+        for index_name, entity_ids in [
+            ("associated_locations", location_ids), ("associated_travelers", traveler_ids), ("associated_events", event_ids),
+        ]:
+            if not entity_ids:
+                continue
+            index_str = self._inner_repo.retrieve_index(index_name)
+            index: Dict[str, Set[str]] = {key: set(vals) for key, vals in loads(index_str).items()} if index_str is not None else {}
+            index.setdefault(str(world_id), set()).update(map(str, entity_ids))
+            self._inner_repo.save_index(index_name, dumps({key: list(vals) for key, vals in index.items()}))
+
     def disassociate(
             self, world_id: PrefixedUUID,
             *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, event_id: PrefixedUUID = None
@@ -200,12 +321,16 @@ class JsonFileWorldRepository(WorldRepository):
 
 class JsonFileLocationRepository(LocationRepository):
     _inner_repo: _JsonFileIdentifiedEntityRepository[Location]
+    _span_index: Optional[SpanIndex]
 
     def __init__(self, **kwargs) -> None:
         self._inner_repo = _JsonFileIdentifiedEntityRepository(_LOCATION_REPO_DIR_NAME, Location, **kwargs)
+        self._span_index = None
 
     def save(self, location: Location) -> None:
         self._inner_repo.save(location)
+        if self._span_index is not None:
+            self._span_index.add(location.id, location.span)
 
     def retrieve(self, location_id: PrefixedUUID) -> Location:
         return self._inner_repo.retrieve(location_id)
@@ -213,18 +338,59 @@ class JsonFileLocationRepository(LocationRepository):
     def retrieve_all(self) -> Set[Location]:
         return self._inner_repo.retrieve_all()
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        return self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, span_includes: Position = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None,
+            tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        if span_includes is None and continuum_intersects is None and reality_intersects is None:
+            return self._inner_repo.retrieve_ids(
+                name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+                tagged_none=tagged_none)
+        location_ids = self._get_span_index().retrieve_ids(
+            continuum_intersects=continuum_intersects, reality_intersects=reality_intersects, span_includes=span_includes)
+        if name_is is None and name_has is None and tagged_all is None and tagged_any is None and tagged_only is None \
+                and tagged_none is None:
+            return location_ids
+        return location_ids & self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
     def delete(self, location_id: PrefixedUUID) -> None:
         self._inner_repo.delete(location_id)
+        if self._span_index is not None:
+            self._span_index.remove(location_id)
+
+    def _get_span_index(self) -> SpanIndex:
+        # Spans are indexed in memory, built from the stored files on first use and kept up to date by subsequent saves and deletes
+        if self._span_index is None:
+            span_index = SpanIndex()
+            for location in self._inner_repo.retrieve_all():
+                span_index.add(location.id, location.span)
+            self._span_index = span_index
+        return self._span_index
 
 
 class JsonFileTravelerRepository(TravelerRepository):
     _inner_repo: _JsonFileIdentifiedEntityRepository[Traveler]
+    _journey_index: Optional[JourneyIndex]
 
     def __init__(self, **kwargs) -> None:
-        self._inner_repo = _JsonFileIdentifiedEntityRepository(_TRAVELER_REPO_DIR_NAME, Traveler, **kwargs)
+        self._inner_repo = _JsonFileIdentifiedEntityRepository(_TRAVELER_REPO_DIR_NAME, Traveler, appendable_attribute="journey", **kwargs)
+        self._journey_index = None
 
     def save(self, traveler: Traveler) -> None:
         self._inner_repo.save(traveler)
+        if self._journey_index is not None:
+            self._journey_index.add(traveler)
 
     def retrieve(self, traveler_id: PrefixedUUID) -> Traveler:
         return self._inner_repo.retrieve(traveler_id)
@@ -232,28 +398,145 @@ class JsonFileTravelerRepository(TravelerRepository):
     def retrieve_all(self) -> Set[Traveler]:
         return self._inner_repo.retrieve_all()
 
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, journey_includes: Position = None,
+            journey_intersects: PositionalRange = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        estimate = self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+        if journey_includes is None and journey_intersects is None:
+            return estimate
+        journey_estimate = self._get_journey_index().estimate_count(
+            journey_includes=journey_includes, journey_intersects=journey_intersects)
+        return min(estimate, journey_estimate)
+
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, journey_includes: Position = None,
+            journey_intersects: PositionalRange = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        if journey_includes is None and journey_intersects is None:
+            return self._inner_repo.retrieve_ids(
+                name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+                tagged_none=tagged_none)
+        traveler_ids = self._get_journey_index().retrieve_ids(journey_includes=journey_includes, journey_intersects=journey_intersects)
+        if name_is is None and name_has is None and tagged_all is None and tagged_any is None and tagged_only is None \
+                and tagged_none is None:
+            return traveler_ids
+        return traveler_ids & self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def append_to_journey(self, traveler_id: PrefixedUUID, positional_move: PositionalMove) -> None:
+        if not isinstance(positional_move, PositionalMove):
+            raise TypeError(f"Argument 'positional_move' must be of type {PositionalMove}")
+        self._inner_repo.append(traveler_id, positional_move)
+        if self._journey_index is not None:
+            self._journey_index.append(traveler_id, positional_move)
+
     def delete(self, traveler_id: PrefixedUUID) -> None:
         self._inner_repo.delete(traveler_id)
+        if self._journey_index is not None:
+            self._journey_index.remove(traveler_id)
+
+    def _get_journey_index(self) -> JourneyIndex:
+        # Journeys are indexed in memory, built from the stored files on first use and kept up to date by subsequent saves and deletes
+        if self._journey_index is None:
+            journey_index = JourneyIndex()
+            for traveler in self._inner_repo.retrieve_all():
+                journey_index.add(traveler)
+            self._journey_index = journey_index
+        return self._journey_index
 
 
 class JsonFileEventRepository(EventRepository):
     _inner_repo: _JsonFileIdentifiedEntityRepository[Event]
+    _span_index: Optional[SpanIndex]
 
     def __init__(self, **kwargs) -> None:
         self._inner_repo = _JsonFileIdentifiedEntityRepository(_EVENT_REPO_DIR_NAME, Event, **kwargs)
+        self._span_index = None
 
     def save(self, event: Event) -> None:
         self._inner_repo.save(event)
+        if self._span_index is not None:
+            self._span_index.add(event.id, event.span)
         self._add_to_index("event_ids_by_location_id", event.affected_locations, event.id)
         self._add_to_index("event_ids_by_traveler_id", event.affected_travelers, event.id)
 
     def retrieve(self, event_id: PrefixedUUID) -> Event:
         return self._inner_repo.retrieve(event_id)
 
-    def retrieve_all(self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None) -> Set[Event]:
-        if location_id is None and traveler_id is None:
+    def retrieve_all(
+            self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None
+    ) -> Set[Event]:
+        linked_event_ids = self._linked_event_ids(
+            location_id=location_id, traveler_id=traveler_id, continuum_intersects=continuum_intersects,
+            reality_intersects=reality_intersects)
+        if linked_event_ids is None:
             # Neither filter provided, return all
             return self._inner_repo.retrieve_all()
+        return {self.retrieve(event_id) for event_id in linked_event_ids}
+
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        return self._inner_repo.estimate_count(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def retrieve_ids(
+            self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None, span_includes: Position = None, name_is: str = None, name_has: str = None,
+            tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        linked_event_ids = self._linked_event_ids(
+            location_id=location_id, traveler_id=traveler_id, continuum_intersects=continuum_intersects,
+            reality_intersects=reality_intersects, span_includes=span_includes)
+        if linked_event_ids is None:
+            return self._inner_repo.retrieve_ids(
+                name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+                tagged_none=tagged_none)
+        if name_is is None and name_has is None and tagged_all is None and tagged_any is None and tagged_only is None \
+                and tagged_none is None:
+            return linked_event_ids
+        return linked_event_ids & self._inner_repo.retrieve_ids(
+            name_is=name_is, name_has=name_has, tagged_all=tagged_all, tagged_any=tagged_any, tagged_only=tagged_only,
+            tagged_none=tagged_none)
+
+    def delete(self, event_id: PrefixedUUID) -> None:
+        self._inner_repo.delete(event_id)
+        if self._span_index is not None:
+            self._span_index.remove(event_id)
+        self._strip_value_from_index_entries("event_ids_by_location_id", event_id)
+        self._strip_value_from_index_entries("event_ids_by_traveler_id", event_id)
+
+    def _get_span_index(self) -> SpanIndex:
+        # Spans are indexed in memory, built from the stored files on first use and kept up to date by subsequent saves and deletes
+        if self._span_index is None:
+            span_index = SpanIndex()
+            for event in self._inner_repo.retrieve_all():
+                span_index.add(event.id, event.span)
+            self._span_index = span_index
+        return self._span_index
+
+    def _linked_event_ids(
+            self, *, location_id: Optional[PrefixedUUID], traveler_id: Optional[PrefixedUUID], continuum_intersects: Optional[Range[float]],
+            reality_intersects: Optional[Set[int]], span_includes: Optional[Position] = None
+    ) -> Optional[Set[PrefixedUUID]]:
+        if continuum_intersects is None and reality_intersects is None and span_includes is None:
+            window_event_ids = None
+        else:
+            # Narrow down by span first, so only events within the window are loaded
+            window_event_ids = self._get_span_index().retrieve_ids(
+                continuum_intersects=continuum_intersects, reality_intersects=reality_intersects, span_includes=span_includes)
+
+        if location_id is None and traveler_id is None:
+            return window_event_ids
 
         events_linked_to_provided_location_id = self._retrieve_from_index("event_ids_by_location_id", location_id)
         events_linked_to_provided_traveler_id = self._retrieve_from_index("event_ids_by_traveler_id", traveler_id)
@@ -263,12 +546,9 @@ class JsonFileEventRepository(EventRepository):
         else:
             # Only on filter provided, return events linked to that one (union with empty set)
             desired_event_ids = events_linked_to_provided_location_id.union(events_linked_to_provided_traveler_id)
-        return {self.retrieve(event_id) for event_id in desired_event_ids}
-
-    def delete(self, event_id: PrefixedUUID) -> None:
-        self._inner_repo.delete(event_id)
-        self._strip_value_from_index_entries("event_ids_by_location_id", event_id)
-        self._strip_value_from_index_entries("event_ids_by_traveler_id", event_id)
+        if window_event_ids is not None:
+            desired_event_ids = desired_event_ids.intersection(window_event_ids)
+        return desired_event_ids
 
     def _strip_value_from_index_entries(self, name: str, value: PrefixedUUID) -> None:
         index_str = self._inner_repo.retrieve_index(name)
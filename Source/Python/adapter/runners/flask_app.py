@@ -1,7 +1,8 @@
 from collections import defaultdict
 from functools import wraps
+from gzip import GzipFile
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, Iterator
 
 from flask import Flask, redirect, Response, request, make_response
 from flask_cors import CORS
@@ -110,6 +111,18 @@ def _create_timeline_tracker_flask_app(timeline_tracker_app_config: dict, auth_c
     return flask_web_app
 
 
+def _iterate_request_body_lines() -> Iterator[str]:
+    # Gzip compressed bodies, such as world exports, are decompressed as their lines are read
+    body = request.stream
+    if request.mimetype == MIMEType.GZIP.value or request.content_encoding == "gzip":
+        body = GzipFile(fileobj=body)
+    try:
+        for line in body:
+            yield line.decode("utf8")
+    except OSError as e:
+        raise ValueError(f"Failed to read the request body: {e}")
+
+
 class FlaskRESTController(RESTController):
     _flask_web_app: Flask
     _finalized: bool
@@ -121,7 +134,8 @@ class FlaskRESTController(RESTController):
         self._routes = defaultdict(dict)
 
     def register_rest_endpoint(
-            self, route: str, method: RESTMethod, response_type: MIMEType = MIMEType.JSON, *, json: bool = False, query_params: bool = False
+            self, route: str, method: RESTMethod, response_type: MIMEType = MIMEType.JSON, *, json: bool = False,
+            query_params: bool = False, lines: bool = False
     ) -> HandlerRegisterer:
         if self._finalized:
             raise ValueError("Cannot register, controller has already been finalized.")
@@ -134,14 +148,20 @@ class FlaskRESTController(RESTController):
             raise ValueError(f"Cannot register, method {method} already registered for {route}")
 
         def handler_registerer(handler_func: RequestHandler) -> None:
-            validate_route_handler_declaration(route, handler_func, json, query_params)
+            validate_route_handler_declaration(route, handler_func, json, query_params, lines)
 
             def convert_to_flask_response(func: RequestHandler) -> Callable[[...], Response]:
                 @wraps(func)
                 def wrapper(*args, **kwargs) -> Response:
                     response: HandlerResult = func(*args, **kwargs)
-                    status_code, contents = response
-                    flask_response = make_response(contents, status_code)
+                    status_code, contents, *headers = response
+                    if isinstance(contents, str):
+                        flask_response = make_response(contents, status_code)
+                    else:
+                        # Streamed chunks must not need the request context, it is gone by the time they are sent
+                        flask_response = Response(contents, status_code)
+                    if headers:
+                        flask_response.headers.update(headers[0])
                     flask_response.mimetype = response_type.value
                     return flask_response
                 return wrapper
@@ -156,6 +176,8 @@ class FlaskRESTController(RESTController):
                     if request.get_json(silent=True) is None:
                         raise ValueError("A JSON body must be provided and the Content-Type header must be 'application/json'")
                     args.append(request.json)
+                if lines:
+                    args.append(_iterate_request_body_lines())
                 if query_params:
                     args.append(dict(request.args))
 
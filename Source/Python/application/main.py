@@ -2,10 +2,12 @@ from pathlib import Path
 
 from application.factories import RepositoriesFactory, RESTControllersFactory
 from application.requests.rest.handlers import LocationsRestRequestHandler, TravelersRestRequestHandler, EventsRestRequestHandler, \
-    WorldsRESTRequestHandler
+    WorldsRESTRequestHandler, TimelinesRestRequestHandler, TransfersRestRequestHandler
 from application.use_case.event_use_cases import EventUseCase
+from application.use_case.filtering_use_cases import FilterResultCache
 from application.use_case.location_use_cases import LocationUseCase
-from application.use_case.timeline_use_cases import TimelineUseCase
+from application.use_case.timeline_use_cases import TimelineUseCase, MaterializedTimelines
+from application.use_case.transfer_use_cases import TransferUseCase
 from application.use_case.traveler_use_cases import TravelerUseCase
 from application.use_case.world_use_cases import WorldUseCase
 from util.logging import configure_logging
@@ -19,6 +21,7 @@ class TimelineTrackerApp:
     _traveler_use_case: TravelerUseCase
     _event_use_case: EventUseCase
     _timeline_use_case: TimelineUseCase
+    _transfer_use_case: TransferUseCase
 
     @property
     def resources_folder(self) -> Path:
@@ -37,11 +40,23 @@ class TimelineTrackerApp:
         traveler_repository = repositories_factory.traveler_repo
         event_repository = repositories_factory.event_repo
 
-        self._world_use_case = WorldUseCase(world_repository)
-        self._location_use_case = LocationUseCase(world_repository, location_repository, event_repository)
-        self._traveler_use_case = TravelerUseCase(world_repository, traveler_repository, event_repository)
-        self._event_use_case = EventUseCase(world_repository, location_repository, traveler_repository, event_repository)
-        self._timeline_use_case = TimelineUseCase(world_repository, location_repository, traveler_repository, event_repository)
+        filter_result_cache = FilterResultCache()
+        materialized_timelines = MaterializedTimelines()
+        self._world_use_case = WorldUseCase(world_repository, filter_result_cache=filter_result_cache)
+        self._location_use_case = LocationUseCase(
+            world_repository, location_repository, event_repository, filter_result_cache=filter_result_cache,
+            materialized_timelines=materialized_timelines)
+        self._traveler_use_case = TravelerUseCase(
+            world_repository, traveler_repository, event_repository, filter_result_cache=filter_result_cache,
+            materialized_timelines=materialized_timelines)
+        self._event_use_case = EventUseCase(
+            world_repository, location_repository, traveler_repository, event_repository, filter_result_cache=filter_result_cache,
+            materialized_timelines=materialized_timelines)
+        self._timeline_use_case = TimelineUseCase(
+            world_repository, location_repository, traveler_repository, event_repository, materialized_timelines=materialized_timelines)
+        self._transfer_use_case = TransferUseCase(
+            world_repository, location_repository, traveler_repository, event_repository, filter_result_cache=filter_result_cache,
+            materialized_timelines=materialized_timelines)
 
     def initialize_controllers(self, *, rest_controller_config: dict) -> None:
         rest_controller = RESTControllersFactory(**rest_controller_config).rest_controller
@@ -50,5 +65,7 @@ class TimelineTrackerApp:
         LocationsRestRequestHandler.register_routes(rest_controller, self._location_use_case, self._timeline_use_case)
         TravelersRestRequestHandler.register_routes(rest_controller, self._traveler_use_case, self._timeline_use_case)
         EventsRestRequestHandler.register_routes(rest_controller, self._event_use_case)
+        TimelinesRestRequestHandler.register_routes(rest_controller, self._timeline_use_case)
+        TransfersRestRequestHandler.register_routes(rest_controller, self._transfer_use_case)
 
         rest_controller.finalize()
@@ -5,10 +5,14 @@ from uuid import UUID
 
 from domain.attributes import JsonType
 from domain.collections import Range
+from domain.encounters import Encounter
 from domain.events import Event
 from domain.ids import PrefixedUUID
+from domain.journey_stats import JourneyStats, RealityTransition
 from domain.locations import Location
+from domain.overlaps import EventOverlap
 from domain.positions import PositionalRange, PositionalMove, Position, MovementType
+from domain.snapshots import Snapshot
 from domain.tags import Tag
 from domain.travelers import Traveler
 from domain.worlds import World
@@ -36,9 +40,13 @@ def _ensure_type(value: Any, *types: Type[T]) -> T:
 class JsonTranslator(Generic[T]):
     __pass_through_types = [int, float, bool]
     __to_str_types = [PrefixedUUID, Tag]
+    # Computed from other attributes when needed, never serialized
+    __derived_attributes = {"_continuum_index"}
 
     @staticmethod
-    def to_json(value: T) -> Any:
+    def to_json(value: T, *, omit: Set[str] = frozenset(), fields: Set[str] = None) -> Any:
+        # Attributes named in 'omit', or not named in 'fields' when given, are left out of the value itself and never translated. Nested
+        # values are translated whole.
         if type(value) in JsonTranslator.__pass_through_types:
             return value
         if type(value) in JsonTranslator.__to_str_types:
@@ -47,7 +55,7 @@ class JsonTranslator(Generic[T]):
             return value
         if type(value) is list:
             return [JsonTranslator.to_json(inner_val) for inner_val in value]
-        if type(value) is set:
+        if type(value) in {set, frozenset}:
             return sorted([JsonTranslator.to_json(inner_val) for inner_val in value])
         if type(value) is MovementType:
             movement_type: MovementType = value
@@ -57,16 +65,21 @@ class JsonTranslator(Generic[T]):
                 JsonTranslator.to_json(key): JsonTranslator.to_json(val)
                 for key, val in value.items()
             }
-        if type(value) in {World, Location, Event, Traveler, PositionalRange, Position, Range, PositionalMove}:
+        if type(value) in {
+            World, Location, Event, Traveler, PositionalRange, Position, Range, PositionalMove, Encounter, EventOverlap, Snapshot,
+            JourneyStats, RealityTransition,
+        }:
             return {
                 str(key).removeprefix("_"): JsonTranslator.to_json(val)
                 for key, val in vars(value).items()
+                if key not in JsonTranslator.__derived_attributes and str(key).removeprefix("_") not in omit
+                and (fields is None or str(key).removeprefix("_") in fields)
             }
         raise TypeError(f"Unsupported type {type(value)}")
 
     @staticmethod
-    def to_json_str(value: T, *, indent: int = 2) -> str:
-        return dumps(JsonTranslator.to_json(value), indent=indent)
+    def to_json_str(value: T, *, indent: int = 2, fields: Set[str] = None) -> str:
+        return dumps(JsonTranslator.to_json(value, fields=fields), indent=indent)
 
     @staticmethod
     def from_json(value: Any, type_: Type[T]) -> T:
@@ -81,6 +94,9 @@ class JsonTranslator(Generic[T]):
             if type_ is Set[PrefixedUUID]:
                 ids_json = _ensure_type(value, list)
                 return {JsonTranslator.from_json(id_, PrefixedUUID) for id_ in ids_json}
+            if type_ is List[PrefixedUUID]:
+                ids_json = _ensure_type(value, list)
+                return [JsonTranslator.from_json(id_, PrefixedUUID) for id_ in ids_json]
             if type_ is PrefixedUUID:
                 prefixed_uuid_raw = _ensure_type(value, str)
                 prefix, uuid = prefixed_uuid_raw.split("-", 1)
@@ -1,12 +1,14 @@
 from enum import Enum
 from functools import total_ordering
-from typing import Callable, Tuple, Optional
+from typing import Callable, Tuple, Optional, Union, Dict, Iterator
 
 
 Route = str
 StatusCode = int
 VerifierResult = Optional[str]
-HandlerResult = Tuple[StatusCode, str]
+# Contents are either the full response body or an iterator of chunks to be streamed, binary for compressed responses
+ResponseContents = Union[str, Iterator[str], Iterator[bytes]]
+HandlerResult = Union[Tuple[StatusCode, ResponseContents], Tuple[StatusCode, ResponseContents, Dict[str, str]]]
 RequestVerifier = Callable[[...], VerifierResult]
 RequestHandler = Callable[[...], HandlerResult]
 
@@ -35,6 +37,7 @@ RouteDescriptor = Tuple[Route, RESTMethod, RequestVerifier, RequestHandler]
 
 
 class MIMEType(Enum):
+    GZIP = "application/gzip"
     JSON = "application/json"
 
 
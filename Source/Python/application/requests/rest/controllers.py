@@ -10,7 +10,7 @@ HandlerRegisterer = Callable[[RequestHandler], None]
 _ROUTE_URL_PARAM_PATTERN = re.compile("<([a-zA-Z_]+)>")
 
 
-def validate_route_handler_declaration(route: str, handler: RequestHandler, json: bool, query_params: bool) -> None:
+def validate_route_handler_declaration(route: str, handler: RequestHandler, json: bool, query_params: bool, lines: bool = False) -> None:
     handler_argument_spec = getfullargspec(handler)
     route_url_parameters = re.findall(_ROUTE_URL_PARAM_PATTERN, route)
     if signature(handler).return_annotation != HandlerResult:
@@ -18,7 +18,9 @@ def validate_route_handler_declaration(route: str, handler: RequestHandler, json
     for url_param in route_url_parameters:
         if url_param not in handler_argument_spec.kwonlyargs:
             raise ValueError(f"Failed to register route {route}, handler does not accept '{url_param}' as a keyword-only arg.")
-    expected_args_count = int(json) + int(query_params)
+    if json and lines:
+        raise ValueError(f"Failed to register route {route}, the body can be requested either as JSON or as lines, not both")
+    expected_args_count = int(json) + int(lines) + int(query_params)
     if len(handler_argument_spec.args) != expected_args_count:
         raise ValueError(f"Failed to register route {route}, handler's positional args do not match expected amounts for requested params")
 
@@ -26,8 +28,10 @@ def validate_route_handler_declaration(route: str, handler: RequestHandler, json
 class RESTController(ABC):
     @abstractmethod
     def register_rest_endpoint(
-            self, route: str, method: RESTMethod, response_type: MIMEType = MIMEType.JSON, *, json: bool = False, query_params: bool = False
+            self, route: str, method: RESTMethod, response_type: MIMEType = MIMEType.JSON, *, json: bool = False,
+            query_params: bool = False, lines: bool = False
     ) -> HandlerRegisterer:
+        # With 'lines', the handler is given the request body as an iterator over its lines, read as they are consumed
         pass
 
     @abstractmethod
@@ -1,6 +1,7 @@
-from copy import deepcopy
 from http import HTTPStatus
-from typing import Set, Dict, List, Any
+from json import dumps, loads
+from functools import partial
+from typing import Set, Dict, List, Any, Callable, Tuple, Iterator, Union, Optional
 
 from jsonpatch import JsonPatch, PatchOperation
 
@@ -8,10 +9,15 @@ from application.requests.data_forms import JsonTranslator
 from application.requests.rest import RESTMethod, HandlerResult, MIMEType
 from application.requests.rest.controllers import RESTController
 from application.requests.rest.utils import parse_optional_tag_set_query_param, parse_optional_position_query_param, \
-    parse_optional_positional_range_query_param
+    parse_optional_positional_range_query_param, parse_optional_bool_query_param, parse_optional_limit_query_param, \
+    parse_optional_cursor_query_param, encode_cursor, stream_json_array, parse_optional_float_query_param, \
+    parse_optional_int_set_query_param, parse_optional_int_query_param, stream_gzip, \
+    parse_optional_expand_query_param, parse_optional_fields_query_param
 from application.use_case.event_use_cases import EventUseCase
+from application.use_case.filtering_use_cases import FilterPlan
 from application.use_case.location_use_cases import LocationUseCase
 from application.use_case.timeline_use_cases import TimelineUseCase
+from application.use_case.transfer_use_cases import TransferUseCase, ImportedEntity
 from application.use_case.traveler_use_cases import TravelerUseCase
 from application.use_case.world_use_cases import WorldUseCase
 from domain.attributes import JsonType
@@ -48,24 +54,162 @@ def _parse_event_id(event_id_raw: str) -> PrefixedUUID:
     return JsonTranslator.from_json(event_id_raw, PrefixedUUID)
 
 
+def _parse_world_kwargs(json_body: dict) -> Dict[str, Any]:
+    return {
+        "name": JsonTranslator.from_json(json_body["name"], str),
+        "description": JsonTranslator.from_json(json_body.get("description", ""), str),
+        "attributes": JsonTranslator.from_json(json_body.get("attributes", {}), Dict[str, JsonType]),
+        "tags": JsonTranslator.from_json(json_body.get("tags", []), Set[Tag]),
+    }
+
+
+def _parse_location_kwargs(json_body: dict) -> Dict[str, Any]:
+    return {
+        "name": JsonTranslator.from_json(json_body["name"], str),
+        "description": JsonTranslator.from_json(json_body.get("description", ""), str),
+        "span": JsonTranslator.from_json(json_body["span"], PositionalRange),
+        "attributes": JsonTranslator.from_json(json_body.get("attributes", {}), Dict[str, JsonType]),
+        "tags": JsonTranslator.from_json(json_body.get("tags", []), Set[Tag]),
+    }
+
+
+def _parse_traveler_kwargs(json_body: dict) -> Dict[str, Any]:
+    return {
+        "name": JsonTranslator.from_json(json_body["name"], str),
+        "description": JsonTranslator.from_json(json_body.get("description", ""), str),
+        "journey": JsonTranslator.from_json(json_body["journey"], List[PositionalMove]),
+        "attributes": JsonTranslator.from_json(json_body.get("attributes", {}), Dict[str, JsonType]),
+        "tags": JsonTranslator.from_json(json_body.get("tags", []), Set[Tag]),
+    }
+
+
+def _parse_event_kwargs(json_body: dict) -> Dict[str, Any]:
+    return {
+        "name": JsonTranslator.from_json(json_body["name"], str),
+        "description": JsonTranslator.from_json(json_body.get("description", ""), str),
+        "span": JsonTranslator.from_json(json_body["span"], PositionalRange),
+        "attributes": JsonTranslator.from_json(json_body.get("attributes", {}), Dict[str, JsonType]),
+        "tags": JsonTranslator.from_json(json_body.get("tags", []), Set[Tag]),
+        "affected_locations": JsonTranslator.from_json(json_body["affected_locations"], Set[PrefixedUUID]),
+        "affected_travelers": JsonTranslator.from_json(json_body["affected_travelers"], Set[PrefixedUUID]),
+    }
+
+
+_ENTITY_KWARGS_PARSERS = {
+    "world": _parse_world_kwargs,
+    "location": _parse_location_kwargs,
+    "traveler": _parse_traveler_kwargs,
+    "event": _parse_event_kwargs,
+}
+
+
+def _parse_import_line(line: str) -> ImportedEntity:
+    # A line holds one entity as for its POST route, plus its 'type' and optionally the 'id' other lines of the import refer to it by
+    json_body = loads(line)
+    if type(json_body) is not dict:
+        raise ValueError("Each line must be a JSON object")
+    entity_type = json_body.get("type", None)
+    if entity_type not in _ENTITY_KWARGS_PARSERS:
+        raise ValueError(f"Attribute 'type' must be one of {', '.join(_ENTITY_KWARGS_PARSERS)}, was {entity_type}")
+    source_id = JsonTranslator.from_json(json_body["id"], PrefixedUUID) if "id" in json_body else None
+    return entity_type, source_id, _ENTITY_KWARGS_PARSERS[entity_type](json_body)
+
+
+def _parse_entity_fields(query_params: Dict[str, str]) -> Optional[Set[str]]:
+    if not {"fields"}.issuperset(query_params.keys()):
+        raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - {'fields'})}")
+    return parse_optional_fields_query_param(query_params.get("fields", None))
+
+
+def _filtered_page_response(
+        query_params: Dict[str, str], retrieve_page_ids: Callable[..., Tuple[List[PrefixedUUID], bool]],
+        plan_retrieve_all: Callable[[], FilterPlan], retrieve_page: Callable[..., Tuple[List[Any], bool]] = None
+) -> HandlerResult:
+    page_kwargs = {
+        "after": parse_optional_cursor_query_param(query_params.get("cursor", None)),
+        "limit": parse_optional_limit_query_param(query_params.get("limit", None)),
+    }
+    supported_expansions = {"full"} if retrieve_page is not None else set()
+    fields = parse_optional_fields_query_param(query_params.get("fields", None))
+    expand_full = "full" in parse_optional_expand_query_param(query_params.get("expand", None), supported_expansions)
+    if fields is not None and not expand_full:
+        raise ValueError("Query parameter 'fields' can only be provided along with 'expand=full'")
+    # The explained plan is the one the page runs, unless the page is served from the cache without running any plan
+    plan = plan_retrieve_all() if parse_optional_bool_query_param(query_params.get("explain", None)) else None
+    if expand_full:
+        entities, has_more = retrieve_page(plan=plan, **page_kwargs)
+        entity_ids = [entity.id for entity in entities]
+    else:
+        entity_ids, has_more = retrieve_page_ids(plan=plan, **page_kwargs)
+        entities = entity_ids
+
+    headers = {}
+    if has_more:
+        headers["X-Next-Cursor"] = encode_cursor(entity_ids[-1])
+    if plan is not None:
+        headers["X-Filter-Plan"] = str(plan) if plan.executed else "cached"
+
+    if headers:
+        return HTTPStatus.OK, stream_json_array(entities, fields=fields), headers
+    return HTTPStatus.OK, stream_json_array(entities, fields=fields)
+
+
+def _parse_timeline_filters(query_params: Dict[str, str]) -> Dict[str, Any]:
+    supported_filters = {
+        "taggedAll", "taggedAny", "taggedOnly", "taggedNone", "continuumFrom", "continuumTo", "reality", "expand", "eventFields",
+    }
+    if not supported_filters.issuperset(query_params.keys()):
+        raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
+    return {
+        "tagged_all": parse_optional_tag_set_query_param(query_params.get("taggedAll", None)),
+        "tagged_any": parse_optional_tag_set_query_param(query_params.get("taggedAny", None)),
+        "tagged_only": parse_optional_tag_set_query_param(query_params.get("taggedOnly", None)),
+        "tagged_none": parse_optional_tag_set_query_param(query_params.get("taggedNone", None)),
+        "continuum_from": parse_optional_float_query_param(query_params.get("continuumFrom", None)),
+        "continuum_to": parse_optional_float_query_param(query_params.get("continuumTo", None)),
+        "reality": parse_optional_int_set_query_param(query_params.get("reality", None)),
+        "expand_events": "events" in parse_optional_expand_query_param(query_params.get("expand", None), {"events"}),
+    }
+
+
+def _parse_timeline_event_fields(query_params: Dict[str, str]) -> Optional[Set[str]]:
+    event_fields = parse_optional_fields_query_param(query_params.get("eventFields", None))
+    if event_fields is not None and "events" not in parse_optional_expand_query_param(query_params.get("expand", None), {"events"}):
+        raise ValueError("Query parameter 'eventFields' can only be provided along with 'expand=events'")
+    return event_fields
+
+
+def _timeline_to_json(timeline: List[Union[PrefixedUUID, Event, PositionalMove]], event_fields: Optional[Set[str]]) -> Iterator[Any]:
+    # Expanded events are translated from the instances the timeline already holds, limited to 'event_fields' when given
+    for timeline_item in timeline:
+        yield JsonTranslator.to_json(timeline_item, fields=event_fields if type(timeline_item) is Event else None)
+
+
+def _parse_continuum_and_reality(query_params: Dict[str, str]) -> Dict[str, Any]:
+    required_params = {"continuum", "reality"}
+    if not required_params.issuperset(query_params.keys()):
+        raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - required_params)}")
+    if not required_params.issubset(query_params.keys()):
+        raise ValueError(f"Query parameter(s) must be provided: {', '.join(sorted(required_params - query_params.keys()))}")
+    return {
+        "continuum": parse_optional_float_query_param(query_params["continuum"]),
+        "reality": parse_optional_int_query_param(query_params["reality"]),
+    }
+
+
 class WorldsRESTRequestHandler:
     @staticmethod
     def register_routes(rest_controller: RESTController, world_use_case: WorldUseCase) -> None:
         @rest_controller.register_rest_endpoint("/api/world", RESTMethod.POST, MIMEType.JSON, json=True)
         def world_post_handler(json_body: dict, **kwargs) -> HandlerResult:
-            world_kwargs = {
-                "name": JsonTranslator.from_json(json_body["name"], str),
-                "description": JsonTranslator.from_json(json_body.get("description", ""), str),
-                "attributes": JsonTranslator.from_json(json_body.get("attributes", {}), Dict[str, JsonType]),
-                "tags": JsonTranslator.from_json(json_body.get("tags", []), Set[Tag]),
-            }
-            world = world_use_case.create(**world_kwargs, **kwargs)
+            world = world_use_case.create(**_parse_world_kwargs(json_body), **kwargs)
 
             return HTTPStatus.CREATED, JsonTranslator.to_json_str(world)
 
         @rest_controller.register_rest_endpoint("/api/worlds", RESTMethod.GET, MIMEType.JSON, query_params=True)
         def worlds_get_handler(query_params: Dict[str, str], **kwargs) -> HandlerResult:
-            supported_filters = {"nameIs", "nameHas", "taggedAll", "taggedAny", "taggedOnly", "taggedNone"}
+            supported_filters = {"nameIs", "nameHas", "taggedAll", "taggedAny", "taggedOnly", "taggedNone", "explain", "limit",
+                                 "cursor"}
             if not supported_filters.issuperset(query_params.keys()):
                 raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
             filters = {
@@ -77,17 +221,18 @@ class WorldsRESTRequestHandler:
                 "tagged_none": parse_optional_tag_set_query_param(query_params.get("taggedNone", None)),
             }
 
-            world_ids = [world.id for world in world_use_case.retrieve_all(**filters, **kwargs)]
+            return _filtered_page_response(
+                query_params, partial(world_use_case.retrieve_page_ids, **filters, **kwargs),
+                partial(world_use_case.plan_retrieve_all, **filters, **kwargs))
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(world_ids)
-
-        @rest_controller.register_rest_endpoint("/api/world/<world_id>", RESTMethod.GET, MIMEType.JSON)
-        def world_get_handler(*, world_id: str, **kwargs) -> HandlerResult:
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>", RESTMethod.GET, MIMEType.JSON, query_params=True)
+        def world_get_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
             world_id_ = _parse_world_id(world_id)
+            fields = _parse_entity_fields(query_params)
 
             world = world_use_case.retrieve(world_id_, **kwargs)
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(world)
+            return HTTPStatus.OK, JsonTranslator.to_json_str(world, fields=fields)
 
         @rest_controller.register_rest_endpoint("/api/world/<world_id>", RESTMethod.PATCH, MIMEType.JSON, json=True)
         def world_patch_handler(body_patch_operations: List[Dict[str, Any]], *, world_id: str, **kwargs) -> HandlerResult:
@@ -120,21 +265,15 @@ class LocationsRestRequestHandler:
     def register_routes(rest_controller: RESTController, location_use_case: LocationUseCase, timeline_use_case: TimelineUseCase) -> None:
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/location", RESTMethod.POST, MIMEType.JSON, json=True)
         def locations_post_handler(json_body: dict, *, world_id: str, **kwargs) -> HandlerResult:
-            location_kwargs = {
-                "name": JsonTranslator.from_json(json_body["name"], str),
-                "description": JsonTranslator.from_json(json_body.get("description", ""), str),
-                "span": JsonTranslator.from_json(json_body["span"], PositionalRange),
-                "attributes": JsonTranslator.from_json(json_body.get("attributes", {}), Dict[str, JsonType]),
-                "tags": JsonTranslator.from_json(json_body.get("tags", []), Set[Tag]),
-            }
-            location = location_use_case.create(to_world_id(world_id), **location_kwargs, **kwargs)
+            location = location_use_case.create(to_world_id(world_id), **_parse_location_kwargs(json_body), **kwargs)
 
             return HTTPStatus.CREATED, JsonTranslator.to_json_str(location)
 
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/locations", RESTMethod.GET, MIMEType.JSON, query_params=True)
         def locations_get_all_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
             supported_filters = {
-                "nameIs", "nameHas", "taggedAll", "taggedAny", "taggedOnly", "taggedNone", "spanIncludes", "spanIntersects"
+                "nameIs", "nameHas", "taggedAll", "taggedAny", "taggedOnly", "taggedNone", "spanIncludes", "spanIntersects",
+                "explain", "limit", "cursor", "expand", "fields",
             }
             if not supported_filters.issuperset(query_params.keys()):
                 raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
@@ -149,17 +288,36 @@ class LocationsRestRequestHandler:
                 "span_intersects": parse_optional_positional_range_query_param(query_params.get("spanIntersects", None)),
             }
 
-            location_ids = [location.id for location in location_use_case.retrieve_all(to_world_id(world_id), **filters, **kwargs)]
+            return _filtered_page_response(
+                query_params, partial(location_use_case.retrieve_page_ids, to_world_id(world_id), **filters, **kwargs),
+                partial(location_use_case.plan_retrieve_all, to_world_id(world_id), **filters, **kwargs),
+                partial(location_use_case.retrieve_page, to_world_id(world_id), **filters, **kwargs))
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(location_ids)
+        @rest_controller.register_rest_endpoint(
+            "/api/world/<world_id>/locations/batch-get", RESTMethod.POST, MIMEType.JSON, json=True, query_params=True
+        )
+        def locations_batch_get_handler(
+                body_location_ids: List[str], query_params: Dict[str, str], *, world_id: str, **kwargs
+        ) -> HandlerResult:
+            if type(body_location_ids) is not list:
+                raise ValueError("Body must be a list of location ids")
+            location_ids = [_parse_location_id(location_id) for location_id in body_location_ids]
+            fields = _parse_entity_fields(query_params)
+
+            locations = location_use_case.retrieve_many(to_world_id(world_id), location_ids, **kwargs)
 
-        @rest_controller.register_rest_endpoint("/api/world/<world_id>/location/<location_id>", RESTMethod.GET, MIMEType.JSON)
-        def location_get_handler(*, world_id: str, location_id: str, **kwargs) -> HandlerResult:
+            return HTTPStatus.OK, stream_json_array(locations, fields=fields)
+
+        @rest_controller.register_rest_endpoint(
+            "/api/world/<world_id>/location/<location_id>", RESTMethod.GET, MIMEType.JSON, query_params=True
+        )
+        def location_get_handler(query_params: Dict[str, str], *, world_id: str, location_id: str, **kwargs) -> HandlerResult:
             _location_id = _parse_location_id(location_id)
+            fields = _parse_entity_fields(query_params)
 
             location = location_use_case.retrieve(to_world_id(world_id), _location_id, **kwargs)
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(location)
+            return HTTPStatus.OK, JsonTranslator.to_json_str(location, fields=fields)
 
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/location/<location_id>", RESTMethod.DELETE, MIMEType.JSON)
         def location_delete_handler(*, world_id: str, location_id: str, **kwargs) -> HandlerResult:
@@ -194,19 +352,12 @@ class LocationsRestRequestHandler:
         def location_timeline_get_handler(query_params: Dict[str, str], *, world_id: str, location_id: str, **kwargs) -> HandlerResult:
             location_id_ = _parse_location_id(location_id)
 
-            supported_filters = {"taggedAll", "taggedAny", "taggedOnly", "taggedNone"}
-            if not supported_filters.issuperset(query_params.keys()):
-                raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
-            filters = {
-                "tagged_all": parse_optional_tag_set_query_param(query_params.get("taggedAll", None)),
-                "tagged_any": parse_optional_tag_set_query_param(query_params.get("taggedAny", None)),
-                "tagged_only": parse_optional_tag_set_query_param(query_params.get("taggedOnly", None)),
-                "tagged_none": parse_optional_tag_set_query_param(query_params.get("taggedNone", None)),
-            }
+            filters = _parse_timeline_filters(query_params)
+            event_fields = _parse_timeline_event_fields(query_params)
 
             timeline = timeline_use_case.construct_location_timeline(to_world_id(world_id), location_id_, **filters, **kwargs)
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(timeline)
+            return HTTPStatus.OK, stream_json_array(_timeline_to_json(timeline, event_fields))
 
 
 class TravelersRestRequestHandler:
@@ -214,21 +365,14 @@ class TravelersRestRequestHandler:
     def register_routes(rest_controller: RESTController, traveler_use_case: TravelerUseCase, timeline_use_case: TimelineUseCase) -> None:
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/traveler", RESTMethod.POST, MIMEType.JSON, json=True)
         def travelers_post_handler(request_body: dict, *, world_id: str, **kwargs) -> HandlerResult:
-            traveler_kwargs = {
-                "name": JsonTranslator.from_json(request_body["name"], str),
-                "description": JsonTranslator.from_json(request_body.get("description", ""), str),
-                "journey": JsonTranslator.from_json(request_body["journey"], List[PositionalMove]),
-                "attributes": JsonTranslator.from_json(request_body.get("attributes", {}), Dict[str, JsonType]),
-                "tags": JsonTranslator.from_json(request_body.get("tags", []), Set[Tag]),
-            }
-            traveler = traveler_use_case.create(to_world_id(world_id), **traveler_kwargs, **kwargs)
+            traveler = traveler_use_case.create(to_world_id(world_id), **_parse_traveler_kwargs(request_body), **kwargs)
 
             return HTTPStatus.CREATED, JsonTranslator.to_json_str(traveler)
 
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/travelers", RESTMethod.GET, MIMEType.JSON, query_params=True)
         def travelers_get_all_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
             supported_filters = {"nameIs", "nameHas", "taggedAll", "taggedAny", "taggedOnly", "taggedNone", "journeyIntersects",
-                                 "journeyIncludes"}
+                                 "journeyIncludes", "explain", "limit", "cursor", "expand", "fields"}
             if not supported_filters.issuperset(query_params.keys()):
                 raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
             filters = {
@@ -242,17 +386,55 @@ class TravelersRestRequestHandler:
                 "journey_includes": parse_optional_position_query_param(query_params.get("journeyIncludes", None)),
             }
 
-            traveler_ids = [traveler.id for traveler in traveler_use_case.retrieve_all(to_world_id(world_id), **filters, **kwargs)]
+            return _filtered_page_response(
+                query_params, partial(traveler_use_case.retrieve_page_ids, to_world_id(world_id), **filters, **kwargs),
+                partial(traveler_use_case.plan_retrieve_all, to_world_id(world_id), **filters, **kwargs),
+                partial(traveler_use_case.retrieve_page, to_world_id(world_id), **filters, **kwargs))
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(traveler_ids)
+        @rest_controller.register_rest_endpoint(
+            "/api/world/<world_id>/travelers/batch-get", RESTMethod.POST, MIMEType.JSON, json=True, query_params=True
+        )
+        def travelers_batch_get_handler(
+                body_traveler_ids: List[str], query_params: Dict[str, str], *, world_id: str, **kwargs
+        ) -> HandlerResult:
+            if type(body_traveler_ids) is not list:
+                raise ValueError("Body must be a list of traveler ids")
+            traveler_ids = [_parse_traveler_id(traveler_id) for traveler_id in body_traveler_ids]
+            fields = _parse_entity_fields(query_params)
 
-        @rest_controller.register_rest_endpoint("/api/world/<world_id>/traveler/<traveler_id>", RESTMethod.GET, MIMEType.JSON)
-        def traveler_get_handler(*, world_id: str, traveler_id: str, **kwargs) -> HandlerResult:
+            travelers = traveler_use_case.retrieve_many(to_world_id(world_id), traveler_ids, **kwargs)
+
+            return HTTPStatus.OK, stream_json_array(travelers, fields=fields)
+
+        @rest_controller.register_rest_endpoint(
+            "/api/world/<world_id>/traveler/<traveler_id>", RESTMethod.GET, MIMEType.JSON, query_params=True
+        )
+        def traveler_get_handler(query_params: Dict[str, str], *, world_id: str, traveler_id: str, **kwargs) -> HandlerResult:
             traveler_id_ = _parse_traveler_id(traveler_id)
+            supported_filters = {"tolerance", "continuumFrom", "continuumTo", "fields"}
+            if not supported_filters.issuperset(query_params.keys()):
+                raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
+            tolerance = parse_optional_float_query_param(query_params.get("tolerance", None))
+            fields = parse_optional_fields_query_param(query_params.get("fields", None))
+
+            if fields is not None and "journey" not in fields:
+                # The journey is neither windowed nor simplified when it is not going to be returned
+                traveler = traveler_use_case.retrieve(to_world_id(world_id), traveler_id_, **kwargs)
+                return HTTPStatus.OK, JsonTranslator.to_json_str(traveler, fields=fields)
+
+            if "continuumFrom" in query_params or "continuumTo" in query_params:
+                traveler, journey_window = traveler_use_case.retrieve_with_journey_window(
+                    to_world_id(world_id), traveler_id_, tolerance=tolerance,
+                    continuum_from=parse_optional_float_query_param(query_params.get("continuumFrom", None)),
+                    continuum_to=parse_optional_float_query_param(query_params.get("continuumTo", None)), **kwargs)
+                # Only the moves in the window are translated, the rest of the journey is never serialized
+                traveler_json = JsonTranslator.to_json(traveler, omit={"journey"}, fields=fields)
+                traveler_json["journey"] = JsonTranslator.to_json(journey_window)
+                return HTTPStatus.OK, dumps(traveler_json, indent=2)
 
-            traveler = traveler_use_case.retrieve(to_world_id(world_id), traveler_id_, **kwargs)
+            traveler = traveler_use_case.retrieve(to_world_id(world_id), traveler_id_, tolerance=tolerance, **kwargs)
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(traveler)
+            return HTTPStatus.OK, JsonTranslator.to_json_str(traveler, fields=fields)
 
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/traveler/<traveler_id>", RESTMethod.DELETE, MIMEType.JSON)
         def traveler_delete_handler(*, world_id: str, traveler_id: str, **kwargs) -> HandlerResult:
@@ -289,15 +471,7 @@ class TravelersRestRequestHandler:
 
             new_positional_move = JsonTranslator.from_json(body_new_positional_move, PositionalMove)
 
-            existing_traveler = traveler_use_case.retrieve(to_world_id(world_id), traveler_id_, **kwargs)
-
-            appended_journey = deepcopy(existing_traveler.journey)
-            appended_journey.append(new_positional_move)
-            modified_traveler = Traveler(
-                id=existing_traveler.id, name=existing_traveler.name, description=existing_traveler.description,
-                journey=appended_journey, tags=existing_traveler.tags, attributes=existing_traveler.attributes)
-
-            traveler_use_case.update(to_world_id(world_id), modified_traveler, **kwargs)
+            modified_traveler = traveler_use_case.append_to_journey(to_world_id(world_id), traveler_id_, new_positional_move, **kwargs)
 
             return HTTPStatus.OK, JsonTranslator.to_json_str(modified_traveler)
 
@@ -307,19 +481,47 @@ class TravelersRestRequestHandler:
         def traveler_timeline_get_handler(query_params: Dict[str, str], *, world_id: str, traveler_id: str, **kwargs) -> HandlerResult:
             traveler_id = _parse_traveler_id(traveler_id)
 
-            supported_filters = {"taggedAll", "taggedAny", "taggedOnly", "taggedNone"}
+            query_params = dict(query_params)
+            tolerance = parse_optional_float_query_param(query_params.pop("tolerance", None))
+            filters = _parse_timeline_filters(query_params)
+            event_fields = _parse_timeline_event_fields(query_params)
+
+            timeline = timeline_use_case.construct_traveler_timeline(
+                to_world_id(world_id), traveler_id, tolerance=tolerance, **filters, **kwargs)
+
+            return HTTPStatus.OK, stream_json_array(_timeline_to_json(timeline, event_fields))
+
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/traveler/<traveler_id>/journey/stats", RESTMethod.GET, MIMEType.JSON)
+        def traveler_journey_stats_get_handler(*, world_id: str, traveler_id: str, **kwargs) -> HandlerResult:
+            traveler_id = _parse_traveler_id(traveler_id)
+
+            journey_stats = timeline_use_case.construct_journey_stats(to_world_id(world_id), traveler_id, **kwargs)
+
+            return HTTPStatus.OK, JsonTranslator.to_json_str(journey_stats)
+
+        @rest_controller.register_rest_endpoint(
+            "/api/world/<world_id>/traveler/<traveler_id>/position", RESTMethod.GET, MIMEType.JSON, query_params=True
+        )
+        def traveler_position_get_handler(query_params: Dict[str, str], *, world_id: str, traveler_id: str, **kwargs) -> HandlerResult:
+            traveler_id = _parse_traveler_id(traveler_id)
+
+            position = traveler_use_case.retrieve_position(
+                to_world_id(world_id), traveler_id, **_parse_continuum_and_reality(query_params), **kwargs)
+
+            return HTTPStatus.OK, JsonTranslator.to_json_str(position)
+
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/encounters", RESTMethod.GET, MIMEType.JSON, query_params=True)
+        def encounters_get_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
+            supported_filters = {"distance"}
             if not supported_filters.issuperset(query_params.keys()):
                 raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
-            filters = {
-                "tagged_all": parse_optional_tag_set_query_param(query_params.get("taggedAll", None)),
-                "tagged_any": parse_optional_tag_set_query_param(query_params.get("taggedAny", None)),
-                "tagged_only": parse_optional_tag_set_query_param(query_params.get("taggedOnly", None)),
-                "tagged_none": parse_optional_tag_set_query_param(query_params.get("taggedNone", None)),
-            }
+            if "distance" not in query_params:
+                raise ValueError("Query parameter 'distance' must be provided")
+            distance = parse_optional_float_query_param(query_params["distance"])
 
-            timeline = timeline_use_case.construct_traveler_timeline(to_world_id(world_id), traveler_id, **filters, **kwargs)
+            encounters = traveler_use_case.find_encounters(to_world_id(world_id), distance=distance, **kwargs)
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(timeline)
+            return HTTPStatus.OK, stream_json_array(encounters)
 
 
 class EventsRestRequestHandler:
@@ -330,23 +532,15 @@ class EventsRestRequestHandler:
     def register_routes(rest_controller: RESTController, event_use_case: EventUseCase) -> None:
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/event", RESTMethod.POST, MIMEType.JSON, json=True)
         def events_post_handler(request_body: dict, *, world_id: str, **kwargs) -> HandlerResult:
-            event_kwargs = {
-                "name": JsonTranslator.from_json(request_body["name"], str),
-                "description": JsonTranslator.from_json(request_body.get("description", ""), str),
-                "span": JsonTranslator.from_json(request_body["span"], PositionalRange),
-                "attributes": JsonTranslator.from_json(request_body.get("attributes", {}), Dict[str, JsonType]),
-                "tags": JsonTranslator.from_json(request_body.get("tags", []), Set[Tag]),
-                "affected_locations": JsonTranslator.from_json(request_body["affected_locations"], Set[PrefixedUUID]),
-                "affected_travelers": JsonTranslator.from_json(request_body["affected_travelers"], Set[PrefixedUUID]),
-            }
-            event = event_use_case.create(to_world_id(world_id), **event_kwargs, **kwargs)
+            event = event_use_case.create(to_world_id(world_id), **_parse_event_kwargs(request_body), **kwargs)
 
             return HTTPStatus.CREATED, JsonTranslator.to_json_str(event)
 
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/events", RESTMethod.GET, MIMEType.JSON, query_params=True)
         def events_get_all_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
             supported_filters = {
-                "nameIs", "nameHas", "taggedAll", "taggedAny", "taggedOnly", "taggedNone", "spanIncludes", "spanIntersects"
+                "nameIs", "nameHas", "taggedAll", "taggedAny", "taggedOnly", "taggedNone", "spanIncludes", "spanIntersects",
+                "explain", "limit", "cursor", "expand", "fields",
             }
             if not supported_filters.issuperset(query_params.keys()):
                 raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
@@ -361,17 +555,34 @@ class EventsRestRequestHandler:
                 "span_intersects": parse_optional_positional_range_query_param(query_params.get("spanIntersects", None)),
             }
 
-            event_ids = [event.id for event in event_use_case.retrieve_all(to_world_id(world_id), **filters, **kwargs)]
+            return _filtered_page_response(
+                query_params, partial(event_use_case.retrieve_page_ids, to_world_id(world_id), **filters, **kwargs),
+                partial(event_use_case.plan_retrieve_all, to_world_id(world_id), **filters, **kwargs),
+                partial(event_use_case.retrieve_page, to_world_id(world_id), **filters, **kwargs))
+
+        @rest_controller.register_rest_endpoint(
+            "/api/world/<world_id>/events/batch-get", RESTMethod.POST, MIMEType.JSON, json=True, query_params=True
+        )
+        def events_batch_get_handler(
+                body_event_ids: List[str], query_params: Dict[str, str], *, world_id: str, **kwargs
+        ) -> HandlerResult:
+            if type(body_event_ids) is not list:
+                raise ValueError("Body must be a list of event ids")
+            event_ids = [_parse_event_id(event_id) for event_id in body_event_ids]
+            fields = _parse_entity_fields(query_params)
+
+            events = event_use_case.retrieve_many(to_world_id(world_id), event_ids, **kwargs)
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(event_ids)
+            return HTTPStatus.OK, stream_json_array(events, fields=fields)
 
-        @rest_controller.register_rest_endpoint("/api/world/<world_id>/event/<event_id>", RESTMethod.GET, MIMEType.JSON)
-        def event_get_handler(*, world_id: str, event_id: str, **kwargs) -> HandlerResult:
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/event/<event_id>", RESTMethod.GET, MIMEType.JSON, query_params=True)
+        def event_get_handler(query_params: Dict[str, str], *, world_id: str, event_id: str, **kwargs) -> HandlerResult:
             event_id_ = _parse_event_id(event_id)
+            fields = _parse_entity_fields(query_params)
 
             event = event_use_case.retrieve(to_world_id(world_id), event_id_, **kwargs)
 
-            return HTTPStatus.OK, JsonTranslator.to_json_str(event)
+            return HTTPStatus.OK, JsonTranslator.to_json_str(event, fields=fields)
 
         @rest_controller.register_rest_endpoint("/api/world/<world_id>/event/<event_id>", RESTMethod.DELETE, MIMEType.JSON)
         def event_delete_handler(*, world_id: str, event_id: str, **kwargs) -> HandlerResult:
@@ -397,3 +608,73 @@ class EventsRestRequestHandler:
             event_use_case.update(to_world_id(world_id), modified_event, **kwargs)
 
             return HTTPStatus.OK, JsonTranslator.to_json_str(modified_event)
+
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/event-overlaps", RESTMethod.GET, MIMEType.JSON, query_params=True)
+        def event_overlaps_get_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
+            supported_filters = {"sharingTraveler"}
+            if not supported_filters.issuperset(query_params.keys()):
+                raise ValueError(f"Unsupported filter(s): {', '.join(query_params.keys() - supported_filters)}")
+            sharing_traveler = parse_optional_bool_query_param(query_params.get("sharingTraveler", None))
+
+            overlaps = event_use_case.find_overlaps(to_world_id(world_id), sharing_traveler=sharing_traveler, **kwargs)
+
+            return HTTPStatus.OK, stream_json_array(overlaps)
+
+
+class TimelinesRestRequestHandler:
+    @staticmethod
+    def register_routes(rest_controller: RESTController, timeline_use_case: TimelineUseCase) -> None:
+        @rest_controller.register_rest_endpoint(
+            "/api/world/<world_id>/timelines", RESTMethod.POST, MIMEType.JSON, json=True, query_params=True
+        )
+        def timelines_post_handler(request_body: dict, query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
+            location_ids = JsonTranslator.from_json(request_body.get("locations", []), List[PrefixedUUID])
+            traveler_ids = JsonTranslator.from_json(request_body.get("travelers", []), List[PrefixedUUID])
+            filters = _parse_timeline_filters(query_params)
+            event_fields = _parse_timeline_event_fields(query_params)
+
+            timelines = timeline_use_case.construct_timelines(
+                to_world_id(world_id), location_ids=location_ids, traveler_ids=traveler_ids, **filters, **kwargs)
+
+            return HTTPStatus.OK, stream_json_array(
+                {"id": subject_id, "timeline": list(_timeline_to_json(timeline, event_fields))}
+                for subject_id, timeline in timelines.items())
+
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/snapshot", RESTMethod.GET, MIMEType.JSON, query_params=True)
+        def snapshot_get_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
+            snapshot = timeline_use_case.construct_snapshot(to_world_id(world_id), **_parse_continuum_and_reality(query_params), **kwargs)
+
+            return HTTPStatus.OK, JsonTranslator.to_json_str(snapshot)
+
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/here", RESTMethod.GET, MIMEType.JSON, query_params=True)
+        def here_get_handler(query_params: Dict[str, str], *, world_id: str, **kwargs) -> HandlerResult:
+            if set(query_params.keys()) != {"position"}:
+                raise ValueError("Query parameter 'position' must be provided, and no others")
+            position = parse_optional_position_query_param(query_params["position"])
+
+            entities = timeline_use_case.retrieve_entities_at(to_world_id(world_id), position, **kwargs)
+
+            return HTTPStatus.OK, JsonTranslator.to_json_str(entities)
+
+
+class TransfersRestRequestHandler:
+    @staticmethod
+    def register_routes(rest_controller: RESTController, transfer_use_case: TransferUseCase) -> None:
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/import", RESTMethod.POST, MIMEType.JSON, lines=True)
+        def import_post_handler(body_lines: Iterator[str], *, world_id: str, **kwargs) -> HandlerResult:
+            # Lines are only read and parsed as the import reaches them
+            entity_parsers = (partial(_parse_import_line, line) if line.strip() else None for line in body_lines)
+
+            import_report = transfer_use_case.import_entities(to_world_id(world_id), entity_parsers, **kwargs)
+
+            return HTTPStatus.OK, JsonTranslator.to_json_str(import_report)
+
+        @rest_controller.register_rest_endpoint("/api/world/<world_id>/export", RESTMethod.GET, MIMEType.GZIP)
+        def export_get_handler(*, world_id: str, **kwargs) -> HandlerResult:
+            exported_entities = transfer_use_case.export_entities(to_world_id(world_id), **kwargs)
+
+            # One line per entity, in the same form the import route reads
+            export_lines = (
+                dumps({"type": entity_type, **JsonTranslator.to_json(entity)}) + "\n" for entity_type, entity in exported_entities)
+            headers = {"Content-Disposition": f"attachment; filename={world_id}.ndjson.gz"}
+            return HTTPStatus.OK, stream_gzip(export_lines), headers
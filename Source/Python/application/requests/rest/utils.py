@@ -1,13 +1,17 @@
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from binascii import Error as BinasciiError
 from http import HTTPStatus
 from json import loads, dumps
 from logging import exception
-from typing import Union, Optional, Set
+from typing import Union, Optional, Set, Iterable, Iterator, Any
+from zlib import compressobj
 
 from jsonpatch import InvalidJsonPatch, JsonPatchTestFailed, JsonPatchConflict
 
 from application.access.errors import AuthError
 from application.requests.data_forms import JsonTranslator
 from application.requests.rest import RequestHandler, HandlerResult
+from domain.ids import PrefixedUUID
 from domain.positions import PositionalRange, Position
 from domain.tags import Tag
 
@@ -16,12 +20,99 @@ def error_response(message: Union[str, BaseException], status_code: int) -> Hand
     return status_code, dumps({"error": str(message)})
 
 
+def stream_json_array(items: Iterable[Any], *, fields: Set[str] = None) -> Iterator[str]:
+    # Translates one item at a time so the full array never has to be held as a single string
+    yield "["
+    separator = "\n"
+    for item in items:
+        yield separator + JsonTranslator.to_json_str(item, fields=fields)
+        separator = ",\n"
+    yield "\n]"
+
+
+def stream_gzip(chunks: Iterable[str]) -> Iterator[bytes]:
+    # Compresses one chunk at a time, only the compressor's window is held rather than the whole body
+    compressor = compressobj(wbits=31)  # 31 selects the gzip container
+    for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk.encode("utf8"))
+        if compressed_chunk:
+            yield compressed_chunk
+    yield compressor.flush()
+
+
 def parse_optional_tag_set_query_param(tags_query_param: Optional[str]) -> Optional[Set[Tag]]:
     if tags_query_param is None:
         return None
     return {JsonTranslator.from_json(tag_str, Tag) for tag_str in tags_query_param.split(",") if len(tag_str) > 0}
 
 
+def parse_optional_float_query_param(float_query_param: Optional[str]) -> Optional[float]:
+    if float_query_param is None:
+        return None
+    return JsonTranslator.from_json(float(float_query_param), float)
+
+
+def parse_optional_int_query_param(int_query_param: Optional[str]) -> Optional[int]:
+    if int_query_param is None:
+        return None
+    return JsonTranslator.from_json(int(int_query_param), int)
+
+
+def parse_optional_int_set_query_param(ints_query_param: Optional[str]) -> Optional[Set[int]]:
+    if ints_query_param is None:
+        return None
+    return {JsonTranslator.from_json(int(int_str), int) for int_str in ints_query_param.split(",") if len(int_str) > 0}
+
+
+def parse_optional_bool_query_param(bool_query_param: Optional[str]) -> bool:
+    if bool_query_param is None:
+        return False
+    if bool_query_param.lower() not in {"true", "false"}:
+        raise ValueError(f"Expected 'true' or 'false' but was '{bool_query_param}'")
+    return bool_query_param.lower() == "true"
+
+
+def parse_optional_limit_query_param(limit_query_param: Optional[str]) -> Optional[int]:
+    if limit_query_param is None:
+        return None
+    limit = int(limit_query_param)
+    if limit < 1:
+        raise ValueError(f"Limit must be a positive integer but was '{limit_query_param}'")
+    return limit
+
+
+def parse_optional_expand_query_param(expand_query_param: Optional[str], supported_expansions: Set[str]) -> Set[str]:
+    if expand_query_param is None:
+        return set()
+    expansions = {expansion for expansion in expand_query_param.split(",") if len(expansion) > 0}
+    if not supported_expansions.issuperset(expansions):
+        raise ValueError(f"Unsupported expansion(s): {', '.join(sorted(expansions - supported_expansions))}")
+    return expansions
+
+
+def parse_optional_fields_query_param(fields_query_param: Optional[str]) -> Optional[Set[str]]:
+    if fields_query_param is None:
+        return None
+    fields = {field for field in fields_query_param.split(",") if len(field) > 0}
+    if not fields:
+        raise ValueError("At least one field must be requested")
+    return fields
+
+
+def encode_cursor(last_entity_id: PrefixedUUID) -> str:
+    return urlsafe_b64encode(str(last_entity_id).encode("utf8")).decode("ascii")
+
+
+def parse_optional_cursor_query_param(cursor_query_param: Optional[str]) -> Optional[PrefixedUUID]:
+    if cursor_query_param is None:
+        return None
+    try:
+        last_entity_id_str = urlsafe_b64decode(cursor_query_param.encode("ascii")).decode("utf8")
+    except (BinasciiError, UnicodeError):
+        raise ValueError(f"Invalid cursor '{cursor_query_param}'")
+    return JsonTranslator.from_json(last_entity_id_str, PrefixedUUID)
+
+
 def parse_optional_positional_range_query_param(positional_range_query_param: Optional[str]) -> Optional[PositionalRange]:
     if positional_range_query_param is None:
         return None
@@ -1,10 +1,28 @@
-from typing import Set
+from typing import Set, List, Tuple, Optional, Callable
 
 from application.access.authentication import requires_authentication
-from application.use_case.filtering_use_cases import FilteringUseCase
+from application.use_case.filtering_use_cases import FilteringUseCase, FilterPlan, FilterResultCache
+from application.use_case.timeline_use_cases import MaterializedTimelines
 from domain.events import Event
 from domain.ids import PrefixedUUID, generate_prefixed_id
+from domain.locations import Location
+from domain.overlaps import EventOverlap, find_event_overlaps
 from domain.persistence.repositories import EventRepository, TravelerRepository, LocationRepository, WorldRepository
+from domain.travelers import Traveler
+
+
+def validate_affected_entities(
+        event: Event, retrieve_location: Callable[[PrefixedUUID], Location], retrieve_traveler: Callable[[PrefixedUUID], Traveler]
+) -> None:
+    for affected_location_id in event.affected_locations:
+        location = retrieve_location(affected_location_id)
+        if not location.span.intersects(event.span):
+            raise ValueError(f"Event's span does not intersect with {affected_location_id}'s span")
+
+    for affected_traveler_id in event.affected_travelers:
+        traveler = retrieve_traveler(affected_traveler_id)
+        if not any([event.span.includes(positional_move.position) for positional_move in traveler.journey]):
+            raise ValueError(f"Event's span does not intersect with {affected_traveler_id}'s journey")
 
 
 class EventUseCase:
@@ -12,14 +30,20 @@ class EventUseCase:
     _location_repository: LocationRepository
     _traveler_repository: TravelerRepository
     _event_repository: EventRepository
+    _filter_result_cache: FilterResultCache
+    _materialized_timelines: Optional[MaterializedTimelines]
 
     def __init__(
             self, world_repository: WorldRepository, location_repository: LocationRepository, traveler_repository: TravelerRepository,
-            event_repository: EventRepository) -> None:
+            event_repository: EventRepository, *, filter_result_cache: FilterResultCache = None,
+            materialized_timelines: MaterializedTimelines = None
+    ) -> None:
         self._world_repository = world_repository
         self._location_repository = location_repository
         self._traveler_repository = traveler_repository
         self._event_repository = event_repository
+        self._filter_result_cache = filter_result_cache if filter_result_cache is not None else FilterResultCache()
+        self._materialized_timelines = materialized_timelines
 
     @requires_authentication()
     def create(self, world_id: PrefixedUUID, **kwargs) -> Event:
@@ -27,9 +51,11 @@ class EventUseCase:
         kwargs["id"] = generate_prefixed_id("event")
 
         event = Event(**kwargs)
-        self._validate_affected_entities(event)
+        validate_affected_entities(event, self._location_repository.retrieve, self._traveler_repository.retrieve)
         self._event_repository.save(event)
         self._world_repository.associate(world_id, event_id=event.id)
+        self._filter_result_cache.bump_generation(world_id)
+        self._event_changed(None, event)
 
         return event
 
@@ -46,16 +72,46 @@ class EventUseCase:
 
     @requires_authentication()
     def retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> Set[Event]:
+        events, _ = self._retrieve_page(world_id, **kwargs)
+        return set(events)
+
+    @requires_authentication()
+    def retrieve_many(self, world_id: PrefixedUUID, event_ids: List[PrefixedUUID]) -> List[Event]:
+        # The world is validated and its events looked up once for all the ids rather than once per id
         self._validate_world_exists(world_id)
         associated_events = self._world_repository.get_all_associated(world_id, events=True)
-        all_events = {event for event in self._event_repository.retrieve_all() if event.id in associated_events}
-        name_filtered_events, kwargs = FilteringUseCase.filter_named_entities(all_events, **kwargs)
-        tag_filtered_events, kwargs = FilteringUseCase.filter_tagged_entities(name_filtered_events, **kwargs)
-        span_filtered_events, kwargs = FilteringUseCase.filter_spanning_entities(tag_filtered_events, **kwargs)
-        if kwargs:
-            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+        for event_id in event_ids:
+            if not event_id.prefix == "event":
+                raise ValueError("Argument 'event_ids' must only contain ids prefixed with 'event'")
+            if event_id not in associated_events:
+                raise NameError(f"No event '{event_id}' is exists for world '{world_id}'")
 
-        return span_filtered_events
+        return [self._event_repository.retrieve(event_id) for event_id in event_ids]
+
+    @requires_authentication()
+    def retrieve_page(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, **kwargs
+    ) -> Tuple[List[Event], bool]:
+        return self._retrieve_page(world_id, after=after, limit=limit, **kwargs)
+
+    @requires_authentication()
+    def retrieve_page_ids(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, **kwargs
+    ) -> Tuple[List[PrefixedUUID], bool]:
+        return self._retrieve_page_ids(world_id, after=after, limit=limit, **kwargs)
+
+    @requires_authentication()
+    def plan_retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> FilterPlan[Event]:
+        return self._plan_retrieve_all(world_id, **kwargs)
+
+    @requires_authentication()
+    def find_overlaps(self, world_id: PrefixedUUID, *, sharing_traveler: bool = False) -> List[EventOverlap]:
+        self._validate_world_exists(world_id)
+        # Associations outlive deleted events, only the ones still stored are considered
+        event_ids = self._world_repository.get_all_associated(world_id, events=True) & self._event_repository.retrieve_ids()
+
+        return find_event_overlaps(
+            [self._event_repository.retrieve(event_id) for event_id in event_ids], sharing_traveler=sharing_traveler)
 
     @requires_authentication()
     def update(self, world_id: PrefixedUUID, event: Event) -> None:
@@ -64,10 +120,12 @@ class EventUseCase:
         if event.id not in associated_events:
             raise NameError(f"No event '{event.id}' is exists for world '{world_id}'")
 
-        self._event_repository.retrieve(event.id)
-        self._validate_affected_entities(event)
+        previous_event = self._event_repository.retrieve(event.id)
+        validate_affected_entities(event, self._location_repository.retrieve, self._traveler_repository.retrieve)
 
         self._event_repository.save(event)
+        self._filter_result_cache.bump_generation(world_id)
+        self._event_changed(previous_event, event)
 
     @requires_authentication()
     def delete(self, world_id: PrefixedUUID, event_id: PrefixedUUID) -> None:
@@ -78,20 +136,52 @@ class EventUseCase:
         if event_id not in associated_events:
             raise NameError(f"No event '{event_id}' is exists for world '{world_id}'")
 
-        return self._event_repository.delete(event_id)
+        previous_event = self._event_repository.retrieve(event_id)
+        self._event_repository.delete(event_id)
+        self._filter_result_cache.bump_generation(world_id)
+        self._event_changed(previous_event, None)
+
+    def _retrieve_page_ids(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, plan: FilterPlan[Event] = None, **kwargs
+    ) -> Tuple[List[PrefixedUUID], bool]:
+        self._validate_world_exists(world_id)
+        event_ids, has_more = self._filter_result_cache.retrieve(
+            world_id, "event", {"after": after, "limit": limit, **kwargs},
+            lambda: (plan if plan is not None else self._plan_retrieve_all(world_id, **kwargs)).execute_page_ids(after=after, limit=limit))
+        return list(event_ids), has_more
+
+    def _retrieve_page(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, plan: FilterPlan[Event] = None, **kwargs
+    ) -> Tuple[List[Event], bool]:
+        # Each event is loaded once, either while checking the filters or from the page's cached ids
+        self._validate_world_exists(world_id)
+        return self._filter_result_cache.retrieve_page(
+            world_id, "event", {"after": after, "limit": limit, **kwargs},
+            lambda: (plan if plan is not None else self._plan_retrieve_all(world_id, **kwargs)).execute_page(after=after, limit=limit),
+            self._event_repository.retrieve)
+
+    def _plan_retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> FilterPlan[Event]:
+        self._validate_world_exists(world_id)
+        associated_events = self._world_repository.get_all_associated(world_id, events=True)
+        name_filters, kwargs = FilteringUseCase.extract_name_filters(**kwargs)
+        tag_filters, kwargs = FilteringUseCase.extract_tag_filters(**kwargs)
+        span_filters, kwargs = FilteringUseCase.extract_span_filters(**kwargs)
+        if kwargs:
+            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+
+        predicates = [
+            FilteringUseCase.indexed_predicate("name", FilteringUseCase.matches_name_filters, self._event_repository, name_filters),
+            FilteringUseCase.indexed_predicate("tags", FilteringUseCase.matches_tag_filters, self._event_repository, tag_filters),
+            FilteringUseCase.unindexed_predicate("span", FilteringUseCase.matches_span_filters, span_filters),
+        ]
+        return FilterPlan(
+            associated_events, predicates, retrieve=self._event_repository.retrieve, retrieve_all_ids=self._event_repository.retrieve_ids)
+
+    def _event_changed(self, previous_event: Optional[Event], event: Optional[Event]) -> None:
+        if self._materialized_timelines is not None:
+            self._materialized_timelines.event_changed(previous_event, event)
 
     def _validate_world_exists(self, world_id: PrefixedUUID) -> None:
         if not world_id.prefix == "world":
             raise ValueError("Argument 'world_id' must be prefixed with 'world'")
         self._world_repository.retrieve(world_id)
-
-    def _validate_affected_entities(self, event: Event) -> None:
-        for affected_location_id in event.affected_locations:
-            location = self._location_repository.retrieve(affected_location_id)
-            if not location.span.intersects(event.span):
-                raise ValueError(f"Event's span does not intersect with {affected_location_id}'s span")
-
-        for affected_traveler_id in event.affected_travelers:
-            traveler = self._traveler_repository.retrieve(affected_traveler_id)
-            if not any([event.span.includes(positional_move.position) for positional_move in traveler.journey]):
-                raise ValueError(f"Event's span does not intersect with {affected_traveler_id}'s journey")
@@ -1,75 +1,284 @@
-from typing import Set, Tuple, TypeVar, List
+from collections import OrderedDict, defaultdict
+from itertools import islice
+from threading import Lock
+from typing import Set, Tuple, TypeVar, List, Callable, Optional, Generic, Iterator, Any, Dict
 
 from domain.descriptors import NamedEntity
+from domain.ids import PrefixedUUID
 from domain.positions import Position, PositionalRange, SpanningEntity, JourneyingEntity, PositionalMove
 from domain.tags import TaggedEntity, Tag
 
 
+T = TypeVar("T")
 T_NE = TypeVar("T_NE", bound=NamedEntity)
 T_TE = TypeVar("T_TE", bound=TaggedEntity)
 T_SE = TypeVar("T_SE", bound=SpanningEntity)
 T_JE = TypeVar("T_JE", bound=JourneyingEntity)
 
 
+class FilterPredicate:
+    name: str
+    matches: Callable[[Any], bool]
+    _estimate_count: Optional[Callable[[], int]]
+    _retrieve_ids: Optional[Callable[[], Set[PrefixedUUID]]]
+
+    def __init__(
+            self, name: str, matches: Callable[[Any], bool],
+            *, estimate_count: Callable[[], int] = None, retrieve_ids: Callable[[], Set[PrefixedUUID]] = None
+    ) -> None:
+        if (estimate_count is None) != (retrieve_ids is None):
+            raise ValueError("An indexed predicate must provide both 'estimate_count' and 'retrieve_ids'")
+        self.name = name
+        self.matches = matches
+        self._estimate_count = estimate_count
+        self._retrieve_ids = retrieve_ids
+
+    @property
+    def is_indexed(self) -> bool:
+        return self._retrieve_ids is not None
+
+    def estimate_count(self) -> int:
+        return self._estimate_count()
+
+    def retrieve_ids(self) -> Set[PrefixedUUID]:
+        return self._retrieve_ids()
+
+
+class FilterPlan(Generic[T]):
+    _scope_ids: Optional[Set[PrefixedUUID]]
+    _driver: Optional[FilterPredicate]
+    _driver_estimate: int
+    _residuals: List[FilterPredicate]
+    _retrieve: Callable[[PrefixedUUID], T]
+    _retrieve_all_ids: Callable[[], Set[PrefixedUUID]]
+    _executed: bool
+
+    def __init__(
+            self, scope_ids: Optional[Set[PrefixedUUID]], predicates: List[Optional[FilterPredicate]],
+            *, retrieve: Callable[[PrefixedUUID], T], retrieve_all_ids: Callable[[], Set[PrefixedUUID]]
+    ) -> None:
+        # The most selective indexed predicate produces the candidates, unless the scope is already smaller than its estimate. Everything
+        # else is checked per candidate, cheapest-to-fail first: indexed predicates by estimate, then the geometric ones.
+        predicates = [predicate for predicate in predicates if predicate is not None]
+        estimates = {predicate.name: predicate.estimate_count() for predicate in predicates if predicate.is_indexed}
+        indexed = sorted((predicate for predicate in predicates if predicate.is_indexed), key=lambda predicate: estimates[predicate.name])
+        unindexed = [predicate for predicate in predicates if not predicate.is_indexed]
+
+        self._driver = None
+        self._driver_estimate = len(scope_ids) if scope_ids is not None else -1
+        if indexed and (scope_ids is None or estimates[indexed[0].name] < len(scope_ids)):
+            self._driver = indexed.pop(0)
+            self._driver_estimate = estimates[self._driver.name]
+        self._scope_ids = scope_ids
+        self._residuals = indexed + unindexed
+        self._retrieve = retrieve
+        self._retrieve_all_ids = retrieve_all_ids
+        self._executed = False
+
+    @property
+    def executed(self) -> bool:
+        return self._executed
+
+    def execute(self, *, after: PrefixedUUID = None) -> Iterator[T]:
+        for entity_id in self._candidate_ids(after):
+            entity = self._retrieve(entity_id)
+            if all(predicate.matches(entity) for predicate in self._residuals):
+                yield entity
+
+    def execute_ids(self, *, after: PrefixedUUID = None) -> Iterator[PrefixedUUID]:
+        # Without residual predicates every candidate matches, so none need loading
+        if not self._residuals:
+            yield from self._candidate_ids(after)
+        else:
+            yield from (entity.id for entity in self.execute(after=after))
+
+    def execute_page(self, *, after: PrefixedUUID = None, limit: int = None) -> Tuple[List[T], bool]:
+        return _page(self.execute(after=after), limit)
+
+    def execute_page_ids(self, *, after: PrefixedUUID = None, limit: int = None) -> Tuple[List[PrefixedUUID], bool]:
+        return _page(self.execute_ids(after=after), limit)
+
+    def _candidate_ids(self, after: Optional[PrefixedUUID]) -> List[PrefixedUUID]:
+        self._executed = True
+        candidate_ids = self._driver.retrieve_ids() if self._driver is not None else self._retrieve_all_ids()
+        if self._scope_ids is not None:
+            candidate_ids = candidate_ids & self._scope_ids
+        # Candidates are ordered by id before any are loaded, so a page can resume after the last id of the previous one and stops loading
+        # once the caller has enough
+        if after is not None:
+            candidate_ids = {entity_id for entity_id in candidate_ids if str(entity_id) > str(after)}
+        return sorted(candidate_ids, key=str)
+
+    def __str__(self) -> str:
+        steps = [f"index={self._driver.name}~{self._driver_estimate}" if self._driver is not None else "scan"]
+        if self._scope_ids is not None:
+            steps.append(f"scope={len(self._scope_ids)}")
+        if self._residuals:
+            steps.append(f"filter={','.join(predicate.name for predicate in self._residuals)}")
+        return ";".join(steps)
+
+
+def _page(items: Iterator[T], limit: Optional[int]) -> Tuple[List[T], bool]:
+    # One past the limit reveals whether another page follows
+    page = list(islice(items, limit + 1 if limit is not None else None))
+    if limit is not None and len(page) > limit:
+        return page[:limit], True
+    return page, False
+
+
+class FilterResultCache:
+    _lock: Lock
+    _max_entries: int
+    _generations: Dict[Optional[PrefixedUUID], int]
+    _results: "OrderedDict[tuple, Any]"
+
+    def __init__(self, *, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("Argument 'max_entries' must be positive")
+        self._lock = Lock()
+        self._max_entries = max_entries
+        self._generations = defaultdict(int)
+        self._results = OrderedDict()
+
+    def bump_generation(self, world_id: Optional[PrefixedUUID]) -> None:
+        with self._lock:
+            self._generations[world_id] += 1
+            for key in [key for key in self._results if key[0] == world_id]:
+                self._results.pop(key)
+
+    def retrieve(self, world_id: Optional[PrefixedUUID], entity_type: str, filters: Dict[str, Any], compute: Callable[[], T]) -> T:
+        # The generation is read before computing, so a result raced by a write is stored under a generation that is already stale
+        key = self._key(world_id, entity_type, filters)
+        if key is None:
+            return compute()
+        found, result = self._lookup(key)
+        if found:
+            return result
+
+        result = compute()
+        self._store(key, result)
+        return result
+
+    def retrieve_page(
+            self, world_id: Optional[PrefixedUUID], entity_type: str, filters: Dict[str, Any],
+            compute_page: Callable[[], Tuple[List[T], bool]], retrieve: Callable[[PrefixedUUID], T]
+    ) -> Tuple[List[T], bool]:
+        # Only the ids of a computed page are kept, shared with retrieve under the same filters. A computed page is returned as loaded,
+        # only a cached one has its entities retrieved.
+        key = self._key(world_id, entity_type, filters)
+        if key is None:
+            return compute_page()
+        found, result = self._lookup(key)
+        if found:
+            entity_ids, has_more = result
+            return [retrieve(entity_id) for entity_id in entity_ids], has_more
+
+        entities, has_more = compute_page()
+        self._store(key, ([entity.id for entity in entities], has_more))
+        return entities, has_more
+
+    def _key(self, world_id: Optional[PrefixedUUID], entity_type: str, filters: Dict[str, Any]) -> Optional[tuple]:
+        normalized_filters = tuple(sorted(
+            (name, frozenset(value) if isinstance(value, set) else value) for name, value in filters.items() if value is not None
+        ))
+        try:
+            hash(normalized_filters)
+        except TypeError:
+            return None
+        with self._lock:
+            return world_id, entity_type, self._generations[world_id], normalized_filters
+
+    def _lookup(self, key: tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            if key not in self._results:
+                return False, None
+            self._results.move_to_end(key)
+            return True, self._results[key]
+
+    def _store(self, key: tuple, result: Any) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+
+
 class FilteringUseCase:
     @staticmethod
-    def filter_named_entities(
-            named_entities: Set[T_NE], *, name_is: str = None, name_has: str = None, **kwargs
-    ) -> Tuple[Set[T_NE], dict]:
-        def matches_filters(entity: T_NE) -> bool:
-            name: str = entity.name
-            if name_is is not None and name_is.lower() != name.lower():
-                return False
-            if name_has is not None and name_has.lower() not in name.lower():
-                return False
-            return True
-
-        return {entity for entity in named_entities if matches_filters(entity)}, kwargs
+    def matches_name_filters(entity: T_NE, *, name_is: str = None, name_has: str = None) -> bool:
+        name: str = entity.name
+        if name_is is not None and name_is.lower() != name.lower():
+            return False
+        if name_has is not None and name_has.lower() not in name.lower():
+            return False
+        return True
+
+    @staticmethod
+    def matches_tag_filters(
+            entity: T_TE, *, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None,
+            tagged_none: Set[Tag] = None
+    ) -> bool:
+        if tagged_all is not None and not tagged_all.issubset(entity.tags):
+            return False
+        if tagged_any is not None and not tagged_any.intersection(entity.tags):
+            return False
+        if tagged_only is not None and not tagged_only.issuperset(entity.tags):
+            return False
+        if tagged_none is not None and not tagged_none.isdisjoint(entity.tags):
+            return False
+        return True
 
     @staticmethod
-    def filter_tagged_entities(
-            tagged_entities: Set[T_TE],
+    def matches_span_filters(entity: T_SE, *, span_includes: Position = None, span_intersects: PositionalRange = None) -> bool:
+        entity_span: PositionalRange = entity.span
+        if span_includes is not None and not entity_span.includes(span_includes):
+            return False
+        if span_intersects is not None and not entity_span.intersects(span_intersects):
+            return False
+        return True
+
+    @staticmethod
+    def matches_journey_filters(entity: T_JE, *, journey_includes: Position = None, journey_intersects: PositionalRange = None) -> bool:
+        entity_journey: List[PositionalMove] = entity.journey
+        if journey_includes is not None and not any(positional_move.position == journey_includes for positional_move in entity_journey):
+            return False
+        if journey_intersects is not None \
+                and not any(journey_intersects.intersects_path(start, end) for start, end in entity.journey_paths):
+            return False
+        return True
+
+    @staticmethod
+    def extract_name_filters(*, name_is: str = None, name_has: str = None, **kwargs) -> Tuple[dict, dict]:
+        return {"name_is": name_is, "name_has": name_has}, kwargs
+
+    @staticmethod
+    def extract_tag_filters(
             *, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None,
             **kwargs
-    ) -> Tuple[Set[T_TE], dict]:
-        def matches_filters(entity: T_TE) -> bool:
-            if tagged_all is not None and not tagged_all.issubset(entity.tags):
-                return False
-            if tagged_any is not None and not tagged_any.intersection(entity.tags):
-                return False
-            if tagged_only is not None and not tagged_only.issuperset(entity.tags):
-                return False
-            if tagged_none is not None and not tagged_none.isdisjoint(entity.tags):
-                return False
-            return True
-
-        return {entity for entity in tagged_entities if matches_filters(entity)}, kwargs
+    ) -> Tuple[dict, dict]:
+        tag_filters = {"tagged_all": tagged_all, "tagged_any": tagged_any, "tagged_only": tagged_only, "tagged_none": tagged_none}
+        return tag_filters, kwargs
+
+    @staticmethod
+    def extract_span_filters(*, span_includes: Position = None, span_intersects: PositionalRange = None, **kwargs) -> Tuple[dict, dict]:
+        return {"span_includes": span_includes, "span_intersects": span_intersects}, kwargs
+
+    @staticmethod
+    def extract_journey_filters(
+            *, journey_includes: Position = None, journey_intersects: PositionalRange = None, **kwargs
+    ) -> Tuple[dict, dict]:
+        return {"journey_includes": journey_includes, "journey_intersects": journey_intersects}, kwargs
 
     @staticmethod
-    def filter_spanning_entities(
-            spanning_entities: Set[T_SE], *, span_includes: Position = None, span_intersects: PositionalRange = None, **kwargs
-    ) -> Tuple[Set[T_SE], dict]:
-        def matches_filters(entity: T_SE) -> bool:
-            entity_span: PositionalRange = entity.span
-            if span_includes is not None and not entity_span.includes(span_includes):
-                return False
-            if span_intersects is not None and not entity_span.intersects(span_intersects):
-                return False
-            return True
-
-        return {entity for entity in spanning_entities if matches_filters(entity)}, kwargs
+    def indexed_predicate(name: str, matches: Callable[..., bool], repository: Any, filters: dict) -> Optional[FilterPredicate]:
+        if all(value is None for value in filters.values()):
+            return None
+        return FilterPredicate(
+            name, lambda entity: matches(entity, **filters),
+            estimate_count=lambda: repository.estimate_count(**filters), retrieve_ids=lambda: repository.retrieve_ids(**filters))
 
     @staticmethod
-    def filter_journeying_entities(
-            journeying_entities: Set[T_JE], *, journey_includes: Position = None, journey_intersects: PositionalRange = None, **kwargs
-    ) -> Tuple[Set[T_SE], dict]:
-        def matches_filters(entity: T_JE) -> bool:
-            entity_journey: List[PositionalMove] = entity.journey
-            if journey_includes is not None and not any(positional_move.position == journey_includes for positional_move in entity_journey):
-                return False
-            if journey_intersects is not None \
-                    and not any(journey_intersects.includes(positional_move.position) for positional_move in entity_journey):
-                return False
-            return True
-
-        return {entity for entity in journeying_entities if matches_filters(entity)}, kwargs
+    def unindexed_predicate(name: str, matches: Callable[..., bool], filters: dict) -> Optional[FilterPredicate]:
+        if all(value is None for value in filters.values()):
+            return None
+        return FilterPredicate(name, lambda entity: matches(entity, **filters))
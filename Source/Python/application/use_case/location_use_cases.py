@@ -1,7 +1,8 @@
-from typing import Set
+from typing import Set, List, Tuple, Optional
 
 from application.access.authentication import requires_authentication
-from application.use_case.filtering_use_cases import FilteringUseCase
+from application.use_case.filtering_use_cases import FilteringUseCase, FilterPlan, FilterResultCache
+from application.use_case.timeline_use_cases import MaterializedTimelines
 from domain.ids import PrefixedUUID, generate_prefixed_id
 from domain.locations import Location
 from domain.persistence.repositories import LocationRepository, EventRepository, WorldRepository
@@ -10,14 +11,19 @@ from domain.persistence.repositories import LocationRepository, EventRepository,
 class LocationUseCase:
     _world_repository: WorldRepository
     _location_repository: LocationRepository
+    _filter_result_cache: FilterResultCache
     _event_repository: EventRepository
+    _materialized_timelines: Optional[MaterializedTimelines]
 
     def __init__(
-            self, world_repository: WorldRepository, location_repository: LocationRepository, event_repository: EventRepository
+            self, world_repository: WorldRepository, location_repository: LocationRepository, event_repository: EventRepository,
+            *, filter_result_cache: FilterResultCache = None, materialized_timelines: MaterializedTimelines = None
     ) -> None:
         self._world_repository = world_repository
         self._location_repository = location_repository
         self._event_repository = event_repository
+        self._filter_result_cache = filter_result_cache if filter_result_cache is not None else FilterResultCache()
+        self._materialized_timelines = materialized_timelines
 
     @requires_authentication()
     def create(self, world_id: PrefixedUUID, **kwargs) -> Location:
@@ -27,6 +33,8 @@ class LocationUseCase:
 
         self._location_repository.save(location)
         self._world_repository.associate(world_id, location_id=location.id)
+        self._filter_result_cache.bump_generation(world_id)
+        self._locations_changed(world_id)
 
         return location
 
@@ -43,16 +51,37 @@ class LocationUseCase:
 
     @requires_authentication()
     def retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> Set[Location]:
+        locations, _ = self._retrieve_page(world_id, **kwargs)
+        return set(locations)
+
+    @requires_authentication()
+    def retrieve_many(self, world_id: PrefixedUUID, location_ids: List[PrefixedUUID]) -> List[Location]:
+        # The world is validated and its locations looked up once for all the ids rather than once per id
         self._validate_world_exists(world_id)
         associated_locations = self._world_repository.get_all_associated(world_id, locations=True)
-        all_locations = {location for location in self._location_repository.retrieve_all() if location.id in associated_locations}
-        name_filtered_locations, kwargs = FilteringUseCase.filter_named_entities(all_locations, **kwargs)
-        tag_filtered_locations, kwargs = FilteringUseCase.filter_tagged_entities(name_filtered_locations, **kwargs)
-        span_filtered_locations, kwargs = FilteringUseCase.filter_spanning_entities(tag_filtered_locations, **kwargs)
-        if kwargs:
-            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+        for location_id in location_ids:
+            if not location_id.prefix == "location":
+                raise ValueError("Argument 'location_ids' must only contain ids prefixed with 'location'")
+            if location_id not in associated_locations:
+                raise NameError(f"No location '{location_id}' is exists for world '{world_id}'")
+
+        return [self._location_repository.retrieve(location_id) for location_id in location_ids]
 
-        return span_filtered_locations
+    @requires_authentication()
+    def retrieve_page(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, **kwargs
+    ) -> Tuple[List[Location], bool]:
+        return self._retrieve_page(world_id, after=after, limit=limit, **kwargs)
+
+    @requires_authentication()
+    def retrieve_page_ids(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, **kwargs
+    ) -> Tuple[List[PrefixedUUID], bool]:
+        return self._retrieve_page_ids(world_id, after=after, limit=limit, **kwargs)
+
+    @requires_authentication()
+    def plan_retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> FilterPlan[Location]:
+        return self._plan_retrieve_all(world_id, **kwargs)
 
     @requires_authentication()
     def update(self, world_id: PrefixedUUID, location: Location) -> None:
@@ -65,6 +94,8 @@ class LocationUseCase:
         self._validate_linked_events_still_intersect_for_update(location)
 
         self._location_repository.save(location)
+        self._filter_result_cache.bump_generation(world_id)
+        self._locations_changed(world_id)
 
     @requires_authentication()
     def delete(self, world_id: PrefixedUUID, location_id: PrefixedUUID) -> None:
@@ -77,7 +108,50 @@ class LocationUseCase:
 
         self._validate_no_linked_events_for_delete(location_id)
 
-        return self._location_repository.delete(location_id)
+        self._location_repository.delete(location_id)
+        self._filter_result_cache.bump_generation(world_id)
+        self._locations_changed(world_id)
+
+    def _retrieve_page_ids(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, plan: FilterPlan[Location] = None, **kwargs
+    ) -> Tuple[List[PrefixedUUID], bool]:
+        self._validate_world_exists(world_id)
+        location_ids, has_more = self._filter_result_cache.retrieve(
+            world_id, "location", {"after": after, "limit": limit, **kwargs},
+            lambda: (plan if plan is not None else self._plan_retrieve_all(world_id, **kwargs)).execute_page_ids(after=after, limit=limit))
+        return list(location_ids), has_more
+
+    def _retrieve_page(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, plan: FilterPlan[Location] = None, **kwargs
+    ) -> Tuple[List[Location], bool]:
+        # Each location is loaded once, either while checking the filters or from the page's cached ids
+        self._validate_world_exists(world_id)
+        return self._filter_result_cache.retrieve_page(
+            world_id, "location", {"after": after, "limit": limit, **kwargs},
+            lambda: (plan if plan is not None else self._plan_retrieve_all(world_id, **kwargs)).execute_page(after=after, limit=limit),
+            self._location_repository.retrieve)
+
+    def _plan_retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> FilterPlan[Location]:
+        self._validate_world_exists(world_id)
+        associated_locations = self._world_repository.get_all_associated(world_id, locations=True)
+        name_filters, kwargs = FilteringUseCase.extract_name_filters(**kwargs)
+        tag_filters, kwargs = FilteringUseCase.extract_tag_filters(**kwargs)
+        span_filters, kwargs = FilteringUseCase.extract_span_filters(**kwargs)
+        if kwargs:
+            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+
+        predicates = [
+            FilteringUseCase.indexed_predicate("name", FilteringUseCase.matches_name_filters, self._location_repository, name_filters),
+            FilteringUseCase.indexed_predicate("tags", FilteringUseCase.matches_tag_filters, self._location_repository, tag_filters),
+            FilteringUseCase.unindexed_predicate("span", FilteringUseCase.matches_span_filters, span_filters),
+        ]
+        return FilterPlan(
+            associated_locations, predicates,
+            retrieve=self._location_repository.retrieve, retrieve_all_ids=self._location_repository.retrieve_ids)
+
+    def _locations_changed(self, world_id: PrefixedUUID) -> None:
+        if self._materialized_timelines is not None:
+            self._materialized_timelines.locations_changed(world_id)
 
     def _validate_world_exists(self, world_id: PrefixedUUID) -> None:
         if not world_id.prefix == "world":
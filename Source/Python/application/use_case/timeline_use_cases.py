@@ -1,12 +1,250 @@
-from typing import List, Union, Set
+from bisect import insort
+from collections import defaultdict
+from heapq import heappush, heappop
+from math import inf, isclose
+from sys import float_info
+from threading import Lock
+from typing import List, Union, Set, Tuple, Dict, Optional, Callable
 
 from application.access.authentication import requires_authentication
 from application.use_case.filtering_use_cases import FilteringUseCase
 from domain.collections import Range
 from domain.events import Event
 from domain.ids import PrefixedUUID
+from domain.journey_stats import JourneyStats, compute_journey_stats
 from domain.persistence.repositories import LocationRepository, EventRepository, TravelerRepository, WorldRepository
-from domain.positions import MovementType, PositionalMove
+from domain.locations import Location
+from domain.positions import MovementType, PositionalMove, Position, PositionalRange
+from domain.simplification import simplified_move_indices
+from domain.snapshots import Snapshot, take_snapshot
+from domain.travelers import Traveler
+
+
+_TimelineEntry = Tuple[Tuple[float, float, str], PrefixedUUID, Event]
+_MAX_CACHED_TOLERANCES_PER_TRAVELER = 8
+_POSITION_TOLERANCE = 1e-9
+
+
+def _timeline_entry(event: Event) -> _TimelineEntry:
+    # Events are listed by continuum, ties broken by id. The event itself is kept so timelines can list it in full without reading it again.
+    return (event.span.continuum.low, event.span.continuum.high, str(event.id)), event.id, event
+
+
+def _timeline_events(
+        entries: List[_TimelineEntry], event_ids: Optional[Set[PrefixedUUID]], expand_events: bool
+) -> List[Union[PrefixedUUID, Event]]:
+    return [event if expand_events else event_id for _, event_id, event in entries if event_ids is None or event_id in event_ids]
+
+
+def _events_including_each_move(journey: List[PositionalMove], events_in_continuum_order: List[Event]) -> List[Set[int]]:
+    # Sweep the moves in continuum order (journeys may jump backwards), keeping open only the events whose continuum covers the current
+    # move. Only those need their full span checked.
+    open_event_ends: List[Tuple[float, int]] = []
+    open_event_indices: Set[int] = set()
+    next_event_index = 0
+
+    applicable_per_move: List[Set[int]] = [set()] * len(journey)
+    for move_index in sorted(range(len(journey)), key=lambda index: journey[index].position.continuum):
+        position = journey[move_index].position
+        while next_event_index < len(events_in_continuum_order) \
+                and events_in_continuum_order[next_event_index].span.continuum.low <= position.continuum:
+            heappush(open_event_ends, (events_in_continuum_order[next_event_index].span.continuum.high, next_event_index))
+            open_event_indices.add(next_event_index)
+            next_event_index += 1
+        while open_event_ends and open_event_ends[0][0] < position.continuum:
+            _, event_index = heappop(open_event_ends)
+            open_event_indices.discard(event_index)
+        applicable_per_move[move_index] = {
+            event_index for event_index in open_event_indices if events_in_continuum_order[event_index].span.includes(position)
+        }
+    return applicable_per_move
+
+
+def _padded_range(value: float) -> Range[float]:
+    # Interpolated coordinates may be off by a rounding error, so a point is searched with a little room around it
+    padding = _POSITION_TOLERANCE * max(1., abs(value))
+    return Range(float(value) - padding, float(value) + padding)
+
+
+def _is_at(actual: Optional[Position], expected: Position) -> bool:
+    return actual is not None and all(
+        isclose(actual_value, expected_value, rel_tol=_POSITION_TOLERANCE, abs_tol=_POSITION_TOLERANCE)
+        for actual_value, expected_value in [(actual.latitude, expected.latitude), (actual.longitude, expected.longitude),
+                                             (actual.altitude, expected.altitude)]
+    )
+
+
+class _TravelerTimeline:
+    journey: List[PositionalMove]
+    _newly_applicable_per_move: List[List[_TimelineEntry]]
+    _move_indices_by_event_id: Dict[PrefixedUUID, List[int]]
+
+    def __init__(self, journey: List[PositionalMove], events: Set[Event]) -> None:
+        events_in_continuum_order = sorted(events, key=_timeline_entry)
+        self.journey = journey
+        self._newly_applicable_per_move = [[] for _ in journey]
+        self._move_indices_by_event_id = {}
+
+        previously_applicable: Set[int] = set()
+        for move_index, applicable in enumerate(_events_including_each_move(journey, events_in_continuum_order)):
+            # Events that were left and are re-entered count as newly applicable again
+            for event_index in sorted(applicable - previously_applicable):
+                event = events_in_continuum_order[event_index]
+                self._newly_applicable_per_move[move_index].append(_timeline_entry(event))
+                self._move_indices_by_event_id.setdefault(event.id, []).append(move_index)
+            previously_applicable = applicable
+
+    def add(self, event: Event) -> None:
+        self.remove(event.id)
+        entry = _timeline_entry(event)
+        previously_applicable = False
+        for move_index, positional_move in enumerate(self.journey):
+            applicable = event.span.includes(positional_move.position)
+            if applicable and not previously_applicable:
+                insort(self._newly_applicable_per_move[move_index], entry)
+                self._move_indices_by_event_id.setdefault(event.id, []).append(move_index)
+            previously_applicable = applicable
+
+    def remove(self, event_id: PrefixedUUID) -> None:
+        for move_index in self._move_indices_by_event_id.pop(event_id, []):
+            newly_applicable = self._newly_applicable_per_move[move_index]
+            newly_applicable[:] = [entry for entry in newly_applicable if entry[1] != event_id]
+
+    def render(
+            self, event_ids: Optional[Set[PrefixedUUID]], *, continuum_intersects: Range[float] = None, reality_intersects: Set[int] = None,
+            kept_move_indices: List[int] = None, expand_events: bool = False
+    ) -> List[Union[PrefixedUUID, Event, PositionalMove]]:
+        kept_move_indices = set(kept_move_indices) if kept_move_indices is not None else None
+        timeline: List[Union[PrefixedUUID, Event, PositionalMove]] = []
+        for move_index, (positional_move, newly_applicable) in enumerate(zip(self.journey, self._newly_applicable_per_move)):
+            position = positional_move.position
+            if continuum_intersects is not None and not continuum_intersects.low <= position.continuum <= continuum_intersects.high:
+                continue
+            if reality_intersects is not None and position.reality not in reality_intersects:
+                continue
+            newly_applicable_events = _timeline_events(newly_applicable, event_ids, expand_events)
+            if kept_move_indices is not None and move_index not in kept_move_indices:
+                # Moves dropped by simplification still list the events they made applicable
+                timeline.extend(newly_applicable_events)
+            elif positional_move.movement_type == MovementType.IMMEDIATE:
+                timeline.append(positional_move)
+                timeline.extend(newly_applicable_events)
+            else:
+                timeline.extend(newly_applicable_events)
+                timeline.append(positional_move)
+        return timeline
+
+
+class MaterializedTimelines:
+    _lock: Lock
+    _location_timelines: Dict[PrefixedUUID, List[_TimelineEntry]]
+    _traveler_timelines: Dict[PrefixedUUID, _TravelerTimeline]
+    _simplified_journeys: Dict[PrefixedUUID, Dict[float, List[int]]]
+    _journey_stats: Dict[PrefixedUUID, Tuple[Tuple[int, int], JourneyStats]]
+    _traveler_revisions: Dict[PrefixedUUID, int]
+    _location_generations: Dict[PrefixedUUID, int]
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._location_timelines = {}
+        self._traveler_timelines = {}
+        self._simplified_journeys = {}
+        self._journey_stats = {}
+        self._traveler_revisions = defaultdict(int)
+        self._location_generations = defaultdict(int)
+
+    def location_timeline(
+            self, location_id: PrefixedUUID, retrieve_events: Callable[[], Set[Event]], event_ids: Optional[Set[PrefixedUUID]],
+            expand_events: bool = False
+    ) -> List[Union[PrefixedUUID, Event]]:
+        # Timelines are built on first read while holding the lock, so a write that lands during the build is applied after it
+        with self._lock:
+            if location_id not in self._location_timelines:
+                self._location_timelines[location_id] = sorted(_timeline_entry(event) for event in retrieve_events())
+            return _timeline_events(self._location_timelines[location_id], event_ids, expand_events)
+
+    def traveler_revision(self, traveler_id: PrefixedUUID) -> int:
+        # Read before the traveler is, so that a write landing in between is noticed by the methods the revision is passed to
+        with self._lock:
+            return self._traveler_revisions.get(traveler_id, 0)
+
+    def traveler_timeline(
+            self, traveler: Traveler, revision: int, retrieve_events: Callable[[], Set[Event]], event_ids: Optional[Set[PrefixedUUID]],
+            kept_move_indices: List[int] = None, expand_events: bool = False
+    ) -> List[Union[PrefixedUUID, Event, PositionalMove]]:
+        # Kept until traveler_changed is notified of a write to the traveler. A traveler written since it was read is rendered as read
+        # without being kept.
+        with self._lock:
+            if revision != self._traveler_revisions.get(traveler.id, 0):
+                return _TravelerTimeline(traveler.journey, retrieve_events()).render(
+                    event_ids, kept_move_indices=kept_move_indices, expand_events=expand_events)
+            traveler_timeline = self._traveler_timelines.get(traveler.id)
+            if traveler_timeline is None:
+                traveler_timeline = _TravelerTimeline(traveler.journey, retrieve_events())
+                self._traveler_timelines[traveler.id] = traveler_timeline
+            return traveler_timeline.render(event_ids, kept_move_indices=kept_move_indices, expand_events=expand_events)
+
+    def simplified_move_indices(self, traveler: Traveler, revision: int, tolerance: float) -> List[int]:
+        # Only the most recently requested tolerances of each traveler are kept, until traveler_changed drops them. A traveler written
+        # since it was read is simplified as read without being kept.
+        with self._lock:
+            if revision != self._traveler_revisions.get(traveler.id, 0):
+                return simplified_move_indices(traveler.journey, tolerance)
+            indices_by_tolerance = self._simplified_journeys.setdefault(traveler.id, {})
+            if tolerance not in indices_by_tolerance:
+                kept_move_indices = simplified_move_indices(traveler.journey, tolerance)
+                if len(indices_by_tolerance) >= _MAX_CACHED_TOLERANCES_PER_TRAVELER:
+                    del indices_by_tolerance[next(iter(indices_by_tolerance))]
+                indices_by_tolerance[tolerance] = kept_move_indices
+            return indices_by_tolerance[tolerance]
+
+    def journey_stats(
+            self, world_id: PrefixedUUID, traveler: Traveler, revision: int, retrieve_locations: Callable[[], List[Location]]
+    ) -> JourneyStats:
+        # Kept until the traveler changes or any location of the world is written, the locations are only loaded to compute them. A
+        # traveler written since it was read is measured as read without being kept.
+        with self._lock:
+            if revision != self._traveler_revisions.get(traveler.id, 0):
+                return compute_journey_stats(traveler.journey, retrieve_locations())
+            key = revision, self._location_generations[world_id]
+            cached_key, journey_stats = self._journey_stats.get(traveler.id, (None, None))
+            if cached_key != key:
+                journey_stats = compute_journey_stats(traveler.journey, retrieve_locations())
+                self._journey_stats[traveler.id] = key, journey_stats
+            return journey_stats
+
+    def event_changed(self, previous_event: Optional[Event], event: Optional[Event]) -> None:
+        affected_locations = set()
+        affected_travelers = set()
+        for changed_event in [previous_event, event]:
+            if changed_event is not None:
+                affected_locations.update(changed_event.affected_locations)
+                affected_travelers.update(changed_event.affected_travelers)
+        event_id = event.id if event is not None else previous_event.id
+
+        with self._lock:
+            for location_id in affected_locations.intersection(self._location_timelines):
+                location_timeline = [entry for entry in self._location_timelines[location_id] if entry[1] != event_id]
+                if event is not None and location_id in event.affected_locations:
+                    insort(location_timeline, _timeline_entry(event))
+                self._location_timelines[location_id] = location_timeline
+            for traveler_id in affected_travelers.intersection(self._traveler_timelines):
+                traveler_timeline = self._traveler_timelines[traveler_id]
+                if event is not None and traveler_id in event.affected_travelers:
+                    traveler_timeline.add(event)
+                else:
+                    traveler_timeline.remove(event_id)
+
+    def locations_changed(self, world_id: PrefixedUUID) -> None:
+        with self._lock:
+            self._location_generations[world_id] += 1
+
+    def traveler_changed(self, traveler_id: PrefixedUUID) -> None:
+        with self._lock:
+            self._traveler_revisions[traveler_id] += 1
+            self._traveler_timelines.pop(traveler_id, None)
+            self._simplified_journeys.pop(traveler_id, None)
+            self._journey_stats.pop(traveler_id, None)
 
 
 class TimelineUseCase:
@@ -14,75 +252,226 @@ class TimelineUseCase:
     _location_repository: LocationRepository
     _traveler_repository: TravelerRepository
     _event_repository: EventRepository
+    _materialized_timelines: Optional[MaterializedTimelines]
 
     def __init__(
             self, world_repository, location_repository: LocationRepository, traveler_repository: TravelerRepository,
-            event_repository: EventRepository) -> None:
+            event_repository: EventRepository, *, materialized_timelines: MaterializedTimelines = None) -> None:
         self._world_repository = world_repository
         self._location_repository = location_repository
         self._traveler_repository = traveler_repository
         self._event_repository = event_repository
+        self._materialized_timelines = materialized_timelines
 
     @requires_authentication()
-    def construct_location_timeline(self, world_id: PrefixedUUID, location_id: PrefixedUUID, **filter_kwargs) -> List[PrefixedUUID]:
-        def get_continuum(e: Event) -> Range:
-            return e.span.continuum
+    def construct_location_timeline(
+            self, world_id: PrefixedUUID, location_id: PrefixedUUID, *, continuum_from: float = None, continuum_to: float = None,
+            reality: Set[int] = None, expand_events: bool = False, **filter_kwargs
+    ) -> List[Union[PrefixedUUID, Event]]:
+        self._validate_world_exists(world_id)
+        associated_locations = self._world_repository.get_all_associated(world_id, locations=True)
+        self._validate_location_associated(world_id, location_id, associated_locations)
+        tag_filtered_event_ids = self._retrieve_tag_filtered_event_ids(**filter_kwargs)
+        window = self._window(continuum_from, continuum_to, reality)
 
+        return self._location_timeline(
+            location_id, self._event_repository.retrieve_all, tag_filtered_event_ids, window, expand_events=expand_events)
+
+    @requires_authentication()
+    def construct_traveler_timeline(
+            self, world_id: PrefixedUUID, traveler_id: PrefixedUUID, *, continuum_from: float = None, continuum_to: float = None,
+            reality: Set[int] = None, tolerance: float = None, expand_events: bool = False, **filter_kwargs
+    ) -> List[Union[PrefixedUUID, Event, PositionalMove]]:
+        self._validate_world_exists(world_id)
+        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
+        revision = self._traveler_revision(traveler_id)
+        traveler = self._retrieve_traveler_associated(world_id, traveler_id, associated_travelers)
+        tag_filtered_event_ids = self._retrieve_tag_filtered_event_ids(**filter_kwargs)
+        window = self._window(continuum_from, continuum_to, reality)
+        kept_move_indices = None
+        if tolerance is not None and self._materialized_timelines is None:
+            kept_move_indices = simplified_move_indices(traveler.journey, float(tolerance))
+        elif tolerance is not None:
+            kept_move_indices = self._materialized_timelines.simplified_move_indices(traveler, revision, float(tolerance))
+
+        return self._traveler_timeline(
+            traveler, revision, self._event_repository.retrieve_all, tag_filtered_event_ids, window, kept_move_indices=kept_move_indices,
+            expand_events=expand_events)
+
+    @requires_authentication()
+    def construct_journey_stats(self, world_id: PrefixedUUID, traveler_id: PrefixedUUID) -> JourneyStats:
+        self._validate_world_exists(world_id)
+        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
+        revision = self._traveler_revision(traveler_id)
+        traveler = self._retrieve_traveler_associated(world_id, traveler_id, associated_travelers)
+
+        def retrieve_locations() -> List[Location]:
+            # Associations outlive deleted entities, only the ones still stored are considered
+            associated_locations = self._world_repository.get_all_associated(world_id, locations=True)
+            location_ids = associated_locations & self._location_repository.retrieve_ids()
+            return [self._location_repository.retrieve(location_id) for location_id in location_ids]
+
+        if self._materialized_timelines is None:
+            return compute_journey_stats(traveler.journey, retrieve_locations())
+        return self._materialized_timelines.journey_stats(world_id, traveler, revision, retrieve_locations)
+
+    @requires_authentication()
+    def construct_timelines(
+            self, world_id: PrefixedUUID, *, location_ids: List[PrefixedUUID] = (), traveler_ids: List[PrefixedUUID] = (),
+            continuum_from: float = None, continuum_to: float = None, reality: Set[int] = None, expand_events: bool = False,
+            **filter_kwargs
+    ) -> Dict[PrefixedUUID, List[Union[PrefixedUUID, Event, PositionalMove]]]:
         self._validate_world_exists(world_id)
-        if not location_id.prefix == "location":
-            raise ValueError("Argument 'location_id' must be prefixed with 'location'")
         associated_locations = self._world_repository.get_all_associated(world_id, locations=True)
-        if location_id not in associated_locations:
-            raise NameError(f"No location '{location_id}' is exists for world '{world_id}'")
+        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
+        for location_id in location_ids:
+            self._validate_location_associated(world_id, location_id, associated_locations)
+        revisions = {traveler_id: self._traveler_revision(traveler_id) for traveler_id in traveler_ids}
+        travelers = [self._retrieve_traveler_associated(world_id, traveler_id, associated_travelers) for traveler_id in traveler_ids]
+        tag_filtered_event_ids = self._retrieve_tag_filtered_event_ids(**filter_kwargs)
+        window = self._window(continuum_from, continuum_to, reality)
 
-        self._location_repository.retrieve(location_id)
-        events = self._event_repository.retrieve_all(location_id=location_id)
+        # Events linked to several of the requested locations and travelers are only loaded once
+        events_by_id: Dict[PrefixedUUID, Event] = {}
 
-        events, filter_kwargs = FilteringUseCase.filter_tagged_entities(events, **filter_kwargs)
-        if filter_kwargs:
-            raise ValueError(f"Unknown filters: {','.join(filter_kwargs)}")
+        def retrieve_linked_events(**kwargs) -> Set[Event]:
+            event_ids = self._event_repository.retrieve_ids(**kwargs)
+            for event_id in event_ids - events_by_id.keys():
+                events_by_id[event_id] = self._event_repository.retrieve(event_id)
+            return {events_by_id[event_id] for event_id in event_ids}
 
-        events_ordered_by_continuum = sorted(events, key=get_continuum)
-        return [event.id for event in events_ordered_by_continuum]
+        timelines: Dict[PrefixedUUID, List[Union[PrefixedUUID, Event, PositionalMove]]] = {}
+        for location_id in location_ids:
+            timelines[location_id] = self._location_timeline(
+                location_id, retrieve_linked_events, tag_filtered_event_ids, window, expand_events=expand_events)
+        for traveler in travelers:
+            timelines[traveler.id] = self._traveler_timeline(
+                traveler, revisions[traveler.id], retrieve_linked_events, tag_filtered_event_ids, window, expand_events=expand_events)
+        return timelines
 
     @requires_authentication()
-    def construct_traveler_timeline(
-            self, world_id: PrefixedUUID, traveler_id: PrefixedUUID, **filter_kwargs
-    ) -> List[Union[PrefixedUUID, PositionalMove]]:
+    def construct_snapshot(self, world_id: PrefixedUUID, *, continuum: float, reality: int) -> Snapshot:
+        self._validate_world_exists(world_id)
+        continuum = float(continuum)
+        associated_locations = self._world_repository.get_all_associated(world_id, locations=True)
+        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
+        associated_events = self._world_repository.get_all_associated(world_id, events=True)
+
+        # Associations outlive deleted entities, only the ones still stored are considered
+        location_ids = associated_locations & self._location_repository.retrieve_ids(
+            continuum_intersects=Range(continuum, continuum), reality_intersects={reality})
+        traveler_ids = associated_travelers & self._traveler_repository.retrieve_ids()
+        event_ids = associated_events & self._event_repository.retrieve_ids(
+            continuum_intersects=Range(continuum, continuum), reality_intersects={reality})
+
+        return take_snapshot(
+            continuum, reality,
+            travelers=[self._traveler_repository.retrieve(traveler_id) for traveler_id in traveler_ids],
+            locations=[self._location_repository.retrieve(location_id) for location_id in location_ids],
+            events=[self._event_repository.retrieve(event_id) for event_id in event_ids])
+
+    @requires_authentication()
+    def retrieve_entities_at(self, world_id: PrefixedUUID, position: Position) -> Dict[str, List[Union[Location, Event, Traveler]]]:
         self._validate_world_exists(world_id)
+        associated_locations = self._world_repository.get_all_associated(world_id, locations=True)
+        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
+        associated_events = self._world_repository.get_all_associated(world_id, events=True)
+
+        location_ids = associated_locations & self._location_repository.retrieve_ids(span_includes=position)
+        event_ids = associated_events & self._event_repository.retrieve_ids(span_includes=position)
+        # A traveler waiting at the position since an earlier move is only indexed at that move's continuum, so candidates are searched
+        # from the start of time and confirmed by where they actually are at the position's continuum
+        candidate_range = PositionalRange(
+            latitude=_padded_range(position.latitude), longitude=_padded_range(position.longitude),
+            altitude=_padded_range(position.altitude), continuum=Range(-float_info.max, float(position.continuum)),
+            reality={position.reality})
+        candidate_ids = associated_travelers & self._traveler_repository.retrieve_ids(journey_intersects=candidate_range)
+        candidates = [self._traveler_repository.retrieve(traveler_id) for traveler_id in sorted(candidate_ids, key=str)]
+        travelers = [traveler for traveler in candidates if _is_at(traveler.position_at(position.continuum, position.reality), position)]
+
+        return {
+            "locations": [self._location_repository.retrieve(location_id) for location_id in sorted(location_ids, key=str)],
+            "events": [self._event_repository.retrieve(event_id) for event_id in sorted(event_ids, key=str)],
+            "travelers": travelers,
+        }
+
+    def _location_timeline(
+            self, location_id: PrefixedUUID, retrieve_events: Callable[..., Set[Event]],
+            tag_filtered_event_ids: Optional[Set[PrefixedUUID]], window: Optional[dict], *, expand_events: bool = False
+    ) -> List[Union[PrefixedUUID, Event]]:
+        if window is not None:
+            # Windowed timelines are built from the events overlapping the window only, without touching the materialized timeline
+            windowed_events = retrieve_events(location_id=location_id, **window)
+            return _timeline_events(sorted(map(_timeline_entry, windowed_events)), tag_filtered_event_ids, expand_events)
+
+        def retrieve_location_events() -> Set[Event]:
+            return retrieve_events(location_id=location_id)
+
+        if self._materialized_timelines is None:
+            return _timeline_events(sorted(map(_timeline_entry, retrieve_location_events())), tag_filtered_event_ids, expand_events)
+        return self._materialized_timelines.location_timeline(location_id, retrieve_location_events, tag_filtered_event_ids, expand_events)
+
+    def _traveler_timeline(
+            self, traveler: Traveler, revision: Optional[int], retrieve_events: Callable[..., Set[Event]],
+            tag_filtered_event_ids: Optional[Set[PrefixedUUID]], window: Optional[dict], *, kept_move_indices: List[int] = None,
+            expand_events: bool = False
+    ) -> List[Union[PrefixedUUID, Event, PositionalMove]]:
+        if window is not None:
+            # Any event applicable at a move within the window overlaps the window, so the others need not be loaded
+            windowed_events = retrieve_events(traveler_id=traveler.id, **window)
+            return _TravelerTimeline(traveler.journey, windowed_events).render(
+                tag_filtered_event_ids, kept_move_indices=kept_move_indices, expand_events=expand_events, **window)
+
+        def retrieve_traveler_events() -> Set[Event]:
+            return retrieve_events(traveler_id=traveler.id)
+
+        if self._materialized_timelines is None:
+            return _TravelerTimeline(traveler.journey, retrieve_traveler_events()).render(
+                tag_filtered_event_ids, kept_move_indices=kept_move_indices, expand_events=expand_events)
+        return self._materialized_timelines.traveler_timeline(
+            traveler, revision, retrieve_traveler_events, tag_filtered_event_ids, kept_move_indices, expand_events)
+
+    def _traveler_revision(self, traveler_id: PrefixedUUID) -> Optional[int]:
+        if self._materialized_timelines is None:
+            return None
+        return self._materialized_timelines.traveler_revision(traveler_id)
+
+    def _validate_location_associated(
+            self, world_id: PrefixedUUID, location_id: PrefixedUUID, associated_locations: Set[PrefixedUUID]
+    ) -> None:
+        if not location_id.prefix == "location":
+            raise ValueError("Argument 'location_id' must be prefixed with 'location'")
+        if location_id not in associated_locations:
+            raise NameError(f"No location '{location_id}' is exists for world '{world_id}'")
+        self._location_repository.retrieve(location_id)
+
+    def _retrieve_traveler_associated(
+            self, world_id: PrefixedUUID, traveler_id: PrefixedUUID, associated_travelers: Set[PrefixedUUID]
+    ) -> Traveler:
         if not traveler_id.prefix == "traveler":
             raise ValueError("Argument 'traveler_id' must be prefixed with 'traveler'")
-        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
         if traveler_id not in associated_travelers:
             raise NameError(f"No traveler '{traveler_id}' is exists for world '{world_id}'")
+        return self._traveler_repository.retrieve(traveler_id)
 
-        traveler = self._traveler_repository.retrieve(traveler_id)
-        events = self._event_repository.retrieve_all(traveler_id=traveler_id)
+    @staticmethod
+    def _window(continuum_from: Optional[float], continuum_to: Optional[float], reality: Optional[Set[int]]) -> Optional[dict]:
+        if continuum_from is None and continuum_to is None and reality is None:
+            return None
+        continuum_low = float(continuum_from) if continuum_from is not None else -inf
+        continuum_high = float(continuum_to) if continuum_to is not None else inf
+        if continuum_low > continuum_high:
+            raise ValueError("Argument 'continuum_from' must not be greater than 'continuum_to'")
+        return {"continuum_intersects": Range(continuum_low, continuum_high), "reality_intersects": reality}
 
-        events, filter_kwargs = FilteringUseCase.filter_tagged_entities(events, **filter_kwargs)
+    def _retrieve_tag_filtered_event_ids(self, **filter_kwargs) -> Optional[Set[PrefixedUUID]]:
+        tag_filters, filter_kwargs = FilteringUseCase.extract_tag_filters(**filter_kwargs)
         if filter_kwargs:
             raise ValueError(f"Unknown filters: {','.join(filter_kwargs)}")
 
-        already_applicable_events: Set[Event] = set([])
-        timeline: List[Union[PrefixedUUID, PositionalMove]] = []
-        for curr_positional_move in traveler.journey:
-            curr_position = curr_positional_move.position
-
-            already_applicable_events = {event for event in already_applicable_events if event.span.includes(curr_position)}
-            newly_applicable_events: Set[Event] = {
-                event for event in events
-                if event.span.includes(curr_position) and event not in already_applicable_events
-            }
-            already_applicable_events.update(newly_applicable_events)
-
-            if curr_positional_move.movement_type == MovementType.IMMEDIATE:
-                timeline.append(curr_positional_move)
-                timeline.extend(map(lambda event: event.id, newly_applicable_events))
-            else:
-                timeline.extend(map(lambda event: event.id, newly_applicable_events))
-                timeline.append(curr_positional_move)
-
-        return timeline
+        if all(tag_filter is None for tag_filter in tag_filters.values()):
+            return None
+        return self._event_repository.retrieve_ids(**tag_filters)
 
     def _validate_world_exists(self, world_id: PrefixedUUID) -> None:
         if not world_id.prefix == "world":
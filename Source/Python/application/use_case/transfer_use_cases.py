@@ -0,0 +1,165 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from application.access.authentication import requires_authentication
+from application.use_case.event_use_cases import validate_affected_entities
+from application.use_case.filtering_use_cases import FilterResultCache
+from application.use_case.timeline_use_cases import MaterializedTimelines
+from domain.events import Event
+from domain.ids import PrefixedUUID, generate_prefixed_id
+from domain.locations import Location
+from domain.persistence.repositories import WorldRepository, LocationRepository, TravelerRepository, EventRepository
+from domain.travelers import Traveler
+from domain.worlds import World
+
+
+# An imported entity's type, the id it is referred to by within the import (if any) and its attributes
+ImportedEntity = Tuple[str, Optional[PrefixedUUID], Dict[str, Any]]
+# An exported entity's type and the entity itself
+ExportedEntity = Tuple[str, Union[World, Location, Traveler, Event]]
+_IMPORT_BATCH_SIZE = 500
+
+
+class _ImportBatch:
+    world: Optional[World]
+    locations: Dict[PrefixedUUID, Location]
+    travelers: Dict[PrefixedUUID, Traveler]
+    events: List[Event]
+
+    def __init__(self) -> None:
+        self.world = None
+        self.locations = {}
+        self.travelers = {}
+        self.events = []
+
+    def __len__(self) -> int:
+        return int(self.world is not None) + len(self.locations) + len(self.travelers) + len(self.events)
+
+
+class TransferUseCase:
+    _world_repository: WorldRepository
+    _location_repository: LocationRepository
+    _traveler_repository: TravelerRepository
+    _event_repository: EventRepository
+    _filter_result_cache: FilterResultCache
+    _materialized_timelines: Optional[MaterializedTimelines]
+
+    def __init__(
+            self, world_repository: WorldRepository, location_repository: LocationRepository, traveler_repository: TravelerRepository,
+            event_repository: EventRepository, *, filter_result_cache: FilterResultCache = None,
+            materialized_timelines: MaterializedTimelines = None
+    ) -> None:
+        self._world_repository = world_repository
+        self._location_repository = location_repository
+        self._traveler_repository = traveler_repository
+        self._event_repository = event_repository
+        self._filter_result_cache = filter_result_cache if filter_result_cache is not None else FilterResultCache()
+        self._materialized_timelines = materialized_timelines
+
+    @requires_authentication()
+    def import_entities(
+            self, world_id: PrefixedUUID, entity_parsers: Iterable[Optional[Callable[[], ImportedEntity]]], *,
+            batch_size: int = _IMPORT_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        # Each entry parses one line of the import when called, or is None for a blank line. Entries are validated one at a time as they
+        # are read and persisted in batches, associating each batch with the world at once. Entries that fail are reported by line and
+        # skipped, the rest are still imported. Every entity is given a new id; events refer to entities of the same import by the ids
+        # given in it, so those entities must come first.
+        world = self._validate_world_exists(world_id)
+        imported_ids: Dict[PrefixedUUID, PrefixedUUID] = {}
+        errors = []
+        imported_count = 0
+
+        batch = _ImportBatch()
+        for line_number, entity_parser in enumerate(entity_parsers, start=1):
+            if entity_parser is None:
+                continue
+            try:
+                entity_type, source_id, kwargs = entity_parser()
+                if source_id is not None and source_id in imported_ids:
+                    raise ValueError(f"Id {source_id} was already imported")
+                entity_id = self._add_to_batch(batch, world, entity_type, kwargs, imported_ids)
+            except (ValueError, TypeError, KeyError, NameError) as e:
+                errors.append({"line": line_number, "error": f"{type(e).__name__}: {e}"})
+                continue
+            if source_id is not None and entity_id is not None:
+                imported_ids[source_id] = entity_id
+            imported_count += 1
+            if len(batch) >= batch_size:
+                self._persist(world_id, batch)
+                batch = _ImportBatch()
+        self._persist(world_id, batch)
+
+        return {"imported": imported_count, "ids": imported_ids, "errors": errors}
+
+    @requires_authentication()
+    def export_entities(self, world_id: PrefixedUUID) -> Iterator[ExportedEntity]:
+        # The world is validated right away, its entities are then only retrieved one at a time as the export is consumed
+        world = self._validate_world_exists(world_id)
+        return self._iterate_exported_entities(world)
+
+    def _iterate_exported_entities(self, world: World) -> Iterator[ExportedEntity]:
+        # Events come last so that, when imported, the locations and travelers they affect have already been read. Associations outlive
+        # deleted entities, only the ones still stored are exported.
+        yield "world", world
+        for location_id in self._world_repository.get_all_associated(world.id, locations=True) & self._location_repository.retrieve_ids():
+            yield "location", self._location_repository.retrieve(location_id)
+        for traveler_id in self._world_repository.get_all_associated(world.id, travelers=True) & self._traveler_repository.retrieve_ids():
+            yield "traveler", self._traveler_repository.retrieve(traveler_id)
+        for event_id in self._world_repository.get_all_associated(world.id, events=True) & self._event_repository.retrieve_ids():
+            yield "event", self._event_repository.retrieve(event_id)
+
+    def _add_to_batch(
+            self, batch: _ImportBatch, world: World, entity_type: str, kwargs: Dict[str, Any],
+            imported_ids: Dict[PrefixedUUID, PrefixedUUID]
+    ) -> Optional[PrefixedUUID]:
+        if entity_type == "world":
+            # The world itself is never created, its details are updated instead
+            batch.world = World(id=world.id, **kwargs)
+            return None
+        if entity_type == "location":
+            location = Location(id=generate_prefixed_id("location"), **kwargs)
+            batch.locations[location.id] = location
+            return location.id
+        if entity_type == "traveler":
+            traveler = Traveler(id=generate_prefixed_id("traveler"), **kwargs)
+            batch.travelers[traveler.id] = traveler
+            return traveler.id
+        if entity_type == "event":
+            kwargs = dict(kwargs)
+            kwargs["affected_locations"] = {imported_ids.get(location_id, location_id) for location_id in kwargs["affected_locations"]}
+            kwargs["affected_travelers"] = {imported_ids.get(traveler_id, traveler_id) for traveler_id in kwargs["affected_travelers"]}
+            event = Event(id=generate_prefixed_id("event"), **kwargs)
+            self._validate_affected_entities(event, batch)
+            batch.events.append(event)
+            return event.id
+        raise ValueError(f"Unsupported entity type '{entity_type}', must be one of world, location, traveler or event")
+
+    def _persist(self, world_id: PrefixedUUID, batch: _ImportBatch) -> None:
+        if batch.world is not None:
+            self._world_repository.save(batch.world)
+            self._filter_result_cache.bump_generation(None)
+        for location in batch.locations.values():
+            self._location_repository.save(location)
+        for traveler in batch.travelers.values():
+            self._traveler_repository.save(traveler)
+        for event in batch.events:
+            self._event_repository.save(event)
+        self._world_repository.associate_all(
+            world_id, location_ids=set(batch.locations), traveler_ids=set(batch.travelers), event_ids={event.id for event in batch.events})
+        self._filter_result_cache.bump_generation(world_id)
+        if self._materialized_timelines is not None:
+            if batch.locations:
+                self._materialized_timelines.locations_changed(world_id)
+            for event in batch.events:
+                self._materialized_timelines.event_changed(None, event)
+
+    def _validate_affected_entities(self, event: Event, batch: _ImportBatch) -> None:
+        # Entities of the batch being imported are not persisted yet
+        validate_affected_entities(
+            event, lambda location_id: batch.locations.get(location_id) or self._location_repository.retrieve(location_id),
+            lambda traveler_id: batch.travelers.get(traveler_id) or self._traveler_repository.retrieve(traveler_id))
+
+    def _validate_world_exists(self, world_id: PrefixedUUID) -> World:
+        if not world_id.prefix == "world":
+            raise ValueError("Argument 'world_id' must be prefixed with 'world'")
+        return self._world_repository.retrieve(world_id)
@@ -1,9 +1,15 @@
-from typing import Set
+from math import inf
+from typing import Set, List, Tuple, Optional
 
 from application.access.authentication import requires_authentication
-from application.use_case.filtering_use_cases import FilteringUseCase
+from application.use_case.filtering_use_cases import FilteringUseCase, FilterPlan, FilterResultCache
+from application.use_case.timeline_use_cases import MaterializedTimelines
+from domain.collections import Range
+from domain.encounters import Encounter, find_encounters
 from domain.ids import PrefixedUUID, generate_prefixed_id
 from domain.persistence.repositories import TravelerRepository, EventRepository, WorldRepository
+from domain.positions import Position, PositionalMove
+from domain.simplification import simplified_move_indices
 from domain.travelers import Traveler
 
 
@@ -11,13 +17,18 @@ class TravelerUseCase:
     _world_repository: WorldRepository
     _event_repository: EventRepository
     _traveler_repository: TravelerRepository
+    _filter_result_cache: FilterResultCache
+    _materialized_timelines: Optional[MaterializedTimelines]
 
     def __init__(
-            self, world_repository: WorldRepository, traveler_repository: TravelerRepository, event_repository: EventRepository
+            self, world_repository: WorldRepository, traveler_repository: TravelerRepository, event_repository: EventRepository,
+            *, filter_result_cache: FilterResultCache = None, materialized_timelines: MaterializedTimelines = None
     ) -> None:
         self._world_repository = world_repository
         self._event_repository = event_repository
         self._traveler_repository = traveler_repository
+        self._filter_result_cache = filter_result_cache if filter_result_cache is not None else FilterResultCache()
+        self._materialized_timelines = materialized_timelines
 
     @requires_authentication()
     def create(self, world_id: PrefixedUUID, **kwargs) -> Traveler:
@@ -27,32 +38,93 @@ class TravelerUseCase:
         traveler = Traveler(**kwargs)
         self._traveler_repository.save(traveler)
         self._world_repository.associate(world_id, traveler_id=traveler.id)
+        self._filter_result_cache.bump_generation(world_id)
 
         return traveler
 
     @requires_authentication()
-    def retrieve(self, world_id: PrefixedUUID, traveler_id: PrefixedUUID) -> Traveler:
-        self._validate_world_exists(world_id)
-        if not traveler_id.prefix == "traveler":
-            raise ValueError("Argument 'traveler_id' must be prefixed with 'traveler'")
-        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
-        if traveler_id not in associated_travelers:
-            raise NameError(f"No traveler '{traveler_id}' is exists for world '{world_id}'")
+    def retrieve(self, world_id: PrefixedUUID, traveler_id: PrefixedUUID, *, tolerance: float = None) -> Traveler:
+        revision = self._traveler_revision(traveler_id)
+        traveler = self._retrieve_associated(world_id, traveler_id)
+        if tolerance is None:
+            return traveler
+
+        journey = traveler.journey
+        return Traveler(
+            id=traveler.id, name=traveler.name, description=traveler.description,
+            journey=[journey[move_index] for move_index in self._simplified_move_indices(traveler, revision, tolerance)],
+            tags=traveler.tags, attributes=traveler.attributes)
 
-        return self._traveler_repository.retrieve(traveler_id)
+    @requires_authentication()
+    def retrieve_with_journey_window(
+            self, world_id: PrefixedUUID, traveler_id: PrefixedUUID, *, continuum_from: float = None, continuum_to: float = None,
+            tolerance: float = None
+    ) -> Tuple[Traveler, List[PositionalMove]]:
+        # A window of a journey is not a journey on its own (it may start with an interpolated move), so it is returned beside the traveler
+        continuum_low = float(continuum_from) if continuum_from is not None else -inf
+        continuum_high = float(continuum_to) if continuum_to is not None else inf
+        if continuum_low > continuum_high:
+            raise ValueError("Argument 'continuum_from' must not be greater than 'continuum_to'")
+        revision = self._traveler_revision(traveler_id)
+        traveler = self._retrieve_associated(world_id, traveler_id)
+
+        journey = traveler.journey
+        move_indices = traveler.continuum_index.move_indices_within(Range(continuum_low, continuum_high))
+        if tolerance is not None:
+            kept_move_indices = set(self._simplified_move_indices(traveler, revision, tolerance))
+            move_indices = [move_index for move_index in move_indices if move_index in kept_move_indices]
+        return traveler, [journey[move_index] for move_index in move_indices]
+
+    @requires_authentication()
+    def retrieve_position(self, world_id: PrefixedUUID, traveler_id: PrefixedUUID, *, continuum: float, reality: int) -> Position:
+        traveler = self._retrieve_associated(world_id, traveler_id)
+
+        position = traveler.position_at(float(continuum), reality)
+        if position is None:
+            raise NameError(f"Traveler '{traveler_id}' has no position at continuum {continuum} in reality {reality}")
+        return position
 
     @requires_authentication()
     def retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> Set[Traveler]:
+        travelers, _ = self._retrieve_page(world_id, **kwargs)
+        return set(travelers)
+
+    @requires_authentication()
+    def retrieve_many(self, world_id: PrefixedUUID, traveler_ids: List[PrefixedUUID]) -> List[Traveler]:
+        # The world is validated and its travelers looked up once for all the ids rather than once per id
         self._validate_world_exists(world_id)
         associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
-        all_travelers = {traveler for traveler in self._traveler_repository.retrieve_all() if traveler.id in associated_travelers}
-        name_filtered_travelers, kwargs = FilteringUseCase.filter_named_entities(all_travelers, **kwargs)
-        tag_filtered_travelers, kwargs = FilteringUseCase.filter_tagged_entities(name_filtered_travelers, **kwargs)
-        journey_filtered_travelers, kwargs = FilteringUseCase.filter_journeying_entities(tag_filtered_travelers, **kwargs)
-        if kwargs:
-            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+        for traveler_id in traveler_ids:
+            if not traveler_id.prefix == "traveler":
+                raise ValueError("Argument 'traveler_ids' must only contain ids prefixed with 'traveler'")
+            if traveler_id not in associated_travelers:
+                raise NameError(f"No traveler '{traveler_id}' is exists for world '{world_id}'")
+
+        return [self._traveler_repository.retrieve(traveler_id) for traveler_id in traveler_ids]
+
+    @requires_authentication()
+    def retrieve_page(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, **kwargs
+    ) -> Tuple[List[Traveler], bool]:
+        return self._retrieve_page(world_id, after=after, limit=limit, **kwargs)
+
+    @requires_authentication()
+    def retrieve_page_ids(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, **kwargs
+    ) -> Tuple[List[PrefixedUUID], bool]:
+        return self._retrieve_page_ids(world_id, after=after, limit=limit, **kwargs)
+
+    @requires_authentication()
+    def plan_retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> FilterPlan[Traveler]:
+        return self._plan_retrieve_all(world_id, **kwargs)
+
+    @requires_authentication()
+    def find_encounters(self, world_id: PrefixedUUID, *, distance: float) -> List[Encounter]:
+        self._validate_world_exists(world_id)
+        # Associations outlive deleted travelers, only the ones still stored are considered
+        traveler_ids = self._world_repository.get_all_associated(world_id, travelers=True) & self._traveler_repository.retrieve_ids()
 
-        return journey_filtered_travelers
+        return find_encounters([self._traveler_repository.retrieve(traveler_id) for traveler_id in traveler_ids], distance)
 
     @requires_authentication()
     def update(self, world_id: PrefixedUUID, traveler: Traveler) -> None:
@@ -65,6 +137,20 @@ class TravelerUseCase:
         self._validate_linked_events_still_intersect_for_update(traveler)
 
         self._traveler_repository.save(traveler)
+        self._filter_result_cache.bump_generation(world_id)
+        self._traveler_changed(traveler.id)
+
+    @requires_authentication()
+    def append_to_journey(self, world_id: PrefixedUUID, traveler_id: PrefixedUUID, positional_move: PositionalMove) -> Traveler:
+        traveler = self._retrieve_associated(world_id, traveler_id)
+        # Appending only adds positions, every linked event still includes one of the earlier moves so none need re-checking
+        appended_traveler = traveler.with_move_appended(positional_move)
+
+        self._traveler_repository.append_to_journey(traveler_id, positional_move)
+        self._filter_result_cache.bump_generation(world_id)
+        self._traveler_changed(traveler_id)
+
+        return appended_traveler
 
     @requires_authentication()
     def delete(self, world_id: PrefixedUUID, traveler_id: PrefixedUUID) -> None:
@@ -78,6 +164,70 @@ class TravelerUseCase:
         self._validate_no_linked_events_for_delete(traveler_id)
 
         self._traveler_repository.delete(traveler_id)
+        self._filter_result_cache.bump_generation(world_id)
+        self._traveler_changed(traveler_id)
+
+    def _retrieve_page_ids(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, plan: FilterPlan[Traveler] = None, **kwargs
+    ) -> Tuple[List[PrefixedUUID], bool]:
+        self._validate_world_exists(world_id)
+        traveler_ids, has_more = self._filter_result_cache.retrieve(
+            world_id, "traveler", {"after": after, "limit": limit, **kwargs},
+            lambda: (plan if plan is not None else self._plan_retrieve_all(world_id, **kwargs)).execute_page_ids(after=after, limit=limit))
+        return list(traveler_ids), has_more
+
+    def _retrieve_page(
+            self, world_id: PrefixedUUID, *, after: PrefixedUUID = None, limit: int = None, plan: FilterPlan[Traveler] = None, **kwargs
+    ) -> Tuple[List[Traveler], bool]:
+        # Each traveler is loaded once, either while checking the filters or from the page's cached ids
+        self._validate_world_exists(world_id)
+        return self._filter_result_cache.retrieve_page(
+            world_id, "traveler", {"after": after, "limit": limit, **kwargs},
+            lambda: (plan if plan is not None else self._plan_retrieve_all(world_id, **kwargs)).execute_page(after=after, limit=limit),
+            self._traveler_repository.retrieve)
+
+    def _plan_retrieve_all(self, world_id: PrefixedUUID, **kwargs) -> FilterPlan[Traveler]:
+        self._validate_world_exists(world_id)
+        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
+        name_filters, kwargs = FilteringUseCase.extract_name_filters(**kwargs)
+        tag_filters, kwargs = FilteringUseCase.extract_tag_filters(**kwargs)
+        journey_filters, kwargs = FilteringUseCase.extract_journey_filters(**kwargs)
+        if kwargs:
+            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+
+        predicates = [
+            FilteringUseCase.indexed_predicate("name", FilteringUseCase.matches_name_filters, self._traveler_repository, name_filters),
+            FilteringUseCase.indexed_predicate("tags", FilteringUseCase.matches_tag_filters, self._traveler_repository, tag_filters),
+            FilteringUseCase.indexed_predicate(
+                "journey", FilteringUseCase.matches_journey_filters, self._traveler_repository, journey_filters),
+        ]
+        return FilterPlan(
+            associated_travelers, predicates,
+            retrieve=self._traveler_repository.retrieve, retrieve_all_ids=self._traveler_repository.retrieve_ids)
+
+    def _traveler_changed(self, traveler_id: PrefixedUUID) -> None:
+        if self._materialized_timelines is not None:
+            self._materialized_timelines.traveler_changed(traveler_id)
+
+    def _traveler_revision(self, traveler_id: PrefixedUUID) -> Optional[int]:
+        if self._materialized_timelines is None:
+            return None
+        return self._materialized_timelines.traveler_revision(traveler_id)
+
+    def _simplified_move_indices(self, traveler: Traveler, revision: Optional[int], tolerance: float) -> List[int]:
+        if self._materialized_timelines is None:
+            return simplified_move_indices(traveler.journey, float(tolerance))
+        return self._materialized_timelines.simplified_move_indices(traveler, revision, float(tolerance))
+
+    def _retrieve_associated(self, world_id: PrefixedUUID, traveler_id: PrefixedUUID) -> Traveler:
+        self._validate_world_exists(world_id)
+        if not traveler_id.prefix == "traveler":
+            raise ValueError("Argument 'traveler_id' must be prefixed with 'traveler'")
+        associated_travelers = self._world_repository.get_all_associated(world_id, travelers=True)
+        if traveler_id not in associated_travelers:
+            raise NameError(f"No traveler '{traveler_id}' is exists for world '{world_id}'")
+
+        return self._traveler_repository.retrieve(traveler_id)
 
     def _validate_world_exists(self, world_id: PrefixedUUID) -> None:
         if not world_id.prefix == "world":
@@ -1,7 +1,7 @@
-from typing import Set
+from typing import Set, List, Tuple
 
 from application.access.authentication import requires_authentication
-from application.use_case.filtering_use_cases import FilteringUseCase
+from application.use_case.filtering_use_cases import FilteringUseCase, FilterPlan, FilterResultCache
 from domain.ids import generate_prefixed_id, PrefixedUUID
 from domain.persistence.repositories import WorldRepository
 from domain.worlds import World
@@ -9,9 +9,11 @@ from domain.worlds import World
 
 class WorldUseCase:
     _world_repository: WorldRepository
+    _filter_result_cache: FilterResultCache
 
-    def __init__(self, world_repository: WorldRepository) -> None:
+    def __init__(self, world_repository: WorldRepository, *, filter_result_cache: FilterResultCache = None) -> None:
         self._world_repository = world_repository
+        self._filter_result_cache = filter_result_cache if filter_result_cache is not None else FilterResultCache()
 
     @requires_authentication()
     def create(self, **kwargs) -> World:
@@ -19,6 +21,7 @@ class WorldUseCase:
         world = World(**kwargs)
 
         self._world_repository.save(world)
+        self._filter_result_cache.bump_generation(None)
 
         return world
 
@@ -31,18 +34,24 @@ class WorldUseCase:
 
     @requires_authentication()
     def retrieve_all(self, **kwargs) -> Set[World]:
-        all_worlds = self._world_repository.retrieve_all()
-        name_filtered_worlds, kwargs = FilteringUseCase.filter_named_entities(all_worlds, **kwargs)
-        tag_filtered_worlds, kwargs = FilteringUseCase.filter_tagged_entities(name_filtered_worlds, **kwargs)
-        if kwargs:
-            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+        # Each world is loaded once, either while checking the filters or from the cached ids
+        worlds, _ = self._filter_result_cache.retrieve_page(
+            None, "world", kwargs, lambda: self._plan_retrieve_all(**kwargs).execute_page(), self._world_repository.retrieve)
+        return set(worlds)
 
-        return tag_filtered_worlds
+    @requires_authentication()
+    def retrieve_page_ids(self, *, after: PrefixedUUID = None, limit: int = None, **kwargs) -> Tuple[List[PrefixedUUID], bool]:
+        return self._retrieve_page_ids(after=after, limit=limit, **kwargs)
+
+    @requires_authentication()
+    def plan_retrieve_all(self, **kwargs) -> FilterPlan[World]:
+        return self._plan_retrieve_all(**kwargs)
 
     @requires_authentication()
     def update(self, world: World) -> None:
         self._world_repository.retrieve(world.id)
         self._world_repository.save(world)
+        self._filter_result_cache.bump_generation(None)
 
     @requires_authentication()
     def delete(self, world_id: PrefixedUUID) -> None:
@@ -50,3 +59,26 @@ class WorldUseCase:
             raise ValueError("Argument 'world_id' must be prefixed with 'world'")
 
         self._world_repository.delete(world_id)
+        self._filter_result_cache.bump_generation(None)
+        self._filter_result_cache.bump_generation(world_id)
+
+    def _retrieve_page_ids(
+            self, *, after: PrefixedUUID = None, limit: int = None, plan: FilterPlan[World] = None, **kwargs
+    ) -> Tuple[List[PrefixedUUID], bool]:
+        # Worlds are not scoped to a world, their listings are cached under no world id
+        world_ids, has_more = self._filter_result_cache.retrieve(
+            None, "world", {"after": after, "limit": limit, **kwargs},
+            lambda: (plan if plan is not None else self._plan_retrieve_all(**kwargs)).execute_page_ids(after=after, limit=limit))
+        return list(world_ids), has_more
+
+    def _plan_retrieve_all(self, **kwargs) -> FilterPlan[World]:
+        name_filters, kwargs = FilteringUseCase.extract_name_filters(**kwargs)
+        tag_filters, kwargs = FilteringUseCase.extract_tag_filters(**kwargs)
+        if kwargs:
+            raise ValueError(f"Unknown filters: {','.join(kwargs)}")
+
+        predicates = [
+            FilteringUseCase.indexed_predicate("name", FilteringUseCase.matches_name_filters, self._world_repository, name_filters),
+            FilteringUseCase.indexed_predicate("tags", FilteringUseCase.matches_tag_filters, self._world_repository, tag_filters),
+        ]
+        return FilterPlan(None, predicates, retrieve=self._world_repository.retrieve, retrieve_all_ids=self._world_repository.retrieve_ids)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from heapq import heappush, heappop
+from itertools import product
+from math import floor, sqrt, isinf, isnan
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from domain.collections import Range
+from domain.ids import PrefixedUUID
+from domain.positions import Position
+from domain.travelers import Traveler
+
+
+_MAX_CELLS_PER_SEGMENT = 64
+_Cell = Tuple[int, int, int, int]
+
+
+class Encounter:
+    _travelers: FrozenSet[PrefixedUUID]
+    _continuum: Range[float]
+    _reality: int
+
+    @property
+    def travelers(self) -> Set[PrefixedUUID]:
+        return set(self._travelers)
+
+    @property
+    def continuum(self) -> Range[float]:
+        return self._continuum
+
+    @property
+    def reality(self) -> int:
+        return self._reality
+
+    def __init__(self, *, travelers: Set[PrefixedUUID], continuum: Range[float], reality: int) -> None:
+        if len(travelers) != 2:
+            raise ValueError(f"{Encounter.__name__} attribute 'travelers' must contain exactly two traveler ids")
+        self._travelers = frozenset(travelers)
+        self._continuum = continuum
+        self._reality = reality
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Encounter):
+            return NotImplemented
+        return self._travelers == other._travelers and self._continuum == other._continuum and self._reality == other._reality
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._travelers, self._continuum, self._reality))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({sorted(map(str, self._travelers))},{repr(self._continuum)},{repr(self._reality)})"
+
+
+class _Segment:
+    traveler_id: PrefixedUUID
+    start: Position
+    end: Position
+    reality: int
+
+    def __init__(self, traveler_id: PrefixedUUID, start: Position, end: Position) -> None:
+        self.traveler_id = traveler_id
+        self.start = start
+        self.end = end
+        self.reality = start.reality
+
+    def position_at(self, continuum: float) -> Tuple[float, float, float]:
+        duration = self.end.continuum - self.start.continuum
+        fraction = (continuum - self.start.continuum) / duration if duration > 0 else 0.
+        return (self.start.latitude + (self.end.latitude - self.start.latitude) * fraction,
+                self.start.longitude + (self.end.longitude - self.start.longitude) * fraction,
+                self.start.altitude + (self.end.altitude - self.start.altitude) * fraction)
+
+    def velocity(self) -> Tuple[float, float, float]:
+        duration = self.end.continuum - self.start.continuum
+        if duration <= 0:
+            return 0., 0., 0.
+        return ((self.end.latitude - self.start.latitude) / duration,
+                (self.end.longitude - self.start.longitude) / duration,
+                (self.end.altitude - self.start.altitude) / duration)
+
+    def cells(self, cell_size: float, margin: float) -> Optional[List[_Cell]]:
+        # The grid cells covered by the segment's bounding box, or None when there are too many to be worth listing
+        lows = [min(a, b) - margin for a, b in self._coordinate_pairs()]
+        highs = [max(a, b) + margin for a, b in self._coordinate_pairs()]
+        ranges = [range(floor(low / cell_size), floor(high / cell_size) + 1) for low, high in zip(lows, highs)]
+        if len(ranges[0]) * len(ranges[1]) * len(ranges[2]) > _MAX_CELLS_PER_SEGMENT:
+            return None
+        return [(self.reality, *cell) for cell in product(*ranges)]
+
+    def _coordinate_pairs(self) -> List[Tuple[float, float]]:
+        return [(self.start.latitude, self.end.latitude), (self.start.longitude, self.end.longitude),
+                (self.start.altitude, self.end.altitude)]
+
+
+def find_encounters(travelers: Iterable[Traveler], distance: float) -> List[Encounter]:
+    if isinf(distance) or isnan(distance) or distance < 0:
+        raise ValueError(f"Argument 'distance' must be a finite, non-negative number, was {distance}")
+
+    segments = [_Segment(traveler.id, start, end) for traveler in travelers for start, end in traveler.continuum_index.stretch_paths()]
+    segments.sort(key=lambda segment: segment.start.continuum)
+    cell_size = distance if distance > 0 else 1.
+
+    # Sweep over continuum, keeping only the segments still covering the current continuum active. Active segments are bucketed by
+    # reality and spatial grid cell, so each new segment is only compared with the ones near it. Segments spanning too many cells are
+    # kept aside and compared with every new segment of their reality.
+    active_ends: List[Tuple[float, int]] = []
+    active_indices_by_cell: Dict[_Cell, Set[int]] = defaultdict(set)
+    oversized_indices_by_reality: Dict[int, Set[int]] = defaultdict(set)
+    active_indices_by_reality: Dict[int, Set[int]] = defaultdict(set)
+    cells_by_index: Dict[int, Optional[List[_Cell]]] = {}
+
+    intervals_by_pair: Dict[Tuple[FrozenSet[PrefixedUUID], int], List[Tuple[float, float]]] = defaultdict(list)
+    for index, segment in enumerate(segments):
+        while active_ends and active_ends[0][0] < segment.start.continuum:
+            _, ended_index = heappop(active_ends)
+            ended_cells = cells_by_index.pop(ended_index)
+            active_indices_by_reality[segments[ended_index].reality].discard(ended_index)
+            if ended_cells is None:
+                oversized_indices_by_reality[segments[ended_index].reality].discard(ended_index)
+            else:
+                for cell in ended_cells:
+                    active_indices_by_cell[cell].discard(ended_index)
+
+        cells = segment.cells(cell_size, 0.)
+        query_cells = segment.cells(cell_size, distance)
+        if query_cells is None:
+            candidate_indices = set(active_indices_by_reality[segment.reality])
+        else:
+            candidate_indices = set(oversized_indices_by_reality[segment.reality])
+            for cell in query_cells:
+                candidate_indices.update(active_indices_by_cell.get(cell, ()))
+
+        for candidate_index in candidate_indices:
+            candidate = segments[candidate_index]
+            if candidate.traveler_id == segment.traveler_id:
+                continue
+            interval = _interval_within_distance(segment, candidate, distance)
+            if interval is not None:
+                intervals_by_pair[frozenset({segment.traveler_id, candidate.traveler_id}), segment.reality].append(interval)
+
+        heappush(active_ends, (segment.end.continuum, index))
+        cells_by_index[index] = cells
+        active_indices_by_reality[segment.reality].add(index)
+        if cells is None:
+            oversized_indices_by_reality[segment.reality].add(index)
+        else:
+            for cell in cells:
+                active_indices_by_cell[cell].add(index)
+
+    encounters = [
+        Encounter(travelers=set(traveler_ids), continuum=Range(low, high), reality=reality)
+        for (traveler_ids, reality), intervals in intervals_by_pair.items()
+        for low, high in _merge_intervals(intervals)
+    ]
+    return sorted(encounters, key=lambda encounter: (encounter.continuum.low, sorted(map(str, encounter.travelers)), encounter.reality))
+
+
+def _interval_within_distance(segment_a: _Segment, segment_b: _Segment, distance: float) -> Optional[Tuple[float, float]]:
+    low = max(segment_a.start.continuum, segment_b.start.continuum)
+    high = min(segment_a.end.continuum, segment_b.end.continuum)
+    if low > high:
+        return None
+
+    # With u = continuum - low, the squared distance between the two is the quadratic |offset + velocity * u|^2
+    offset = [a - b for a, b in zip(segment_a.position_at(low), segment_b.position_at(low))]
+    velocity = [a - b for a, b in zip(segment_a.velocity(), segment_b.velocity())]
+    quadratic = sum(v * v for v in velocity)
+    linear = sum(o * v for o, v in zip(offset, velocity))
+    constant = sum(o * o for o in offset) - distance * distance
+    if quadratic == 0:
+        return (low, high) if constant <= 0 else None
+
+    discriminant = linear * linear - quadratic * constant
+    if discriminant < 0:
+        return None
+    root = sqrt(discriminant)
+    enter = max(0., (-linear - root) / quadratic)
+    leave = min(high - low, (-linear + root) / quadratic)
+    if enter > leave:
+        return None
+    return low + enter, low + leave
+
+
+def _merge_intervals(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    merged: List[Tuple[float, float]] = []
+    for low, high in sorted(intervals):
+        if merged and low <= merged[-1][1]:
+            merged[-1] = merged[-1][0], max(merged[-1][1], high)
+        else:
+            merged.append((low, high))
+    return merged
@@ -0,0 +1,163 @@
+from math import hypot
+from typing import Dict, Iterable, List
+
+from domain.ids import PrefixedUUID
+from domain.locations import Location
+from domain.positions import PositionalMove, MovementType
+
+
+class RealityTransition:
+    _continuum: float
+    _from_reality: int
+    _to_reality: int
+
+    @property
+    def continuum(self) -> float:
+        return self._continuum
+
+    @property
+    def from_reality(self) -> int:
+        return self._from_reality
+
+    @property
+    def to_reality(self) -> int:
+        return self._to_reality
+
+    def __init__(self, *, continuum: float, from_reality: int, to_reality: int) -> None:
+        self._continuum = continuum
+        self._from_reality = from_reality
+        self._to_reality = to_reality
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RealityTransition):
+            return NotImplemented
+        return self._continuum == other._continuum and self._from_reality == other._from_reality and self._to_reality == other._to_reality
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._continuum, self._from_reality, self._to_reality))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({repr(self._continuum)},{repr(self._from_reality)},{repr(self._to_reality)})"
+
+
+class JourneyStats:
+    _path_length_by_reality: Dict[int, float]
+    _average_speed: float
+    _max_speed: float
+    _dwell_by_location: Dict[PrefixedUUID, float]
+    _reality_transitions: List[RealityTransition]
+
+    @property
+    def path_length_by_reality(self) -> Dict[int, float]:
+        return dict(self._path_length_by_reality)
+
+    @property
+    def average_speed(self) -> float:
+        return self._average_speed
+
+    @property
+    def max_speed(self) -> float:
+        return self._max_speed
+
+    @property
+    def dwell_by_location(self) -> Dict[PrefixedUUID, float]:
+        return dict(self._dwell_by_location)
+
+    @property
+    def reality_transitions(self) -> List[RealityTransition]:
+        return list(self._reality_transitions)
+
+    def __init__(
+            self, *, path_length_by_reality: Dict[int, float], average_speed: float, max_speed: float,
+            dwell_by_location: Dict[PrefixedUUID, float], reality_transitions: List[RealityTransition]
+    ) -> None:
+        self._path_length_by_reality = dict(path_length_by_reality)
+        self._average_speed = average_speed
+        self._max_speed = max_speed
+        self._dwell_by_location = dict(dwell_by_location)
+        self._reality_transitions = list(reality_transitions)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JourneyStats):
+            return NotImplemented
+        return (self._path_length_by_reality == other._path_length_by_reality
+                and self._average_speed == other._average_speed
+                and self._max_speed == other._max_speed
+                and self._dwell_by_location == other._dwell_by_location
+                and self._reality_transitions == other._reality_transitions)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({repr(self._path_length_by_reality)},{repr(self._average_speed)},{repr(self._max_speed)}," \
+               f"{repr(self._dwell_by_location)},{repr(self._reality_transitions)})"
+
+
+def compute_journey_stats(journey: List[PositionalMove], locations: Iterable[Location]) -> JourneyStats:
+    # The journey is split into columns, one per coordinate, and every stretch between a move and the next is computed from them one
+    # column at a time. Until an immediate move the traveler stays where they were, until an interpolated one they travel towards it.
+    # The last move, and any move followed by a jump back in continuum, only covers its own continuum and so adds nothing.
+    latitudes, longitudes, altitudes, continuums, realities = map(list, zip(*(
+        (move.position.latitude, move.position.longitude, move.position.altitude, move.position.continuum, move.position.reality)
+        for move in journey
+    )))
+    travelling = [move.movement_type == MovementType.INTERPOLATED for move in journey[1:]]
+    durations = [max(0., end - start) for start, end in zip(continuums, continuums[1:])]
+    latitude_deltas = _deltas(latitudes, travelling)
+    longitude_deltas = _deltas(longitudes, travelling)
+    altitude_deltas = _deltas(altitudes, travelling)
+    lengths = list(map(hypot, latitude_deltas, longitude_deltas, altitude_deltas))
+    speeds = [length / duration for length, duration, travels in zip(lengths, durations, travelling) if travels]
+
+    path_length_by_reality = dict.fromkeys(realities, 0.)
+    for reality, length in zip(realities, lengths):
+        path_length_by_reality[reality] += length
+    total_duration = sum(durations)
+
+    dwell_by_location = {}
+    for location in locations:
+        dwell = _dwell(location, latitudes, longitudes, altitudes, continuums, realities, latitude_deltas, longitude_deltas,
+                       altitude_deltas, durations)
+        if dwell > 0:
+            dwell_by_location[location.id] = dwell
+
+    return JourneyStats(
+        path_length_by_reality=path_length_by_reality,
+        average_speed=sum(lengths) / total_duration if total_duration > 0 else 0.,
+        max_speed=max(speeds, default=0.),
+        dwell_by_location=dwell_by_location,
+        reality_transitions=[
+            RealityTransition(continuum=continuum, from_reality=from_reality, to_reality=to_reality)
+            for continuum, from_reality, to_reality in zip(continuums[1:], realities, realities[1:]) if from_reality != to_reality
+        ])
+
+
+def _deltas(column: List[float], travelling: List[bool]) -> List[float]:
+    return [end - start if travels else 0. for start, end, travels in zip(column, column[1:], travelling)]
+
+
+def _dwell(
+        location: Location, latitudes: List[float], longitudes: List[float], altitudes: List[float], continuums: List[float],
+        realities: List[int], latitude_deltas: List[float], longitude_deltas: List[float], altitude_deltas: List[float],
+        durations: List[float]
+) -> float:
+    # Each stretch is clipped to the location's span one dimension at a time, as the fraction of the stretch spent within it
+    span = location.span
+    stretch_indices = [
+        index for index, (reality, duration) in enumerate(zip(realities, durations)) if duration > 0 and reality in span.reality
+    ]
+    enters = [0.] * len(stretch_indices)
+    exits = [1.] * len(stretch_indices)
+    for column, deltas, range_ in [
+        (latitudes, latitude_deltas, span.latitude), (longitudes, longitude_deltas, span.longitude),
+        (altitudes, altitude_deltas, span.altitude), (continuums, durations, span.continuum),
+    ]:
+        for position, index in enumerate(stretch_indices):
+            start, delta = column[index], deltas[index]
+            if delta == 0:
+                if not range_.low <= start <= range_.high:
+                    exits[position] = 0.
+                continue
+            low_fraction = (range_.low - start) / delta
+            high_fraction = (range_.high - start) / delta
+            enters[position] = max(enters[position], min(low_fraction, high_fraction))
+            exits[position] = min(exits[position], max(low_fraction, high_fraction))
+    return sum(max(0., exit_ - enter) * durations[index] for index, enter, exit_ in zip(stretch_indices, enters, exits))
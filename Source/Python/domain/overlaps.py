@@ -0,0 +1,89 @@
+from collections import defaultdict
+from heapq import heappush, heappop
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from domain.collections import Range
+from domain.events import Event
+from domain.ids import PrefixedUUID
+
+
+class EventOverlap:
+    _events: FrozenSet[PrefixedUUID]
+    _travelers: FrozenSet[PrefixedUUID]
+
+    @property
+    def events(self) -> Set[PrefixedUUID]:
+        return set(self._events)
+
+    @property
+    def travelers(self) -> Set[PrefixedUUID]:
+        return set(self._travelers)
+
+    def __init__(self, *, events: Set[PrefixedUUID], travelers: Set[PrefixedUUID]) -> None:
+        if len(events) != 2:
+            raise ValueError(f"{EventOverlap.__name__} attribute 'events' must contain exactly two event ids")
+        self._events = frozenset(events)
+        self._travelers = frozenset(travelers)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EventOverlap):
+            return NotImplemented
+        return self._events == other._events and self._travelers == other._travelers
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._events, self._travelers))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({sorted(map(str, self._events))},{sorted(map(str, self._travelers))})"
+
+
+def find_event_overlaps(events: Iterable[Event], *, sharing_traveler: bool = False) -> List[EventOverlap]:
+    events = sorted(events, key=lambda event_: event_.span.continuum.low)
+
+    # Sweep over continuum, keeping only the events whose continuum covers the current one active. Only those can overlap it, the other
+    # dimensions are then checked pair by pair. When a shared traveler is required, active events are looked up by traveler instead.
+    active_ends: List[Tuple[float, int]] = []
+    active_indices: Set[int] = set()
+    active_indices_by_traveler_id: Dict[PrefixedUUID, Set[int]] = defaultdict(set)
+
+    overlaps = []
+    for index, event in enumerate(events):
+        while active_ends and active_ends[0][0] < event.span.continuum.low:
+            _, ended_index = heappop(active_ends)
+            active_indices.discard(ended_index)
+            for traveler_id in events[ended_index].affected_travelers:
+                active_indices_by_traveler_id[traveler_id].discard(ended_index)
+
+        if sharing_traveler:
+            candidate_indices = set()
+            for traveler_id in event.affected_travelers:
+                candidate_indices.update(active_indices_by_traveler_id[traveler_id])
+        else:
+            candidate_indices = active_indices
+
+        for candidate_index in candidate_indices:
+            candidate = events[candidate_index]
+            if _spans_overlap_outside_continuum(event, candidate):
+                overlaps.append(EventOverlap(
+                    events={event.id, candidate.id}, travelers=event.affected_travelers & candidate.affected_travelers))
+
+        heappush(active_ends, (event.span.continuum.high, index))
+        active_indices.add(index)
+        for traveler_id in event.affected_travelers:
+            active_indices_by_traveler_id[traveler_id].add(index)
+
+    return sorted(overlaps, key=lambda overlap: sorted(map(str, overlap.events)))
+
+
+def _spans_overlap_outside_continuum(event_a: Event, event_b: Event) -> bool:
+    span_a = event_a.span
+    span_b = event_b.span
+    return (_ranges_overlap(span_a.latitude, span_b.latitude)
+            and _ranges_overlap(span_a.longitude, span_b.longitude)
+            and _ranges_overlap(span_a.altitude, span_b.altitude)
+            and not span_a.reality.isdisjoint(span_b.reality))
+
+
+def _ranges_overlap(range_a: Range, range_b: Range) -> bool:
+    # Compared by value, spans may mix int and float ranges
+    return range_a.low <= range_b.high and range_b.low <= range_a.high
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Set
 
+from domain.collections import Range
 from domain.events import Event
 from domain.ids import PrefixedUUID
 from domain.locations import Location
+from domain.positions import Position, PositionalRange, PositionalMove
+from domain.tags import Tag
 from domain.travelers import Traveler
 from domain.worlds import World
 
@@ -21,6 +24,20 @@ class WorldRepository(ABC):
     def retrieve_all(self) -> Set[World]:
         pass
 
+    @abstractmethod
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        pass
+
     @abstractmethod
     def delete(self, world_id: PrefixedUUID) -> None:
         pass
@@ -32,6 +49,14 @@ class WorldRepository(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def associate_all(
+            self, world_id: PrefixedUUID,
+            *, location_ids: Set[PrefixedUUID] = frozenset(), traveler_ids: Set[PrefixedUUID] = frozenset(),
+            event_ids: Set[PrefixedUUID] = frozenset()
+    ) -> None:
+        pass
+
     @abstractmethod
     def disassociate(
             self, world_id: PrefixedUUID,
@@ -59,6 +84,21 @@ class LocationRepository(ABC):
     def retrieve_all(self) -> Set[Location]:
         pass
 
+    @abstractmethod
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, span_includes: Position = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None,
+            tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        pass
+
     @abstractmethod
     def delete(self, location_id: PrefixedUUID) -> None:
         pass
@@ -77,6 +117,26 @@ class TravelerRepository(ABC):
     def retrieve_all(self) -> Set[Traveler]:
         pass
 
+    @abstractmethod
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, journey_includes: Position = None,
+            journey_intersects: PositionalRange = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def retrieve_ids(
+            self, *, name_is: str = None, name_has: str = None, journey_includes: Position = None,
+            journey_intersects: PositionalRange = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
+        pass
+
+    @abstractmethod
+    def append_to_journey(self, traveler_id: PrefixedUUID, positional_move: PositionalMove) -> None:
+        pass
+
     @abstractmethod
     def delete(self, traveler_id: PrefixedUUID) -> None:
         pass
@@ -92,7 +152,25 @@ class EventRepository(ABC):
         pass
 
     @abstractmethod
-    def retrieve_all(self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None) -> Set[Event]:
+    def retrieve_all(
+            self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None
+    ) -> Set[Event]:
+        pass
+
+    @abstractmethod
+    def estimate_count(
+            self, *, name_is: str = None, name_has: str = None, tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None,
+            tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def retrieve_ids(
+            self, *, location_id: PrefixedUUID = None, traveler_id: PrefixedUUID = None, continuum_intersects: Range[float] = None,
+            reality_intersects: Set[int] = None, span_includes: Position = None, name_is: str = None, name_has: str = None,
+            tagged_all: Set[Tag] = None, tagged_any: Set[Tag] = None, tagged_only: Set[Tag] = None, tagged_none: Set[Tag] = None
+    ) -> Set[PrefixedUUID]:
         pass
 
     @abstractmethod
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from copy import copy
 from enum import Enum
 from math import isinf, isnan
-from typing import Any, List, Set
+from typing import Any, List, Set, Tuple, Dict, Optional
 
 from domain.base_entity import BaseEntity
 from domain.collections import Range
@@ -163,6 +166,35 @@ class PositionalRange:
                 and self._continuum.intersects(positional_range.continuum)
                 and len(self._reality.intersection(positional_range.reality)) > 0)
 
+    def intersects_path(self, start: Position, end: Position) -> bool:
+        if not isinstance(start, Position) or not isinstance(end, Position):
+            raise TypeError(f"Arguments must be of type {Position.__name__}")
+        if start.reality != end.reality:
+            raise ValueError(f"Cannot interpolate a path across realities, was {start.reality} and {end.reality}")
+        if start.reality not in self._reality:
+            return False
+
+        # Clip the straight path start -> end (parameterized over [0, 1]) against each dimension of the range
+        entry, exit_ = 0., 1.
+        for range_, start_value, end_value in [
+            (self._latitude, start.latitude, end.latitude),
+            (self._longitude, start.longitude, end.longitude),
+            (self._altitude, start.altitude, end.altitude),
+            (self._continuum, start.continuum, end.continuum),
+        ]:
+            delta = end_value - start_value
+            if delta == 0:
+                if not range_.includes(start_value):
+                    return False
+                continue
+            low_t = (range_.low - start_value) / delta
+            high_t = (range_.high - start_value) / delta
+            entry = max(entry, min(low_t, high_t))
+            exit_ = min(exit_, max(low_t, high_t))
+            if entry > exit_:
+                return False
+        return True
+
     @staticmethod
     def _range_includes(low: Any, high: Any, value: Any) -> bool:
         return low <= value <= high
@@ -241,18 +273,148 @@ class SpanningEntity(BaseEntity):
         return hash((SpanningEntity, self._span, super().__hash__()))
 
 
+def interpolate_positions(paths: List[Tuple[Position, Position]], continuum: float) -> List[Position]:
+    # Interpolates every (start, end) path at the same continuum in one pass, one coordinate at a time
+    fractions = [
+        (continuum - start.continuum) / (end.continuum - start.continuum) if end.continuum > start.continuum else 0.
+        for start, end in paths
+    ]
+    latitudes = [start.latitude + (end.latitude - start.latitude) * fraction for (start, end), fraction in zip(paths, fractions)]
+    longitudes = [start.longitude + (end.longitude - start.longitude) * fraction for (start, end), fraction in zip(paths, fractions)]
+    altitudes = [start.altitude + (end.altitude - start.altitude) * fraction for (start, end), fraction in zip(paths, fractions)]
+    return [
+        Position(latitude=latitude, longitude=longitude, altitude=altitude, continuum=continuum, reality=start.reality)
+        for (start, _), latitude, longitude, altitude in zip(paths, latitudes, longitudes, altitudes)
+    ]
+
+
+def _latest_paths(
+        bounds: List[float], stretches: List[Tuple[int, Position, Position, float, bool]]
+) -> List[Optional[Tuple[Position, Position]]]:
+    # Element 2 * i is the bound itself, element 2 * i + 1 the open interval up to the next bound. Stretches are laid down latest first,
+    # each skipping over the elements already taken, so every element is assigned once.
+    latest: List[Optional[Tuple[Position, Position]]] = [None] * (2 * len(bounds) - 1)
+    next_free = list(range(len(latest) + 1))
+
+    def find_free(element: int) -> int:
+        while next_free[element] != element:
+            next_free[element] = next_free[next_free[element]]
+            element = next_free[element]
+        return element
+
+    for _, start, end, high, closed in sorted(stretches, key=lambda stretch_: stretch_[0], reverse=True):
+        last = 2 * bisect_left(bounds, high) - (0 if closed else 1)
+        element = find_free(2 * bisect_left(bounds, start.continuum))
+        while element <= last:
+            latest[element] = start, end
+            next_free[element] = element + 1
+            element = find_free(element + 1)
+    return latest
+
+
+class JourneyContinuumIndex:
+    # The stretch of a journey between each move and the next, grouped by reality. Until an immediate move the traveler stays where they
+    # were, until an interpolated one they travel towards it. The last move, and any move followed by a jump back in continuum, only
+    # covers its own continuum. The continuums where stretches start or end split each reality into points and the open intervals
+    # between them, and the latest stretch in journey order covering each of those is found once up front.
+    _stretches_by_reality: Dict[int, List[Tuple[int, Position, Position, float, bool]]]
+    _bounds_by_reality: Dict[int, List[float]]
+    _latest_by_reality: Dict[int, List[Optional[Tuple[Position, Position]]]]
+    _move_continuums: List[float]
+    _move_indices_by_continuum: List[int]
+
+    def __init__(self, journey: List[PositionalMove]) -> None:
+        stretches_by_reality = defaultdict(list)
+        for move_index, positional_move in enumerate(journey):
+            position = positional_move.position
+            next_move = journey[move_index + 1] if move_index + 1 < len(journey) else None
+            if next_move is None or next_move.position.continuum <= position.continuum:
+                stretch = (move_index, position, position, position.continuum, True)
+            elif next_move.movement_type == MovementType.INTERPOLATED:
+                stretch = (move_index, position, next_move.position, next_move.position.continuum, False)
+            else:
+                stretch = (move_index, position, position, next_move.position.continuum, False)
+            stretches_by_reality[position.reality].append(stretch)
+
+        self._stretches_by_reality = dict(stretches_by_reality)
+        self._bounds_by_reality = {}
+        self._latest_by_reality = {}
+        for reality, stretches in self._stretches_by_reality.items():
+            bounds = sorted({start.continuum for _, start, _, _, _ in stretches} | {high for _, _, _, high, _ in stretches})
+            self._bounds_by_reality[reality] = bounds
+            self._latest_by_reality[reality] = _latest_paths(bounds, stretches)
+
+        self._move_indices_by_continuum = sorted(range(len(journey)), key=lambda move_index_: journey[move_index_].position.continuum)
+        self._move_continuums = [journey[move_index].position.continuum for move_index in self._move_indices_by_continuum]
+
+    def path_at(self, continuum: float, reality: int) -> Optional[Tuple[Position, Position]]:
+        # The (start, end) path to interpolate at the continuum, or None when the journey is not in the reality then. When the journey
+        # passes the continuum more than once, the latest pass in journey order is used.
+        if reality not in self._bounds_by_reality:
+            return None
+        bounds = self._bounds_by_reality[reality]
+        index = bisect_left(bounds, continuum)
+        if index < len(bounds) and bounds[index] == continuum:
+            return self._latest_by_reality[reality][2 * index]
+        if index == 0 or index == len(bounds):
+            return None
+        return self._latest_by_reality[reality][2 * index - 1]
+
+    def stretch_paths(self) -> List[Tuple[Position, Position]]:
+        # The (start, end) path covered by each stretch, a stay until an immediate move ends at that move's continuum
+        return [
+            (start, end if end.continuum == high else Position(latitude=end.latitude, longitude=end.longitude, altitude=end.altitude,
+                                                               continuum=high, reality=end.reality))
+            for stretches in self._stretches_by_reality.values()
+            for _, start, end, high, _ in stretches
+        ]
+
+    def move_indices_within(self, continuum: Range[float]) -> List[int]:
+        # The indices, in journey order, of the moves whose continuum is within the range
+        low = bisect_left(self._move_continuums, continuum.low)
+        high = bisect_right(self._move_continuums, continuum.high)
+        return sorted(self._move_indices_by_continuum[low:high])
+
+
 class JourneyingEntity(BaseEntity):
     _journey: List[PositionalMove]
+    _continuum_index: Optional[JourneyContinuumIndex]
 
     @property
     def journey(self) -> List[PositionalMove]:
         return list(self._journey)
 
+    @property
+    def continuum_index(self) -> JourneyContinuumIndex:
+        # Built on first use, journeys are never modified in place
+        if self._continuum_index is None:
+            self._continuum_index = JourneyContinuumIndex(self._journey)
+        return self._continuum_index
+
+    @property
+    def journey_paths(self) -> List[Tuple[Position, Position]]:
+        # The (start, end) path covered by each move, immediate moves only ever cover their own position
+        paths = []
+        previous_position = None
+        for positional_move in self._journey:
+            position = positional_move.position
+            if positional_move.movement_type == MovementType.INTERPOLATED and previous_position is not None:
+                paths.append((previous_position, position))
+            else:
+                paths.append((position, position))
+            previous_position = position
+        return paths
+
+    def position_at(self, continuum: float, reality: int) -> Optional[Position]:
+        path = self.continuum_index.path_at(continuum, reality)
+        return None if path is None else interpolate_positions([path], continuum)[0]
+
     def __init__(self, journey: List[PositionalMove], **kwargs) -> None:
         if not isinstance(journey, list) or any([not isinstance(move, PositionalMove) for move in journey]):
             raise TypeError(f"{self.__class__.__name__} attribute 'journey' must be a list of {PositionalMove.__name__}s")
         self.validate_journey(journey)
         self._journey = journey
+        self._continuum_index = None
         super().__init__(**kwargs)
 
     def __eq__(self, other: object) -> bool:
@@ -263,25 +425,34 @@ class JourneyingEntity(BaseEntity):
     def __hash__(self) -> int:
         return hash((JourneyingEntity, tuple(self._journey), super().__hash__()))
 
+    def with_move_appended(self, positional_move: PositionalMove) -> JourneyingEntity:
+        # Only the new move needs validating, the journey before it already is valid
+        if not isinstance(positional_move, PositionalMove):
+            raise TypeError(f"Argument 'positional_move' must be of type {PositionalMove.__name__}")
+        self._validate_move(self._journey[-1].position, positional_move)
+        appended = copy(self)
+        appended._journey = self._journey + [positional_move]
+        appended._continuum_index = None
+        return appended
+
     @staticmethod
     def validate_journey(journey: List[PositionalMove]) -> None:
         if not journey:
             raise ValueError(f"Argument 'journey' must not be empty")
         if journey[0].movement_type != MovementType.IMMEDIATE:
             raise ValueError(f"Invalid Journey: Initial position in journey must be movement_type={MovementType.IMMEDIATE}")
-        last_position = None
-        for positional_move in journey:
-            if last_position is None:
-                last_position = positional_move.position
-                continue
-            if positional_move.movement_type == MovementType.INTERPOLATED:
-                if positional_move.position.reality != last_position.reality:
-                    raise ValueError(f"Invalid journey: Cannot interpolate across realities. (problematic move was: {positional_move}, "
-                                     f"which succeeded {last_position})")
-                elif positional_move.position.continuum == last_position.continuum:
-                    raise ValueError(f"Invalid journey: Cannot interpolate when continuum values are identical. (problematic move was: "
-                                     f"{positional_move}, which succeeded {last_position})")
-                elif positional_move.position.continuum < last_position.continuum:
-                    raise ValueError(f"Invalid journey: Cannot interpolate backwards in continuum. (problematic move was: "
-                                     f"{positional_move}, which succeeded {last_position})")
-            last_position = positional_move.position
+        for previous_move, positional_move in zip(journey, journey[1:]):
+            JourneyingEntity._validate_move(previous_move.position, positional_move)
+
+    @staticmethod
+    def _validate_move(last_position: Position, positional_move: PositionalMove) -> None:
+        if positional_move.movement_type == MovementType.INTERPOLATED:
+            if positional_move.position.reality != last_position.reality:
+                raise ValueError(f"Invalid journey: Cannot interpolate across realities. (problematic move was: {positional_move}, "
+                                 f"which succeeded {last_position})")
+            elif positional_move.position.continuum == last_position.continuum:
+                raise ValueError(f"Invalid journey: Cannot interpolate when continuum values are identical. (problematic move was: "
+                                 f"{positional_move}, which succeeded {last_position})")
+            elif positional_move.position.continuum < last_position.continuum:
+                raise ValueError(f"Invalid journey: Cannot interpolate backwards in continuum. (problematic move was: "
+                                 f"{positional_move}, which succeeded {last_position})")
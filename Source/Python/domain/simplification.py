@@ -0,0 +1,56 @@
+from math import isinf, isnan, sqrt
+from typing import List, Tuple
+
+from domain.positions import PositionalMove, MovementType, Position
+
+
+def simplified_move_indices(journey: List[PositionalMove], tolerance: float) -> List[int]:
+    if isinf(tolerance) or isnan(tolerance) or tolerance < 0:
+        raise ValueError(f"Argument 'tolerance' must be a finite, non-negative number, was {tolerance}")
+
+    # Every run of interpolated moves is simplified on its own, from the move it starts at to its last move. The first and last moves of a
+    # run are always kept, so immediate moves, the moves right before them and reality changes all survive.
+    kept_indices = []
+    run_start = 0
+    for move_index in range(1, len(journey) + 1):
+        if move_index == len(journey) or journey[move_index].movement_type == MovementType.IMMEDIATE \
+                or journey[move_index].position.reality != journey[run_start].position.reality:
+            kept_indices.extend(_douglas_peucker(journey, run_start, move_index - 1, tolerance))
+            run_start = move_index
+    return kept_indices
+
+
+def _douglas_peucker(journey: List[PositionalMove], first: int, last: int, tolerance: float) -> List[int]:
+    # Iterative, long runs would otherwise exceed the recursion limit
+    kept_indices = [first]
+    pending = [(first, last)] if first < last else []
+    while pending:
+        start, end = pending.pop()
+        farthest_index, farthest_distance = start, -1.
+        for move_index in range(start + 1, end):
+            distance = _distance_to_path(journey[move_index].position, journey[start].position, journey[end].position)
+            if distance > farthest_distance:
+                farthest_index, farthest_distance = move_index, distance
+        if farthest_distance > tolerance:
+            # End is pushed first so the start half is handled first, keeping the indices in journey order
+            pending.append((farthest_index, end))
+            pending.append((start, farthest_index))
+        else:
+            kept_indices.append(end)
+    return kept_indices
+
+
+def _distance_to_path(position: Position, start: Position, end: Position) -> float:
+    # Euclidean distance over latitude, longitude, altitude and continuum to the closest point of the straight path start -> end
+    point = _coordinates(position)
+    origin = _coordinates(start)
+    direction = [b - a for a, b in zip(origin, _coordinates(end))]
+    length_squared = sum(d * d for d in direction)
+    fraction = 0.
+    if length_squared > 0:
+        fraction = min(1., max(0., sum((p - o) * d for p, o, d in zip(point, origin, direction)) / length_squared))
+    return sqrt(sum((p - o - d * fraction) ** 2 for p, o, d in zip(point, origin, direction)))
+
+
+def _coordinates(position: Position) -> Tuple[float, float, float, float]:
+    return position.latitude, position.longitude, position.altitude, position.continuum
@@ -0,0 +1,79 @@
+from typing import Dict, Iterable, Set
+
+from domain.events import Event
+from domain.ids import PrefixedUUID
+from domain.locations import Location
+from domain.positions import Position, SpanningEntity, interpolate_positions
+from domain.travelers import Traveler
+
+
+class Snapshot:
+    _continuum: float
+    _reality: int
+    _travelers: Dict[PrefixedUUID, Position]
+    _locations: Set[PrefixedUUID]
+    _events: Set[PrefixedUUID]
+
+    @property
+    def continuum(self) -> float:
+        return self._continuum
+
+    @property
+    def reality(self) -> int:
+        return self._reality
+
+    @property
+    def travelers(self) -> Dict[PrefixedUUID, Position]:
+        return dict(self._travelers)
+
+    @property
+    def locations(self) -> Set[PrefixedUUID]:
+        return set(self._locations)
+
+    @property
+    def events(self) -> Set[PrefixedUUID]:
+        return set(self._events)
+
+    def __init__(
+            self, *, continuum: float, reality: int, travelers: Dict[PrefixedUUID, Position], locations: Set[PrefixedUUID],
+            events: Set[PrefixedUUID]
+    ) -> None:
+        self._continuum = continuum
+        self._reality = reality
+        self._travelers = dict(travelers)
+        self._locations = set(locations)
+        self._events = set(events)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Snapshot):
+            return NotImplemented
+        return (self._continuum == other._continuum
+                and self._reality == other._reality
+                and self._travelers == other._travelers
+                and self._locations == other._locations
+                and self._events == other._events)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({repr(self._continuum)},{repr(self._reality)},{repr(self._travelers)}," \
+               f"{repr(self._locations)},{repr(self._events)})"
+
+
+def take_snapshot(
+        continuum: float, reality: int, *, travelers: Iterable[Traveler], locations: Iterable[Location], events: Iterable[Event]
+) -> Snapshot:
+    # Each traveler's path at the continuum is looked up in their journey's continuum index, then all of them are interpolated
+    # together
+    paths_by_traveler_id = {}
+    for traveler in travelers:
+        path = traveler.continuum_index.path_at(continuum, reality)
+        if path is not None:
+            paths_by_traveler_id[traveler.id] = path
+    positions = interpolate_positions(list(paths_by_traveler_id.values()), continuum)
+
+    def spans_snapshot(entity: SpanningEntity) -> bool:
+        return entity.span.continuum.low <= continuum <= entity.span.continuum.high and reality in entity.span.reality
+
+    return Snapshot(
+        continuum=continuum, reality=reality, travelers=dict(zip(paths_by_traveler_id, positions)),
+        locations={location.id for location in locations if spans_snapshot(location)},
+        events={event.id for event in events if spans_snapshot(event)})
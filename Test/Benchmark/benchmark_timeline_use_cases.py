@@ -0,0 +1,110 @@
+from argparse import ArgumentParser, Namespace
+from random import Random
+from time import perf_counter
+from typing import List, Set, Union
+
+from adapter.persistence.in_memory_repositories import InMemoryWorldRepository, InMemoryLocationRepository, InMemoryTravelerRepository, \
+    InMemoryEventRepository
+from application.access.clients import Profile
+from application.use_case.timeline_use_cases import TimelineUseCase
+from domain.collections import Range
+from domain.events import Event
+from domain.ids import generate_prefixed_id, PrefixedUUID
+from domain.positions import PositionalMove, Position, MovementType, PositionalRange
+from domain.travelers import Traveler
+from domain.worlds import World
+
+
+def _main() -> None:
+    args = _parse_arguments()
+    rng = Random(args.seed)
+
+    world_repository = InMemoryWorldRepository()
+    traveler_repository = InMemoryTravelerRepository()
+    event_repository = InMemoryEventRepository()
+    timeline_use_case = TimelineUseCase(world_repository, InMemoryLocationRepository(), traveler_repository, event_repository)
+    profile = Profile("benchmark", "benchmark")
+
+    world = World(id=generate_prefixed_id("world"), name="Benchmark World")
+    world_repository.save(world)
+    traveler = Traveler(id=generate_prefixed_id("traveler"), name="Benchmark Traveler", journey=_journey(rng, args.moves))
+    traveler_repository.save(traveler)
+    world_repository.associate(world.id, traveler_id=traveler.id)
+    events = _events(rng, args.events, traveler)
+    for event in events:
+        event_repository.save(event)
+        world_repository.associate(world.id, event_id=event.id)
+
+    start = perf_counter()
+    timeline = timeline_use_case.construct_traveler_timeline(world.id, traveler.id, profile=profile)
+    sweep_seconds = perf_counter() - start
+    print(f"construct_traveler_timeline: {args.moves} moves, {args.events} events, {len(timeline)} entries in {sweep_seconds:.3f}s")
+
+    if args.compare:
+        start = perf_counter()
+        rescan_timeline = _rescan_traveler_timeline(traveler, set(events))
+        rescan_seconds = perf_counter() - start
+        print(f"per-move rescan: {len(rescan_timeline)} entries in {rescan_seconds:.3f}s ({rescan_seconds / sweep_seconds:.1f}x slower)")
+        if timeline != rescan_timeline:
+            raise AssertionError("Timelines differ")
+
+
+def _parse_arguments() -> Namespace:
+    parser = ArgumentParser(description="Times construct_traveler_timeline for a single traveler with many linked events.")
+    parser.add_argument("--moves", type=int, default=10_000, help="Number of moves in the traveler's journey")
+    parser.add_argument("--events", type=int, default=5_000, help="Number of events linked to the traveler")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated journey and events")
+    parser.add_argument("--compare", action="store_true", help="Also time the per-move rescan and check both produce the same timeline")
+    return parser.parse_args()
+
+
+def _journey(rng: Random, move_count: int) -> List[PositionalMove]:
+    # Mostly forward in continuum, with the occasional jump back
+    journey = []
+    continuum = 0.
+    for move_index in range(move_count):
+        continuum = continuum - rng.uniform(0., 200.) if rng.random() < 0.01 else continuum + rng.uniform(0.5, 1.5)
+        movement_type = MovementType.IMMEDIATE if move_index == 0 or rng.random() < 0.05 else MovementType.INTERPOLATED
+        if movement_type == MovementType.INTERPOLATED and continuum <= journey[-1].position.continuum:
+            movement_type = MovementType.IMMEDIATE
+        position = Position(latitude=rng.uniform(-100., 100.), longitude=rng.uniform(-100., 100.), altitude=0., continuum=continuum,
+                            reality=0)
+        journey.append(PositionalMove(position=position, movement_type=movement_type))
+    return journey
+
+
+def _events(rng: Random, event_count: int, traveler: Traveler) -> List[Event]:
+    events = []
+    for _ in range(event_count):
+        included = rng.choice(traveler.journey).position
+        span = PositionalRange(
+            latitude=Range(included.latitude - rng.uniform(0., 50.), included.latitude + rng.uniform(0., 50.)),
+            longitude=Range(included.longitude - rng.uniform(0., 50.), included.longitude + rng.uniform(0., 50.)),
+            altitude=Range(-1., 1.),
+            continuum=Range(included.continuum - rng.uniform(0., 20.), included.continuum + rng.uniform(0., 20.)),
+            reality={0})
+        events.append(Event(id=generate_prefixed_id("event"), name="Benchmark Event", span=span, affected_travelers={traveler.id}))
+    return events
+
+
+def _rescan_traveler_timeline(traveler: Traveler, events: Set[Event]) -> List[Union[PrefixedUUID, PositionalMove]]:
+    # Reference: checks every event against every move
+    timeline = []
+    previously_applicable_events = set()
+    for positional_move in traveler.journey:
+        applicable_events = {event for event in events if event.span.includes(positional_move.position)}
+        newly_applicable_events = sorted(applicable_events - previously_applicable_events,
+                                         key=lambda event: (event.span.continuum.low, event.span.continuum.high, str(event.id)))
+        newly_applicable_ids = [event.id for event in newly_applicable_events]
+        previously_applicable_events = applicable_events
+        if positional_move.movement_type == MovementType.IMMEDIATE:
+            timeline.append(positional_move)
+            timeline.extend(newly_applicable_ids)
+        else:
+            timeline.extend(newly_applicable_ids)
+            timeline.append(positional_move)
+    return timeline
+
+
+if __name__ == "__main__":
+    _main()
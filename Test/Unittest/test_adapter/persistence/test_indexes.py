@@ -0,0 +1,364 @@
+from random import sample
+from unittest import TestCase
+
+from Test.Unittest.test_helpers.anons import anon_float, anon_int, anon_prefixed_id, anon_traveler, anon_position, anon_tag, \
+    anon_name, anon_positional_range
+from adapter.persistence.indexes import SpatialIndex, JourneyIndex, TagIndex, NameIndex, SpanIndex
+from domain.collections import Range
+from domain.positions import PositionalMove, Position, MovementType, PositionalRange
+from domain.travelers import Traveler
+
+
+def _anon_box(size: float = 10.) -> tuple:
+    lows = tuple(anon_float(-100., 100.) for _ in range(5))
+    highs = tuple(low + anon_float(0., size) for low in lows)
+    return lows, highs
+
+
+def _boxes_intersect(box_a: tuple, box_b: tuple) -> bool:
+    return all(low_a <= high_b and low_b <= high_a for low_a, high_a, low_b, high_b in zip(box_a[0], box_a[1], box_b[0], box_b[1]))
+
+
+class TestSpatialIndex(TestCase):
+    def test__search__should_return_same_entries_as_exhaustive_scan__when_many_entries_inserted_and_removed(self) -> None:
+        # Arrange
+        index = SpatialIndex()
+        boxes_by_key = {key: _anon_box() for key in range(500)}
+        for key, box in boxes_by_key.items():
+            index.insert(key, box)
+        for key in sample(list(boxes_by_key), 300):
+            index.remove(key)
+            boxes_by_key.pop(key)
+        query = _anon_box(size=80.)
+        expected = {key for key, box in boxes_by_key.items() if _boxes_intersect(box, query)}
+
+        # Act
+        actual = {entry.key for entry in index.search(query)}
+
+        # Assert
+        self.assertSetEqual(expected, actual)
+        self.assertEqual(len(boxes_by_key), len(index))
+
+    def test__search__should_return_nothing__when_empty(self) -> None:
+        # Arrange
+        index = SpatialIndex()
+
+        # Act
+        actual = list(index.search(_anon_box()))
+
+        # Assert
+        self.assertListEqual([], actual)
+
+
+class TestJourneyIndex(TestCase):
+    def test__retrieve_ids__should_return_all_indexed__when_no_filters_provided(self) -> None:
+        # Arrange
+        index = JourneyIndex()
+        travelers = [anon_traveler() for _ in range(3)]
+        for traveler in travelers:
+            index.add(traveler)
+        expected = {traveler.id for traveler in travelers}
+
+        # Act
+        actual = index.retrieve_ids()
+
+        # Assert
+        self.assertSetEqual(expected, actual)
+
+    def test__retrieve_ids__should_return_travelers_passing_through_range__when_interpolating_across_it(self) -> None:
+        # Arrange
+        index = JourneyIndex()
+        reality = anon_int()
+        interpolating = anon_traveler(journey=[
+            PositionalMove(position=Position(latitude=-5, longitude=0, altitude=0, continuum=0, reality=reality),
+                           movement_type=MovementType.IMMEDIATE),
+            PositionalMove(position=Position(latitude=5, longitude=0, altitude=0, continuum=10, reality=reality),
+                           movement_type=MovementType.INTERPOLATED),
+        ])
+        jumping = anon_traveler(journey=[
+            PositionalMove(position=Position(latitude=-5, longitude=0, altitude=0, continuum=0, reality=reality),
+                           movement_type=MovementType.IMMEDIATE),
+            PositionalMove(position=Position(latitude=5, longitude=0, altitude=0, continuum=10, reality=reality),
+                           movement_type=MovementType.IMMEDIATE),
+        ])
+        index.add(interpolating)
+        index.add(jumping)
+        range_ = Range(-1., 6.)
+        positional_range = PositionalRange(latitude=range_, longitude=range_, altitude=range_, continuum=range_, reality={reality})
+
+        # Act
+        actual = index.retrieve_ids(journey_intersects=positional_range)
+
+        # Assert
+        self.assertSetEqual({interpolating.id}, actual)
+
+    def test__retrieve_ids__should_return_travelers_with_exact_position__when_journey_includes_provided(self) -> None:
+        # Arrange
+        index = JourneyIndex()
+        position = anon_position()
+        expected = anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])
+        index.add(expected)
+        index.add(anon_traveler())
+
+        # Act
+        actual = index.retrieve_ids(journey_includes=position)
+
+        # Assert
+        self.assertSetEqual({expected.id}, actual)
+
+    def test__estimate_count__should_be_exact__when_journey_includes_provided(self) -> None:
+        # Arrange
+        index = JourneyIndex()
+        position = anon_position()
+        index.add(anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)]))
+        index.add(anon_traveler())
+
+        # Act
+        actual = index.estimate_count(journey_includes=position)
+
+        # Assert
+        self.assertEqual(1, actual)
+
+    def test__remove__should_no_longer_return_traveler(self) -> None:
+        # Arrange
+        index = JourneyIndex()
+        position = anon_position()
+        traveler = anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])
+        index.add(traveler)
+
+        # Act
+        index.remove(traveler.id)
+
+        # Assert
+        self.assertSetEqual(set(), index.retrieve_ids(journey_includes=position))
+        self.assertSetEqual(set(), index.retrieve_ids())
+
+    def test__append__should_index_like_the_appended_journey__when_traveler_indexed(self) -> None:
+        # Arrange
+        reality = anon_int()
+        start = PositionalMove(position=Position(latitude=0, longitude=0, altitude=0, continuum=0, reality=reality),
+                               movement_type=MovementType.IMMEDIATE)
+        appended_move = PositionalMove(position=Position(latitude=10, longitude=0, altitude=0, continuum=10, reality=reality),
+                                       movement_type=MovementType.INTERPOLATED)
+        traveler = anon_traveler(journey=[start])
+        index = JourneyIndex()
+        index.add(traveler)
+        expected_index = JourneyIndex()
+        expected_index.add(Traveler(id=traveler.id, name=traveler.name, journey=[start, appended_move]))
+        range_ = Range(4., 6.)
+        positional_range = PositionalRange(latitude=range_, longitude=Range(0., 0.), altitude=Range(0., 0.), continuum=range_,
+                                           reality={reality})
+
+        # Act
+        index.append(traveler.id, appended_move)
+
+        # Assert
+        self.assertSetEqual({traveler.id}, index.retrieve_ids(journey_intersects=positional_range))
+        self.assertSetEqual(expected_index.retrieve_ids(journey_includes=appended_move.position),
+                            index.retrieve_ids(journey_includes=appended_move.position))
+
+    def test__remove__should_ignore_unknown_ids(self) -> None:
+        # Arrange
+        index = JourneyIndex()
+
+        # Act
+        index.remove(anon_prefixed_id(prefix="traveler"))
+
+        # Assert
+        self.assertSetEqual(set(), index.retrieve_ids())
+
+
+class TestSpanIndex(TestCase):
+    def test__retrieve_ids__should_match_exhaustive_scan__when_continuum_and_reality_provided(self) -> None:
+        # Arrange
+        index = SpanIndex()
+        spans_by_id = {}
+        for _ in range(200):
+            low = anon_float(-100., 100.)
+            spans_by_id[anon_prefixed_id(prefix="event")] = anon_positional_range(
+                continuum=Range(low, low + anon_float(0., 30.)), reality={anon_int(0, 3), anon_int(0, 3)})
+        for entity_id, span in spans_by_id.items():
+            index.add(entity_id, span)
+        for entity_id in sample(list(spans_by_id), 50):
+            index.remove(entity_id)
+            spans_by_id.pop(entity_id)
+        low = anon_float(-100., 100.)
+        continuum = Range(low, low + anon_float(0., 50.))
+        reality = {anon_int(0, 3)}
+
+        # Act
+        actual = index.retrieve_ids(continuum_intersects=continuum, reality_intersects=reality)
+
+        # Assert
+        expected = {
+            entity_id for entity_id, span in spans_by_id.items()
+            if span.continuum.low <= continuum.high and continuum.low <= span.continuum.high and span.reality.intersection(reality)
+        }
+        self.assertSetEqual(expected, actual)
+
+
+    def test__retrieve_ids__should_match_exhaustive_scan__when_span_includes_provided(self) -> None:
+        # Arrange
+        index = SpanIndex()
+        spans_by_id = {}
+        for _ in range(200):
+            lows = [anon_float(-10., 10.) for _ in range(4)]
+            spans_by_id[anon_prefixed_id(prefix="event")] = PositionalRange(
+                latitude=Range(lows[0], lows[0] + 8.), longitude=Range(lows[1], lows[1] + 8.), altitude=Range(lows[2], lows[2] + 8.),
+                continuum=Range(lows[3], lows[3] + 8.), reality={anon_int(0, 3), anon_int(0, 3)})
+        for entity_id, span in spans_by_id.items():
+            index.add(entity_id, span)
+        position = Position(latitude=anon_float(-5., 5.), longitude=anon_float(-5., 5.), altitude=anon_float(-5., 5.),
+                            continuum=anon_float(-5., 5.), reality=anon_int(0, 3))
+        continuum = Range(position.continuum + 2., position.continuum + 20.)
+
+        # Act
+        actual = index.retrieve_ids(span_includes=position)
+        actual_in_window = index.retrieve_ids(span_includes=position, continuum_intersects=continuum)
+
+        # Assert
+        expected = {entity_id for entity_id, span in spans_by_id.items() if span.includes(position)}
+        self.assertSetEqual(expected, actual)
+        expected_in_window = {entity_id for entity_id in expected if spans_by_id[entity_id].continuum.intersects(continuum)}
+        self.assertSetEqual(expected_in_window, actual_in_window)
+
+
+class TestTagIndex(TestCase):
+    def test__retrieve_ids__should_match_set_based_tag_filtering(self) -> None:
+        # Arrange
+        index = TagIndex()
+        tags = [anon_tag() for _ in range(6)]
+        tags_by_id = {anon_prefixed_id(): set(sample(tags, anon_int(0, 4))) for _ in range(200)}
+        for entity_id, entity_tags in tags_by_id.items():
+            index.add(entity_id, entity_tags)
+        for entity_id in sample(list(tags_by_id), 50):
+            index.remove(entity_id)
+            tags_by_id.pop(entity_id)
+        filter_tags = set(sample(tags, 2))
+
+        # Act
+        actual_all = index.retrieve_ids(tagged_all=filter_tags)
+        actual_any = index.retrieve_ids(tagged_any=filter_tags)
+        actual_only = index.retrieve_ids(tagged_only=filter_tags)
+        actual_none = index.retrieve_ids(tagged_none=filter_tags)
+
+        # Assert
+        self.assertSetEqual({id_ for id_, entity_tags in tags_by_id.items() if filter_tags.issubset(entity_tags)}, actual_all)
+        self.assertSetEqual({id_ for id_, entity_tags in tags_by_id.items() if filter_tags.intersection(entity_tags)}, actual_any)
+        self.assertSetEqual({id_ for id_, entity_tags in tags_by_id.items() if filter_tags.issuperset(entity_tags)}, actual_only)
+        self.assertSetEqual({id_ for id_, entity_tags in tags_by_id.items() if filter_tags.isdisjoint(entity_tags)}, actual_none)
+
+    def test__retrieve_ids__should_return_all_indexed__when_no_filters_provided(self) -> None:
+        # Arrange
+        index = TagIndex()
+        entity_ids = {anon_prefixed_id() for _ in range(3)}
+        for entity_id in entity_ids:
+            index.add(entity_id, {anon_tag()})
+
+        # Act
+        actual = index.retrieve_ids()
+
+        # Assert
+        self.assertSetEqual(entity_ids, actual)
+
+    def test__estimate_count__should_not_underestimate__when_tag_filters_provided(self) -> None:
+        # Arrange
+        index = TagIndex()
+        tags = [anon_tag() for _ in range(6)]
+        for _ in range(100):
+            index.add(anon_prefixed_id(), set(sample(tags, anon_int(0, 4))))
+        filter_tags = set(sample(tags, 2))
+
+        for filters in [{"tagged_all": filter_tags}, {"tagged_any": filter_tags}, {"tagged_none": filter_tags}, {}]:
+            # Act
+            actual = index.estimate_count(**filters)
+
+            # Assert
+            self.assertGreaterEqual(actual, len(index.retrieve_ids(**filters)))
+
+    def test__add__should_replace_previous_tags__when_entity_already_indexed(self) -> None:
+        # Arrange
+        index = TagIndex()
+        entity_id = anon_prefixed_id()
+        old_tag = anon_tag()
+        new_tag = anon_tag()
+        index.add(entity_id, {old_tag})
+
+        # Act
+        index.add(entity_id, {new_tag})
+
+        # Assert
+        self.assertSetEqual(set(), index.retrieve_ids(tagged_any={old_tag}))
+        self.assertSetEqual({entity_id}, index.retrieve_ids(tagged_any={new_tag}))
+
+
+class TestNameIndex(TestCase):
+    def test__retrieve_ids__should_match_substring_scan__when_name_has_provided(self) -> None:
+        # Arrange
+        index = NameIndex()
+        names_by_id = {anon_prefixed_id(): anon_name() for _ in range(200)}
+        for entity_id, name in names_by_id.items():
+            index.add(entity_id, name)
+        for entity_id in sample(list(names_by_id), 50):
+            index.remove(entity_id)
+            names_by_id.pop(entity_id)
+        queries = [name[2:6].upper() for name in sample(list(names_by_id.values()), 10)] + ["a", "Z_", ""]
+
+        for query in queries:
+            # Act
+            actual = index.retrieve_ids(name_has=query)
+
+            # Assert
+            self.assertSetEqual({entity_id for entity_id, name in names_by_id.items() if query.lower() in name.lower()}, actual)
+
+    def test__retrieve_ids__should_match_case_insensitively__when_name_is_provided(self) -> None:
+        # Arrange
+        index = NameIndex()
+        entity_id = anon_prefixed_id()
+        index.add(entity_id, "Rivendell")
+        index.add(anon_prefixed_id(), "Rivendell Gate")
+
+        # Act
+        actual = index.retrieve_ids(name_is="rIVENDELL")
+
+        # Assert
+        self.assertSetEqual({entity_id}, actual)
+
+    def test__retrieve_ids__should_require_both__when_name_is_and_name_has_provided(self) -> None:
+        # Arrange
+        index = NameIndex()
+        index.add(anon_prefixed_id(), "Rivendell")
+
+        # Act
+        actual = index.retrieve_ids(name_is="Rivendell", name_has="gate")
+
+        # Assert
+        self.assertSetEqual(set(), actual)
+
+    def test__add__should_replace_previous_name__when_entity_already_indexed(self) -> None:
+        # Arrange
+        index = NameIndex()
+        entity_id = anon_prefixed_id()
+        index.add(entity_id, "Bree")
+
+        # Act
+        index.add(entity_id, "Bag End")
+
+        # Assert
+        self.assertSetEqual(set(), index.retrieve_ids(name_has="bree"))
+        self.assertSetEqual({entity_id}, index.retrieve_ids(name_has="bag"))
+
+    def test__estimate_count__should_not_underestimate__when_name_has_provided(self) -> None:
+        # Arrange
+        index = NameIndex()
+        names = [anon_name() for _ in range(100)]
+        for name in names:
+            index.add(anon_prefixed_id(), name)
+        queries = [name[2:6] for name in sample(names, 10)] + ["a", ""]
+
+        for query in queries:
+            # Act
+            actual = index.estimate_count(name_has=query)
+
+            # Assert
+            self.assertGreaterEqual(actual, len(index.retrieve_ids(name_has=query)))
@@ -8,7 +8,7 @@ from Test.Unittest.test_helpers.anons import anon_string, anon_name, anon_route
 from application.access.clients import Profile
 from application.requests.rest import RESTMethod, HandlerResult
 from application.requests.rest.controllers import RESTController
-from application.requests.rest.utils import error_response
+from application.requests.rest.utils import error_response, stream_json_array
 
 
 class TestRESTController(ABC):
@@ -79,6 +79,42 @@ class TestRESTController(ABC):
         self.assertEqual(expected_1, actual_1.data.decode())
         self.assertEqual(expected_2, actual_2.data.decode())
 
+    def test__registered_route__should_include_headers__when_handler_returns_headers(self, *_) -> None:
+        # Arrange
+        route = anon_route()
+        expected_header = anon_name()
+
+        @self.controller.register_rest_endpoint(route, RESTMethod.GET)
+        def handler(**_) -> HandlerResult:
+            return HTTPStatus.OK, "", {"X-Anon-Header": expected_header}
+
+        self.controller.finalize()
+
+        # Act
+        actual = self.invoke(route, RESTMethod.GET)
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual(expected_header, actual.headers["X-Anon-Header"])
+
+    def test__registered_route__should_send_all_chunks__when_handler_returns_streamed_contents(self, *_) -> None:
+        # Arrange
+        route = anon_route()
+        expected_items = [anon_name() for _ in range(5)]
+
+        @self.controller.register_rest_endpoint(route, RESTMethod.GET)
+        def handler(**_) -> HandlerResult:
+            return HTTPStatus.OK, stream_json_array(expected_items)
+
+        self.controller.finalize()
+
+        # Act
+        actual = self.invoke(route, RESTMethod.GET)
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual(expected_items, actual.json)
+
     def test__registered_route__should_pass_none_for_profile__when_profile_equivalent_not_set(self, *_) -> None:
         # Arrange
         self.setup_equivalent_of_profile(None)
@@ -1,5 +1,6 @@
 from typing import Set, Any, TypeVar, Type, List, Dict
 from unittest import TestCase
+from unittest.mock import patch
 
 from parameterized import parameterized
 
@@ -12,7 +13,7 @@ from domain.positions import PositionalRange, PositionalMove, Position, Movement
 from domain.tags import Tag
 from domain.travelers import Traveler
 from domain.worlds import World
-from test_helpers.anons import anon_anything
+from test_helpers.anons import anon_anything, anon_traveler
 
 
 T = TypeVar("T")
@@ -52,3 +53,42 @@ class JsonTranslatorTest(TestCase):
         with self.assertRaises(TypeError) as _:
             action()
             self.fail(f"Should not have been able to parse a {type_} from '{invalid_param}'")
+
+    def test__to_json__should_not_include_continuum_index__when_traveler_journey_was_indexed(self) -> None:
+        # Arrange
+        traveler = anon_traveler()
+        expected = JsonTranslator.to_json(traveler)
+        _ = traveler.continuum_index
+
+        # Act
+        actual = JsonTranslator.to_json(traveler)
+
+        # Assert
+        self.assertEqual(expected, actual)
+        self.assertNotIn("continuum_index", actual)
+
+    def test__to_json__should_leave_out_omitted_attributes__when_omit_provided(self) -> None:
+        # Arrange
+        traveler = anon_traveler()
+        expected = JsonTranslator.to_json(traveler)
+        expected.pop("journey")
+
+        # Act
+        actual = JsonTranslator.to_json(traveler, omit={"journey"})
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test__to_json__should_only_translate_requested_attributes__when_fields_provided(self) -> None:
+        # Arrange
+        traveler = anon_traveler()
+        full = JsonTranslator.to_json(traveler)
+        expected = {"id": full["id"], "name": full["name"]}
+
+        # Act
+        with patch.object(JsonTranslator, "to_json", wraps=JsonTranslator.to_json) as to_json_spy:
+            actual = JsonTranslator.to_json(traveler, fields={"id", "name", "unknown"})
+
+        # Assert
+        self.assertEqual(expected, actual)
+        self.assertNotIn(traveler.journey, [call.args[0] for call in to_json_spy.call_args_list])
@@ -35,6 +35,7 @@ class TestTimelineTrackerApp(TestCase):
         self.assertIsNotNone(app._traveler_use_case)
         self.assertIsNotNone(app._event_use_case)
         self.assertIsNotNone(app._timeline_use_case)
+        self.assertIsNotNone(app._transfer_use_case)
 
     @patch("application.main.WorldsRESTRequestHandler")
     def test__initialize_controllers__should_register_world_routes(self, world_handler_class_mock: MagicMock) -> None:
@@ -89,9 +90,23 @@ class TestTimelineTrackerApp(TestCase):
         event_route_registration_method.assert_called_once()
 
 
+    @patch("application.main.TransfersRestRequestHandler")
+    def test__initialize_controllers__should_register_transfer_routes(self, transfer_handler_class_mock: MagicMock) -> None:
+        # Arrange
+        app = TimelineTrackerApp(**_CONFIG)
+
+        # Act
+        app.initialize_controllers(
+            rest_controller_config=dict(controller_class_path="test_application.test_main.TestableRESTControllerStub"))
+
+        # Assert
+        transfer_route_registration_method: MagicMock = transfer_handler_class_mock.register_routes
+        transfer_route_registration_method.assert_called_once()
+
 class TestableRESTControllerStub(RESTController):
     def register_rest_endpoint(
-            self, route: str, method: RESTMethod, response_type: MIMEType = MIMEType.JSON, *, json: bool = False, query_params: bool = False
+            self, route: str, method: RESTMethod, response_type: MIMEType = MIMEType.JSON, *, json: bool = False,
+            query_params: bool = False, lines: bool = False
     ) -> HandlerRegisterer:
         return MagicMock()
 
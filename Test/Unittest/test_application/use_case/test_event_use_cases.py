@@ -1,6 +1,5 @@
 from copy import deepcopy
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
 
 from Test.Unittest.test_helpers.anons import anon_prefixed_id, anon_positional_range, anon_name, anon_description, anon_tag, \
     anon_create_event_kwargs, anon_event, anon_anything, anon_location, anon_traveler, anon_attributes, anon_world
@@ -8,10 +7,12 @@ from adapter.persistence.in_memory_repositories import InMemoryEventRepository,
     InMemoryWorldRepository
 from application.access.clients import Profile
 from application.use_case.event_use_cases import EventUseCase
+from domain.collections import Range
 from domain.events import Event
 from domain.ids import PrefixedUUID
+from domain.overlaps import EventOverlap
 from domain.persistence.repositories import TravelerRepository, LocationRepository
-from domain.positions import PositionalMove, MovementType, Position
+from domain.positions import PositionalMove, MovementType, Position, PositionalRange
 
 
 class TestEventUseCase(TestCase):
@@ -176,6 +177,30 @@ class TestEventUseCase(TestCase):
         # Assert
         self.assertRaises(ValueError, action)
 
+    def test__retrieve_many__should_return_saved_in_given_order__when_all_exist_for_given_world(self) -> None:
+        # Arrange
+        event_a = self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs())
+        event_b = self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs())
+
+        # Act
+        actual = self.event_use_case.retrieve_many(self.world_id, [event_b.id, event_a.id], profile=self.profile)
+
+        # Assert
+        self.assertListEqual([event_b, event_a], actual)
+
+    def test__retrieve_page__should_return_saved_of_page_ids(self) -> None:
+        # Arrange
+        for _ in range(3):
+            self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs())
+        expected_ids, expected_has_more = self.event_use_case.retrieve_page_ids(self.world_id, limit=2, profile=self.profile)
+
+        # Act
+        actual, actual_has_more = self.event_use_case.retrieve_page(self.world_id, limit=2, profile=self.profile)
+
+        # Assert
+        self.assertListEqual(expected_ids, [event.id for event in actual])
+        self.assertEqual(expected_has_more, actual_has_more)
+
     def test__retrieve_all__should_raise_exception__when_world_does_not_exist(self) -> None:
         # Arrange
 
@@ -210,50 +235,66 @@ class TestEventUseCase(TestCase):
         # Assert
         self.assertSetEqual(expected, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_named_entities")
-    def test__retrieve_all__should_delegate_to_filter_named_entities__when_filtering_necessary(
-            self, filter_named_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_events_matching_name_filters__when_name_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_event()}
-        filter_named_entities_mock.return_value = expected_output, {}
-        expected_input = {self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs())}
+        expected = {self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs(name="The Lonely Mountain"))}
+        self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs(name="Mountainous Lonely"))
+        self.event_use_case.create(self.other_world_id, profile=self.profile, **anon_create_event_kwargs(name="The Lonely Mountain"))
 
         # Act
-        actual = self.event_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual_name_has = self.event_use_case.retrieve_all(self.world_id, name_has="lONELY mou", profile=self.profile)
+        actual_name_is = self.event_use_case.retrieve_all(self.world_id, name_is="the lonely MOUNTAIN", profile=self.profile)
 
         # Assert
-        filter_named_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual_name_has)
+        self.assertSetEqual(expected, actual_name_is)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_tagged_entities")
-    def test__retrieve_all__should_delegate_to_filter_tagged_entities__when_filtering_necessary(
-            self, filter_tagged_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_events_matching_tag_filters__when_tag_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_event()}
-        filter_tagged_entities_mock.return_value = expected_output, {}
-        expected_input = {self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs())}
+        tag = anon_tag()
+        expected = {self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs(tags={tag, anon_tag()}))}
+        self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs(tags={anon_tag()}))
+        self.event_use_case.create(self.other_world_id, profile=self.profile, **anon_create_event_kwargs(tags={tag}))
 
         # Act
-        actual = self.event_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual = self.event_use_case.retrieve_all(self.world_id, tagged_all={tag}, tagged_none={anon_tag()}, profile=self.profile)
 
         # Assert
-        filter_tagged_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_spanning_entities")
-    def test__retrieve_all__should_delegate_to_filter_spanning_entities__when_filtering_necessary(
-            self, filter_spanning_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_events_matching_span_filters__when_span_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_event()}
-        filter_spanning_entities_mock.return_value = expected_output, {}
-        expected_input = {self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs())}
+        span = anon_positional_range(reality={1})
+        expected = {self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs(span=span))}
+        self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs(span=anon_positional_range(reality={2})))
+        position = Position(latitude=span.latitude.low, longitude=span.longitude.low, altitude=span.altitude.low,
+                            continuum=span.continuum.low, reality=1)
 
         # Act
-        actual = self.event_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual = self.event_use_case.retrieve_all(self.world_id, span_includes=position, profile=self.profile)
+
+        # Assert
+        self.assertSetEqual(expected, actual)
+
+    def test__plan_retrieve_all__should_drive_from_most_selective_index__when_several_indexed_filters_provided(self) -> None:
+        # Arrange
+        rare_tag = anon_tag()
+        common_tag = anon_tag()
+        expected = {self.event_use_case.create(
+            self.world_id, profile=self.profile, **anon_create_event_kwargs(tags={rare_tag, common_tag}))}
+        for _ in range(5):
+            self.event_use_case.create(self.world_id, profile=self.profile, **anon_create_event_kwargs(tags={common_tag}))
+
+        # Act
+        plan = self.event_use_case.plan_retrieve_all(
+            self.world_id, tagged_any={common_tag}, name_has="", span_intersects=anon_positional_range(), profile=self.profile)
+        selective_plan = self.event_use_case.plan_retrieve_all(
+            self.world_id, tagged_all={rare_tag}, tagged_any={common_tag}, profile=self.profile)
 
         # Assert
-        filter_spanning_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertEqual("scan;scope=6;filter=name,tags,span", str(plan))
+        self.assertEqual("index=tags~1;scope=6", str(selective_plan))
+        self.assertSetEqual(expected, set(selective_plan.execute()))
 
     def test__retrieve_all__should_raise_exception__when_unsupported_filter_provided(self) -> None:
         # Arrange
@@ -377,3 +418,28 @@ class TestEventUseCase(TestCase):
 
         # Assert
         self.assertRaises(ValueError, action)
+
+    def test__find_overlaps__should_only_consider_events_of_the_world(self) -> None:
+        # Arrange
+        span = PositionalRange(
+            latitude=Range(0., 1.), longitude=Range(0., 1.), altitude=Range(0., 1.), continuum=Range(0., 1.), reality={0})
+        event_1 = self.event_use_case.create(self.world_id, name=anon_name(), span=span, profile=self.profile)
+        event_2 = self.event_use_case.create(self.world_id, name=anon_name(), span=span, profile=self.profile)
+        self.event_use_case.create(self.other_world_id, name=anon_name(), span=span, profile=self.profile)
+        deleted_event = self.event_use_case.create(self.world_id, name=anon_name(), span=span, profile=self.profile)
+        self.event_use_case.delete(self.world_id, deleted_event.id, profile=self.profile)
+
+        # Act
+        actual = self.event_use_case.find_overlaps(self.world_id, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([EventOverlap(events={event_1.id, event_2.id}, travelers=set())], actual)
+
+    def test__find_overlaps__should_raise_exception__when_world_does_not_exist(self) -> None:
+        # Arrange
+
+        # Act
+        def action(): self.event_use_case.find_overlaps(anon_prefixed_id(prefix="world"), profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
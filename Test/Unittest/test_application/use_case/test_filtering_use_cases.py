@@ -1,102 +1,86 @@
 from typing import Set
 from unittest import TestCase
 
-from Test.Unittest.test_helpers.anons import anon_traveler, anon_location, anon_tag, anon_anything
-from application.use_case.filtering_use_cases import FilteringUseCase
+from Test.Unittest.test_helpers.anons import anon_traveler, anon_location, anon_tag, anon_prefixed_id
+from application.use_case.filtering_use_cases import FilteringUseCase, FilterPredicate, FilterPlan, FilterResultCache
 from domain.collections import Range
 from domain.descriptors import NamedEntity
+from domain.ids import PrefixedUUID
+from domain.locations import Location
 from domain.positions import SpanningEntity, PositionalRange, Position, JourneyingEntity, PositionalMove, MovementType
 from domain.tags import TaggedEntity, Tag
 
 
 class TestFilteringUseCase(TestCase):
-    def test__filter_named_entity__should_pass_through_unused_kwargs(self) -> None:
-        # Arrange
-
-        # Act
-        _, actual = FilteringUseCase.filter_named_entities(set(), other_kwarg=anon_anything())
-
-        # Assert
-        self.assertIn("other_kwarg", actual)
-
-    def test__filter_named_entities__should_pass_through_all__when_no_filters_provided(self) -> None:
+    def test__matches_name_filters__should_match_all__when_no_filters_provided(self) -> None:
         # Arrange
         expected: Set[NamedEntity] = {anon_traveler(), anon_location()}
 
         # Act
-        actual, _ = FilteringUseCase.filter_named_entities(expected)
+        actual = {entity for entity in expected if FilteringUseCase.matches_name_filters(entity)}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_named_entity__should_filter_down_to_matching__when_name_is_provided(self) -> None:
+    def test__matches_name_filters__should_match_only_matching__when_name_is_provided(self) -> None:
         # Arrange
         expected: Set[NamedEntity] = {anon_traveler(name="name"), anon_location(name="name")}
         all_named_entities = {anon_location()}
         all_named_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_named_entities(all_named_entities, name_is="name")
+        actual = {entity for entity in all_named_entities if FilteringUseCase.matches_name_filters(entity, name_is="name")}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_named_entity__should_filter_down_to_matching__when_name_is_provided_with_different_case(self) -> None:
+    def test__matches_name_filters__should_match_only_matching__when_name_is_provided_with_different_case(self) -> None:
         # Arrange
         expected: Set[NamedEntity] = {anon_traveler(name="Name"), anon_location(name="Name")}
         all_named_entities = {anon_location()}
         all_named_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_named_entities(all_named_entities, name_is="name")
+        actual = {entity for entity in all_named_entities if FilteringUseCase.matches_name_filters(entity, name_is="name")}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_named_entity__should_filter_down_to_matching__when_name_has_provided(self) -> None:
+    def test__matches_name_filters__should_match_only_matching__when_name_has_provided(self) -> None:
         # Arrange
         expected: Set[NamedEntity] = {anon_traveler(name="this name 1"), anon_location(name="that name 2")}
         all_named_entities = {anon_location()}
         all_named_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_named_entities(all_named_entities, name_has="name")
+        actual = {entity for entity in all_named_entities if FilteringUseCase.matches_name_filters(entity, name_has="name")}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_named_entity__should_filter_down_to_matching__when_name_has_provided_with_different_case(self) -> None:
+    def test__matches_name_filters__should_match_only_matching__when_name_has_provided_with_different_case(self) -> None:
         # Arrange
         expected: Set[NamedEntity] = {anon_traveler(name="this name 1"), anon_location(name="that name 2")}
         all_named_entities = {anon_location()}
         all_named_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_named_entities(all_named_entities, name_has="Name")
+        actual = {entity for entity in all_named_entities if FilteringUseCase.matches_name_filters(entity, name_has="Name")}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_tagged_entity__should_pass_through_unused_kwargs(self) -> None:
-        # Arrange
-
-        # Act
-        _, actual = FilteringUseCase.filter_tagged_entities(set(), other_kwarg=anon_anything())
-
-        # Assert
-        self.assertIn("other_kwarg", actual)
-
-    def test__filter_tagged_entities__should_pass_through_all__when_no_filters_provided(self) -> None:
+    def test__matches_tag_filters__should_match_all__when_no_filters_provided(self) -> None:
         # Arrange
         expected: Set[TaggedEntity] = {anon_traveler(), anon_location()}
 
         # Act
-        actual, _ = FilteringUseCase.filter_tagged_entities(expected)
+        actual = {entity for entity in expected if FilteringUseCase.matches_tag_filters(entity)}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_tagged_entity__should_filter_down_to_matching__when_tagged_all_provided(self) -> None:
+    def test__matches_tag_filters__should_match_only_matching__when_tagged_all_provided(self) -> None:
         # Arrange
         expected: Set[TaggedEntity] = {
             anon_traveler(tags={Tag("tag1"), Tag("tag2")}), anon_location(tags={Tag("tag1"), Tag("tag2"), anon_tag()})
@@ -105,67 +89,60 @@ class TestFilteringUseCase(TestCase):
         all_tagged_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_tagged_entities(all_tagged_entities, tagged_all={Tag("tag1"), Tag("tag2")})
+        actual = {
+            entity for entity in all_tagged_entities if FilteringUseCase.matches_tag_filters(entity, tagged_all={Tag("tag1"), Tag("tag2")})
+        }
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_tagged_entity__should_filter_down_to_matching__when_tagged_any_provided(self) -> None:
+    def test__matches_tag_filters__should_match_only_matching__when_tagged_any_provided(self) -> None:
         # Arrange
         expected: Set[TaggedEntity] = {anon_traveler(tags={Tag("tag1"), anon_tag()}), anon_location(tags={Tag("tag1"), anon_tag()})}
         all_tagged_entities = {anon_location(tags={anon_tag()})}
         all_tagged_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_tagged_entities(all_tagged_entities, tagged_any={Tag("tag1")})
+        actual = {entity for entity in all_tagged_entities if FilteringUseCase.matches_tag_filters(entity, tagged_any={Tag("tag1")})}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_tagged_entity__should_filter_down_to_matching__when_tagged_only_provided(self) -> None:
+    def test__matches_tag_filters__should_match_only_matching__when_tagged_only_provided(self) -> None:
         # Arrange
         expected: Set[TaggedEntity] = {anon_traveler(tags={Tag("tag1")}), anon_location(tags=set())}
         all_tagged_entities = {anon_location(tags={Tag("tag1"), anon_tag()})}
         all_tagged_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_tagged_entities(all_tagged_entities, tagged_only={Tag("tag1")})
+        actual = {entity for entity in all_tagged_entities if FilteringUseCase.matches_tag_filters(entity, tagged_only={Tag("tag1")})}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_tagged_entity__should_filter_down_to_matching__when_tagged_none_provided(self) -> None:
+    def test__matches_tag_filters__should_match_only_matching__when_tagged_none_provided(self) -> None:
         # Arrange
         expected: Set[TaggedEntity] = {anon_traveler(tags={Tag("tag1"), anon_tag()}), anon_location(tags=set())}
         all_tagged_entities = {anon_location(tags={anon_tag(), Tag("tag2")})}
         all_tagged_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_tagged_entities(all_tagged_entities, tagged_none={Tag("tag2")})
+        actual = {entity for entity in all_tagged_entities if FilteringUseCase.matches_tag_filters(entity, tagged_none={Tag("tag2")})}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_spanning_entity__should_pass_through_unused_kwargs(self) -> None:
-        # Arrange
-
-        # Act
-        _, actual = FilteringUseCase.filter_spanning_entities(set(), other_kwarg=anon_anything())
-
-        # Assert
-        self.assertIn("other_kwarg", actual)
-
-    def test__filter_spanning_entities__should_pass_through_all__when_no_filters_provided(self) -> None:
+    def test__matches_span_filters__should_match_all__when_no_filters_provided(self) -> None:
         # Arrange
         expected: Set[SpanningEntity] = {anon_location(), anon_location()}
 
         # Act
-        actual, _ = FilteringUseCase.filter_spanning_entities(expected)
+        actual = {entity for entity in expected if FilteringUseCase.matches_span_filters(entity)}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_spanning_entity__should_filter_down_to_matching__when_span_includes_provided(self) -> None:
+    def test__matches_span_filters__should_match_only_matching__when_span_includes_provided(self) -> None:
         # Arrange
         positional_range = PositionalRange(latitude=Range(0, 1), longitude=Range(0, 1), altitude=Range(0, 1),
                                            continuum=Range(0, 1), reality={0})
@@ -175,12 +152,14 @@ class TestFilteringUseCase(TestCase):
         position_filter = Position(latitude=0, longitude=0, altitude=0, continuum=0, reality=0)
 
         # Act
-        actual, _ = FilteringUseCase.filter_spanning_entities(all_spanning_entities, span_includes=position_filter)
+        actual = {
+            entity for entity in all_spanning_entities if FilteringUseCase.matches_span_filters(entity, span_includes=position_filter)
+        }
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_spanning_entity__should_filter_down_to_matching__when_span_intersects_provided(self) -> None:
+    def test__matches_span_filters__should_match_only_matching__when_span_intersects_provided(self) -> None:
         # Arrange
         positional_range = PositionalRange(latitude=Range(0, 1), longitude=Range(0, 1), altitude=Range(0, 1),
                                            continuum=Range(0, 1), reality={0})
@@ -189,31 +168,24 @@ class TestFilteringUseCase(TestCase):
         all_spanning_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_spanning_entities(all_spanning_entities, span_intersects=positional_range)
+        actual = {
+            entity for entity in all_spanning_entities if FilteringUseCase.matches_span_filters(entity, span_intersects=positional_range)
+        }
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_journeying_entity__should_pass_through_unused_kwargs(self) -> None:
-        # Arrange
-
-        # Act
-        _, actual = FilteringUseCase.filter_journeying_entities(set(), other_kwarg=anon_anything())
-
-        # Assert
-        self.assertIn("other_kwarg", actual)
-
-    def test__filter_journeying_entities__should_pass_through_all__when_no_filters_provided(self) -> None:
+    def test__matches_journey_filters__should_match_all__when_no_filters_provided(self) -> None:
         # Arrange
         expected: Set[JourneyingEntity] = {anon_traveler(), anon_traveler()}
 
         # Act
-        actual, _ = FilteringUseCase.filter_journeying_entities(expected)
+        actual = {entity for entity in expected if FilteringUseCase.matches_journey_filters(entity)}
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_journeying_entity__should_filter_down_to_matching__when_journey_includes_provided(self) -> None:
+    def test__matches_journey_filters__should_match_only_matching__when_journey_includes_provided(self) -> None:
         # Arrange
         position = Position(latitude=0, longitude=0, altitude=0, continuum=0, reality=0)
         expected: Set[JourneyingEntity] = {anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])}
@@ -221,12 +193,14 @@ class TestFilteringUseCase(TestCase):
         all_journeying_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_journeying_entities(all_journeying_entities, journey_includes=position)
+        actual = {
+            entity for entity in all_journeying_entities if FilteringUseCase.matches_journey_filters(entity, journey_includes=position)
+        }
 
         # Assert
         self.assertEqual(expected, actual)
 
-    def test__filter_journeying_entity__should_filter_down_to_matching__when_journey_intersects_provided(self) -> None:
+    def test__matches_journey_filters__should_match_only_matching__when_journey_intersects_provided(self) -> None:
         # Arrange
         positional_range = PositionalRange(latitude=Range(0, 1), longitude=Range(0, 1), altitude=Range(0, 1),
                                            continuum=Range(0, 1), reality={0})
@@ -236,7 +210,195 @@ class TestFilteringUseCase(TestCase):
         all_journeying_entities |= expected
 
         # Act
-        actual, _ = FilteringUseCase.filter_journeying_entities(all_journeying_entities, journey_intersects=positional_range)
+        actual = {
+            entity for entity in all_journeying_entities
+            if FilteringUseCase.matches_journey_filters(entity, journey_intersects=positional_range)
+        }
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+
+class TestFilterPlan(TestCase):
+    def setUp(self) -> None:
+        self.entities_by_id = {entity.id: entity for entity in [anon_location() for _ in range(10)]}
+        self.retrieved_ids = []
+
+    def retrieve(self, entity_id: PrefixedUUID) -> Location:
+        self.retrieved_ids.append(entity_id)
+        return self.entities_by_id[entity_id]
+
+    def indexed_predicate(self, name: str, matching_ids: Set[PrefixedUUID]) -> FilterPredicate:
+        return FilterPredicate(name, lambda entity: entity.id in matching_ids,
+                               estimate_count=lambda: len(matching_ids), retrieve_ids=lambda: set(matching_ids))
+
+    def test__execute__should_only_retrieve_candidates_of_most_selective_index(self) -> None:
+        # Arrange
+        all_ids = list(self.entities_by_id)
+        selective = self.indexed_predicate("selective", set(all_ids[:2]))
+        broad = self.indexed_predicate("broad", set(all_ids[1:]))
+        plan = FilterPlan(set(all_ids), [broad, selective], retrieve=self.retrieve, retrieve_all_ids=lambda: set(all_ids))
+
+        # Act
+        actual = set(plan.execute())
+
+        # Assert
+        self.assertSetEqual({self.entities_by_id[all_ids[1]]}, actual)
+        self.assertCountEqual(all_ids[:2], self.retrieved_ids)
+        self.assertEqual("index=selective~2;scope=10;filter=broad", str(plan))
+
+    def test__execute__should_scan_scope__when_scope_smaller_than_every_index_estimate(self) -> None:
+        # Arrange
+        all_ids = list(self.entities_by_id)
+        scope_ids = set(all_ids[:3])
+        unindexed = FilterPredicate("unindexed", lambda entity: entity.id != all_ids[0])
+        plan = FilterPlan(scope_ids, [unindexed, self.indexed_predicate("broad", set(all_ids))],
+                          retrieve=self.retrieve, retrieve_all_ids=lambda: set(all_ids))
+
+        # Act
+        actual = set(plan.execute())
+
+        # Assert
+        self.assertSetEqual({self.entities_by_id[entity_id] for entity_id in all_ids[1:3]}, actual)
+        self.assertCountEqual(scope_ids, self.retrieved_ids)
+        self.assertEqual("scan;scope=3;filter=broad,unindexed", str(plan))
+
+    def test__execute__should_yield_in_id_order_after_given_id__when_after_provided(self) -> None:
+        # Arrange
+        ordered_ids = sorted(self.entities_by_id, key=str)
+        plan = FilterPlan(set(ordered_ids), [], retrieve=self.retrieve, retrieve_all_ids=lambda: set(ordered_ids))
+
+        # Act
+        actual = [entity.id for entity in plan.execute(after=ordered_ids[3])]
+
+        # Assert
+        self.assertListEqual(ordered_ids[4:], actual)
+        self.assertListEqual(ordered_ids[4:], self.retrieved_ids)
+
+    def test__execute__should_ignore_scoped_ids_no_longer_stored(self) -> None:
+        # Arrange
+        stored_ids = set(self.entities_by_id)
+        plan = FilterPlan(stored_ids | {anon_prefixed_id(prefix="location")}, [None], retrieve=self.retrieve,
+                          retrieve_all_ids=lambda: set(stored_ids))
+
+        # Act
+        actual = set(plan.execute())
+
+        # Assert
+        self.assertSetEqual(set(self.entities_by_id.values()), actual)
+
+    def test__execute_page_ids__should_not_retrieve_candidates__when_no_residual_predicates(self) -> None:
+        # Arrange
+        ordered_ids = sorted(self.entities_by_id, key=str)
+        plan = FilterPlan(None, [self.indexed_predicate("only", set(ordered_ids[:5]))], retrieve=self.retrieve,
+                          retrieve_all_ids=lambda: set(ordered_ids))
+
+        # Act
+        actual = plan.execute_page_ids(limit=3)
+
+        # Assert
+        self.assertEqual((ordered_ids[:3], True), actual)
+        self.assertListEqual([], self.retrieved_ids)
+
+    def test__execute_page__should_return_loaded_entities_up_to_limit(self) -> None:
+        # Arrange
+        ordered_ids = sorted(self.entities_by_id, key=str)
+        plan = FilterPlan(set(ordered_ids), [FilterPredicate("unindexed", lambda entity: entity.id != ordered_ids[0])],
+                          retrieve=self.retrieve, retrieve_all_ids=lambda: set(ordered_ids))
+
+        # Act
+        actual = plan.execute_page(limit=2)
+
+        # Assert
+        self.assertEqual(([self.entities_by_id[ordered_ids[1]], self.entities_by_id[ordered_ids[2]]], True), actual)
+        self.assertListEqual(ordered_ids[:4], self.retrieved_ids)
+
+    def test__filter_predicate__should_reject__when_only_partially_indexed(self) -> None:
+        # Arrange
+
+        # Act
+        def action(): FilterPredicate("partial", lambda _: True, estimate_count=lambda: 0)
+
+        # Assert
+        self.assertRaises(ValueError, action)
+
+
+class TestFilterResultCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = FilterResultCache(max_entries=2)
+        self.world_id = anon_prefixed_id(prefix="world")
+        self.compute_count = 0
+
+    def compute(self) -> int:
+        self.compute_count += 1
+        return self.compute_count
+
+    def test__retrieve__should_return_cached_result__when_same_filters_requested_again(self) -> None:
+        # Arrange
+        tags = {anon_tag(), anon_tag()}
+        expected = self.cache.retrieve(self.world_id, "location", {"tagged_all": tags, "name_is": None}, self.compute)
+
+        # Act
+        actual = self.cache.retrieve(self.world_id, "location", {"tagged_all": set(tags)}, self.compute)
+
+        # Assert
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, self.compute_count)
+
+    def test__retrieve__should_recompute__when_generation_bumped_for_world(self) -> None:
+        # Arrange
+        other_world_id = anon_prefixed_id(prefix="world")
+        self.cache.retrieve(self.world_id, "location", {}, self.compute)
+        other_world_result = self.cache.retrieve(other_world_id, "location", {}, self.compute)
+
+        # Act
+        self.cache.bump_generation(self.world_id)
+        actual = self.cache.retrieve(self.world_id, "location", {}, self.compute)
+        actual_other_world = self.cache.retrieve(other_world_id, "location", {}, self.compute)
+
+        # Assert
+        self.assertEqual(3, actual)
+        self.assertEqual(other_world_result, actual_other_world)
+
+    def test__retrieve__should_evict_least_recently_used__when_max_entries_exceeded(self) -> None:
+        # Arrange
+        self.cache.retrieve(self.world_id, "location", {}, self.compute)
+        self.cache.retrieve(self.world_id, "event", {}, self.compute)
+        self.cache.retrieve(self.world_id, "location", {}, self.compute)
+
+        # Act
+        self.cache.retrieve(self.world_id, "traveler", {}, self.compute)
+
+        # Assert
+        self.assertEqual(1, self.cache.retrieve(self.world_id, "location", {}, self.compute))
+        self.assertEqual(4, self.cache.retrieve(self.world_id, "event", {}, self.compute))
+
+    def test__retrieve__should_compute_without_caching__when_filters_unhashable(self) -> None:
+        # Arrange
+        filters = {"unsupported": [anon_tag()]}
+
+        # Act
+        self.cache.retrieve(self.world_id, "location", filters, self.compute)
+        actual = self.cache.retrieve(self.world_id, "location", filters, self.compute)
+
+        # Assert
+        self.assertEqual(2, actual)
+
+    def test__retrieve_page__should_cache_ids_and_retrieve_entities__when_same_page_requested_again(self) -> None:
+        # Arrange
+        entities = [anon_location() for _ in range(3)]
+        entities_by_id = {entity.id: entity for entity in entities}
+        retrieved_ids = []
+
+        def retrieve(entity_id: PrefixedUUID) -> Location:
+            retrieved_ids.append(entity_id)
+            return entities_by_id[entity_id]
+        expected = self.cache.retrieve_page(self.world_id, "location", {}, lambda: (entities, False), retrieve)
+
+        # Act
+        actual = self.cache.retrieve_page(self.world_id, "location", {}, lambda: self.fail("Page computed again"), retrieve)
 
         # Assert
         self.assertEqual(expected, actual)
+        self.assertListEqual([entity.id for entity in entities], retrieved_ids)
+        self.assertEqual(([entity.id for entity in entities], False), self.cache.retrieve(self.world_id, "location", {}, self.compute))
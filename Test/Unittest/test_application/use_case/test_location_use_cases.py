@@ -1,6 +1,6 @@
 from copy import deepcopy
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from Test.Unittest.test_helpers.anons import anon_prefixed_id, anon_positional_range, anon_name, anon_description, anon_tag, \
     anon_create_location_kwargs, anon_location, anon_anything, anon_event, anon_attributes
@@ -9,12 +9,14 @@ from application.access.clients import Profile
 from application.use_case.location_use_cases import LocationUseCase
 from domain.ids import PrefixedUUID
 from domain.locations import Location
-from domain.persistence.repositories import EventRepository
+from domain.positions import Position
+from domain.persistence.repositories import EventRepository, LocationRepository
 from test_helpers.anons import anon_world
 
 
 class TestLocationUseCase(TestCase):
     event_repository: EventRepository
+    location_repository: LocationRepository
     location_use_case: LocationUseCase
     profile: Profile
     world_id: PrefixedUUID
@@ -23,7 +25,8 @@ class TestLocationUseCase(TestCase):
     def setUp(self) -> None:
         world_repository = InMemoryWorldRepository()
         self.event_repository = InMemoryEventRepository()
-        self.location_use_case = LocationUseCase(world_repository, InMemoryLocationRepository(), self.event_repository)
+        self.location_repository = InMemoryLocationRepository()
+        self.location_use_case = LocationUseCase(world_repository, self.location_repository, self.event_repository)
         self.profile = Profile(anon_name(), anon_name())
         world_1 = anon_world()
         world_2 = anon_world()
@@ -126,6 +129,64 @@ class TestLocationUseCase(TestCase):
         # Assert
         self.assertRaises(ValueError, action)
 
+    def test__retrieve_many__should_return_saved_in_given_order__when_all_exist_for_given_world(self) -> None:
+        # Arrange
+        location_a = self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())
+        location_b = self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())
+
+        # Act
+        actual = self.location_use_case.retrieve_many(self.world_id, [location_b.id, location_a.id], profile=self.profile)
+
+        # Assert
+        self.assertListEqual([location_b, location_a], actual)
+
+    def test__retrieve_many__should_raise_exception__when_any_exists_for_another_world(self) -> None:
+        # Arrange
+        location_a = self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())
+        location_b = self.location_use_case.create(self.other_world_id, profile=self.profile, **anon_create_location_kwargs())
+
+        # Act
+        def action(): self.location_use_case.retrieve_many(self.world_id, [location_a.id, location_b.id], profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
+    def test__retrieve_many__should_raise_exception__when_invalid_id_provided(self) -> None:
+        # Arrange
+
+        # Act
+        def action(): self.location_use_case.retrieve_many(self.world_id, [anon_prefixed_id()], profile=self.profile)
+
+        # Assert
+        self.assertRaises(ValueError, action)
+
+    def test__retrieve_page__should_return_saved_of_page_ids(self) -> None:
+        # Arrange
+        for _ in range(3):
+            self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())
+        expected_ids, expected_has_more = self.location_use_case.retrieve_page_ids(self.world_id, limit=2, profile=self.profile)
+
+        # Act
+        actual, actual_has_more = self.location_use_case.retrieve_page(self.world_id, limit=2, profile=self.profile)
+
+        # Assert
+        self.assertListEqual(expected_ids, [location.id for location in actual])
+        self.assertEqual(expected_has_more, actual_has_more)
+
+    def test__retrieve_page__should_retrieve_each_location_once__when_filtered(self) -> None:
+        # Arrange
+        tag = anon_tag()
+        for _ in range(3):
+            self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={tag}))
+
+        # Act
+        with patch.object(self.location_repository, "retrieve", wraps=self.location_repository.retrieve) as retrieve_spy:
+            actual, _ = self.location_use_case.retrieve_page(self.world_id, tagged_all={tag}, name_has="", profile=self.profile)
+
+        # Assert
+        self.assertEqual(3, len(actual))
+        self.assertEqual(3, retrieve_spy.call_count)
+
     def test__retrieve_all__should_raise_exception__when_world_does_not_exist(self) -> None:
         # Arrange
 
@@ -160,50 +221,69 @@ class TestLocationUseCase(TestCase):
         # Assert
         self.assertSetEqual(expected, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_named_entities")
-    def test__retrieve_all__should_delegate_to_filter_named_entities__when_filtering_necessary(
-            self, filter_named_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_locations_matching_name_filters__when_name_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_location()}
-        filter_named_entities_mock.return_value = expected_output, {}
-        expected_input = {self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())}
+        expected = {self.location_use_case.create(
+            self.world_id, profile=self.profile, **anon_create_location_kwargs(name="The Lonely Mountain"))}
+        self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(name="Mountainous Lonely"))
+        self.location_use_case.create(self.other_world_id, profile=self.profile, **anon_create_location_kwargs(name="The Lonely Mountain"))
 
         # Act
-        actual = self.location_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual_name_has = self.location_use_case.retrieve_all(self.world_id, name_has="lONELY mou", profile=self.profile)
+        actual_name_is = self.location_use_case.retrieve_all(self.world_id, name_is="the lonely MOUNTAIN", profile=self.profile)
 
         # Assert
-        filter_named_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual_name_has)
+        self.assertSetEqual(expected, actual_name_is)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_tagged_entities")
-    def test__retrieve_all__should_delegate_to_filter_tagged_entities__when_filtering_necessary(
-            self, filter_tagged_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_locations_matching_tag_filters__when_tag_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_location()}
-        filter_tagged_entities_mock.return_value = expected_output, {}
-        expected_input = {self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())}
+        tag = anon_tag()
+        expected = {self.location_use_case.create(
+            self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={tag, anon_tag()}))}
+        self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={anon_tag()}))
+        self.location_use_case.create(self.other_world_id, profile=self.profile, **anon_create_location_kwargs(tags={tag}))
 
         # Act
-        actual = self.location_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual = self.location_use_case.retrieve_all(self.world_id, tagged_all={tag}, tagged_none={anon_tag()}, profile=self.profile)
 
         # Assert
-        filter_tagged_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_spanning_entities")
-    def test__retrieve_all__should_delegate_to_filter_spanning_entities__when_filtering_necessary(
-            self, filter_spanning_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_locations_matching_span_filters__when_span_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_location()}
-        filter_spanning_entities_mock.return_value = expected_output, {}
-        expected_input = {self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())}
+        span = anon_positional_range(reality={1})
+        expected = {self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(span=span))}
+        self.location_use_case.create(
+            self.world_id, profile=self.profile, **anon_create_location_kwargs(span=anon_positional_range(reality={2})))
+        position = Position(latitude=span.latitude.low, longitude=span.longitude.low, altitude=span.altitude.low,
+                            continuum=span.continuum.low, reality=1)
 
         # Act
-        actual = self.location_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual = self.location_use_case.retrieve_all(self.world_id, span_includes=position, profile=self.profile)
 
         # Assert
-        filter_spanning_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual)
+
+    def test__plan_retrieve_all__should_drive_from_most_selective_index__when_several_indexed_filters_provided(self) -> None:
+        # Arrange
+        rare_tag = anon_tag()
+        common_tag = anon_tag()
+        expected = {self.location_use_case.create(
+            self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={rare_tag, common_tag}))}
+        for _ in range(5):
+            self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={common_tag}))
+
+        # Act
+        plan = self.location_use_case.plan_retrieve_all(
+            self.world_id, tagged_any={common_tag}, name_has="", span_intersects=anon_positional_range(), profile=self.profile)
+        selective_plan = self.location_use_case.plan_retrieve_all(
+            self.world_id, tagged_all={rare_tag}, tagged_any={common_tag}, profile=self.profile)
+
+        # Assert
+        self.assertEqual("scan;scope=6;filter=name,tags,span", str(plan))
+        self.assertEqual("index=tags~1;scope=6", str(selective_plan))
+        self.assertSetEqual(expected, set(selective_plan.execute()))
 
     def test__retrieve_all__should_raise_exception__when_unsupported_filter_provided(self) -> None:
         # Arrange
@@ -214,6 +294,23 @@ class TestLocationUseCase(TestCase):
         # Assert
         self.assertRaises(ValueError, action)
 
+    def test__retrieve_all__should_not_serve_cached_results__when_locations_changed_since(self) -> None:
+        # Arrange
+        tag = anon_tag()
+        retagged = self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={tag}))
+        deleted = self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={tag}))
+        self.location_use_case.retrieve_all(self.world_id, tagged_all={tag}, profile=self.profile)
+        retagged.remove_tag(tag)
+        self.location_use_case.update(self.world_id, retagged, profile=self.profile)
+        self.location_use_case.delete(self.world_id, deleted.id, profile=self.profile)
+        created = self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs(tags={tag}))
+
+        # Act
+        actual = self.location_use_case.retrieve_all(self.world_id, tagged_all={tag}, profile=self.profile)
+
+        # Assert
+        self.assertSetEqual({created}, actual)
+
     def test__update__should_raise_exception__when_world_does_not_exist(self) -> None:
         # Arrange
         location = self.location_use_case.create(self.world_id, profile=self.profile, **anon_create_location_kwargs())
@@ -1,19 +1,25 @@
+from random import randint, choice
 from sys import float_info
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from Test.Unittest.test_helpers.anons import anon_prefixed_id, anon_positional_range, anon_name, \
-    anon_world, anon_create_traveler_kwargs
+    anon_world, anon_create_traveler_kwargs, anon_tag, positional_move_at
 from adapter.persistence.in_memory_repositories import InMemoryLocationRepository, InMemoryTravelerRepository, InMemoryEventRepository, \
     InMemoryWorldRepository
 from application.access.clients import Profile
 from application.use_case.event_use_cases import EventUseCase
 from application.use_case.location_use_cases import LocationUseCase
-from application.use_case.timeline_use_cases import TimelineUseCase
+from application.use_case.timeline_use_cases import TimelineUseCase, MaterializedTimelines
 from application.use_case.traveler_use_cases import TravelerUseCase
 from domain.collections import Range
+from domain.events import Event
 from domain.ids import PrefixedUUID
+from domain.journey_stats import JourneyStats
+from domain.locations import Location
 from domain.positions import Position, PositionalMove, MovementType, PositionalRange
+from domain.snapshots import Snapshot
+from domain.travelers import Traveler
 from test_helpers.anons import anon_create_location_kwargs, anon_create_event_kwargs
 
 
@@ -26,6 +32,11 @@ class TestTimelineUseCase(TestCase):
     traveler_use_case: TravelerUseCase
     event_use_case: EventUseCase
     timeline_use_case: TimelineUseCase
+    recomputing_timeline_use_case: TimelineUseCase
+    event_repository: InMemoryEventRepository
+    location_repository: InMemoryLocationRepository
+    traveler_repository: InMemoryTravelerRepository
+    materialized_timelines: MaterializedTimelines
     profile: Profile
     world_id: PrefixedUUID
     other_world_id: PrefixedUUID
@@ -35,10 +46,20 @@ class TestTimelineUseCase(TestCase):
         location_repository = InMemoryLocationRepository()
         traveler_repository = InMemoryTravelerRepository()
         event_repository = InMemoryEventRepository()
-        self.location_use_case = LocationUseCase(world_repository, location_repository, event_repository)
-        self.traveler_use_case = TravelerUseCase(world_repository, traveler_repository, event_repository)
-        self.event_use_case = EventUseCase(world_repository, location_repository, traveler_repository, event_repository)
-        self.timeline_use_case = TimelineUseCase(world_repository, location_repository, traveler_repository, event_repository)
+        self.event_repository = event_repository
+        self.location_repository = location_repository
+        self.traveler_repository = traveler_repository
+        materialized_timelines = MaterializedTimelines()
+        self.materialized_timelines = materialized_timelines
+        self.location_use_case = LocationUseCase(
+            world_repository, location_repository, event_repository, materialized_timelines=materialized_timelines)
+        self.traveler_use_case = TravelerUseCase(
+            world_repository, traveler_repository, event_repository, materialized_timelines=materialized_timelines)
+        self.event_use_case = EventUseCase(
+            world_repository, location_repository, traveler_repository, event_repository, materialized_timelines=materialized_timelines)
+        self.timeline_use_case = TimelineUseCase(
+            world_repository, location_repository, traveler_repository, event_repository, materialized_timelines=materialized_timelines)
+        self.recomputing_timeline_use_case = TimelineUseCase(world_repository, location_repository, traveler_repository, event_repository)
         self.maxDiff = None
         self.profile = Profile(anon_name(), anon_name())
         world_1 = anon_world()
@@ -129,26 +150,99 @@ class TestTimelineUseCase(TestCase):
         # Assert
         self.assertListEqual(expected_timeline, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_tagged_entities")
-    def test__construct_location_timeline__should_delegate_to_filter_tagged_entities__when_filtering_necessary(
-            self, filter_tagged_entities_mock: MagicMock) -> None:
+    def test__construct_location_timeline__should_only_include_events_matching_tag_filters__when_tag_filters_provided(self) -> None:
         # Arrange
         span = anon_positional_range()
-
+        tag = anon_tag()
         location = self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=span), profile=self.profile)
         event = self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=span, tags={tag}, affected_locations={location.id}), profile=self.profile)
+        self.event_use_case.create(
             self.world_id, **anon_create_event_kwargs(span=span, affected_locations={location.id}), profile=self.profile)
+        self.event_use_case.create(self.world_id, **anon_create_event_kwargs(span=span, tags={tag}), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_location_timeline(self.world_id, location.id, tagged_any={tag}, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([event.id], actual)
+
+    def test__construct_location_timeline__should_reflect_event_changes__when_events_change_after_first_construction(self) -> None:
+        # Arrange
+        large_range = Range(FLOAT_MIN_VALUE, FLOAT_MAX_VALUE)
+        location_id = self.location_use_case.create(self.world_id, **anon_create_location_kwargs(
+            span=PositionalRange(latitude=large_range, longitude=large_range, altitude=large_range, continuum=large_range, reality={0})
+        ), profile=self.profile).id
+        moved_event, deleted_event, unchanged_event = [self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(
+                span=anon_positional_range(continuum=Range(continuum, continuum + 1), reality={0}), affected_locations={location_id}),
+            profile=self.profile) for continuum in [1, 2, 3]]
+        self.timeline_use_case.construct_location_timeline(self.world_id, location_id, profile=self.profile)
+        self.event_use_case.update(self.world_id, Event(
+            id=moved_event.id, name=moved_event.name, span=anon_positional_range(continuum=Range(5, 6), reality={0}),
+            affected_locations={location_id}), profile=self.profile)
+        self.event_use_case.delete(self.world_id, deleted_event.id, profile=self.profile)
+        created_event = self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(
+                span=anon_positional_range(continuum=Range(4, 5), reality={0}), affected_locations={location_id}),
+            profile=self.profile)
 
-        filter_tagged_entities_mock.return_value = {event}, {}
-        expected_input = {event}
-        expected_output = [event.id]
+        # Act
+        actual = self.timeline_use_case.construct_location_timeline(self.world_id, location_id, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([unchanged_event.id, created_event.id, moved_event.id], actual)
+
+    def test__construct_location_timeline__should_list_current_events_without_reading_them__when_expand_events_requested(self) -> None:
+        # Arrange
+        location_id = self.location_use_case.create(self.world_id, **anon_create_location_kwargs(
+            span=anon_positional_range(continuum=Range(0, 10), reality={0})), profile=self.profile).id
+        location_span = self.location_use_case.retrieve(self.world_id, location_id, profile=self.profile).span
+        event = self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=location_span, affected_locations={location_id}), profile=self.profile)
+        self.timeline_use_case.construct_location_timeline(self.world_id, location_id, profile=self.profile)
+        updated_event = Event(id=event.id, name=anon_name(), span=location_span, affected_locations={location_id})
+        self.event_use_case.update(self.world_id, updated_event, profile=self.profile)
 
         # Act
-        actual = self.timeline_use_case.construct_location_timeline(self.world_id, location.id, profile=self.profile)
+        with patch.object(self.event_repository, "retrieve", wraps=self.event_repository.retrieve) as retrieve_spy:
+            actual = self.timeline_use_case.construct_location_timeline(
+                self.world_id, location_id, expand_events=True, profile=self.profile)
 
         # Assert
-        filter_tagged_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertListEqual([updated_event], actual)
+        retrieve_spy.assert_not_called()
+
+    def test__construct_location_timeline__should_only_include_events_overlapping_window__when_window_provided(self) -> None:
+        # Arrange
+        large_range = Range(FLOAT_MIN_VALUE, FLOAT_MAX_VALUE)
+        location_id = self.location_use_case.create(self.world_id, **anon_create_location_kwargs(
+            span=PositionalRange(latitude=large_range, longitude=large_range, altitude=large_range, continuum=large_range,
+                                 reality={0, 1})
+        ), profile=self.profile).id
+        before_event, overlapping_event, after_event, other_reality_event = [self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(
+                span=anon_positional_range(continuum=continuum, reality=reality), affected_locations={location_id}),
+            profile=self.profile) for continuum, reality in [(Range(0., 1.), {0}), (Range(5., 6.), {0}), (Range(10., 11.), {0}),
+                                                             (Range(5., 6.), {1})]]
+
+        # Act
+        actual = self.timeline_use_case.construct_location_timeline(
+            self.world_id, location_id, continuum_from=4., continuum_to=7., reality={0}, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([overlapping_event.id], actual)
+
+    def test__construct_location_timeline__should_reject_window__when_continuum_from_greater_than_continuum_to(self) -> None:
+        # Arrange
+        location = self.location_use_case.create(self.world_id, **anon_create_location_kwargs(), profile=self.profile)
+
+        # Act
+        def action(): self.timeline_use_case.construct_location_timeline(
+            self.world_id, location.id, continuum_from=2., continuum_to=1., profile=self.profile)
+
+        # Assert
+        self.assertRaises(ValueError, action)
 
     def test__construct_traveler_timeline__should_reject_nonexistent_world(self) -> None:
         # Arrange
@@ -335,26 +429,485 @@ class TestTimelineUseCase(TestCase):
         # Assert
         self.assertListEqual(expected_timeline, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_tagged_entities")
-    def test__construct_traveler_timeline__should_delegate_to_filter_tagged_entities__when_filtering_necessary(
-            self, filter_tagged_entities_mock: MagicMock) -> None:
+    def test__construct_traveler_timeline__should_only_include_events_matching_tag_filters__when_tag_filters_provided(self) -> None:
         # Arrange
         span = anon_positional_range()
+        tag = anon_tag()
         position = Position(latitude=span.latitude.low, longitude=span.longitude.low, altitude=span.altitude.low,
                             continuum=span.continuum.low, reality=next(iter(span.reality)))
         positional_move = PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)
         traveler = self.traveler_use_case.create(
             self.world_id, **anon_create_traveler_kwargs(journey=[positional_move]), profile=self.profile)
         event = self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=span, tags={tag}, affected_travelers={traveler.id}), profile=self.profile)
+        self.event_use_case.create(
             self.world_id, **anon_create_event_kwargs(span=span, affected_travelers={traveler.id}), profile=self.profile)
 
-        filter_tagged_entities_mock.return_value = {event}, {}
-        expected_input = {event}
-        expected_output = [positional_move, event.id]
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, tagged_only={tag}, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([positional_move, event.id], actual)
+
+    def test__construct_traveler_timeline__should_list_events_as_they_become_applicable__when_journey_jumps_back_and_forth(self) -> None:
+        # Arrange
+        journey = [
+            PositionalMove(position=Position(latitude=randint(0, 3), longitude=0, altitude=0, continuum=randint(0, 20), reality=0),
+                           movement_type=MovementType.IMMEDIATE)
+            for _ in range(40)
+        ]
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile)
+        events = []
+        for _ in range(30):
+            included = choice(journey).position
+            span = PositionalRange(latitude=Range(included.latitude - randint(0, 1), included.latitude + randint(0, 1)),
+                                   longitude=Range(-1, 1), altitude=Range(-1, 1),
+                                   continuum=Range(included.continuum - randint(0, 5), included.continuum + randint(0, 5)), reality={0})
+            events.append(self.event_use_case.create(
+                self.world_id, **anon_create_event_kwargs(span=span, affected_travelers={traveler.id}), profile=self.profile))
+        expected_timeline = []
+        previously_applicable = set()
+        for positional_move in journey:
+            applicable = {event for event in events if event.span.includes(positional_move.position)}
+            expected_timeline.append(positional_move)
+            newly_applicable = sorted(
+                applicable - previously_applicable, key=lambda event: (event.span.continuum.low, event.span.continuum.high, str(event.id)))
+            expected_timeline.extend(event.id for event in newly_applicable)
+            previously_applicable = applicable
 
         # Act
         actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
 
         # Assert
-        filter_tagged_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertListEqual(expected_timeline, actual)
+
+    def test__construct_traveler_timeline__should_match_recomputed_timeline__when_events_change_after_first_construction(self) -> None:
+        # Arrange
+        journey = []
+        for _ in range(40):
+            # Interpolating moves may only go forward in continuum, immediate moves can jump anywhere
+            if journey and choice([True, False]):
+                continuum = journey[-1].position.continuum + randint(1, 2)
+                movement_type = MovementType.INTERPOLATED
+            else:
+                continuum = randint(0, 20)
+                movement_type = MovementType.IMMEDIATE
+            journey.append(PositionalMove(
+                position=Position(latitude=randint(0, 3), longitude=0, altitude=0, continuum=continuum, reality=0),
+                movement_type=movement_type))
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile)
+
+        def anon_span_including_journey() -> PositionalRange:
+            included = choice(journey).position
+            return PositionalRange(latitude=Range(included.latitude - randint(0, 1), included.latitude + randint(0, 1)),
+                                   longitude=Range(-1, 1), altitude=Range(-1, 1),
+                                   continuum=Range(included.continuum - randint(0, 5), included.continuum + randint(0, 5)), reality={0})
+
+        events = [self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=anon_span_including_journey(), affected_travelers={traveler.id}),
+            profile=self.profile) for _ in range(30)]
+        self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+        for event in events[:10]:
+            self.event_use_case.update(self.world_id, Event(
+                id=event.id, name=event.name, span=anon_span_including_journey(), affected_travelers={traveler.id}), profile=self.profile)
+        for event in events[10:15]:
+            self.event_use_case.delete(self.world_id, event.id, profile=self.profile)
+        for _ in range(5):
+            self.event_use_case.create(
+                self.world_id, **anon_create_event_kwargs(span=anon_span_including_journey(), affected_travelers={traveler.id}),
+                profile=self.profile)
+        expected = self.recomputing_timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertListEqual(expected, actual)
+
+    def test__construct_traveler_timeline__should_list_events_in_place_of_their_ids__when_expand_events_requested(self) -> None:
+        # Arrange
+        span = PositionalRange(latitude=Range(0, 1), longitude=Range(0, 1), altitude=Range(0, 1), continuum=Range(0, 10), reality={0})
+        journey = [PositionalMove(position=Position(latitude=latitude, longitude=0, altitude=0, continuum=continuum, reality=0),
+                                  movement_type=MovementType.IMMEDIATE) for latitude, continuum in [(0, 1), (5, 2), (0, 3)]]
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile)
+        events_by_id = {event.id: event for event in [self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=span, affected_travelers={traveler.id}), profile=self.profile)
+            for _ in range(2)]}
+        timeline = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+        expected = [events_by_id.get(timeline_item, timeline_item) for timeline_item in timeline]
+
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, expand_events=True, profile=self.profile)
+        actual_windowed = self.timeline_use_case.construct_traveler_timeline(
+            self.world_id, traveler.id, continuum_from=0, continuum_to=10, expand_events=True, profile=self.profile)
+
+        # Assert
+        self.assertListEqual(expected, actual)
+        self.assertListEqual(expected, actual_windowed)
+
+    def test__construct_traveler_timeline__should_follow_new_journey__when_journey_changes_after_first_construction(self) -> None:
+        # Arrange
+        span = PositionalRange(latitude=Range(0, 1), longitude=Range(0, 1), altitude=Range(0, 1), continuum=Range(0, 10), reality={0})
+        inside = PositionalMove(
+            position=Position(latitude=0, longitude=0, altitude=0, continuum=1, reality=0), movement_type=MovementType.IMMEDIATE)
+        outside = PositionalMove(
+            position=Position(latitude=5, longitude=5, altitude=5, continuum=2, reality=0), movement_type=MovementType.IMMEDIATE)
+        traveler = self.traveler_use_case.create(
+            self.world_id, **anon_create_traveler_kwargs(journey=[inside, outside]), profile=self.profile)
+        event = self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=span, affected_travelers={traveler.id}), profile=self.profile)
+        self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+        self.traveler_use_case.update(
+            self.world_id, Traveler(id=traveler.id, name=traveler.name, journey=[outside, inside]), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([outside, inside, event.id], actual)
+
+    def test__construct_traveler_timeline__should_follow_new_journey__when_journey_changes_while_first_constructed(self) -> None:
+        # Arrange
+        span = PositionalRange(latitude=Range(0, 1), longitude=Range(0, 1), altitude=Range(0, 1), continuum=Range(0, 10), reality={0})
+        inside = PositionalMove(
+            position=Position(latitude=0, longitude=0, altitude=0, continuum=1, reality=0), movement_type=MovementType.IMMEDIATE)
+        outside = PositionalMove(
+            position=Position(latitude=5, longitude=5, altitude=5, continuum=2, reality=0), movement_type=MovementType.IMMEDIATE)
+        traveler = self.traveler_use_case.create(
+            self.world_id, **anon_create_traveler_kwargs(journey=[inside, outside]), profile=self.profile)
+        event = self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=span, affected_travelers={traveler.id}), profile=self.profile)
+        with self._writing_after_each_read(Traveler(id=traveler.id, name=traveler.name, journey=[outside, inside])):
+            self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([outside, inside, event.id], actual)
+
+    def test__construct_traveler_timeline__should_only_include_moves_within_window__when_window_provided(self) -> None:
+        # Arrange
+        def move_at(continuum: float) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=0, longitude=0, altitude=0, continuum=continuum, reality=0),
+                                  movement_type=MovementType.IMMEDIATE)
+
+        journey = [move_at(1.), move_at(5.), move_at(10.)]
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile)
+        self.event_use_case.create(self.world_id, **anon_create_event_kwargs(
+            span=PositionalRange(latitude=Range(-1, 1), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(0., 20.),
+                                 reality={0}),
+            affected_travelers={traveler.id}), profile=self.profile)
+        window_event = self.event_use_case.create(self.world_id, **anon_create_event_kwargs(
+            span=PositionalRange(latitude=Range(-1, 1), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(4., 6.),
+                                 reality={0}),
+            affected_travelers={traveler.id}), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(
+            self.world_id, traveler.id, continuum_from=4., continuum_to=6., profile=self.profile)
+
+        # Assert
+        self.assertListEqual([move_at(5.), window_event.id], actual)
+
+    def test__construct_traveler_timeline__should_omit_dropped_moves_but_keep_their_events__when_tolerance_provided(self) -> None:
+        # Arrange
+        def move(latitude: float, continuum: float, movement_type: MovementType = MovementType.INTERPOLATED) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=latitude, longitude=0., altitude=0., continuum=continuum, reality=0),
+                                  movement_type=movement_type)
+
+        journey = [move(0., 0., MovementType.IMMEDIATE), move(0.1, 1.), move(0., 2.)]
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile)
+        event = self.event_use_case.create(self.world_id, **anon_create_event_kwargs(
+            span=PositionalRange(latitude=Range(0.05, 0.2), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(0.5, 1.5),
+                                 reality={0}),
+            affected_travelers={traveler.id}), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, tolerance=1., profile=self.profile)
+
+        # Assert
+        self.assertListEqual([journey[0], event.id, journey[2]], actual)
+
+    def test__construct_traveler_timeline__should_reuse_simplified_journey__when_same_tolerance_requested_again(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(), profile=self.profile)
+        self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, tolerance=1., profile=self.profile)
+
+        # Act
+        with patch("application.use_case.timeline_use_cases.simplified_move_indices") as simplify_spy:
+            self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, tolerance=1., profile=self.profile)
+
+        # Assert
+        simplify_spy.assert_not_called()
+
+    def test__construct_traveler_timeline__should_simplify_new_journey__when_journey_changes_while_first_simplified(self) -> None:
+        # Arrange
+        journey = [positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0.1, 1.), positional_move_at(0., 2.)]
+        new_journey = [positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(5., 1.), positional_move_at(0., 2.),
+                       positional_move_at(0., 3.)]
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile)
+        with self._writing_after_each_read(Traveler(id=traveler.id, name=traveler.name, journey=new_journey)):
+            self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, tolerance=1., profile=self.profile)
+        expected = self.recomputing_timeline_use_case.construct_traveler_timeline(
+            self.world_id, traveler.id, tolerance=1., profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler.id, tolerance=1., profile=self.profile)
+
+        # Assert
+        self.assertListEqual(expected, actual)
+
+    def test__construct_journey_stats__should_measure_journey_against_world_locations(self) -> None:
+        # Arrange
+        def span(latitude: Range[float]) -> PositionalRange:
+            return PositionalRange(latitude=latitude, longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(0., 20.), reality={0})
+
+        def move(latitude: float, continuum: float, movement_type: MovementType) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=latitude, longitude=0, altitude=0, continuum=continuum, reality=0),
+                                  movement_type=movement_type)
+
+        location = self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=span(Range(2, 4))), profile=self.profile)
+        self.location_use_case.create(self.other_world_id, **anon_create_location_kwargs(span=span(Range(2, 4))), profile=self.profile)
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(
+            journey=[move(0, 0, MovementType.IMMEDIATE), move(10, 10, MovementType.INTERPOLATED)]), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertEqual(JourneyStats(
+            path_length_by_reality={0: 10.}, average_speed=1., max_speed=1., dwell_by_location={location.id: 2.}, reality_transitions=[]
+        ), actual)
+
+    def test__construct_journey_stats__should_reuse_stats__when_traveler_and_locations_unchanged(self) -> None:
+        # Arrange
+        self.location_use_case.create(self.world_id, **anon_create_location_kwargs(), profile=self.profile)
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(), profile=self.profile)
+        self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Act
+        with patch("application.use_case.timeline_use_cases.compute_journey_stats") as compute_spy, \
+                patch.object(self.location_repository, "retrieve", wraps=self.location_repository.retrieve) as retrieve_spy:
+            self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        compute_spy.assert_not_called()
+        retrieve_spy.assert_not_called()
+
+    def test__construct_journey_stats__should_recompute_stats__when_location_of_world_changes(self) -> None:
+        # Arrange
+        def span(latitude: Range[float]) -> PositionalRange:
+            return PositionalRange(latitude=latitude, longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(0., 20.), reality={0})
+
+        def move(latitude: float, continuum: float, movement_type: MovementType) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=latitude, longitude=0, altitude=0, continuum=continuum, reality=0),
+                                  movement_type=movement_type)
+
+        location_kwargs = anon_create_location_kwargs(span=span(Range(2, 4)))
+        location = self.location_use_case.create(self.world_id, **location_kwargs, profile=self.profile)
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(
+            journey=[move(0, 0, MovementType.IMMEDIATE), move(10, 10, MovementType.INTERPOLATED)]), profile=self.profile)
+        self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+        self.location_use_case.update(
+            self.world_id, Location(id=location.id, **{**location_kwargs, "span": span(Range(2, 6))}), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertAlmostEqual(4., actual.dwell_by_location[location.id])
+
+    def test__construct_journey_stats__should_recompute_stats__when_journey_changes(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(), profile=self.profile)
+        self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+        last_position = traveler.journey[-1].position
+        self.traveler_use_case.append_to_journey(self.world_id, traveler.id, PositionalMove(
+            position=Position(latitude=last_position.latitude + 3, longitude=last_position.longitude, altitude=last_position.altitude,
+                              continuum=last_position.continuum + 1, reality=last_position.reality),
+            movement_type=MovementType.INTERPOLATED), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertEqual(3., actual.max_speed)
+
+    def test__construct_journey_stats__should_measure_new_journey__when_journey_changes_while_first_measured(self) -> None:
+        # Arrange
+        journey = [positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(1., 1.)]
+        new_journey = [positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(3., 1.)]
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile)
+        with self._writing_after_each_read(Traveler(id=traveler.id, name=traveler.name, journey=new_journey)):
+            self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertEqual(3., actual.max_speed)
+
+    def test__construct_journey_stats__should_reject_traveler__when_associated_with_another_world(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.other_world_id, **anon_create_traveler_kwargs(), profile=self.profile)
+
+        # Act
+        def action(): self.timeline_use_case.construct_journey_stats(self.world_id, traveler.id, profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
+    def test__construct_timelines__should_match_individual_timelines__when_locations_and_travelers_share_events(self) -> None:
+        # Arrange
+        span = PositionalRange(latitude=Range(-1, 1), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(0, 10), reality={0})
+        location_ids = [
+            self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=span), profile=self.profile).id
+            for _ in range(2)
+        ]
+        journey = [PositionalMove(position=Position(latitude=0, longitude=0, altitude=0, continuum=continuum, reality=0),
+                                  movement_type=MovementType.IMMEDIATE) for continuum in [1, 5]]
+        traveler_ids = [
+            self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(journey=journey), profile=self.profile).id
+            for _ in range(2)
+        ]
+        for _ in range(3):
+            self.event_use_case.create(self.world_id, **anon_create_event_kwargs(
+                span=span, affected_locations=set(location_ids), affected_travelers=set(traveler_ids)), profile=self.profile)
+        expected = {
+            **{location_id: self.timeline_use_case.construct_location_timeline(self.world_id, location_id, profile=self.profile)
+               for location_id in location_ids},
+            **{traveler_id: self.timeline_use_case.construct_traveler_timeline(self.world_id, traveler_id, profile=self.profile)
+               for traveler_id in traveler_ids},
+        }
+
+        # Act
+        with patch.object(self.event_repository, "retrieve", wraps=self.event_repository.retrieve) as retrieve_spy:
+            actual = self.recomputing_timeline_use_case.construct_timelines(
+                self.world_id, location_ids=location_ids, traveler_ids=traveler_ids, profile=self.profile)
+
+        # Assert
+        self.assertDictEqual(expected, actual)
+        self.assertEqual(3, retrieve_spy.call_count)
+
+    def test__construct_timelines__should_reject_traveler__when_associated_with_another_world(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.other_world_id, **anon_create_traveler_kwargs(), profile=self.profile)
+
+        # Act
+        def action(): self.timeline_use_case.construct_timelines(self.world_id, traveler_ids=[traveler.id], profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
+    def test__construct_snapshot__should_include_world_entities_present__when_continuum_and_reality_provided(self) -> None:
+        # Arrange
+        def span(continuum: Range[float]) -> PositionalRange:
+            return PositionalRange(latitude=Range(-1, 1), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=continuum, reality={0})
+
+        def move(latitude: float, continuum: float, movement_type: MovementType) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=latitude, longitude=0, altitude=0, continuum=continuum, reality=0),
+                                  movement_type=movement_type)
+
+        location = self.location_use_case.create(
+            self.world_id, **anon_create_location_kwargs(span=span(Range(0., 10.))), profile=self.profile)
+        self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=span(Range(6., 10.))), profile=self.profile)
+        self.location_use_case.create(
+            self.other_world_id, **anon_create_location_kwargs(span=span(Range(0., 10.))), profile=self.profile)
+        event = self.event_use_case.create(self.world_id, **anon_create_event_kwargs(
+            span=span(Range(2., 4.)), affected_locations={location.id}), profile=self.profile)
+        self.event_use_case.create(self.world_id, **anon_create_event_kwargs(
+            span=span(Range(5., 8.)), affected_locations={location.id}), profile=self.profile)
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(
+            journey=[move(0, 0, MovementType.IMMEDIATE), move(1, 10, MovementType.INTERPOLATED)]), profile=self.profile)
+        self.traveler_use_case.create(self.other_world_id, **anon_create_traveler_kwargs(
+            journey=[move(0, 0, MovementType.IMMEDIATE), move(1, 10, MovementType.INTERPOLATED)]), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.construct_snapshot(self.world_id, continuum=3, reality=0, profile=self.profile)
+
+        # Assert
+        self.assertEqual(Snapshot(
+            continuum=3., reality=0, travelers={traveler.id: Position(latitude=0.3, longitude=0, altitude=0, continuum=3, reality=0)},
+            locations={location.id}, events={event.id}), actual)
+
+    def test__construct_snapshot__should_only_load_locations_present__when_world_has_other_locations(self) -> None:
+        # Arrange
+        def span(continuum: Range[float], reality: set) -> PositionalRange:
+            return PositionalRange(
+                latitude=Range(-1, 1), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=continuum, reality=reality)
+
+        location = self.location_use_case.create(
+            self.world_id, **anon_create_location_kwargs(span=span(Range(0., 10.), {0})), profile=self.profile)
+        self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=span(Range(6., 10.), {0})), profile=self.profile)
+        self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=span(Range(0., 10.), {1})), profile=self.profile)
+
+        # Act
+        with patch.object(self.location_repository, "retrieve", wraps=self.location_repository.retrieve) as retrieve_spy:
+            actual = self.timeline_use_case.construct_snapshot(self.world_id, continuum=3, reality=0, profile=self.profile)
+
+        # Assert
+        self.assertSetEqual({location.id}, actual.locations)
+        retrieve_spy.assert_called_once_with(location.id)
+
+    def test__construct_snapshot__should_reject_nonexistent_world(self) -> None:
+        # Arrange
+
+        # Act
+        def action(): self.timeline_use_case.construct_snapshot(
+            anon_prefixed_id(prefix="world"), continuum=0., reality=0, profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
+    def test__retrieve_entities_at__should_return_world_entities_at_position(self) -> None:
+        # Arrange
+        span = PositionalRange(latitude=Range(-1, 1), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(0., 10.), reality={0})
+        elsewhere_span = PositionalRange(
+            latitude=Range(2, 3), longitude=Range(-1, 1), altitude=Range(-1, 1), continuum=Range(0., 10.), reality={0})
+        position = Position(latitude=0, longitude=0, altitude=0, continuum=5, reality=0)
+        location = self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=span), profile=self.profile)
+        self.location_use_case.create(self.world_id, **anon_create_location_kwargs(span=elsewhere_span), profile=self.profile)
+        self.location_use_case.create(self.other_world_id, **anon_create_location_kwargs(span=span), profile=self.profile)
+        event = self.event_use_case.create(
+            self.world_id, **anon_create_event_kwargs(span=span, affected_locations={location.id}), profile=self.profile)
+        traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(
+            journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)]), profile=self.profile)
+        self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.retrieve_entities_at(self.world_id, position, profile=self.profile)
+
+        # Assert
+        self.assertDictEqual({"locations": [location], "events": [event], "travelers": [traveler]}, actual)
+
+    def test__retrieve_entities_at__should_return_travelers_waiting_at_or_passing_through_position(self) -> None:
+        # Arrange
+        def move(latitude: float, continuum: float, movement_type: MovementType) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=latitude, longitude=0, altitude=0, continuum=continuum, reality=0),
+                                  movement_type=movement_type)
+        position = Position(latitude=0, longitude=0, altitude=0, continuum=5, reality=0)
+        waiting_traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(
+            journey=[move(0, 0, MovementType.IMMEDIATE), move(50, 10, MovementType.IMMEDIATE)]), profile=self.profile)
+        passing_traveler = self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(
+            journey=[move(-5, 0, MovementType.IMMEDIATE), move(5, 10, MovementType.INTERPOLATED)]), profile=self.profile)
+        self.traveler_use_case.create(self.world_id, **anon_create_traveler_kwargs(
+            journey=[move(0, 0, MovementType.IMMEDIATE), move(50, 4, MovementType.IMMEDIATE)]), profile=self.profile)
+
+        # Act
+        actual = self.timeline_use_case.retrieve_entities_at(self.world_id, position, profile=self.profile)
+
+        # Assert
+        self.assertListEqual(sorted([waiting_traveler, passing_traveler], key=lambda traveler: str(traveler.id)), actual["travelers"])
+
+    def _writing_after_each_read(self, written: Traveler):
+        # Lands a write to the traveler right after each time it is read, before the read traveler is used
+        retrieve = self.traveler_repository.retrieve
+
+        def retrieve_then_write(traveler_id: PrefixedUUID) -> Traveler:
+            traveler = retrieve(traveler_id)
+            self.traveler_repository.save(written)
+            self.materialized_timelines.traveler_changed(written.id)
+            return traveler
+
+        return patch.object(self.traveler_repository, "retrieve", side_effect=retrieve_then_write)
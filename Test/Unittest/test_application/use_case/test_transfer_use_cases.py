@@ -0,0 +1,194 @@
+from typing import Callable
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from Test.Unittest.test_helpers.anons import anon_name, anon_world, anon_prefixed_id, anon_create_location_kwargs, \
+    anon_create_traveler_kwargs, anon_create_event_kwargs, anon_create_world_kwargs, anon_location, anon_traveler, anon_event
+from adapter.persistence.in_memory_repositories import InMemoryWorldRepository, InMemoryLocationRepository, InMemoryTravelerRepository, \
+    InMemoryEventRepository
+from application.access.clients import Profile
+from application.use_case.transfer_use_cases import TransferUseCase, ImportedEntity
+from domain.collections import Range
+from domain.ids import PrefixedUUID
+from domain.positions import PositionalRange, PositionalMove, Position, MovementType
+
+
+def _parser(entity_type: str, kwargs: dict, source_id: PrefixedUUID = None) -> Callable[[], ImportedEntity]:
+    return lambda: (entity_type, source_id, kwargs)
+
+
+def _failing_parser(error: Exception) -> Callable[[], ImportedEntity]:
+    def parse() -> ImportedEntity:
+        raise error
+    return parse
+
+
+class TestTransferUseCase(TestCase):
+    world_repository: InMemoryWorldRepository
+    location_repository: InMemoryLocationRepository
+    traveler_repository: InMemoryTravelerRepository
+    event_repository: InMemoryEventRepository
+    transfer_use_case: TransferUseCase
+    profile: Profile
+    world_id: PrefixedUUID
+
+    def setUp(self) -> None:
+        self.world_repository = InMemoryWorldRepository()
+        self.location_repository = InMemoryLocationRepository()
+        self.traveler_repository = InMemoryTravelerRepository()
+        self.event_repository = InMemoryEventRepository()
+        self.transfer_use_case = TransferUseCase(
+            self.world_repository, self.location_repository, self.traveler_repository, self.event_repository)
+        self.profile = Profile(anon_name(), anon_name())
+        world = anon_world()
+        self.world_repository.save(world)
+        self.world_id = world.id
+
+    def test__import_entities__should_create_and_associate_entities__when_lines_valid(self) -> None:
+        # Arrange
+        span = PositionalRange(latitude=Range(0, 1), longitude=Range(0, 1), altitude=Range(0, 1), continuum=Range(0, 1), reality={0})
+        journey = [PositionalMove(position=Position(latitude=0, longitude=0, altitude=0, continuum=0, reality=0),
+                                  movement_type=MovementType.IMMEDIATE)]
+        source_location_id = anon_prefixed_id(prefix="location")
+        source_traveler_id = anon_prefixed_id(prefix="traveler")
+        location_kwargs = anon_create_location_kwargs(span=span)
+        entity_parsers = [
+            _parser("location", location_kwargs, source_location_id),
+            None,
+            _parser("traveler", anon_create_traveler_kwargs(journey=journey), source_traveler_id),
+            _parser("event", anon_create_event_kwargs(
+                span=span, affected_locations={source_location_id}, affected_travelers={source_traveler_id})),
+        ]
+
+        # Act
+        actual = self.transfer_use_case.import_entities(self.world_id, entity_parsers, profile=self.profile)
+
+        # Assert
+        self.assertEqual(3, actual["imported"])
+        self.assertListEqual([], actual["errors"])
+        location_id = actual["ids"][source_location_id]
+        traveler_id = actual["ids"][source_traveler_id]
+        self.assertSetEqual({location_id}, self.world_repository.get_all_associated(self.world_id, locations=True))
+        self.assertSetEqual({traveler_id}, self.world_repository.get_all_associated(self.world_id, travelers=True))
+        self.assertEqual(location_kwargs["name"], self.location_repository.retrieve(location_id).name)
+        event_id, = self.world_repository.get_all_associated(self.world_id, events=True)
+        event = self.event_repository.retrieve(event_id)
+        self.assertSetEqual({location_id}, event.affected_locations)
+        self.assertSetEqual({traveler_id}, event.affected_travelers)
+
+    def test__import_entities__should_report_failing_lines_and_import_the_rest(self) -> None:
+        # Arrange
+        entity_parsers = [
+            _failing_parser(ValueError("not json")),
+            _parser("location", anon_create_location_kwargs()),
+            _parser("planet", {}),
+            _parser("event", anon_create_event_kwargs(affected_travelers={anon_prefixed_id(prefix="traveler")})),
+        ]
+
+        # Act
+        actual = self.transfer_use_case.import_entities(self.world_id, entity_parsers, profile=self.profile)
+
+        # Assert
+        self.assertEqual(1, actual["imported"])
+        self.assertListEqual([1, 3, 4], [error["line"] for error in actual["errors"]])
+        self.assertEqual(1, len(self.world_repository.get_all_associated(self.world_id, locations=True)))
+        self.assertSetEqual(set(), self.world_repository.get_all_associated(self.world_id, events=True))
+
+    def test__import_entities__should_associate_once_per_batch(self) -> None:
+        # Arrange
+        world_repository = MagicMock(wraps=self.world_repository)
+        transfer_use_case = TransferUseCase(world_repository, self.location_repository, self.traveler_repository, self.event_repository)
+        entity_parsers = [_parser("location", anon_create_location_kwargs()) for _ in range(25)]
+
+        # Act
+        transfer_use_case.import_entities(self.world_id, entity_parsers, batch_size=10, profile=self.profile)
+
+        # Assert
+        world_repository.associate.assert_not_called()
+        self.assertEqual(3, world_repository.associate_all.call_count)
+        self.assertEqual(25, len(self.world_repository.get_all_associated(self.world_id, locations=True)))
+
+    def test__import_entities__should_update_world_details__when_world_line_provided(self) -> None:
+        # Arrange
+        world_kwargs = anon_create_world_kwargs()
+
+        # Act
+        self.transfer_use_case.import_entities(self.world_id, [_parser("world", world_kwargs)], profile=self.profile)
+
+        # Assert
+        actual = self.world_repository.retrieve(self.world_id)
+        self.assertEqual(self.world_id, actual.id)
+        self.assertEqual(world_kwargs["name"], actual.name)
+
+    def test__import_entities__should_raise_exception__when_world_does_not_exist(self) -> None:
+        # Arrange
+
+        # Act
+        def action(): self.transfer_use_case.import_entities(anon_prefixed_id(prefix="world"), [], profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
+    def test__export_entities__should_yield_world_then_associated_entities__with_events_last(self) -> None:
+        # Arrange
+        location = anon_location()
+        traveler = anon_traveler()
+        event = anon_event(affected_locations={location.id})
+        self.location_repository.save(location)
+        self.traveler_repository.save(traveler)
+        self.event_repository.save(event)
+        self.world_repository.associate(self.world_id, location_id=location.id)
+        self.world_repository.associate(self.world_id, traveler_id=traveler.id)
+        self.world_repository.associate(self.world_id, event_id=event.id)
+        self.location_repository.save(anon_location())
+
+        # Act
+        actual = list(self.transfer_use_case.export_entities(self.world_id, profile=self.profile))
+
+        # Assert
+        self.assertListEqual(
+            [("world", self.world_repository.retrieve(self.world_id)), ("location", location), ("traveler", traveler), ("event", event)],
+            actual)
+
+    def test__export_entities__should_retrieve_entities_one_at_a_time__as_export_is_consumed(self) -> None:
+        # Arrange
+        location_repository = MagicMock(wraps=self.location_repository)
+        transfer_use_case = TransferUseCase(self.world_repository, location_repository, self.traveler_repository, self.event_repository)
+        for _ in range(3):
+            location = anon_location()
+            self.location_repository.save(location)
+            self.world_repository.associate(self.world_id, location_id=location.id)
+
+        # Act
+        actual = transfer_use_case.export_entities(self.world_id, profile=self.profile)
+        retrieved_before_consumed = location_repository.retrieve.call_count
+        next(actual)
+        next(actual)
+
+        # Assert
+        self.assertEqual(0, retrieved_before_consumed)
+        self.assertEqual(1, location_repository.retrieve.call_count)
+        location_repository.retrieve_all.assert_not_called()
+
+    def test__export_entities__should_skip_associated_entities__when_deleted(self) -> None:
+        # Arrange
+        location = anon_location()
+        deleted_location = anon_location()
+        deleted_traveler = anon_traveler()
+        deleted_event = anon_event()
+        for entity in [location, deleted_location]:
+            self.location_repository.save(entity)
+            self.world_repository.associate(self.world_id, location_id=entity.id)
+        self.traveler_repository.save(deleted_traveler)
+        self.world_repository.associate(self.world_id, traveler_id=deleted_traveler.id)
+        self.event_repository.save(deleted_event)
+        self.world_repository.associate(self.world_id, event_id=deleted_event.id)
+        self.location_repository.delete(deleted_location.id)
+        self.traveler_repository.delete(deleted_traveler.id)
+        self.event_repository.delete(deleted_event.id)
+
+        # Act
+        actual = list(self.transfer_use_case.export_entities(self.world_id, profile=self.profile))
+
+        # Assert
+        self.assertListEqual([("world", self.world_repository.retrieve(self.world_id)), ("location", location)], actual)
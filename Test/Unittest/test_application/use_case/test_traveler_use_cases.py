@@ -1,15 +1,16 @@
 from copy import deepcopy
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
 
 from Test.Unittest.test_helpers.anons import anon_journey, anon_prefixed_id, anon_name, anon_description, anon_tag, \
-    anon_create_traveler_kwargs, anon_traveler, anon_anything, anon_positional_range, anon_event, anon_attributes, anon_world
+    anon_create_traveler_kwargs, anon_traveler, anon_anything, anon_positional_range, anon_event, anon_attributes, anon_world, anon_position
 from adapter.persistence.in_memory_repositories import InMemoryTravelerRepository, InMemoryEventRepository, InMemoryWorldRepository
 from application.access.clients import Profile
 from application.use_case.traveler_use_cases import TravelerUseCase
+from domain.collections import Range
+from domain.encounters import Encounter
 from domain.ids import PrefixedUUID
 from domain.persistence.repositories import EventRepository
-from domain.positions import PositionalMove, MovementType, Position
+from domain.positions import PositionalMove, MovementType, Position, PositionalRange
 from domain.travelers import Traveler
 
 
@@ -126,6 +127,74 @@ class TestTravelerUseCase(TestCase):
         # Assert
         self.assertRaises(ValueError, action)
 
+    def test__retrieve__should_return_simplified_journey__when_tolerance_provided(self) -> None:
+        # Arrange
+        def move(latitude: float, continuum: float, movement_type: MovementType = MovementType.INTERPOLATED) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=latitude, longitude=0., altitude=0., continuum=continuum, reality=0),
+                                  movement_type=movement_type)
+
+        journey = [move(0., 0., MovementType.IMMEDIATE), move(0.1, 1.), move(0., 2.), move(5., 3., MovementType.IMMEDIATE), move(5., 4.)]
+        traveler = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(journey=journey))
+
+        # Act
+        actual = self.traveler_use_case.retrieve(self.world_id, traveler.id, tolerance=1., profile=self.profile)
+
+        # Assert
+        self.assertListEqual([journey[0], journey[2], journey[3], journey[4]], actual.journey)
+        self.assertEqual(traveler.name, actual.name)
+
+    def test__retrieve_with_journey_window__should_return_moves_within_window__when_window_provided(self) -> None:
+        # Arrange
+        def move(continuum: float, movement_type: MovementType = MovementType.INTERPOLATED) -> PositionalMove:
+            return PositionalMove(position=Position(latitude=continuum, longitude=0., altitude=0., continuum=continuum, reality=0),
+                                  movement_type=movement_type)
+
+        journey = [move(0., MovementType.IMMEDIATE), move(1.), move(2.), move(3.), move(4.)]
+        traveler = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(journey=journey))
+
+        # Act
+        actual_traveler, actual_window = self.traveler_use_case.retrieve_with_journey_window(
+            self.world_id, traveler.id, continuum_from=1., continuum_to=3., profile=self.profile)
+
+        # Assert
+        self.assertEqual(traveler, actual_traveler)
+        self.assertListEqual(journey[1:4], actual_window)
+
+    def test__retrieve_with_journey_window__should_reject_window__when_continuum_from_greater_than_continuum_to(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+
+        # Act
+        def action(): self.traveler_use_case.retrieve_with_journey_window(
+            self.world_id, traveler.id, continuum_from=2., continuum_to=1., profile=self.profile)
+
+        # Assert
+        self.assertRaises(ValueError, action)
+
+    def test__retrieve_many__should_return_saved_in_given_order__when_all_exist_for_given_world(self) -> None:
+        # Arrange
+        traveler_a = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+        traveler_b = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+
+        # Act
+        actual = self.traveler_use_case.retrieve_many(self.world_id, [traveler_b.id, traveler_a.id], profile=self.profile)
+
+        # Assert
+        self.assertListEqual([traveler_b, traveler_a], actual)
+
+    def test__retrieve_page__should_return_saved_of_page_ids(self) -> None:
+        # Arrange
+        for _ in range(3):
+            self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+        expected_ids, expected_has_more = self.traveler_use_case.retrieve_page_ids(self.world_id, limit=2, profile=self.profile)
+
+        # Act
+        actual, actual_has_more = self.traveler_use_case.retrieve_page(self.world_id, limit=2, profile=self.profile)
+
+        # Assert
+        self.assertListEqual(expected_ids, [traveler.id for traveler in actual])
+        self.assertEqual(expected_has_more, actual_has_more)
+
     def test__retrieve_all__should_raise_exception__when_world_does_not_exist(self) -> None:
         # Arrange
 
@@ -160,50 +229,65 @@ class TestTravelerUseCase(TestCase):
         # Assert
         self.assertSetEqual(expected, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_named_entities")
-    def test__retrieve_all__should_delegate_to_filter_named_entities__when_filtering_necessary(
-            self, filter_named_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_travelers_matching_name_filters__when_name_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_traveler()}
-        filter_named_entities_mock.return_value = expected_output, {}
-        expected_input = {self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())}
+        expected = {self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(name="The Lonely Mountain"))}
+        self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(name="Mountainous Lonely"))
+        self.traveler_use_case.create(self.other_world_id, profile=self.profile, **anon_create_traveler_kwargs(name="The Lonely Mountain"))
 
         # Act
-        actual = self.traveler_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual_name_has = self.traveler_use_case.retrieve_all(self.world_id, name_has="lONELY mou", profile=self.profile)
+        actual_name_is = self.traveler_use_case.retrieve_all(self.world_id, name_is="the lonely MOUNTAIN", profile=self.profile)
 
         # Assert
-        self.assertEqual(expected_output, actual)
-        filter_named_entities_mock.assert_called_once_with(expected_input)
+        self.assertSetEqual(expected, actual_name_has)
+        self.assertSetEqual(expected, actual_name_is)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_tagged_entities")
-    def test__retrieve_all__should_delegate_to_filter_tagged_entities__when_filtering_necessary(
-            self, filter_tagged_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_travelers_matching_tag_filters__when_tag_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_traveler()}
-        filter_tagged_entities_mock.return_value = expected_output, {}
-        expected_input = {self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())}
+        tag = anon_tag()
+        expected = {self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(tags={tag, anon_tag()}))}
+        self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(tags={anon_tag()}))
+        self.traveler_use_case.create(self.other_world_id, profile=self.profile, **anon_create_traveler_kwargs(tags={tag}))
 
         # Act
-        actual = self.traveler_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual = self.traveler_use_case.retrieve_all(self.world_id, tagged_all={tag}, tagged_none={anon_tag()}, profile=self.profile)
 
         # Assert
-        self.assertEqual(expected_output, actual)
-        filter_tagged_entities_mock.assert_called_once_with(expected_input)
+        self.assertSetEqual(expected, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_journeying_entities")
-    def test__retrieve_all__should_delegate_to_filter_journeying_entities__when_filtering_necessary(
-            self, filter_journeying_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_travelers_whose_journey_includes_position__when_journey_includes_provided(self) -> None:
         # Arrange
-        expected_output = {anon_traveler()}
-        filter_journeying_entities_mock.return_value = expected_output, {}
-        expected_input = {self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())}
+        position = anon_position()
+        expected = {self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(
+            journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)]))}
+        self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+        self.traveler_use_case.create(self.other_world_id, profile=self.profile, **anon_create_traveler_kwargs(
+            journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)]))
 
         # Act
-        actual = self.traveler_use_case.retrieve_all(self.world_id, profile=self.profile)
+        actual = self.traveler_use_case.retrieve_all(self.world_id, journey_includes=position, profile=self.profile)
 
         # Assert
-        filter_journeying_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual)
+
+    def test__retrieve_all__should_return_travelers_interpolating_through_range__when_journey_intersects_provided(self) -> None:
+        # Arrange
+        range_ = Range(-1., 1.)
+        positional_range = PositionalRange(latitude=range_, longitude=range_, altitude=range_, continuum=range_, reality={0})
+        expected = {self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs(journey=[
+            PositionalMove(position=Position(latitude=-2, longitude=0, altitude=0, continuum=-2, reality=0),
+                           movement_type=MovementType.IMMEDIATE),
+            PositionalMove(position=Position(latitude=2, longitude=0, altitude=0, continuum=2, reality=0),
+                           movement_type=MovementType.INTERPOLATED),
+        ]))}
+        self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+
+        # Act
+        actual = self.traveler_use_case.retrieve_all(self.world_id, journey_intersects=positional_range, profile=self.profile)
+
+        # Assert
+        self.assertSetEqual(expected, actual)
 
     def test__retrieve_all__should_raise_exception__when_unsupported_filter_provided(self) -> None:
         # Arrange
@@ -277,6 +361,49 @@ class TestTravelerUseCase(TestCase):
         self.assertEqual(expected_tags, actual.tags)
         self.assertEqual(expected_attributes, actual.attributes)
 
+    def test__append_to_journey__should_add_move_to_end_of_journey__when_move_valid(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+        last_position = traveler.journey[-1].position
+        positional_move = PositionalMove(
+            position=anon_position(continuum=last_position.continuum + 1, reality=last_position.reality),
+            movement_type=MovementType.INTERPOLATED)
+
+        # Act
+        returned = self.traveler_use_case.append_to_journey(self.world_id, traveler.id, positional_move, profile=self.profile)
+
+        # Assert
+        actual = self.traveler_use_case.retrieve(self.world_id, traveler.id, profile=self.profile)
+        self.assertEqual(traveler.journey + [positional_move], actual.journey)
+        self.assertEqual(actual, returned)
+
+    def test__append_to_journey__should_reject_move__when_it_interpolates_across_realities(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
+        last_position = traveler.journey[-1].position
+        positional_move = PositionalMove(
+            position=anon_position(continuum=last_position.continuum + 1, reality=last_position.reality + 1),
+            movement_type=MovementType.INTERPOLATED)
+
+        # Act
+        def action(): self.traveler_use_case.append_to_journey(self.world_id, traveler.id, positional_move, profile=self.profile)
+
+        # Assert
+        self.assertRaises(ValueError, action)
+        actual = self.traveler_use_case.retrieve(self.world_id, traveler.id, profile=self.profile)
+        self.assertEqual(traveler.journey, actual.journey)
+
+    def test__append_to_journey__should_reject_ids_that_exist_for_another_world(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.other_world_id, profile=self.profile, **anon_create_traveler_kwargs())
+        positional_move = PositionalMove(position=anon_position(), movement_type=MovementType.IMMEDIATE)
+
+        # Act
+        def action(): self.traveler_use_case.append_to_journey(self.world_id, traveler.id, positional_move, profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
     def test__delete__should_delete__when_traveler_exists_for_world(self) -> None:
         # Arrange
         traveler = self.traveler_use_case.create(self.world_id, profile=self.profile, **anon_create_traveler_kwargs())
@@ -335,3 +462,73 @@ class TestTravelerUseCase(TestCase):
 
         # Assert
         self.assertRaises(ValueError, action)
+
+    def test__retrieve_position__should_return_interpolated_position__when_journey_covers_continuum(self) -> None:
+        # Arrange
+        journey = [
+            PositionalMove(position=Position(latitude=0, longitude=0, altitude=0, continuum=0, reality=2),
+                           movement_type=MovementType.IMMEDIATE),
+            PositionalMove(position=Position(latitude=8, longitude=0, altitude=0, continuum=4, reality=2),
+                           movement_type=MovementType.INTERPOLATED),
+        ]
+        traveler = self.traveler_use_case.create(self.world_id, name=anon_name(), journey=journey, profile=self.profile)
+
+        # Act
+        actual = self.traveler_use_case.retrieve_position(self.world_id, traveler.id, continuum=1, reality=2, profile=self.profile)
+
+        # Assert
+        self.assertEqual(Position(latitude=2, longitude=0, altitude=0, continuum=1, reality=2), actual)
+
+    def test__retrieve_position__should_raise_exception__when_journey_does_not_cover_continuum(self) -> None:
+        # Arrange
+        position = anon_position()
+        journey = [PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)]
+        traveler = self.traveler_use_case.create(self.world_id, name=anon_name(), journey=journey, profile=self.profile)
+
+        # Act
+        def action(): self.traveler_use_case.retrieve_position(
+            self.world_id, traveler.id, continuum=position.continuum + 1, reality=position.reality, profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
+    def test__retrieve_position__should_reject_ids_that_exist_for_another_world(self) -> None:
+        # Arrange
+        traveler = self.traveler_use_case.create(self.other_world_id, name=anon_name(), journey=anon_journey(), profile=self.profile)
+        position = traveler.journey[0].position
+
+        # Act
+        def action(): self.traveler_use_case.retrieve_position(
+            self.world_id, traveler.id, continuum=position.continuum, reality=position.reality, profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
+    def test__find_encounters__should_only_consider_travelers_of_the_world(self) -> None:
+        # Arrange
+        def journey(latitude: float) -> list:
+            return [
+                PositionalMove(position=Position(latitude=latitude, longitude=0, altitude=0, continuum=0, reality=0),
+                               movement_type=MovementType.IMMEDIATE),
+                PositionalMove(position=Position(latitude=-latitude, longitude=0, altitude=0, continuum=10, reality=0),
+                               movement_type=MovementType.INTERPOLATED),
+            ]
+
+        traveler_1 = self.traveler_use_case.create(self.world_id, name=anon_name(), journey=journey(5), profile=self.profile)
+        traveler_2 = self.traveler_use_case.create(self.world_id, name=anon_name(), journey=journey(-5), profile=self.profile)
+        self.traveler_use_case.create(self.other_world_id, name=anon_name(), journey=journey(5), profile=self.profile)
+
+        # Act
+        actual = self.traveler_use_case.find_encounters(self.world_id, distance=2, profile=self.profile)
+
+        # Assert
+        self.assertListEqual([Encounter(travelers={traveler_1.id, traveler_2.id}, continuum=Range(4., 6.), reality=0)], actual)
+
+    def test__find_encounters__should_raise_exception__when_world_does_not_exist(self) -> None:
+        # Arrange
+
+        # Act
+        def action(): self.traveler_use_case.find_encounters(anon_prefixed_id(prefix="world"), distance=1, profile=self.profile)
+
+        # Assert
+        self.assertRaises(NameError, action)
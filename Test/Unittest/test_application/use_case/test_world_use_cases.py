@@ -1,5 +1,4 @@
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
 
 from Test.Unittest.test_helpers.anons import anon_prefixed_id, anon_name, anon_description, anon_tag, anon_create_world_kwargs, \
     anon_world, anon_anything, anon_attributes
@@ -93,35 +92,30 @@ class TestWorldUseCase(TestCase):
         # Assert
         self.assertSetEqual(expected, actual)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_named_entities")
-    def test__retrieve_all__should_delegate_to_filter_named_entities__when_filtering_necessary(
-            self, filter_named_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_worlds_matching_name_filters__when_name_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_world()}
-        filter_named_entities_mock.return_value = expected_output, {}
-        expected_input = {self.world_use_case.create(**anon_create_world_kwargs(), profile=self.profile)}
+        expected = {self.world_use_case.create(profile=self.profile, **anon_create_world_kwargs(name="The Lonely Mountain"))}
+        self.world_use_case.create(profile=self.profile, **anon_create_world_kwargs(name="Mountainous Lonely"))
 
         # Act
-        actual = self.world_use_case.retrieve_all(profile=self.profile)
-        
+        actual_name_has = self.world_use_case.retrieve_all(name_has="lONELY mou", profile=self.profile)
+        actual_name_is = self.world_use_case.retrieve_all(name_is="the lonely MOUNTAIN", profile=self.profile)
+
         # Assert
-        filter_named_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual_name_has)
+        self.assertSetEqual(expected, actual_name_is)
 
-    @patch("application.use_case.filtering_use_cases.FilteringUseCase.filter_tagged_entities")
-    def test__retrieve_all__should_delegate_to_filter_tagged_entities__when_filtering_necessary(
-            self, filter_tagged_entities_mock: MagicMock) -> None:
+    def test__retrieve_all__should_return_worlds_matching_tag_filters__when_tag_filters_provided(self) -> None:
         # Arrange
-        expected_output = {anon_world()}
-        filter_tagged_entities_mock.return_value = expected_output, {}
-        expected_input = {self.world_use_case.create(**anon_create_world_kwargs(), profile=self.profile)}
+        tag = anon_tag()
+        expected = {self.world_use_case.create(profile=self.profile, **anon_create_world_kwargs(tags={tag, anon_tag()}))}
+        self.world_use_case.create(profile=self.profile, **anon_create_world_kwargs(tags={anon_tag()}))
 
         # Act
-        actual = self.world_use_case.retrieve_all(profile=self.profile)
+        actual = self.world_use_case.retrieve_all(tagged_all={tag}, tagged_none={anon_tag()}, profile=self.profile)
 
         # Assert
-        filter_tagged_entities_mock.assert_called_once_with(expected_input)
-        self.assertEqual(expected_output, actual)
+        self.assertSetEqual(expected, actual)
 
     def test__retrieve_all__should_raise_exception__when_unsupported_filter_provided(self) -> None:
         # Arrange
@@ -99,6 +99,31 @@ class EventResourceTest(ClientTestCase):
         self.assertEqual(200, actual.status_code)
         self.assertIn(expected_id, parse_json(actual.data))
 
+    def test__get_events__should_return_full_events__when_expand_full_requested(self, client: FlaskClient) -> None:
+        # Arrange
+        response = client.post(f"/api/world/{self.world_id}/event", json=JsonTranslator.to_json(anon_event()))
+        expected = parse_json(response.data)
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/events", query_string={"expand": "full"})
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertListEqual([expected], parse_json(actual.data))
+
+    def test__post_events_batch_get__should_return_requested_events(self, client: FlaskClient) -> None:
+        # Arrange
+        expected = [
+            parse_json(client.post(f"/api/world/{self.world_id}/event", json=JsonTranslator.to_json(anon_event())).data) for _ in range(2)
+        ]
+
+        # Act
+        actual = client.post(f"/api/world/{self.world_id}/events/batch-get", json=[event["id"] for event in expected])
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertListEqual(expected, parse_json(actual.data))
+
     def test__get_event__should_return_existing_event(self, client: FlaskClient) -> None:
         # Arrange
         body = JsonTranslator.to_json(anon_event())
@@ -235,3 +260,26 @@ class EventResourceTest(ClientTestCase):
         # Assert
         self.assertEqual(200, actual.status_code)
         self.assertEqual(expected_json, parse_json(actual.data))
+
+    def test__get_event_overlaps__should_return_events_with_intersecting_spans(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_event())
+        event_ids = {parse_json(client.post(f"/api/world/{self.world_id}/event", json=body).data)["id"] for _ in range(2)}
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/event-overlaps")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        overlaps = parse_json(actual.data)
+        self.assertEqual(1, len(overlaps))
+        self.assertSetEqual(event_ids, set(overlaps[0]["events"]))
+
+    def test__get_event_overlaps__should_reject__when_unsupported_param_provided(self, client: FlaskClient) -> None:
+        # Arrange
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/event-overlaps?distance=1")
+
+        # Assert
+        self.assertEqual(400, actual.status_code)
@@ -1,6 +1,6 @@
 from copy import copy
 from http import HTTPStatus
-from json import loads
+from json import loads, dumps
 from pathlib import Path
 from typing import Any
 
@@ -12,7 +12,7 @@ from adapter.persistence.in_memory_repositories import InMemoryEventRepository,
 from application.requests.data_forms import JsonTranslator
 from domain.ids import PrefixedUUID
 from test_helpers import get_fully_qualified_name
-from test_helpers.anons import anon_location, anon_float, anon_string, anon_route, anon_name, anon_world
+from test_helpers.anons import anon_location, anon_event, anon_float, anon_string, anon_route, anon_name, anon_world, anon_prefixed_id
 
 
 _PORT = 54321
@@ -98,6 +98,112 @@ class LocationResourceTest(ClientTestCase):
         self.assertEqual(HTTPStatus.OK, actual.status_code)
         self.assertIn(expected_id, parse_json(actual.data))
 
+    def test__get_locations__should_report_filter_plan__when_explain_requested(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_location())
+        client.post(f"/api/world/{self.world_id}/location", json=body)
+        client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location()))
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/locations", query_string={"nameIs": body["name"], "explain": "true"})
+        actual_unexplained = client.get(f"/api/world/{self.world_id}/locations", query_string={"nameIs": body["name"]})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual("index=name~1;scope=2", actual.headers["X-Filter-Plan"])
+        self.assertNotIn("X-Filter-Plan", actual_unexplained.headers)
+
+    def test__get_locations__should_report_cached_filter_plan__when_explained_listing_served_from_cache(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_location())
+        client.post(f"/api/world/{self.world_id}/location", json=body)
+        client.get(f"/api/world/{self.world_id}/locations", query_string={"nameIs": body["name"]})
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/locations", query_string={"nameIs": body["name"], "explain": "true"})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual("cached", actual.headers["X-Filter-Plan"])
+
+    def test__get_locations__should_page_through_all_locations_in_order__when_limit_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        expected_ids = sorted(
+            parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location())).data)["id"]
+            for _ in range(5)
+        )
+        actual_ids = []
+        query_string = {"limit": "2"}
+
+        # Act
+        while True:
+            response = client.get(f"/api/world/{self.world_id}/locations", query_string=query_string)
+            self.assertEqual(HTTPStatus.OK, response.status_code)
+            actual_ids.extend(parse_json(response.data))
+            if "X-Next-Cursor" not in response.headers:
+                break
+            query_string = {"limit": "2", "cursor": response.headers["X-Next-Cursor"]}
+
+        # Assert
+        self.assertListEqual(expected_ids, actual_ids)
+
+    def test__get_locations__should_reject__when_cursor_or_limit_invalid(self, client: FlaskClient) -> None:
+        # Arrange
+
+        # Act
+        actual_cursor = client.get(f"/api/world/{self.world_id}/locations", query_string={"cursor": "not a cursor"})
+        actual_limit = client.get(f"/api/world/{self.world_id}/locations", query_string={"limit": "0"})
+
+        # Assert
+        self.assertEqual(HTTPStatus.BAD_REQUEST, actual_cursor.status_code)
+        self.assertEqual(HTTPStatus.BAD_REQUEST, actual_limit.status_code)
+
+    def test__get_locations__should_return_full_locations_with_cursor__when_expand_full_requested(self, client: FlaskClient) -> None:
+        # Arrange
+        for _ in range(3):
+            client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location()))
+        expected = client.get(f"/api/world/{self.world_id}/locations", query_string={"limit": "2"})
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/locations", query_string={"limit": "2", "expand": "full"})
+        actual_unsupported = client.get(f"/api/world/{self.world_id}/locations", query_string={"expand": "events"})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertListEqual(parse_json(expected.data), [location["id"] for location in parse_json(actual.data)])
+        self.assertIn("span", parse_json(actual.data)[0])
+        self.assertEqual(expected.headers["X-Next-Cursor"], actual.headers["X-Next-Cursor"])
+        self.assertEqual(HTTPStatus.BAD_REQUEST, actual_unsupported.status_code)
+
+    def test__get_locations__should_only_return_requested_fields__when_expand_full_and_fields_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        location_json = parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location())).data)
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/locations", query_string={"expand": "full", "fields": "id,name"})
+        actual_unexpanded = client.get(f"/api/world/{self.world_id}/locations", query_string={"fields": "id,name"})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertListEqual([{"id": location_json["id"], "name": location_json["name"]}], parse_json(actual.data))
+        self.assertEqual(HTTPStatus.BAD_REQUEST, actual_unexpanded.status_code)
+
+    def test__post_locations_batch_get__should_return_requested_locations_in_order(self, client: FlaskClient) -> None:
+        # Arrange
+        expected = [
+            parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location())).data)
+            for _ in range(3)
+        ]
+
+        # Act
+        actual = client.post(f"/api/world/{self.world_id}/locations/batch-get", json=[location["id"] for location in reversed(expected)])
+        actual_missing = client.post(f"/api/world/{self.world_id}/locations/batch-get", json=[str(anon_prefixed_id(prefix="location"))])
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertListEqual(list(reversed(expected)), parse_json(actual.data))
+        self.assertEqual(HTTPStatus.NOT_FOUND, actual_missing.status_code)
+
     def test__get_location__should_return_existing_location(self, client: FlaskClient) -> None:
         # Arrange
         body = JsonTranslator.to_json(anon_location())
@@ -113,6 +219,20 @@ class LocationResourceTest(ClientTestCase):
         self.assertEqual(HTTPStatus.OK, actual.status_code)
         self.assertEqual(expected_json, parse_json(actual.data))
 
+    def test__get_location__should_only_return_requested_fields__when_fields_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        location_json = parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location())).data)
+        location_id = location_json["id"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/location/{location_id}", query_string={"fields": "name,span"})
+        actual_unsupported = client.get(f"/api/world/{self.world_id}/location/{location_id}", query_string={"expand": "full"})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual({"name": location_json["name"], "span": location_json["span"]}, parse_json(actual.data))
+        self.assertEqual(HTTPStatus.BAD_REQUEST, actual_unsupported.status_code)
+
     def test__delete_location__should_remove(self, client: FlaskClient) -> None:
         # Arrange
         body = JsonTranslator.to_json(anon_location())
@@ -204,3 +324,76 @@ class LocationResourceTest(ClientTestCase):
         # Assert
         self.assertEqual(HTTPStatus.OK, actual.status_code)
         self.assertEqual(expected_json, parse_json(actual.data))
+
+    def test__get_location_timeline__should_return_bad_request__when_continuum_from_is_not_a_number(self, client: FlaskClient) -> None:
+        # Arrange
+        response = client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location()))
+        location_id = parse_json(response.data)["id"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/location/{location_id}/timeline?continuumFrom={anon_name()}")
+
+        # Assert
+        self.assertEqual(HTTPStatus.BAD_REQUEST, actual.status_code)
+
+    def test__get_location_timeline__should_return_ok__when_continuum_window_and_reality_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        response = client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location()))
+        location_id = parse_json(response.data)["id"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/location/{location_id}/timeline?continuumFrom=-5.5&continuumTo=10&reality=0,2")
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual([], parse_json(actual.data))
+
+    def test__get_location_timeline__should_return_projected_events__when_expand_events_and_event_fields_provided(
+            self, client: FlaskClient
+    ) -> None:
+        # Arrange
+        location = anon_location()
+        location_id = parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(location)).data)["id"]
+        event_body = JsonTranslator.to_json(anon_event(span=location.span))
+        event_body["affected_locations"] = [location_id]
+        event_json = parse_json(client.post(f"/api/world/{self.world_id}/event", json=event_body).data)
+
+        # Act
+        actual = client.get(
+            f"/api/world/{self.world_id}/location/{location_id}/timeline", query_string={"expand": "events", "eventFields": "id,name"})
+        actual_unexpanded = client.get(f"/api/world/{self.world_id}/location/{location_id}/timeline", query_string={"eventFields": "id"})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertListEqual([{"id": event_json["id"], "name": event_json["name"]}], parse_json(actual.data))
+        self.assertEqual(HTTPStatus.BAD_REQUEST, actual_unexpanded.status_code)
+
+    def test__post_timelines__should_return_timeline_of_each_location__when_location_ids_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        location_ids = [
+            parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location())).data)["id"]
+            for _ in range(2)
+        ]
+
+        # Act
+        actual = client.post(f"/api/world/{self.world_id}/timelines", json={"locations": location_ids})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual([{"id": location_id, "timeline": []} for location_id in location_ids], parse_json(actual.data))
+
+    def test__get_here__should_return_locations_whose_span_includes_position(self, client: FlaskClient) -> None:
+        # Arrange
+        location_json = parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location())).data)
+        span_json = location_json["span"]
+        position_json = {
+            "latitude": span_json["latitude"]["low"], "longitude": span_json["longitude"]["low"], "altitude": span_json["altitude"]["low"],
+            "continuum": span_json["continuum"]["low"], "reality": span_json["reality"][0],
+        }
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/here", query_string={"position": dumps(position_json)})
+
+        # Assert
+        self.assertEqual(HTTPStatus.OK, actual.status_code)
+        self.assertEqual({"locations": [location_json], "events": [], "travelers": []}, parse_json(actual.data))
@@ -0,0 +1,124 @@
+from gzip import decompress
+from json import dumps, loads
+from pathlib import Path
+from typing import Any
+
+from flask.testing import FlaskClient
+from flask_unittest import ClientTestCase
+
+from adapter.persistence.in_memory_repositories import InMemoryEventRepository, InMemoryTravelerRepository, InMemoryLocationRepository, \
+    InMemoryWorldRepository
+from application.requests.data_forms import JsonTranslator
+from domain.ids import PrefixedUUID
+from test_helpers import get_fully_qualified_name
+from test_helpers.anons import anon_location, anon_event, anon_string, anon_route, anon_name, anon_world
+
+_APP_CONFIG = {
+    "repositories_config": {
+        "world_repo_class_path": get_fully_qualified_name(InMemoryWorldRepository),
+        "location_repo_class_path": get_fully_qualified_name(InMemoryLocationRepository),
+        "traveler_repo_class_path": get_fully_qualified_name(InMemoryTravelerRepository),
+        "event_repo_class_path": get_fully_qualified_name(InMemoryEventRepository),
+    },
+    "resources_folder_path": Path(__file__).parents[4].joinpath("Source/Resources/").resolve().as_posix(),
+}
+_AUTH_CONFIG = {
+    "auth_callback_route": anon_route(),
+    "client_id": anon_string(),
+    "domain": anon_name(),
+    "api_audience": anon_string(),
+    "algorithms": ["RS256"],
+}
+
+
+def construct_flask_app():
+    # noinspection PyProtectedMember
+    from adapter.runners.flask_app import _create_timeline_tracker_flask_app
+    return _create_timeline_tracker_flask_app(_APP_CONFIG, _AUTH_CONFIG, anon_string())
+
+
+def parse_json(json_bytes: bytes) -> Any:
+    return loads(json_bytes.decode("utf-8"))
+
+
+class TransferResourceTest(ClientTestCase):
+    app = construct_flask_app()
+    world_id: PrefixedUUID
+
+    def setUp(self, client: FlaskClient) -> None:
+        with client.session_transaction() as session:
+            session["profile"] = {"user_id": anon_string(), "name": anon_name()}
+        world_post_body = JsonTranslator.to_json(anon_world())
+        world_post_response = client.post(f"/api/world", json=world_post_body)
+        self.world_id = JsonTranslator.from_json(world_post_response.json["id"], PrefixedUUID)
+
+    def tearDown(self, client: FlaskClient) -> None:
+        with client.session_transaction() as session:
+            del session["profile"]
+
+    def test__post_import__should_import_valid_lines_and_report_the_rest(self, client: FlaskClient) -> None:
+        # Arrange
+        location = anon_location()
+        event = anon_event(span=location.span, affected_locations={location.id})
+        body = "\n".join([
+            dumps({"type": "location", **JsonTranslator.to_json(location)}),
+            "",
+            "not json",
+            dumps({"type": "event", **JsonTranslator.to_json(event)}),
+        ])
+
+        # Act
+        actual = client.post(f"/api/world/{self.world_id}/import", data=body, content_type="application/x-ndjson")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        actual_report = parse_json(actual.data)
+        self.assertEqual(2, actual_report["imported"])
+        self.assertListEqual([3], [error["line"] for error in actual_report["errors"]])
+        imported_location_id = actual_report["ids"][str(location.id)]
+        actual_locations = parse_json(client.get(f"/api/world/{self.world_id}/locations").data)
+        self.assertListEqual([imported_location_id], actual_locations)
+
+    def test__get_export__should_stream_gzip_ndjson_that_imports_into_another_world(self, client: FlaskClient) -> None:
+        # Arrange
+        location = anon_location()
+        location_id = parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(location)).data)["id"]
+        event_body = JsonTranslator.to_json(anon_event(span=location.span))
+        event_body["affected_locations"] = [location_id]
+        client.post(f"/api/world/{self.world_id}/event", json=event_body)
+        other_world_id = parse_json(client.post(f"/api/world", json=JsonTranslator.to_json(anon_world())).data)["id"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/export")
+        actual_import = client.post(f"/api/world/{other_world_id}/import", data=actual.data, content_type="application/gzip")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertEqual("application/gzip", actual.mimetype)
+        actual_lines = [loads(line) for line in decompress(actual.data).decode("utf8").splitlines()]
+        self.assertListEqual(["world", "location", "event"], [line["type"] for line in actual_lines])
+        self.assertEqual(200, actual_import.status_code)
+        actual_report = parse_json(actual_import.data)
+        self.assertEqual(3, actual_report["imported"])
+        self.assertListEqual([], actual_report["errors"])
+        imported_location_id = actual_report["ids"][location_id]
+        imported_event_id, = parse_json(client.get(f"/api/world/{other_world_id}/events").data)
+        imported_event = parse_json(client.get(f"/api/world/{other_world_id}/event/{imported_event_id}").data)
+        self.assertListEqual([imported_location_id], imported_event["affected_locations"])
+
+    def test__get_export__should_skip_deleted_entities(self, client: FlaskClient) -> None:
+        # Arrange
+        location_ids = [
+            parse_json(client.post(f"/api/world/{self.world_id}/location", json=JsonTranslator.to_json(anon_location())).data)["id"]
+            for _ in range(2)
+        ]
+        client.delete(f"/api/world/{self.world_id}/location/{location_ids[0]}")
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/export")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        actual_lines = [loads(line) for line in decompress(actual.data).decode("utf8").splitlines()]
+        self.assertListEqual(["world", "location"], [line["type"] for line in actual_lines])
+        self.assertEqual(location_ids[1], actual_lines[1]["id"])
@@ -97,6 +97,32 @@ class TravelerResourceTest(ClientTestCase):
         self.assertEqual(200, actual.status_code)
         self.assertIn(expected_id, parse_json(actual.data))
 
+    def test__get_travelers__should_return_full_travelers__when_expand_full_requested(self, client: FlaskClient) -> None:
+        # Arrange
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=JsonTranslator.to_json(anon_traveler()))
+        expected = parse_json(response.data)
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/travelers", query_string={"expand": "full"})
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertListEqual([expected], parse_json(actual.data))
+
+    def test__post_travelers_batch_get__should_return_requested_travelers(self, client: FlaskClient) -> None:
+        # Arrange
+        expected = [
+            parse_json(client.post(f"/api/world/{self.world_id}/traveler", json=JsonTranslator.to_json(anon_traveler())).data)
+            for _ in range(2)
+        ]
+
+        # Act
+        actual = client.post(f"/api/world/{self.world_id}/travelers/batch-get", json=[traveler["id"] for traveler in expected])
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertListEqual(expected, parse_json(actual.data))
+
     def test__get_traveler__should_return_existing_traveler(self, client: FlaskClient) -> None:
         # Arrange
         body = JsonTranslator.to_json(anon_traveler())
@@ -112,6 +138,65 @@ class TravelerResourceTest(ClientTestCase):
         self.assertEqual(200, actual.status_code)
         self.assertEqual(expected_json, parse_json(actual.data))
 
+    def test__get_traveler__should_only_return_requested_fields__when_fields_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        traveler_json = parse_json(response.data)
+        traveler_id = traveler_json["id"]
+        expected_json = {"id": traveler_id, "name": traveler_json["name"], "tags": traveler_json["tags"]}
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/traveler/{traveler_id}", query_string={"fields": "id,name,tags"})
+        actual_windowed = client.get(
+            f"/api/world/{self.world_id}/traveler/{traveler_id}", query_string={"fields": "id,journey", "continuumFrom": "0"})
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertEqual(expected_json, parse_json(actual.data))
+        self.assertEqual(200, actual_windowed.status_code)
+        self.assertSetEqual({"id", "journey"}, set(parse_json(actual_windowed.data).keys()))
+
+    def test__get_traveler__should_return_simplified_journey__when_tolerance_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        traveler_id = parse_json(response.data)["id"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/traveler/{traveler_id}?tolerance=0")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertLessEqual(len(parse_json(actual.data)["journey"]), len(body["journey"]))
+
+    def test__get_traveler__should_reject__when_tolerance_negative(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        traveler_id = parse_json(response.data)["id"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/traveler/{traveler_id}?tolerance=-1")
+
+        # Assert
+        self.assertEqual(400, actual.status_code)
+
+    def test__get_traveler__should_only_return_moves_in_window__when_continuum_window_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        expected_json = parse_json(response.data)
+        first_continuum = expected_json["journey"][0]["position"]["continuum"]
+        expected_json["journey"] = [move for move in expected_json["journey"] if move["position"]["continuum"] <= first_continuum]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/traveler/{expected_json['id']}?continuumTo={first_continuum}")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertEqual(expected_json, parse_json(actual.data))
+
     def test__delete_traveler__should_remove(self, client: FlaskClient) -> None:
         # Arrange
         body = JsonTranslator.to_json(anon_traveler())
@@ -188,3 +273,105 @@ class TravelerResourceTest(ClientTestCase):
         # Assert
         self.assertEqual(200, actual.status_code)
         self.assertEqual(expected_json, parse_json(actual.data))
+
+    def test__post_traveler_journey__should_append_move(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        expected_json = parse_json(response.data)
+        traveler_id = expected_json["id"]
+        positional_move = copy(expected_json["journey"][0])
+        expected_json["journey"].append(positional_move)
+
+        # Act
+        actual = client.post(f"/api/world/{self.world_id}/traveler/{traveler_id}/journey", json=positional_move)
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertEqual(expected_json, parse_json(actual.data))
+        self.assertEqual(expected_json, parse_json(client.get(f"/api/world/{self.world_id}/traveler/{traveler_id}").data))
+
+    def test__get_traveler_journey_stats__should_return_stats(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        body["journey"] = [
+            {"position": {"latitude": 0, "longitude": 0, "altitude": 0, "continuum": 0, "reality": 0}, "movement_type": "immediate"},
+            {"position": {"latitude": 6, "longitude": 8, "altitude": 0, "continuum": 5, "reality": 0}, "movement_type": "interpolated"},
+        ]
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        traveler_id = parse_json(response.data)["id"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/traveler/{traveler_id}/journey/stats")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertEqual({
+            "path_length_by_reality": {"0": 10.}, "average_speed": 2., "max_speed": 2., "dwell_by_location": {}, "reality_transitions": [],
+        }, parse_json(actual.data))
+
+    def test__get_traveler_position__should_return_position__when_journey_covers_continuum(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        body["journey"] = body["journey"][:1]
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        traveler_id = parse_json(response.data)["id"]
+        expected_json = body["journey"][0]["position"]
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/traveler/{traveler_id}/position?continuum={expected_json['continuum']}"
+                            f"&reality={expected_json['reality']}")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertEqual(expected_json, parse_json(actual.data))
+
+    def test__get_encounters__should_return_travelers_sharing_a_position(self, client: FlaskClient) -> None:
+        # Arrange
+        journey = anon_traveler().journey[:1]
+        traveler_ids = set()
+        for _ in range(2):
+            response = client.post(f"/api/world/{self.world_id}/traveler", json=JsonTranslator.to_json(anon_traveler(journey=journey)))
+            traveler_ids.add(parse_json(response.data)["id"])
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/encounters?distance=1")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        encounters = parse_json(actual.data)
+        self.assertEqual(1, len(encounters))
+        self.assertSetEqual(traveler_ids, set(encounters[0]["travelers"]))
+
+    def test__get_encounters__should_reject__when_distance_not_provided(self, client: FlaskClient) -> None:
+        # Arrange
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/encounters")
+
+        # Assert
+        self.assertEqual(400, actual.status_code)
+
+    def test__get_snapshot__should_return_traveler_positions__when_continuum_and_reality_provided(self, client: FlaskClient) -> None:
+        # Arrange
+        body = JsonTranslator.to_json(anon_traveler())
+        response = client.post(f"/api/world/{self.world_id}/traveler", json=body)
+        traveler_json = parse_json(response.data)
+        position_json = traveler_json["journey"][0]["position"]
+        query = f"continuum={position_json['continuum']}&reality={position_json['reality']}"
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/snapshot?{query}")
+
+        # Assert
+        self.assertEqual(200, actual.status_code)
+        self.assertIn(traveler_json["id"], parse_json(actual.data)["travelers"])
+
+    def test__get_snapshot__should_reject__when_reality_not_provided(self, client: FlaskClient) -> None:
+        # Arrange
+
+        # Act
+        actual = client.get(f"/api/world/{self.world_id}/snapshot?continuum=1.5")
+
+        # Assert
+        self.assertEqual(400, actual.status_code)
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import Callable, Any
 
-from Test.Unittest.test_helpers.anons import anon_location, anon_anything, anon_traveler, anon_event, anon_positional_range, anon_world
+from Test.Unittest.test_helpers.anons import anon_location, anon_anything, anon_traveler, anon_event, anon_positional_range, anon_world, \
+    anon_position, anon_journey, anon_tag, anon_prefixed_id
+from domain.collections import Range
 from domain.events import Event
 from domain.ids import PrefixedUUID
 from domain.locations import Location
 from domain.persistence.repositories import WorldRepository, LocationRepository, TravelerRepository, EventRepository
-from domain.positions import PositionalMove, Position, MovementType
+from domain.positions import PositionalMove, Position, MovementType, PositionalRange
 from domain.travelers import Traveler
 from domain.worlds import World
 
@@ -116,6 +118,83 @@ class TestSRDRepository(ABC):
         # Assert
         self.assertSetEqual(set(), actual)
 
+    def test__retrieve_ids__should_return_ids_of_entities_matching_tag_filters__when_tag_filters_provided(self) -> None:
+        # Arrange
+        tagged_entity = self.anon_entity()
+        other_entity = self.anon_entity()
+        self.repository.save(tagged_entity)
+        self.repository.save(other_entity)
+        tag = next(iter(tagged_entity.tags))
+
+        # Act
+        actual_tagged_any = self.repository.retrieve_ids(tagged_any={tag})
+        actual_tagged_none = self.repository.retrieve_ids(tagged_none={tag})
+        actual_tagged_only = self.repository.retrieve_ids(tagged_only=tagged_entity.tags)
+
+        # Assert
+        self.assertSetEqual({tagged_entity.id}, actual_tagged_any)
+        self.assertSetEqual({other_entity.id}, actual_tagged_none)
+        self.assertSetEqual({tagged_entity.id}, actual_tagged_only)
+
+    def test__retrieve_ids__should_return_ids_of_entities_matching_name_filters__when_name_filters_provided(self) -> None:
+        # Arrange
+        entity = self.anon_entity()
+        self.repository.save(entity)
+        self.repository.save(self.anon_entity())
+        self.repository.retrieve_ids(name_has=entity.name)
+        deleted_entity = self.anon_entity()
+        self.repository.save(deleted_entity)
+        self.repository.delete(deleted_entity.id)
+
+        # Act
+        actual_name_is = self.repository.retrieve_ids(name_is=entity.name.upper())
+        actual_name_has = self.repository.retrieve_ids(name_has=entity.name[1:-1].lower())
+        actual_deleted = self.repository.retrieve_ids(name_is=deleted_entity.name)
+
+        # Assert
+        self.assertSetEqual({entity.id}, actual_name_is)
+        self.assertSetEqual({entity.id}, actual_name_has)
+        self.assertSetEqual(set(), actual_deleted)
+
+    def test__retrieve_ids__should_reflect_retagged_and_deleted_entities__when_tag_filters_provided(self) -> None:
+        # Arrange
+        retagged_entity = self.anon_entity()
+        deleted_entity = self.anon_entity()
+        tag = anon_tag()
+        retagged_entity.add_tag(tag)
+        deleted_entity.add_tag(tag)
+        self.repository.save(retagged_entity)
+        self.repository.save(deleted_entity)
+        self.repository.retrieve_ids(tagged_all={tag})
+        retagged_entity.remove_tag(tag)
+        self.repository.save(retagged_entity)
+        self.repository.delete(deleted_entity.id)
+
+        # Act
+        actual = self.repository.retrieve_ids(tagged_all={tag})
+
+        # Assert
+        self.assertSetEqual(set(), actual)
+
+    def test__estimate_count__should_bound_matching_count__when_filters_provided(self) -> None:
+        # Arrange
+        entity = self.anon_entity()
+        self.repository.save(entity)
+        self.repository.save(self.anon_entity())
+        tag = next(iter(entity.tags))
+
+        # Act
+        actual_unfiltered = self.repository.estimate_count()
+        actual_name_is = self.repository.estimate_count(name_is=entity.name)
+        actual_tagged_all = self.repository.estimate_count(tagged_all={tag})
+        actual_unknown_tag = self.repository.estimate_count(tagged_all={anon_tag()})
+
+        # Assert
+        self.assertEqual(2, actual_unfiltered)
+        self.assertEqual(1, actual_name_is)
+        self.assertEqual(1, actual_tagged_all)
+        self.assertEqual(0, actual_unknown_tag)
+
     def test__delete__should_delete_entity__when_matching_entity_stored(self) -> None:
         # Arrange
         entity = self.anon_entity()
@@ -151,6 +230,23 @@ class TestWorldsRepository(TestSRDRepository):
     def get_entity_identifier(self, entity: World) -> PrefixedUUID:
         return entity.id
 
+    def test__associate_all__should_associate_every_id_with_world(self) -> None:
+        # Arrange
+        world = self.anon_entity()
+        self.repository.save(world)
+        existing_location_id = anon_prefixed_id(prefix="location")
+        self.repository.associate(world.id, location_id=existing_location_id)
+        location_ids = {anon_prefixed_id(prefix="location") for _ in range(3)}
+        traveler_ids = {anon_prefixed_id(prefix="traveler") for _ in range(3)}
+
+        # Act
+        self.repository.associate_all(world.id, location_ids=location_ids, traveler_ids=traveler_ids)
+
+        # Assert
+        self.assertSetEqual(location_ids | {existing_location_id}, self.repository.get_all_associated(world.id, locations=True))
+        self.assertSetEqual(traveler_ids, self.repository.get_all_associated(world.id, travelers=True))
+        self.assertSetEqual(set(), self.repository.get_all_associated(world.id, events=True))
+
 
 class TestLocationsRepository(TestSRDRepository):
     @property
@@ -164,6 +260,55 @@ class TestLocationsRepository(TestSRDRepository):
     def get_entity_identifier(self, entity: Location) -> PrefixedUUID:
         return entity.id
 
+    def test__retrieve_ids__should_return_locations_whose_span_includes_position__when_span_includes_provided(self) -> None:
+        # Arrange
+        span = anon_positional_range(continuum=Range(0., 10.), reality={0, 2})
+        position = Position(latitude=span.latitude.low, longitude=span.longitude.high, altitude=span.altitude.low, continuum=10.,
+                            reality=2)
+        expected_location = anon_location(span=span)
+        self.repository.save(expected_location)
+        self.repository.save(anon_location(span=anon_positional_range(continuum=Range(11., 20.), reality={2})))
+        self.repository.save(anon_location(span=anon_positional_range(continuum=Range(0., 10.), reality={1})))
+
+        # Act
+        actual = self.repository.retrieve_ids(span_includes=position)
+
+        # Assert
+        self.assertSetEqual({expected_location.id}, actual)
+
+    def test__retrieve_ids__should_return_locations_overlapping_window__when_continuum_and_reality_provided(self) -> None:
+        # Arrange
+        overlapping_location = anon_location(span=anon_positional_range(continuum=Range(5., 15.), reality={1, 2}))
+        self.repository.save(overlapping_location)
+        self.repository.save(anon_location(span=anon_positional_range(continuum=Range(0., 4.), reality={2})))
+        self.repository.save(anon_location(span=anon_positional_range(continuum=Range(21., 30.), reality={2})))
+        self.repository.save(anon_location(span=anon_positional_range(continuum=Range(10., 12.), reality={3})))
+
+        # Act
+        actual = self.repository.retrieve_ids(continuum_intersects=Range(10., 20.), reality_intersects={2, 4})
+
+        # Assert
+        self.assertSetEqual({overlapping_location.id}, actual)
+
+    def test__retrieve_ids__should_reflect_moved_and_deleted_locations__when_span_includes_provided(self) -> None:
+        # Arrange
+        span = anon_positional_range(continuum=Range(0., 10.), reality={0})
+        position = Position(latitude=span.latitude.low, longitude=span.longitude.low, altitude=span.altitude.low, continuum=5.,
+                            reality=0)
+        moved_location = anon_location(span=span)
+        deleted_location = anon_location(span=span)
+        self.repository.save(moved_location)
+        self.repository.save(deleted_location)
+        self.repository.retrieve_ids(span_includes=position)
+
+        # Act
+        self.repository.save(Location(id=moved_location.id, name=moved_location.name, span=anon_positional_range(continuum=Range(6., 7.))))
+        self.repository.delete(deleted_location.id)
+        actual = self.repository.retrieve_ids(span_includes=position)
+
+        # Assert
+        self.assertSetEqual(set(), actual)
+
 
 class TestTravelerRepository(TestSRDRepository):
     @property
@@ -177,6 +322,114 @@ class TestTravelerRepository(TestSRDRepository):
     def get_entity_identifier(self, entity: Traveler) -> PrefixedUUID:
         return entity.id
 
+    def test__retrieve_ids__should_return_all_stored_ids__when_no_filters_provided(self) -> None:
+        # Arrange
+        travelers = {self.anon_entity(), self.anon_entity()}
+        for traveler in travelers:
+            self.repository.save(traveler)
+        expected = {traveler.id for traveler in travelers}
+
+        # Act
+        actual = self.repository.retrieve_ids()
+
+        # Assert
+        self.assertSetEqual(expected, actual)
+
+    def test__retrieve_ids__should_return_travelers_whose_journey_includes_position__when_journey_includes_provided(self) -> None:
+        # Arrange
+        position = anon_position()
+        expected_traveler = anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])
+        self.repository.save(expected_traveler)
+        self.repository.save(self.anon_entity())
+
+        # Act
+        actual = self.repository.retrieve_ids(journey_includes=position)
+
+        # Assert
+        self.assertSetEqual({expected_traveler.id}, actual)
+
+    def test__retrieve_ids__should_return_travelers_whose_journey_intersects_range__when_journey_intersects_provided(self) -> None:
+        # Arrange
+        positional_range = anon_positional_range()
+        position = Position(latitude=positional_range.latitude.low, longitude=positional_range.longitude.high,
+                            altitude=positional_range.altitude.low, continuum=positional_range.continuum.high,
+                            reality=next(iter(positional_range.reality)))
+        expected_traveler = anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])
+        self.repository.save(expected_traveler)
+        self.repository.save(self.anon_entity())
+
+        # Act
+        actual = self.repository.retrieve_ids(journey_intersects=positional_range)
+
+        # Assert
+        self.assertSetEqual({expected_traveler.id}, actual)
+
+    def test__estimate_count__should_count_travelers_at_position__when_journey_includes_provided(self) -> None:
+        # Arrange
+        position = anon_position()
+        self.repository.save(anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)]))
+        self.repository.save(self.anon_entity())
+
+        # Act
+        actual = self.repository.estimate_count(journey_includes=position)
+
+        # Assert
+        self.assertEqual(1, actual)
+
+    def test__retrieve_ids__should_reflect_updated_and_deleted_travelers(self) -> None:
+        # Arrange
+        position = anon_position()
+        traveler = anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])
+        deleted_traveler = anon_traveler(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])
+        self.repository.save(traveler)
+        self.repository.save(deleted_traveler)
+        self.repository.retrieve_ids(journey_includes=position)
+        self.repository.save(Traveler(id=traveler.id, name=traveler.name, journey=anon_journey()))
+        self.repository.delete(deleted_traveler.id)
+
+        # Act
+        actual = self.repository.retrieve_ids(journey_includes=position)
+
+        # Assert
+        self.assertSetEqual(set(), actual)
+
+    def test__append_to_journey__should_add_move_to_retrieved_and_filtered_traveler(self) -> None:
+        # Arrange
+        traveler = self.anon_entity()
+        self.repository.save(traveler)
+        self.repository.retrieve_ids(journey_includes=traveler.journey[0].position)
+        positional_move = PositionalMove(position=anon_position(), movement_type=MovementType.IMMEDIATE)
+
+        # Act
+        self.repository.append_to_journey(traveler.id, positional_move)
+
+        # Assert
+        self.assertEqual(traveler.journey + [positional_move], self.repository.retrieve(traveler.id).journey)
+        self.assertSetEqual({traveler.id}, self.repository.retrieve_ids(journey_includes=positional_move.position))
+
+    def test__append_to_journey__should_be_replaced__when_traveler_saved_afterwards(self) -> None:
+        # Arrange
+        traveler = self.anon_entity()
+        self.repository.save(traveler)
+        self.repository.append_to_journey(traveler.id, PositionalMove(position=anon_position(), movement_type=MovementType.IMMEDIATE))
+        expected = Traveler(id=traveler.id, name=traveler.name, journey=anon_journey())
+
+        # Act
+        self.repository.save(expected)
+
+        # Assert
+        self.assertEqual(expected.journey, self.repository.retrieve(traveler.id).journey)
+
+    def test__append_to_journey__should_raise_name_error__when_traveler_not_stored(self) -> None:
+        # Arrange
+        positional_move = PositionalMove(position=anon_position(), movement_type=MovementType.IMMEDIATE)
+
+        # Act
+        def action(): self.repository.append_to_journey(self.anon_entity().id, positional_move)
+
+        # Assert
+        self.assertRaises(NameError, action)
+
 
 class TestEventRepository(TestSRDRepository):
     @property
@@ -247,3 +500,71 @@ class TestEventRepository(TestSRDRepository):
 
         # Assert
         self.assertSetEqual(expected, actual)
+
+    def test__retrieve_all__should_only_return_events_overlapping_window__when_continuum_and_reality_provided(self) -> None:
+        # Arrange
+        span = anon_positional_range()
+        location = anon_location(span=span)
+
+        def anon_linked_event(continuum: Range, reality: set) -> Event:
+            return anon_event(span=PositionalRange(
+                latitude=span.latitude, longitude=span.longitude, altitude=span.altitude, continuum=continuum, reality=reality),
+                affected_locations={location.id})
+
+        overlapping_event = anon_linked_event(Range(5., 15.), {1, 2})
+        before_event = anon_linked_event(Range(0., 4.), {1})
+        after_event = anon_linked_event(Range(21., 30.), {1})
+        other_reality_event = anon_linked_event(Range(10., 12.), {3})
+        for event in [overlapping_event, before_event, after_event, other_reality_event]:
+            self.repository.save(event)
+
+        # Act
+        actual = self.repository.retrieve_all(location_id=location.id, continuum_intersects=Range(10., 20.), reality_intersects={2, 4})
+
+        # Assert
+        self.assertSetEqual({overlapping_event}, actual)
+
+    def test__retrieve_all__should_use_updated_span__when_event_saved_again_with_new_span(self) -> None:
+        # Arrange
+        event = anon_event(span=anon_positional_range(continuum=Range(0., 1.)))
+        self.repository.save(event)
+        self.repository.retrieve_all(continuum_intersects=Range(0., 1.))
+        moved_event = Event(id=event.id, name=event.name, span=anon_positional_range(continuum=Range(5., 6.)))
+        self.repository.save(moved_event)
+
+        # Act
+        actual_old_window = self.repository.retrieve_all(continuum_intersects=Range(0., 1.))
+        actual_new_window = self.repository.retrieve_all(continuum_intersects=Range(5., 6.))
+
+        # Assert
+        self.assertSetEqual(set(), actual_old_window)
+        self.assertSetEqual({moved_event}, actual_new_window)
+
+    def test__retrieve_ids__should_return_events_whose_span_includes_position__when_span_includes_provided(self) -> None:
+        # Arrange
+        span = anon_positional_range(continuum=Range(0., 10.), reality={3})
+        position = Position(latitude=span.latitude.high, longitude=span.longitude.low, altitude=span.altitude.high, continuum=0.,
+                            reality=3)
+        expected_event = anon_event(span=span)
+        self.repository.save(expected_event)
+        self.repository.save(anon_event(span=anon_positional_range(continuum=Range(-10., -1.), reality={3})))
+
+        # Act
+        actual = self.repository.retrieve_ids(span_includes=position, continuum_intersects=Range(-1., 1.))
+
+        # Assert
+        self.assertSetEqual({expected_event.id}, actual)
+
+    def test__retrieve_ids__should_return_ids_of_events_affecting_location__when_location_id_provided(self) -> None:
+        # Arrange
+        span = anon_positional_range()
+        location = anon_location(span=span)
+        linked_event = anon_event(span=span, affected_locations={location.id})
+        self.repository.save(linked_event)
+        self.repository.save(anon_event())
+
+        # Act
+        actual = self.repository.retrieve_ids(location_id=location.id)
+
+        # Assert
+        self.assertSetEqual({linked_event.id}, actual)
@@ -0,0 +1,136 @@
+from math import sqrt
+from typing import List
+from unittest import TestCase
+
+from Test.Unittest.test_helpers.anons import anon_traveler, anon_float, anon_int, anon_prefixed_id, positional_move_at
+from domain.collections import Range
+from domain.encounters import Encounter, find_encounters
+from domain.positions import MovementType
+from domain.travelers import Traveler
+
+
+def _anon_wandering_traveler(move_count: int) -> Traveler:
+    # Only immediate moves may change reality
+    journey = []
+    continuum = anon_float(0., 10.)
+    reality = 0
+    for move_index in range(move_count):
+        continuum += anon_float(1., 5.)
+        movement_type = MovementType.IMMEDIATE if move_index == 0 or anon_int(0, 9) == 0 else MovementType.INTERPOLATED
+        if movement_type == MovementType.IMMEDIATE:
+            reality = anon_int(0, 1)
+        journey.append(
+            positional_move_at(anon_float(-20., 20.), continuum, movement_type, longitude=anon_float(-20., 20.), reality=reality))
+    return anon_traveler(journey=journey)
+
+
+def _sampled_pairs_within_distance(travelers: List[Traveler], distance: float, continuum: float) -> set:
+    # Reference: the pairs within the distance at a single continuum, found from each traveler's position in every reality
+    positions = []
+    for traveler in travelers:
+        for reality in [0, 1]:
+            position = traveler.position_at(continuum, reality)
+            if position is not None:
+                positions.append((traveler.id, reality, position.latitude, position.longitude))
+    return {
+        (frozenset({id_a, id_b}), reality_a)
+        for id_a, reality_a, latitude_a, longitude_a in positions
+        for id_b, reality_b, latitude_b, longitude_b in positions
+        if id_a != id_b and reality_a == reality_b and sqrt((latitude_a - latitude_b) ** 2 + (longitude_a - longitude_b) ** 2) < distance
+    }
+
+
+class TestEncounter(TestCase):
+    def test__init__should_reject_travelers__when_not_exactly_two(self) -> None:
+        # Arrange
+        travelers = {anon_prefixed_id(prefix="traveler") for _ in range(anon_int(0, 1) * 2 + 1)}
+
+        # Act
+        def action(): Encounter(travelers=travelers, continuum=Range(0., 1.), reality=0)
+
+        # Assert
+        self.assertRaises(ValueError, action)
+
+
+class TestFindEncounters(TestCase):
+    def test__find_encounters__should_find_interval__when_interpolated_paths_cross(self) -> None:
+        # Arrange
+        traveler_a = anon_traveler(journey=[positional_move_at(-10., 0., MovementType.IMMEDIATE), positional_move_at(10., 20.)])
+        traveler_b = anon_traveler(journey=[positional_move_at(10., 0., MovementType.IMMEDIATE), positional_move_at(-10., 20.)])
+
+        # Act
+        actual = find_encounters([traveler_a, traveler_b], 4.)
+
+        # Assert
+        self.assertListEqual([Encounter(travelers={traveler_a.id, traveler_b.id}, continuum=Range(8., 12.), reality=0)], actual)
+
+    def test__find_encounters__should_find_nothing__when_close_in_different_realities(self) -> None:
+        # Arrange
+        traveler_a = anon_traveler(journey=[positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0., 20.)])
+        traveler_b = anon_traveler(journey=[
+            positional_move_at(0., 0., MovementType.IMMEDIATE, reality=1), positional_move_at(0., 20., reality=1)])
+
+        # Act
+        actual = find_encounters([traveler_a, traveler_b], 4.)
+
+        # Assert
+        self.assertListEqual([], actual)
+
+    def test__find_encounters__should_find_nothing__when_close_places_are_at_different_continuums(self) -> None:
+        # Arrange
+        traveler_a = anon_traveler(journey=[positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0., 10.)])
+        traveler_b = anon_traveler(journey=[positional_move_at(0., 11., MovementType.IMMEDIATE), positional_move_at(0., 20.)])
+
+        # Act
+        actual = find_encounters([traveler_a, traveler_b], 4.)
+
+        # Assert
+        self.assertListEqual([], actual)
+
+    def test__find_encounters__should_merge_intervals__when_encounter_spans_several_segments(self) -> None:
+        # Arrange
+        traveler_a = anon_traveler(journey=[
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(1., 5.), positional_move_at(0., 10.)])
+        traveler_b = anon_traveler(journey=[positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0., 10.)])
+
+        # Act
+        actual = find_encounters([traveler_a, traveler_b], 4.)
+
+        # Assert
+        self.assertListEqual([Encounter(travelers={traveler_a.id, traveler_b.id}, continuum=Range(0., 10.), reality=0)], actual)
+
+    def test__find_encounters__should_find_interval__when_traveler_waits_before_immediatepositional_move_at(self) -> None:
+        # Arrange
+        traveler_a = anon_traveler(journey=[positional_move_at(0., 0., MovementType.IMMEDIATE),
+                                            positional_move_at(50., 10., MovementType.IMMEDIATE)])
+        traveler_b = anon_traveler(journey=[positional_move_at(-5., 0., MovementType.IMMEDIATE), positional_move_at(5., 10.)])
+
+        # Act
+        actual = find_encounters([traveler_a, traveler_b], 1.)
+
+        # Assert
+        self.assertListEqual([Encounter(travelers={traveler_a.id, traveler_b.id}, continuum=Range(4., 6.), reality=0)], actual)
+
+    def test__find_encounters__should_reject_distance__when_negative_or_not_finite(self) -> None:
+        for distance in [-1., float("inf"), float("nan")]:
+            # Act
+            def action(): find_encounters([anon_traveler()], distance)
+
+            # Assert
+            self.assertRaises(ValueError, action)
+
+    def test__find_encounters__should_agree_with_sampled_positions__when_many_travelers_wander(self) -> None:
+        # Arrange
+        travelers = [_anon_wandering_traveler(20) for _ in range(15)]
+        distance = 3.
+
+        # Act
+        actual = find_encounters(travelers, distance)
+
+        # Assert
+        for continuum in [anon_float(0., 80.) for _ in range(200)]:
+            expected = _sampled_pairs_within_distance(travelers, distance, continuum)
+            found = {(frozenset(encounter.travelers), encounter.reality) for encounter in actual if encounter.continuum.includes(continuum)}
+            self.assertTrue(expected.issubset(found), f"Missed encounters at continuum {continuum}")
+            self.assertTrue(found.issubset(_sampled_pairs_within_distance(travelers, distance + 1e-6, continuum)),
+                            f"Unexpected encounters at continuum {continuum}")
@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+from Test.Unittest.test_helpers.anons import anon_float, anon_int, anon_location, positional_move_at
+from domain.collections import Range
+from domain.journey_stats import JourneyStats, RealityTransition, compute_journey_stats
+from domain.positions import Position, MovementType, PositionalRange
+
+
+def _span(latitude: Range[float], continuum: Range[float], *, reality: int = 0) -> PositionalRange:
+    return PositionalRange(latitude=latitude, longitude=Range(-1., 1.), altitude=Range(-1., 1.), continuum=continuum, reality={reality})
+
+
+class TestComputeJourneyStats(TestCase):
+    def test__compute_journey_stats__should_measure_path_and_speed__when_journey_travels_and_waits(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(10., 5.),
+            positional_move_at(10., 10., MovementType.IMMEDIATE), positional_move_at(4., 13.),
+        ]
+
+        # Act
+        actual = compute_journey_stats(journey, [])
+
+        # Assert
+        self.assertEqual(JourneyStats(
+            path_length_by_reality={0: 16.}, average_speed=16. / 13., max_speed=2., dwell_by_location={}, reality_transitions=[]), actual)
+
+    def test__compute_journey_stats__should_list_reality_transitions_and_leave_jumps_out_of_path(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(3., 1.),
+            positional_move_at(50., 2., MovementType.IMMEDIATE, reality=1), positional_move_at(51., 3., reality=1),
+            positional_move_at(0., 4., MovementType.IMMEDIATE),
+        ]
+
+        # Act
+        actual = compute_journey_stats(journey, [])
+
+        # Assert
+        self.assertDictEqual({0: 3., 1: 1.}, actual.path_length_by_reality)
+        self.assertListEqual([
+            RealityTransition(continuum=2., from_reality=0, to_reality=1), RealityTransition(continuum=4., from_reality=1, to_reality=0),
+        ], actual.reality_transitions)
+
+    def test__compute_journey_stats__should_measure_time_spent_in_locations__when_journey_passes_through_them(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(10., 10.),
+            positional_move_at(0., 20., MovementType.IMMEDIATE), positional_move_at(0., 25.),
+        ]
+        passed_through = anon_location(span=_span(Range(2., 4.), Range(0., 100.)))
+        waited_in = anon_location(span=_span(Range(9., 11.), Range(0., 15.)))
+        other_reality = anon_location(span=_span(Range(0., 10.), Range(0., 100.), reality=1))
+        never_reached = anon_location(span=_span(Range(20., 30.), Range(0., 100.)))
+
+        # Act
+        actual = compute_journey_stats(journey, [passed_through, waited_in, other_reality, never_reached])
+
+        # Assert
+        self.assertEqual({passed_through.id, waited_in.id}, actual.dwell_by_location.keys())
+        self.assertAlmostEqual(2., actual.dwell_by_location[passed_through.id])
+        self.assertAlmostEqual(6., actual.dwell_by_location[waited_in.id])
+
+    def test__compute_journey_stats__should_match_sampled_dwell__when_journey_is_long(self) -> None:
+        # Arrange
+        journey = [positional_move_at(0., 0., MovementType.IMMEDIATE)]
+        for continuum in range(1, 200):
+            movement_type = MovementType.IMMEDIATE if anon_int(0, 9) == 0 else MovementType.INTERPOLATED
+            journey.append(positional_move_at(anon_float(-10., 10.), float(continuum), movement_type))
+        location = anon_location(span=_span(Range(-2., 3.), Range(20., 150.)))
+        samples = 20000
+
+        # Act
+        actual = compute_journey_stats(journey, [location])
+
+        # Assert
+        # Reference: the fraction of evenly spread samples along the journey that are inside the location
+        sampled_dwell = 0.
+        for sample in range(samples):
+            continuum = 199. * (sample + .5) / samples
+            start, end = journey[int(continuum)], journey[int(continuum) + 1]
+            latitude = start.position.latitude
+            if end.movement_type == MovementType.INTERPOLATED:
+                latitude += (end.position.latitude - start.position.latitude) * (continuum - int(continuum))
+            if location.span.includes(Position(latitude=latitude, longitude=0., altitude=0., continuum=continuum, reality=0)):
+                sampled_dwell += 199. / samples
+        self.assertAlmostEqual(sampled_dwell, actual.dwell_by_location.get(location.id, 0.), delta=1.)
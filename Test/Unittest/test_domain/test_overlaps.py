@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+from Test.Unittest.test_helpers.anons import anon_event, anon_float, anon_int, anon_prefixed_id
+from domain.collections import Range
+from domain.overlaps import EventOverlap, find_event_overlaps
+from domain.positions import PositionalRange
+
+
+def _span(latitude: float, continuum: float, *, size: float = 1., reality: int = 0) -> PositionalRange:
+    return PositionalRange(latitude=Range(latitude, latitude + size), longitude=Range(0., size), altitude=Range(0., size),
+                           continuum=Range(continuum, continuum + size), reality={reality})
+
+
+class TestEventOverlap(TestCase):
+    def test__init__should_reject_events__when_not_exactly_two(self) -> None:
+        # Arrange
+        events = {anon_prefixed_id(prefix="event") for _ in range(anon_int(0, 1) * 2 + 1)}
+
+        # Act
+        def action(): EventOverlap(events=events, travelers=set())
+
+        # Assert
+        self.assertRaises(ValueError, action)
+
+
+class TestFindEventOverlaps(TestCase):
+    def test__find_event_overlaps__should_find_pair__when_spans_intersect(self) -> None:
+        # Arrange
+        traveler_id = anon_prefixed_id(prefix="traveler")
+        event_a = anon_event(span=_span(0., 0., size=2.), affected_travelers={traveler_id})
+        event_b = anon_event(span=_span(2., 2., size=2.), affected_travelers={traveler_id, anon_prefixed_id(prefix="traveler")})
+
+        # Act
+        actual = find_event_overlaps([event_b, event_a])
+
+        # Assert
+        self.assertListEqual([EventOverlap(events={event_a.id, event_b.id}, travelers={traveler_id})], actual)
+
+    def test__find_event_overlaps__should_find_nothing__when_spans_only_intersect_in_some_dimensions(self) -> None:
+        # Arrange
+        events = [
+            anon_event(span=_span(0., 0.)),
+            anon_event(span=_span(5., 0.)),
+            anon_event(span=_span(0., 5.)),
+            anon_event(span=_span(0., 0., reality=1)),
+        ]
+
+        # Act
+        actual = find_event_overlaps(events)
+
+        # Assert
+        self.assertListEqual([], actual)
+
+    def test__find_event_overlaps__should_only_pair_events_sharing_a_traveler__when_sharing_traveler_requested(self) -> None:
+        # Arrange
+        traveler_id = anon_prefixed_id(prefix="traveler")
+        event_a = anon_event(span=_span(0., 0.), affected_travelers={traveler_id})
+        event_b = anon_event(span=_span(0., 0.), affected_travelers={traveler_id})
+        anon_event_c = anon_event(span=_span(0., 0.), affected_travelers={anon_prefixed_id(prefix="traveler")})
+
+        # Act
+        actual = find_event_overlaps([event_a, event_b, anon_event_c], sharing_traveler=True)
+
+        # Assert
+        self.assertListEqual([EventOverlap(events={event_a.id, event_b.id}, travelers={traveler_id})], actual)
+
+    def test__find_event_overlaps__should_agree_with_pairwise_intersects__when_many_events(self) -> None:
+        # Arrange
+        traveler_ids = [anon_prefixed_id(prefix="traveler") for _ in range(5)]
+        events = [
+            anon_event(span=_span(anon_float(0., 20.), anon_float(0., 50.), size=anon_float(0., 5.), reality=anon_int(0, 1)),
+                       affected_travelers={traveler_ids[anon_int(0, 4)] for _ in range(anon_int(0, 2))})
+            for _ in range(150)
+        ]
+
+        for sharing_traveler in [False, True]:
+            # Act
+            actual = find_event_overlaps(events, sharing_traveler=sharing_traveler)
+
+            # Assert
+            expected = {
+                frozenset({event_a.id, event_b.id})
+                for index, event_a in enumerate(events) for event_b in events[index + 1:]
+                if event_a.span.intersects(event_b.span)
+                and (not sharing_traveler or event_a.affected_travelers & event_b.affected_travelers)
+            }
+            self.assertSetEqual(expected, {frozenset(overlap.events) for overlap in actual})
+            self.assertEqual(len(expected), len(actual))
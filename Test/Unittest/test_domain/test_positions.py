@@ -4,10 +4,11 @@ from unittest.mock import MagicMock, patch
 
 from Test.Unittest.test_helpers.anons import anon_float, anon_int, anon_position, anon_positional_range, anon_range, anon_journey, \
     anon_anything
-from Test.Unittest.test_helpers.anons import anon_movement_type, anon_positional_move
+from Test.Unittest.test_helpers.anons import anon_movement_type, anon_positional_move, positional_move_at
 from domain.base_entity import BaseEntity
 from domain.collections import Range
-from domain.positions import Position, PositionalRange, SpanningEntity, JourneyingEntity, MovementType
+from domain.positions import Position, PositionalRange, SpanningEntity, JourneyingEntity, MovementType, JourneyContinuumIndex, \
+    interpolate_positions
 from domain.positions import PositionalMove
 
 
@@ -362,6 +363,56 @@ class TestPositionalRange(TestCase):
         self.assertFalse(actual_continuum)
         self.assertFalse(actual_reality)
 
+    def test__intersects_path__should_return_true__when_path_passes_through_range_without_either_end_inside(self) -> None:
+        # Arrange
+        range_ = Range(-1., 1.)
+        positional_range = PositionalRange(latitude=range_, longitude=range_, altitude=range_, continuum=range_, reality={0})
+        start = Position(latitude=-5., longitude=-5., altitude=0., continuum=-5., reality=0)
+        end = Position(latitude=5., longitude=5., altitude=0., continuum=5., reality=0)
+
+        # Act
+        actual = positional_range.intersects_path(start, end)
+
+        # Assert
+        self.assertFalse(positional_range.includes(start))
+        self.assertFalse(positional_range.includes(end))
+        self.assertTrue(actual)
+
+    def test__intersects_path__should_return_false__when_path_passes_beside_range(self) -> None:
+        # Arrange
+        range_ = Range(-1., 1.)
+        positional_range = PositionalRange(latitude=range_, longitude=range_, altitude=range_, continuum=range_, reality={0})
+        start = Position(latitude=-5., longitude=0., altitude=0., continuum=-5., reality=0)
+        end = Position(latitude=5., longitude=0., altitude=0., continuum=-3., reality=0)
+
+        # Act
+        actual = positional_range.intersects_path(start, end)
+
+        # Assert
+        self.assertFalse(actual)
+
+    def test__intersects_path__should_match_includes__when_start_and_end_are_identical(self) -> None:
+        # Arrange
+        positional_range = anon_positional_range()
+        position = anon_position()
+
+        # Act
+        actual = positional_range.intersects_path(position, position)
+
+        # Assert
+        self.assertEqual(positional_range.includes(position), actual)
+
+    def test__intersects_path__should_reject_paths_across_realities(self) -> None:
+        # Arrange
+        positional_range = anon_positional_range()
+        reality = anon_int()
+
+        # Act
+        def action(): positional_range.intersects_path(anon_position(reality=reality), anon_position(reality=reality + 1))
+
+        # Assert
+        self.assertRaises(ValueError, action)
+
     def test__intersects__should_reject_non_positional_range_arguments(self) -> None:
         # Arrange
         positional_range = anon_positional_range()
@@ -644,6 +695,24 @@ class TestJourneyingEntity(TestCase):
         # Assert
         self.assertRaises(AttributeError, action)
 
+    def test__journey_paths__should_pair_interpolated_moves_with_preceding_position_and_immediate_moves_with_themselves(self) -> None:
+        # Arrange
+        position_1 = anon_position(continuum=1., reality=0)
+        position_2 = anon_position(continuum=2., reality=0)
+        position_3 = anon_position(continuum=0., reality=1)
+        journeying_entity = JourneyingEntity(journey=[
+            PositionalMove(position=position_1, movement_type=MovementType.IMMEDIATE),
+            PositionalMove(position=position_2, movement_type=MovementType.INTERPOLATED),
+            PositionalMove(position=position_3, movement_type=MovementType.IMMEDIATE),
+        ])
+        expected = [(position_1, position_1), (position_1, position_2), (position_3, position_3)]
+
+        # Act
+        actual = journeying_entity.journey_paths
+
+        # Assert
+        self.assertListEqual(expected, actual)
+
     def test__equality__should_correctly_compare_attributes(self) -> None:
         # Arrange
         journey_1 = anon_journey()
@@ -674,6 +743,34 @@ class TestJourneyingEntity(TestCase):
         # Assert
         action()
 
+    def test__position_at__should_interpolate_between_surrounding_moves__when_next_move_interpolated(self) -> None:
+        # Arrange
+        journey_entity = JourneyingEntity(journey=[
+            PositionalMove(position=Position(latitude=0, longitude=2, altitude=-2, continuum=10, reality=1),
+                           movement_type=MovementType.IMMEDIATE),
+            PositionalMove(position=Position(latitude=4, longitude=0, altitude=2, continuum=20, reality=1),
+                           movement_type=MovementType.INTERPOLATED),
+        ])
+
+        # Act
+        actual = journey_entity.position_at(12.5, 1)
+
+        # Assert
+        self.assertEqual(Position(latitude=1, longitude=1.5, altitude=-1, continuum=12.5, reality=1), actual)
+
+    def test__position_at__should_return_none__when_journey_not_in_reality_at_continuum(self) -> None:
+        # Arrange
+        position = anon_position()
+        journey_entity = JourneyingEntity(journey=[PositionalMove(position=position, movement_type=MovementType.IMMEDIATE)])
+
+        # Act
+        before = journey_entity.position_at(position.continuum - 1, position.reality)
+        elsewhere = journey_entity.position_at(position.continuum, position.reality + 1)
+
+        # Assert
+        self.assertIsNone(before)
+        self.assertIsNone(elsewhere)
+
     def test__validate_journey__should_reject__when_empty(self) -> None:
         # Arrange
 
@@ -723,6 +820,189 @@ class TestJourneyingEntity(TestCase):
         # Assert
         self.assertRaises(ValueError, action)
 
+    def test__with_move_appended__should_return_entity_with_move_at_end_of_journey__when_move_valid(self) -> None:
+        # Arrange
+        journey = anon_journey()
+        journey_entity = JourneyingEntity(journey=journey)
+        last_position = journey[-1].position
+        positional_move = PositionalMove(
+            position=anon_position(continuum=last_position.continuum + 1, reality=last_position.reality),
+            movement_type=MovementType.INTERPOLATED)
+
+        # Act
+        actual = journey_entity.with_move_appended(positional_move)
+
+        # Assert
+        self.assertListEqual(journey + [positional_move], actual.journey)
+        self.assertListEqual(journey, journey_entity.journey)
+        self.assertEqual(positional_move.position, actual.position_at(positional_move.position.continuum, last_position.reality))
+
+    def test__with_move_appended__should_reject__when_move_interpolates_across_realities(self) -> None:
+        # Arrange
+        journey = anon_journey()
+        journey_entity = JourneyingEntity(journey=journey)
+        last_position = journey[-1].position
+        positional_move = PositionalMove(
+            position=anon_position(continuum=last_position.continuum + 1, reality=last_position.reality + 1),
+            movement_type=MovementType.INTERPOLATED)
+
+        # Act
+        def action(): journey_entity.with_move_appended(positional_move)
+
+        # Assert
+        self.assertRaises(ValueError, action)
+
+
+class TestJourneyContinuumIndex(TestCase):
+    def test__path_at__should_return_surrounding_moves__when_next_move_interpolated(self) -> None:
+        # Arrange
+        journey = [positional_move_at(1., 0., MovementType.IMMEDIATE), positional_move_at(3., 10., MovementType.INTERPOLATED)]
+        index = JourneyContinuumIndex(journey)
+
+        # Act
+        actual = index.path_at(4., 0)
+
+        # Assert
+        self.assertEqual((journey[0].position, journey[1].position), actual)
+
+    def test__path_at__should_stay_at_previous_move__when_next_move_immediate(self) -> None:
+        # Arrange
+        journey = [positional_move_at(1., 0., MovementType.IMMEDIATE), positional_move_at(3., 10., MovementType.IMMEDIATE)]
+        index = JourneyContinuumIndex(journey)
+
+        # Act
+        before_jump = index.path_at(9.9, 0)
+        at_jump = index.path_at(10., 0)
+
+        # Assert
+        self.assertEqual((journey[0].position, journey[0].position), before_jump)
+        self.assertEqual((journey[1].position, journey[1].position), at_jump)
+
+    def test__path_at__should_return_none__when_outside_journey_or_in_other_reality(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0., 10., MovementType.INTERPOLATED),
+            positional_move_at(0., 20., MovementType.IMMEDIATE, reality=1),
+        ]
+        index = JourneyContinuumIndex(journey)
+
+        for continuum, reality in [(-1., 0), (20.1, 1), (15., 1), (20., 0), (5., 2)]:
+            # Act
+            actual = index.path_at(continuum, reality)
+
+            # Assert
+            self.assertIsNone(actual, f"Expected no path at {continuum} in reality {reality}")
+
+    def test__path_at__should_use_latest_pass__when_journey_jumps_back_in_continuum(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(1., 0., MovementType.IMMEDIATE), positional_move_at(2., 10., MovementType.INTERPOLATED),
+            positional_move_at(3., 5., MovementType.IMMEDIATE), positional_move_at(4., 15., MovementType.INTERPOLATED),
+        ]
+        index = JourneyContinuumIndex(journey)
+
+        # Act
+        actual = index.path_at(7., 0)
+
+        # Assert
+        self.assertEqual((journey[2].position, journey[3].position), actual)
+
+    def test__path_at__should_match_scan_of_journey__when_journey_is_long(self) -> None:
+        # Arrange
+        journey = [positional_move_at(0., 0., MovementType.IMMEDIATE)]
+        for _ in range(300):
+            previous = journey[-1].position
+            if anon_int(0, 9) == 0:
+                journey.append(
+                    positional_move_at(0., previous.continuum + anon_float(-20., 20.), MovementType.IMMEDIATE, reality=anon_int(0, 1)))
+            else:
+                journey.append(
+                    positional_move_at(0., previous.continuum + anon_float(0.1, 2.), MovementType.INTERPOLATED, reality=previous.reality))
+        index = JourneyContinuumIndex(journey)
+
+        def scan(continuum_: float, reality_: int) -> tuple:
+            latest = None
+            for move, next_move in zip(journey, journey[1:] + [None]):
+                position = move.position
+                if position.reality != reality_:
+                    continue
+                if next_move is None or next_move.position.continuum <= position.continuum:
+                    if continuum_ == position.continuum:
+                        latest = position, position
+                elif position.continuum <= continuum_ < next_move.position.continuum:
+                    interpolated = next_move.movement_type == MovementType.INTERPOLATED
+                    latest = position, next_move.position if interpolated else position
+            return latest
+
+        for continuum, reality in [(anon_float(-50., 400.), anon_int(0, 1)) for _ in range(200)] + [(journey[-1].position.continuum, 0)]:
+            # Act
+            actual = index.path_at(continuum, reality)
+
+            # Assert
+            self.assertEqual(scan(continuum, reality), actual)
+
+    def test__path_at__should_use_latest_pass__when_journey_jumps_back_repeatedly(self) -> None:
+        # Arrange
+        journey = []
+        for latitude in range(50):
+            journey += [
+                positional_move_at(latitude, 0., MovementType.IMMEDIATE), positional_move_at(latitude, 10., MovementType.INTERPOLATED),
+            ]
+        index = JourneyContinuumIndex(journey)
+
+        # Act
+        at_start = index.path_at(0., 0)
+        during = index.path_at(5., 0)
+        at_end = index.path_at(10., 0)
+
+        # Assert
+        self.assertEqual((journey[-2].position, journey[-1].position), at_start)
+        self.assertEqual((journey[-2].position, journey[-1].position), during)
+        self.assertEqual((journey[-1].position, journey[-1].position), at_end)
+
+    def test__move_indices_within__should_return_moves_in_range_in_journey_order__when_journey_jumps_back_in_continuum(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0., 10., MovementType.INTERPOLATED),
+            positional_move_at(0., 5., MovementType.IMMEDIATE), positional_move_at(0., 7., MovementType.INTERPOLATED),
+            positional_move_at(0., 20., MovementType.IMMEDIATE),
+        ]
+        index = JourneyContinuumIndex(journey)
+
+        # Act
+        actual = index.move_indices_within(Range(5., 10.))
+
+        # Assert
+        self.assertListEqual([1, 2, 3], actual)
+
+    def test__move_indices_within__should_return_nothing__when_no_move_in_range(self) -> None:
+        # Arrange
+        index = JourneyContinuumIndex([
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0., 10., MovementType.INTERPOLATED)])
+
+        # Act
+        actual = index.move_indices_within(Range(1., 9.))
+
+        # Assert
+        self.assertListEqual([], actual)
+
+class TestInterpolatePositions(TestCase):
+    def test__interpolate_positions__should_interpolate_each_path_at_continuum(self) -> None:
+        # Arrange
+        start = Position(latitude=0., longitude=10., altitude=-4., continuum=0., reality=3)
+        end = Position(latitude=10., longitude=0., altitude=4., continuum=10., reality=3)
+        stationary = anon_position(continuum=1.)
+
+        # Act
+        actual = interpolate_positions([(start, end), (stationary, stationary)], 2.5)
+
+        # Assert
+        self.assertListEqual([
+            Position(latitude=2.5, longitude=7.5, altitude=-2., continuum=2.5, reality=3),
+            Position(latitude=stationary.latitude, longitude=stationary.longitude, altitude=stationary.altitude, continuum=2.5,
+                     reality=stationary.reality),
+        ], actual)
+
 
 class _Other(BaseEntity):
     def __init__(self, other, **kwargs):
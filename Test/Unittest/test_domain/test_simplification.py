@@ -0,0 +1,95 @@
+from math import dist
+from typing import Tuple
+from unittest import TestCase
+
+from Test.Unittest.test_helpers.anons import anon_float, anon_int, positional_move_at
+from domain.positions import PositionalMove, MovementType
+from domain.simplification import simplified_move_indices
+
+
+def _coordinates(move: PositionalMove) -> Tuple[float, float, float, float]:
+    return move.position.latitude, move.position.longitude, move.position.altitude, move.position.continuum
+
+
+def _distance_to_segment(move: PositionalMove, start: PositionalMove, end: PositionalMove) -> float:
+    # Reference: ternary search along the segment for the nearest point, the distance being convex along it
+    def distance_at(fraction: float) -> float:
+        return dist(_coordinates(move), [a + (b - a) * fraction for a, b in zip(_coordinates(start), _coordinates(end))])
+
+    low, high = 0., 1.
+    for _ in range(100):
+        third = (high - low) / 3
+        if distance_at(low + third) <= distance_at(high - third):
+            high -= third
+        else:
+            low += third
+    return distance_at((low + high) / 2)
+
+
+class TestSimplifiedMoveIndices(TestCase):
+    def test__simplified_move_indices__should_drop_moves_close_to_the_path__when_within_tolerance(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0.1, 1.), positional_move_at(-0.1, 2.),
+            positional_move_at(0., 3.), positional_move_at(10., 4.), positional_move_at(0., 5.),
+        ]
+
+        # Act
+        actual = simplified_move_indices(journey, 0.5)
+
+        # Assert
+        self.assertListEqual([0, 3, 4, 5], actual)
+
+    def test__simplified_move_indices__should_keep_every_move__when_tolerance_is_zero_and_no_move_is_on_the_path(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(1., 1.), positional_move_at(0., 2.),
+            positional_move_at(1., 3.),
+        ]
+
+        # Act
+        actual = simplified_move_indices(journey, 0.)
+
+        # Assert
+        self.assertListEqual([0, 1, 2, 3], actual)
+
+    def test__simplified_move_indices__should_keep_immediate_moves_and_the_moves_before_them__when_otherwise_within_tolerance(self) -> None:
+        # Arrange
+        journey = [
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(0., 1.), positional_move_at(0., 2.),
+            positional_move_at(0., 3., MovementType.IMMEDIATE, reality=1), positional_move_at(0., 4., reality=1),
+            positional_move_at(0., 5., reality=1),
+        ]
+
+        # Act
+        actual = simplified_move_indices(journey, 100.)
+
+        # Assert
+        self.assertListEqual([0, 2, 3, 5], actual)
+
+    def test__simplified_move_indices__should_stay_within_tolerance__when_journey_is_long(self) -> None:
+        # Arrange
+        journey = [positional_move_at(0., 0., MovementType.IMMEDIATE)]
+        for continuum in range(1, 2000):
+            movement_type = MovementType.IMMEDIATE if anon_int(0, 99) == 0 else MovementType.INTERPOLATED
+            journey.append(positional_move_at(anon_float(-1., 1.) + continuum / 100, float(continuum), movement_type))
+        tolerance = 1.5
+
+        # Act
+        actual = simplified_move_indices(journey, tolerance)
+
+        # Assert
+        self.assertLess(len(actual), len(journey))
+        self.assertListEqual(sorted(set(actual)), actual)
+        self.assertTrue({index for index, move in enumerate(journey) if move.movement_type == MovementType.IMMEDIATE}.issubset(actual))
+        for start, end in zip(actual, actual[1:]):
+            for dropped in range(start + 1, end):
+                self.assertLessEqual(_distance_to_segment(journey[dropped], journey[start], journey[end]), tolerance + 1e-9)
+
+    def test__simplified_move_indices__should_reject_tolerance__when_negative_or_not_finite(self) -> None:
+        for tolerance in [-1., float("inf"), float("nan")]:
+            # Act
+            def action(): simplified_move_indices([positional_move_at(0., 0., MovementType.IMMEDIATE)], tolerance)
+
+            # Assert
+            self.assertRaises(ValueError, action)
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from Test.Unittest.test_helpers.anons import anon_traveler, anon_location, anon_event, anon_positional_range, positional_move_at
+from domain.collections import Range
+from domain.positions import Position, MovementType
+from domain.snapshots import Snapshot, take_snapshot
+
+
+class TestTakeSnapshot(TestCase):
+    def test__take_snapshot__should_position_each_traveler__when_journeys_cover_continuum(self) -> None:
+        # Arrange
+        walking = anon_traveler(journey=[
+            positional_move_at(0., 0., MovementType.IMMEDIATE), positional_move_at(10., 10., MovementType.INTERPOLATED)])
+        waiting = anon_traveler(journey=[
+            positional_move_at(5., 0., MovementType.IMMEDIATE), positional_move_at(-5., 10., MovementType.IMMEDIATE)])
+        elsewhere = anon_traveler(journey=[
+            positional_move_at(0., 0., MovementType.IMMEDIATE, reality=1), positional_move_at(0., 10., MovementType.IMMEDIATE, reality=1)])
+        not_yet_started = anon_traveler(journey=[positional_move_at(0., 8., MovementType.IMMEDIATE)])
+
+        # Act
+        actual = take_snapshot(4., 0, travelers=[walking, waiting, elsewhere, not_yet_started], locations=[], events=[])
+
+        # Assert
+        self.assertDictEqual({
+            walking.id: Position(latitude=4., longitude=0., altitude=0., continuum=4., reality=0),
+            waiting.id: Position(latitude=5., longitude=0., altitude=0., continuum=4., reality=0),
+        }, actual.travelers)
+
+    def test__take_snapshot__should_include_locations_and_events__when_span_contains_continuum_and_reality(self) -> None:
+        # Arrange
+        present_location = anon_location(span=anon_positional_range(continuum=Range(0., 10.), reality={0, 1}))
+        future_location = anon_location(span=anon_positional_range(continuum=Range(5., 10.), reality={0}))
+        present_event = anon_event(span=anon_positional_range(continuum=Range(-1., 4.), reality={0}))
+        elsewhere_event = anon_event(span=anon_positional_range(continuum=Range(0., 10.), reality={1}))
+
+        # Act
+        actual = take_snapshot(
+            4., 0, travelers=[], locations=[present_location, future_location], events=[present_event, elsewhere_event])
+
+        # Assert
+        expected = Snapshot(continuum=4., reality=0, travelers={}, locations={present_location.id}, events={present_event.id})
+        self.assertEqual(expected, actual)
@@ -116,6 +116,14 @@ def anon_positional_move(*, movement_type: MovementType = None) -> PositionalMov
     return PositionalMove(position=anon_position(), movement_type=_coalesce(movement_type, anon_movement_type()))
 
 
+def positional_move_at(
+        latitude: float, continuum: float, movement_type: MovementType = MovementType.INTERPOLATED, *, longitude: float = 0.,
+        reality: int = 0
+) -> PositionalMove:
+    return PositionalMove(position=Position(latitude=latitude, longitude=longitude, altitude=0., continuum=continuum, reality=reality),
+                          movement_type=movement_type)
+
+
 def anon_range(*, whole_numbers: bool = False) -> Range:
     low = anon_float()
     high = low + abs(anon_float())
@@ -17,9 +17,9 @@ class TestableRESTController(RESTController):
         self.profile = None
 
     def register_rest_endpoint(self, route: str, method: RESTMethod, response_type: MIMEType = MIMEType.JSON, *, json: bool = False,
-                               query_params: bool = False) -> HandlerRegisterer:
+                               query_params: bool = False, lines: bool = False) -> HandlerRegisterer:
         def handler_registerer(handler_func: RequestHandler) -> None:
-            validate_route_handler_declaration(route, handler_func, json, query_params)
+            validate_route_handler_declaration(route, handler_func, json, query_params, lines)
 
             @with_error_response_on_raised_exceptions
             def handler_wrapper(*args, **kwargs) -> HandlerResult: